@@ -2,7 +2,7 @@
 
 __title__ = "Clear Mark"
 __author__ = "Scholten BIM Consultancy"
-__doc__ = """Version   = 1.0
+__doc__ = """Version   = 1.4
 Datum    = 05.11.2025
 __________________________________________________________________
 Description:
@@ -14,6 +14,10 @@ How-to:
 __________________________________________________________________
 Last update:
 
+- [18.10.2026] - 1.4 Tijdmetingen (tellen, verzamelen, venster, wegschrijven) in het timing-log.
+- [18.10.2026] - 1.3 Selectie wordt net als view en model in de collector gefilterd (snel bij grote selecties).
+- [18.10.2026] - 1.2 Venster opent direct; tellingen per scope op de achtergrond en bewaard tot het model wijzigt.
+- [18.10.2026] - 1.1 Sneller bij grote aantallen (in blokken); bij annuleren kiezen: behouden of terugdraaien.
 - [05.11.2025] - 1.0 RELEASE
 __________________________________________________________________
 To-do:
@@ -27,12 +31,19 @@ from pyrevit.forms import WPFWindow
 import clr
 import traceback
 
+from scholtenbim import batch, scopecounts, selection, timing
+
 # MessageBox
 clr.AddReference('System.Windows.Forms')
+clr.AddReference('WindowsBase')
+from System import TimeSpan
 from System.Windows.Forms import MessageBox, MessageBoxButtons, MessageBoxIcon
+from System.Windows.Threading import DispatcherTimer, DispatcherPriority
 
 doc = revit.doc
 uidoc = revit.uidoc
+# Zelfde naam als de transactiegroep, zodat ook de batch-fases onder deze tool vallen
+timings = timing.Timer("Clear Mark", doc)
 
 
 # ------------------------------
@@ -55,6 +66,13 @@ def _nonempty_mark_filter():
 # ------------------------------
 # Collector helpers + snelle telling
 # ------------------------------
+def _collector_selection_only_filled():
+    # Collector op de geselecteerde ids: zelfde native filter als de andere scopes
+    col = selection.collector(doc, uidoc.Selection.GetElementIds())
+    if col is None:
+        return None
+    return col.WhereElementIsNotElementType().WherePasses(_nonempty_mark_filter())
+
 def _collector_active_view_only_filled():
     av = doc.ActiveView
     if av is None:
@@ -84,6 +102,7 @@ def _collector_count(col):
 # ------------------------------
 # Elementen verzamelen (altijd: Mark gevuld)
 # ------------------------------
+@timings.timed("verzamelen")
 def collect_selection_only_filled():
     ids = list(uidoc.Selection.GetElementIds())
     if not ids:
@@ -93,23 +112,9 @@ def collect_selection_only_filled():
             MessageBoxButtons.OK, MessageBoxIcon.Information
         )
         return None
-    elems = [doc.GetElement(i) for i in ids]
-    out = []
-    for e in elems:
-        try:
-            p = e.get_Parameter(DB.BuiltInParameter.ALL_MODEL_MARK)
-            if p and p.HasValue:
-                s = p.AsString()
-                if s and s.strip() != "":
-                    out.append(e)
-        except Exception as ex:
-            try:
-                eid = e.Id.IntegerValue if e else "?"
-            except Exception:
-                eid = "?"
-            print("Selectiecontrole fout op {0}: {1}".format(eid, ex))
-    return out
+    return _collector_selection_only_filled().ToElements()
 
+@timings.timed("verzamelen")
 def collect_active_view_only_filled():
     col = _collector_active_view_only_filled()
     if col is None:
@@ -121,75 +126,38 @@ def collect_active_view_only_filled():
         return None
     return col.ToElements()
 
+@timings.timed("verzamelen")
 def collect_whole_model_only_filled():
     col = _collector_whole_model_only_filled()
     return col.ToElements()
 
 
 # ------------------------------
-# Clear Mark met voortgang + annuleren (rollback)
+# Clear Mark in blokken + annuleren (behouden of terugdraaien)
 # ------------------------------
 def clear_mark_with_progress(elements):
+    """
+    Mark leegmaken via `batch.write_parameters`. De collectors laten alleen
+    elementen met gevulde Mark door, dus de waarde wordt niet opnieuw gelezen.
+    Geeft (aantal aangepast, geannuleerd) terug.
+    """
     if not elements:
         return 0, False
 
-    total = len(elements)
-    changed = 0
-    cancelled = False
-
-    t = DB.Transaction(doc, "Clear Mark")
-    t.Start()
-    try:
-        steps = total if total > 0 else 1
-        with forms.ProgressBar(title="Clear Mark | Bezig met verwerken...",
-                               cancellable=True, step_count=steps) as pb:
-            for idx, elem in enumerate(elements, 1):
-                # Cancel?
-                try:
-                    if hasattr(pb, 'cancelled') and pb.cancelled:
-                        cancelled = True
-                        break
-                except Exception:
-                    pass
-
-                try:
-                    param = elem.get_Parameter(DB.BuiltInParameter.ALL_MODEL_MARK)
-                    if param and param.HasValue:
-                        s = param.AsString()
-                        if s and s.strip() != "":
-                            if not param.IsReadOnly:
-                                param.Set("")
-                                changed += 1
-                            else:
-                                print("Mark is read-only voor element {0}".format(
-                                    elem.Id.IntegerValue))
-                except Exception as e:
-                    print("Kon Mark leegmaken op element {0}: {1}".format(
-                        elem.Id.IntegerValue, e))
-
-                # Progress
-                try:
-                    pb.update_progress(idx, steps)
-                except Exception:
-                    pass
-    finally:
-        if cancelled:
-            try:
-                t.RollBack()
-            except Exception as ex:
-                print("Rollback mislukte: {0}".format(ex))
-        else:
-            try:
-                t.Commit()
-            except Exception as ex:
-                print("Commit mislukte: {0}".format(ex))
-
-    return changed, cancelled
+    bip = DB.BuiltInParameter.ALL_MODEL_MARK
+    writes = [(elem, elem.get_Parameter(bip), "") for elem in elements]
+    result = batch.write_parameters(doc, "Clear Mark", writes, title="Clear Mark | Bezig met verwerken...")
+    for (elem, param, value), ex in result.failures:
+        print("Kon Mark leegmaken op element {0}: {1}".format(elem.Id.IntegerValue, ex))
+    return len(result.succeeded), result.cancelled
 
 
 def show_result_message(changed, cancelled, scope_label):
     if cancelled:
-        msg = "Actie geannuleerd.\n\n{0} element(en) waren al leeggemaakt.".format(changed)
+        if changed:
+            msg = "Actie geannuleerd.\n\n{0} element(en) zijn leeggemaakt en behouden.".format(changed)
+        else:
+            msg = "Actie geannuleerd. Er is niets aangepast."
     else:
         if changed == 0:
             msg = "Geen elementen met gevulde Mark gevonden in {0}.".format(scope_label)
@@ -205,6 +173,36 @@ def show_result_message(changed, cancelled, scope_label):
     )
 
 
+# ------------------------------
+# Tellingen per scope (bewaard tot het model verandert)
+# ------------------------------
+SCOPE_SELECTION = "selection"
+SCOPE_VIEW = "view"
+SCOPE_MODEL = "model"
+COUNTING_TEXT = "Telling: bezig met tellen..."
+
+
+def _scope_key(scope):
+    if scope == SCOPE_SELECTION:
+        ids = sorted(i.IntegerValue for i in uidoc.Selection.GetElementIds())
+        return ("ClearMark", scope, tuple(ids))
+    if scope == SCOPE_VIEW:
+        return ("ClearMark", scope, doc.ActiveView.Id.IntegerValue)
+    return ("ClearMark", scope)
+
+
+def count_scope(scope):
+    """Aantal elementen met gevulde Mark in de scope."""
+    with timings.phase("tellen") as phase:
+        if scope == SCOPE_SELECTION:
+            phase.count = _collector_count(_collector_selection_only_filled())
+        elif scope == SCOPE_VIEW:
+            phase.count = _collector_count(_collector_active_view_only_filled())
+        else:
+            phase.count = _collector_count(_collector_whole_model_only_filled())
+    return phase.count
+
+
 # ------------------------------
 # GUI
 # ------------------------------
@@ -217,13 +215,17 @@ class ClearMarkWindow(WPFWindow):
         self.btn_cancel.Click += self.cancel_click
         self.btn_refresh.Click += self.refresh_count
 
-        # Radio -> live telling
+        # Radio -> telling uit de cache
         self.rb_selection.Checked += self._scope_changed
         self.rb_activeview.Checked += self._scope_changed
         self.rb_wholemodel.Checked += self._scope_changed
 
-        # Init
-        self._refresh_count_safe()
+        # Venster direct tonen; tellen gebeurt daarna, één scope per tick
+        self.timer = DispatcherTimer(DispatcherPriority.Background)
+        self.timer.Interval = TimeSpan.FromMilliseconds(1)
+        self.timer.Tick += self._count_tick
+        self._show_count()
+        self.timer.Start()
 
         # Failsafe
         self.btn_run.IsEnabled = True
@@ -237,43 +239,43 @@ class ClearMarkWindow(WPFWindow):
         except Exception:
             pass
 
-    def _scope_changed(self, sender, e):
-        self._refresh_count_safe()
-
-    def refresh_count(self, sender, e):
-        self._refresh_count_safe()
-
-    def _refresh_count_safe(self):
+    def _current_scope(self):
+        if self.rb_selection.IsChecked:
+            return SCOPE_SELECTION
+        if self.rb_activeview.IsChecked:
+            return SCOPE_VIEW
+        return SCOPE_MODEL
+
+    def _pending_scopes(self):
+        """Scopes zonder bewaarde telling, de gekozen scope eerst."""
+        current = self._current_scope()
+        scopes = [current] + [s for s in (SCOPE_SELECTION, SCOPE_VIEW, SCOPE_MODEL) if s != current]
+        if doc.ActiveView is None:
+            scopes.remove(SCOPE_VIEW)
+        return [s for s in scopes if scopecounts.get(doc, _scope_key(s)) is None]
+
+    def _show_count(self):
+        scope = self._current_scope()
+        if scope == SCOPE_SELECTION and not list(uidoc.Selection.GetElementIds()):
+            self._set_count_text("Telling: 0 (geen selectie)")
+            return
+        if scope == SCOPE_VIEW and doc.ActiveView is None:
+            self._set_count_text("Telling: — (geen actieve view)")
+            return
+        cnt = scopecounts.get(doc, _scope_key(scope))
+        if cnt is None:
+            self._set_count_text(COUNTING_TEXT)
+            return
+        label = {SCOPE_SELECTION: "Selectie", SCOPE_VIEW: "Active View", SCOPE_MODEL: "Whole Model"}[scope]
+        self._set_count_text("Telling: {0} ({1})".format(cnt, label))
+
+    def count_next(self):
+        """Telt één scope die nog niet bekend is; False als alle scopes geteld zijn."""
+        pending = self._pending_scopes()
+        if not pending:
+            return False
         try:
-            if self.rb_selection.IsChecked:
-                ids = list(uidoc.Selection.GetElementIds())
-                if not ids:
-                    self._set_count_text("Telling: 0 (geen selectie)")
-                    return
-                cnt = 0
-                for i in ids:
-                    el = doc.GetElement(i)
-                    if not el:
-                        continue
-                    p = el.get_Parameter(DB.BuiltInParameter.ALL_MODEL_MARK)
-                    if p and p.HasValue:
-                        s = p.AsString()
-                        if s and s.strip() != "":
-                            cnt += 1
-                self._set_count_text("Telling: {0} (Selectie)".format(cnt))
-
-            elif self.rb_activeview.IsChecked:
-                col = _collector_active_view_only_filled()
-                if col is None:
-                    self._set_count_text("Telling: — (geen actieve view)")
-                    return
-                cnt = _collector_count(col)
-                self._set_count_text("Telling: {0} (Active View)".format(cnt))
-
-            else:
-                col = _collector_whole_model_only_filled()
-                cnt = _collector_count(col)
-                self._set_count_text("Telling: {0} (Whole Model)".format(cnt))
+            scopecounts.put(doc, _scope_key(pending[0]), count_scope(pending[0]))
         except Exception as ex:
             self._set_count_text("Telling: — (fout)")
             MessageBox.Show(
@@ -281,12 +283,29 @@ class ClearMarkWindow(WPFWindow):
                 "Clear Mark | Scholten BIM Consultancy",
                 MessageBoxButtons.OK, MessageBoxIcon.Warning
             )
+            return False
+        self._show_count()
+        return len(pending) > 1
+
+    def _count_tick(self, sender, e):
+        if not self.count_next():
+            self.timer.Stop()
+
+    def _scope_changed(self, sender, e):
+        self._show_count()
+
+    def refresh_count(self, sender, e):
+        scopecounts.invalidate(doc)
+        self._show_count()
+        self.timer.Start()
 
     # ---------- Actions ----------
     def cancel_click(self, sender, e):
+        self.timer.Stop()
         self.Close()
 
     def run_click(self, sender, e):
+        self.timer.Stop()
         try:
             if self.rb_selection.IsChecked:
                 elems = collect_selection_only_filled()
@@ -335,7 +354,9 @@ try:
             MessageBoxButtons.OK, MessageBoxIcon.Warning
         )
     else:
-        ClearMarkWindow(xaml_path).ShowDialog()
+        with timings.phase("venster"):
+            window = ClearMarkWindow(xaml_path)
+        window.ShowDialog()
 except Exception as ex:
     MessageBox.Show(
         "Er ging iets mis bij het openen van het venster:\n\n{0}\n\nTraceback:\n{1}".format(
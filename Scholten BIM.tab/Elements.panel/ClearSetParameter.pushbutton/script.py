@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+
+__title__ = "Clear / Set Parameter"
+__author__ = "Scholten BIM Consultancy"
+__doc__ = """Version   = 1.2
+Datum    = 18.10.2026
+__________________________________________________________________
+Description:
+
+Met deze tool kan je elke parameter in bulk leeghalen, een vaste waarde geven of vullen vanuit een andere parameter,
+voor alle elementen die aan een regel voldoen (leeg, niet leeg, gelijk aan, bevat of regex).
+Scope: selectie, active view, gehele model of een set views.
+Regels op tekst-, getal-, lengte- en id-parameters worden door Revit zelf gefilterd (regex en 'bevat' op niet-tekst in Python); 'Tel (dry-run)' telt zonder iets aan te passen.
+__________________________________________________________________
+How-to:
+-> Run het script.
+-> Kies parameter, voorwaarde, scope en actie.
+-> Klik op 'Tel (dry-run)' om te zien hoeveel elementen aangepast worden, en daarna op Uitvoeren.
+__________________________________________________________________
+Last update:
+
+- [18.10.2026] - 1.2 Leeg, niet leeg en gelijk aan op getal-, lengte- en id-parameters in het Revit-filter.
+- [18.10.2026] - 1.1 Tijdmetingen (venster, tellen, verzamelen, wegschrijven) in het timing-log.
+- [18.10.2026] - 1.0 RELEASE
+__________________________________________________________________
+To-do:
+
+-
+__________________________________________________________________
+"""
+
+from pyrevit import revit, DB, forms, script
+from pyrevit.forms import WPFWindow
+import clr
+import traceback
+
+from scholtenbim import batch, paramrules, timing
+
+# MessageBox
+clr.AddReference('System.Windows.Forms')
+from System.Windows.Forms import MessageBox, MessageBoxButtons, MessageBoxIcon
+
+doc = revit.doc
+uidoc = revit.uidoc
+# Zelfde naam als de transactiegroep, zodat ook de batch-fases onder deze tool vallen
+timings = timing.Timer("Clear / Set Parameter", doc)
+
+TITLE = "Clear / Set Parameter | Scholten BIM Consultancy"
+RULES = [
+    ("Leeg", paramrules.RULE_EMPTY),
+    ("Niet leeg", paramrules.RULE_NOT_EMPTY),
+    ("Gelijk aan", paramrules.RULE_EQUALS),
+    ("Bevat", paramrules.RULE_CONTAINS),
+    ("Regex", paramrules.RULE_REGEX),
+]
+ACTIONS = [
+    ("Leegmaken", paramrules.ACTION_CLEAR),
+    ("Vaste waarde zetten", paramrules.ACTION_SET),
+    ("Kopiëren van parameter", paramrules.ACTION_COPY),
+]
+# Parameternamen voor de keuzelijst van zoveel elementen uitlezen
+SAMPLE_SIZE = 200
+
+
+def sample_parameter_names():
+    """Parameternamen van de selectie, of anders van de eerste elementen in de actieve view."""
+    ids = list(uidoc.Selection.GetElementIds())
+    if ids:
+        elements = [doc.GetElement(i) for i in ids[:SAMPLE_SIZE]]
+    elif doc.ActiveView is not None:
+        elements = []
+        for elem in DB.FilteredElementCollector(doc, doc.ActiveView.Id).WhereElementIsNotElementType():
+            elements.append(elem)
+            if len(elements) >= SAMPLE_SIZE:
+                break
+    else:
+        elements = []
+    names = set()
+    for elem in elements:
+        if elem is not None:
+            names.update(p.Definition.Name for p in elem.Parameters)
+    return sorted(names)
+
+
+def printable_views():
+    views = DB.FilteredElementCollector(doc).OfClass(DB.View)
+    return [v for v in views if not v.IsTemplate and v.CanBePrinted]
+
+
+def show_message(msg, icon=MessageBoxIcon.Information):
+    MessageBox.Show(msg, TITLE, MessageBoxButtons.OK, icon)
+
+
+# ------------------------------
+# GUI
+# ------------------------------
+class ClearSetParameterWindow(WPFWindow):
+    def __init__(self, xaml_path):
+        WPFWindow.__init__(self, xaml_path)
+        self.view_ids = []
+
+        for name in sample_parameter_names():
+            self.combo_param.Items.Add(name)
+        for label, _ in RULES:
+            self.combo_rule.Items.Add(label)
+        self.combo_rule.SelectedIndex = 1
+        for label, _ in ACTIONS:
+            self.combo_action.Items.Add(label)
+        self.combo_action.SelectedIndex = 0
+
+        self.btn_run.Click += self.run_click
+        self.btn_cancel.Click += self.cancel_click
+        self.btn_count.Click += self.count_click
+        self.btn_views.Click += self.views_click
+
+    # ---------- Invoer ----------
+    def _scope(self):
+        if self.rb_selection.IsChecked:
+            return paramrules.SCOPE_SELECTION
+        if self.rb_activeview.IsChecked:
+            return paramrules.SCOPE_VIEW
+        if self.rb_views.IsChecked:
+            return paramrules.SCOPE_VIEWS
+        return paramrules.SCOPE_MODEL
+
+    def build_query(self):
+        """RuleQuery uit de invoer, of None (met melding) als er iets ontbreekt."""
+        param_name = (self.combo_param.Text or "").strip()
+        if not param_name:
+            show_message("Kies of typ eerst een parameter.", MessageBoxIcon.Warning)
+            return None
+        scope = self._scope()
+        element_ids = list(uidoc.Selection.GetElementIds()) if scope == paramrules.SCOPE_SELECTION else None
+        if scope == paramrules.SCOPE_SELECTION and not element_ids:
+            show_message("Geen elementen geselecteerd. Selecteer elementen en probeer opnieuw.")
+            return None
+        if scope == paramrules.SCOPE_VIEWS and not self.view_ids:
+            show_message("Kies eerst de views via 'Views kiezen...'.", MessageBoxIcon.Warning)
+            return None
+        try:
+            rule = paramrules.ParameterRule(param_name, RULES[self.combo_rule.SelectedIndex][1],
+                                            self.txt_rule_value.Text or "")
+        except Exception as ex:
+            show_message("Ongeldige regel:\n\n{0}".format(ex), MessageBoxIcon.Warning)
+            return None
+        query = paramrules.RuleQuery(doc, rule, scope, element_ids=element_ids, view_ids=self.view_ids)
+        if query.parameter_id is None:
+            show_message("Parameter '{0}' niet gevonden in de gekozen scope.".format(param_name), MessageBoxIcon.Warning)
+            return None
+        return query
+
+    # ---------- Actions ----------
+    def views_click(self, sender, e):
+        views = dict((v.Name, v) for v in printable_views())
+        names = forms.SelectFromList.show(sorted(views), title="Selecteer de views", button_name="Selecteer", multiselect=True)
+        if names:
+            self.view_ids = [views[name].Id for name in names]
+            self.txt_views.Text = "{0} view(s) gekozen".format(len(self.view_ids))
+            self.rb_views.IsChecked = True
+
+    def count_click(self, sender, e):
+        try:
+            query = self.build_query()
+            if query is None:
+                return
+            how = "in collector" if query.native is not None else "regel in Python"
+            with timings.phase("tellen") as phase:
+                phase.count = query.count()
+            self.txt_count.Text = "Telling: {0} ({1})".format(phase.count, how)
+        except Exception as ex:
+            self.txt_count.Text = "Telling: — (fout)"
+            show_message("Kon telling niet bepalen:\n\n{0}".format(ex), MessageBoxIcon.Warning)
+
+    def cancel_click(self, sender, e):
+        self.Close()
+
+    def run_click(self, sender, e):
+        try:
+            action = ACTIONS[self.combo_action.SelectedIndex][1]
+            value = self.txt_action_value.Text or ""
+            if action == paramrules.ACTION_COPY and not value.strip():
+                show_message("Vul bij 'Waarde / bron' de parameter in waaruit gekopieerd wordt.", MessageBoxIcon.Warning)
+                return
+            query = self.build_query()
+            if query is None:
+                return
+
+            with timings.phase("verzamelen") as phase:
+                writes = query.writes(action, value.strip() if action == paramrules.ACTION_COPY else value)
+                phase.count = len(writes)
+            if not writes:
+                show_message("Geen elementen gevonden die aan de regel voldoen.")
+                return
+
+            result = batch.write_parameters(doc, "Clear / Set Parameter", writes, title="Clear / Set Parameter | Bezig met verwerken...",
+                                            setter=paramrules.set_parameter_text)
+            for (elem, param, text), ex in result.failures:
+                print("Kon '{0}' niet aanpassen op element {1}: {2}".format(query.rule.parameter_name, elem.Id.IntegerValue, ex))
+
+            changed = len(result.succeeded)
+            if result.cancelled:
+                if changed:
+                    msg = "Actie geannuleerd.\n\n{0} element(en) zijn aangepast en behouden.".format(changed)
+                else:
+                    msg = "Actie geannuleerd. Er is niets aangepast."
+            else:
+                msg = "Er zijn {0} van {1} element(en) aangepast.".format(changed, len(writes))
+                if result.failures:
+                    msg += "\n{0} element(en) konden niet worden aangepast: {1}".format(len(result.failures), result.failures[0][1])
+            show_message(msg, MessageBoxIcon.Warning if result.failures else MessageBoxIcon.Information)
+            self.Close()
+        except Exception as ex:
+            show_message("Fout tijdens uitvoeren:\n\n{0}\n\nTraceback:\n{1}".format(ex, traceback.format_exc()), MessageBoxIcon.Error)
+
+
+# ------------------------------
+# Start GUI
+# ------------------------------
+try:
+    xaml_path = script.get_bundle_file('ClearSetParameter.xaml')
+    if not xaml_path:
+        show_message("ClearSetParameter.xaml niet gevonden in de bundle.\n"
+                     "Zorg dat ClearSetParameter.xaml in dezelfde map staat als dit script.", MessageBoxIcon.Warning)
+    else:
+        with timings.phase("venster"):
+            window = ClearSetParameterWindow(xaml_path)
+        window.ShowDialog()
+except Exception as ex:
+    show_message("Er ging iets mis bij het openen van het venster:\n\n{0}\n\nTraceback:\n{1}".format(
+        ex, traceback.format_exc()), MessageBoxIcon.Error)
@@ -1,6 +1,5 @@
 import clr
 import os
-import json
 import sys
 clr.AddReference('RevitAPI')
 clr.AddReference('RevitServices')
@@ -15,23 +14,23 @@ from RevitServices.Transactions import TransactionManager
 from System.Drawing import Icon
 from System.Windows.Forms import Application, Form, Label, TextBox, Button, MessageBox, Keys, Control, FormBorderStyle, DialogResult, FormStartPosition, MessageBox, MessageBoxButtons, DialogResult, MessageBoxIcon
 from pyrevit import forms
+from scholtenbim import configstore
 
 # Actief document en view ophalen
 doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
 active_view = doc.ActiveView
 
+# Instellingen van deze knop in het gebruikers-/projectprofiel
+TOOL = "CopyParameter"
+DEFAULT_CONFIG = {"read_param": "Comments", "write_param": ["Mark"]}
 config_file_path = os.path.join(os.path.dirname(__file__), 'config.json')
 
 def load_config():
-    if os.path.exists(config_file_path):
-        with open(config_file_path, 'r') as f:
-            return json.load(f)
-    return {"read_param": "Comments", "write_param": ["Mark"]}
+    return configstore.load(TOOL, doc, default=DEFAULT_CONFIG, defaults_file=config_file_path)
 
 def save_config(config):
-    with open(config_file_path, 'w') as f:
-        json.dump(config, f)
+    configstore.save(TOOL, config, doc)
 
 config = load_config()
 
@@ -2,7 +2,7 @@
 
 __title__ = "Copy Parameter to Parameter"
 __author__ = "Scholten BIM Consultancy"
-__doc__ = """Version   = 1.2
+__doc__ = """Version   = 1.3
 Datum    = 29.01.2025
 __________________________________________________________________
 Description:
@@ -17,6 +17,7 @@ How-to:
 __________________________________________________________________
 Last update:
 
+- [18.10.2026] - 1.3 Instellingen per gebruiker en per project in plaats van een gedeelde config.json in de extensie.
 - [01.04.2025] - 1.2 Juiste manier van config.py gebruikt, geen veranderde werking van het script.
 - [11.02.2025] - 1.1 Icons toegevoegd aan de meldingen en de mogelijkheid om uit een pulldown menu de uit te lezen en weg te schrijven parameters te selecteren.
 - [29.01.2025] - 1.0 RELEASE
@@ -29,7 +30,6 @@ __________________________________________________________________
 
 import clr
 import os
-import json
 import sys
 clr.AddReference('RevitAPI')
 clr.AddReference('RevitServices')
@@ -39,19 +39,20 @@ from Autodesk.Revit.DB import *
 from Autodesk.Revit.UI.Selection import ObjectType
 from Autodesk.Revit.Exceptions import OperationCanceledException
 from pyrevit import forms
+from scholtenbim import configstore
 from System.Windows.Forms import MessageBox, MessageBoxButtons, MessageBoxIcon
 
 # Actief document en view ophalen
 doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
 
+# Instellingen van deze knop (Shift-klik); config.json naast het script geldt alleen nog als standaard
+TOOL = "CopyParameter"
+DEFAULT_CONFIG = {"read_param": "Comments", "write_param": ["Mark"]}
 config_file_path = os.path.join(os.path.dirname(__file__), 'config.json')
 
 def load_config():
-    if os.path.exists(config_file_path):
-        with open(config_file_path, 'r') as f:
-            return json.load(f)
-    return {"read_param": "Comments", "write_param": ["Mark"]}
+    return configstore.load(TOOL, doc, default=DEFAULT_CONFIG, defaults_file=config_file_path)
 
 config = load_config()
 
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+__title__ = "Copy Parameter from Mapping (CSV/Excel)"
+__author__ = "Scholten BIM Consultancy"
+__doc__ = """Version   = 1.2
+Datum    = 18.10.2026
+__________________________________________________________________
+Description:
+
+Met deze tool kan je in 1x parameters van bronobjecten naar doelobjecten kopieren op basis van een tabel (CSV of Excel), in plaats van per object te klikken.
+Bron- en doelobjecten worden gevonden via een sleutel: Mark, ElementId, IfcGUID of een andere parameter.
+
+Kolommen: Source Key; Target Key; Source Parameter; Target Parameter; Unit
+- Target Parameter leeg = dezelfde parameter als de bron.
+- Unit (optioneel, bijv. mm, m, m2, deg) voor tekst/getal naar lengte, oppervlakte, hoek, etc.
+__________________________________________________________________
+How-to:
+
+-> Run het script en kies het CSV- of Excel-bestand.
+-> Kies de sleutel voor de bronobjecten en voor de doelobjecten.
+-> Na afloop volgt een overzicht; details staan in het output-venster.
+__________________________________________________________________
+Last update:
+
+- [18.10.2026] - 1.2 Tijdmetingen (mapping lezen, plan, verwerken, commit) in het timing-log.
+- [18.10.2026] - 1.1 Kop in het output-venster: "niet uitgevoerd" alleen als er niets is weggeschreven
+- [18.10.2026] - 1.0 RELEASE
+__________________________________________________________________
+To-do:
+
+-
+__________________________________________________________________
+"""
+
+import clr
+clr.AddReference('RevitAPI')
+clr.AddReference('System.Windows.Forms')
+from pyrevit import forms, script
+from System.Windows.Forms import MessageBox, MessageBoxButtons, MessageBoxIcon
+
+from scholtenbim import parammapping, timing
+
+doc = __revit__.ActiveUIDocument.Document
+output = script.get_output()
+
+TITLE = "Copy Parameter from Mapping | Scholten BIM Consultancy"
+# Zelfde naam als de TransactionGroup van apply_plan: fases verwerken/commit komen bij deze tool
+timings = timing.Timer("Parameter Mapping", doc)
+KEY_OTHER = "Andere parameter..."
+# Maximaal aantal regels met details in het output-venster
+MAX_DETAILS = 200
+
+
+def choose_key(side):
+    choice = forms.SelectFromList.show(parammapping.KEY_TYPES + [KEY_OTHER], title="Sleutel voor de {}".format(side), button_name="Kiezen")
+    if choice == KEY_OTHER:
+        choice = forms.ask_for_string(prompt="Naam van de parameter met de sleutel van de {}:".format(side), title=TITLE)
+    return choice.strip() if choice else None
+
+
+path = forms.pick_file(files_filter="Mapping (*.csv;*.xlsx)|*.csv;*.xlsx|CSV (*.csv)|*.csv|Excel (*.xlsx)|*.xlsx")
+if not path:
+    script.exit()
+
+try:
+    with timings.phase("mapping lezen") as phase:
+        rows = parammapping.read_mapping(path)
+        phase.count = len(rows)
+except (parammapping.MappingError, IOError, UnicodeDecodeError) as e:
+    MessageBox.Show("Mapping kan niet gelezen worden:\n{}".format(e), TITLE, MessageBoxButtons.OK, MessageBoxIcon.Error)
+    script.exit()
+
+if not rows:
+    MessageBox.Show("Geen regels gevonden in de mapping.", TITLE, MessageBoxButtons.OK, MessageBoxIcon.Information)
+    script.exit()
+
+source_key = choose_key("bronobjecten")
+target_key = choose_key("doelobjecten") if source_key else None
+if not source_key or not target_key:
+    MessageBox.Show("De gebruiker heeft de actie gestopt.", TITLE, MessageBoxButtons.OK, MessageBoxIcon.Information)
+    script.exit()
+
+# Sleutels en parameters opzoeken, waarden omzetten; nog niets gewijzigd
+with timings.phase("plan", len(rows)):
+    plan = parammapping.build_plan(doc, rows, source_key, target_key)
+
+result = None
+if plan.writes:
+    result = parammapping.apply_plan(doc, plan)
+
+if plan.issues or (result is not None and result.failures):
+    details = [(row.line, reason, detail) for row, reason, detail in plan.issues]
+    if result is not None:
+        details += [(write.row.line, "Fout bij wegschrijven", "{}: {}".format(write.row.target_parameter, e)) for write, e in result.failures]
+    # Alleen "niet uitgevoerd" als er niets is weggeschreven of alles is teruggedraaid
+    if result is None or (result.cancelled and not result.kept):
+        output.print_md("## Copy Parameter from Mapping: niet uitgevoerd")
+    else:
+        output.print_md("## Copy Parameter from Mapping: Aandachtspunten ({} regels niet verwerkt)".format(len(set(line for line, _, _ in details))))
+    for line, reason, detail in sorted(details)[:MAX_DETAILS]:
+        output.print_md("- Regel {}: {} ({})".format(line, reason, detail))
+    if len(details) > MAX_DETAILS:
+        output.print_md("- ... en nog {} regel(s)".format(len(details) - MAX_DETAILS))
+
+icon = MessageBoxIcon.Warning if plan.issues or (result is not None and (result.failures or result.cancelled)) else MessageBoxIcon.Information
+MessageBox.Show("\n".join(parammapping.summary(plan, result)), TITLE, MessageBoxButtons.OK, icon)
@@ -2,7 +2,7 @@
 
 __title__ = "Copy Parameter to Parameter From/To (Multiple)"
 __author__ = "Scholten BIM Consultancy"
-__doc__ = """Version   = 1.2
+__doc__ = """Version   = 1.5
 Datum    = 17.02.2025
 __________________________________________________________________
 Description:
@@ -18,6 +18,9 @@ How-to:
 __________________________________________________________________
 Last update:
 
+- [18.10.2026] - 1.5 Tijdmetingen (verzamelen, wegschrijven, commit) in het timing-log.
+- [18.10.2026] - 1.4 Instellingen per gebruiker en per project in plaats van een gedeelde config.json in de extensie.
+- [18.10.2026] - 1.3 Parameters 1x per categorie/type op naam opgezocht, daarna direct weggeschreven (sneller bij grote selecties).
 - [01.04.2025] - 1.2 Juiste manier van config.py gebruikt, geen veranderde werking van het script.
 - [04.03.2025] - 1.1 Update transaction & empty config file 
 - [17.02.2025] - 1.0 RELEASE
@@ -29,7 +32,6 @@ __________________________________________________________________
 """
 
 import clr
-import json
 import os
 import sys
 clr.AddReference('RevitAPI')
@@ -44,6 +46,7 @@ from RevitServices.Persistence import DocumentManager
 from RevitServices.Transactions import TransactionManager
 from System.Windows.Forms import MessageBox, MessageBoxButtons, MessageBoxIcon, Keys, Control
 from pyrevit import forms
+from scholtenbim import configstore, paramcache, timing
 # Voeg deze regel toe
 from Autodesk.Revit.DB import StorageType
 
@@ -51,8 +54,10 @@ from Autodesk.Revit.DB import StorageType
 doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
 active_view = doc.ActiveView
-# Configuratiebestand pad
+# Instellingen van deze knop (Shift-klik); config.json naast het script geldt alleen nog als standaard
+TOOL = "CopyParameterFromToMultiple"
 config_path = os.path.join(os.path.dirname(__file__), 'config.json')
+timings = timing.Timer("Copy Parameter From/To (Multiple)", doc)
 
 # Initialiseer de errors variabele
 errors = {}
@@ -77,8 +82,7 @@ def get_parameter_info(element, param_name):
     return None, None
 
 # Functie om parameterwaarde in te stellen
-def set_parameter_value(element, param_name, value, storage_type):
-    param = element.LookupParameter(param_name)
+def set_parameter_value(param, value, storage_type):
     if param and value is not None:
         if storage_type == StorageType.String:
             param.Set(value)
@@ -91,34 +95,15 @@ def set_parameter_value(element, param_name, value, storage_type):
         else:
             raise TypeError("Unsupported parameter storage type")
 
-# Functie om parameters te laden uit config.json
+# Functie om parameters te laden uit het gebruikers-/projectprofiel
 def load_parameters_from_config():
-    if not os.path.exists(config_path):
-        MessageBox.Show("Config-bestand niet gevonden. De gebruiker heeft de actie gestopt.", 
-                        "Copy Parameters to Parameters From/To | Scholten BIM Consultancy", 
+    params = configstore.load(TOOL, doc, defaults_file=config_path)
+    if not params:
+        MessageBox.Show("Geen parameters ingesteld. Houd Shift ingedrukt bij het uitvoeren om ze in te stellen.",
+                        "Copy Parameters to Parameters From/To | Scholten BIM Consultancy",
                         MessageBoxButtons.OK, MessageBoxIcon.Information)
         sys.exit()
-    
-    if os.stat(config_path).st_size == 0:
-        MessageBox.Show("Config-bestand is leeg. De gebruiker heeft de actie gestopt.", 
-                        "Copy Parameters to Parameters From/To | Scholten BIM Consultancy", 
-                        MessageBoxButtons.OK, MessageBoxIcon.Information)
-        sys.exit()
-    
-    with open(config_path, 'r') as config_file:
-        try:
-            params = json.load(config_file)
-            if not params:
-                MessageBox.Show("Geen parameters gevonden in het config-bestand. De gebruiker heeft de actie gestopt.", 
-                                "Copy Parameters to Parameters From/To | Scholten BIM Consultancy", 
-                                MessageBoxButtons.OK, MessageBoxIcon.Information)
-                sys.exit()
-            return params
-        except json.JSONDecodeError:
-            MessageBox.Show("Config-bestand bevat ongeldige JSON. De gebruiker heeft de actie gestopt.", 
-                            "Copy Parameters to Parameters From/To | Scholten BIM Consultancy", 
-                            MessageBoxButtons.OK, MessageBoxIcon.Information)
-            sys.exit()
+    return params
 
 # Aangepaste filter om Revit-links uit te sluiten
 class ExcludeRevitLinks(ISelectionFilter):
@@ -138,23 +123,29 @@ try:
     
     with forms.WarningBar(title="Pick target element"):
         target_references = uidoc.Selection.PickObjects(ObjectType.Element, ExcludeRevitLinks(), "Selecteer de doelobjecten")
-    target_elements = [doc.GetElement(ref.ElementId) for ref in target_references]
+    with timings.phase("verzamelen", len(target_references)):
+        target_elements = [doc.GetElement(ref.ElementId) for ref in target_references]
 
     t = Transaction(doc, "Copy Parameter to Parameter From/To (Multipe)")
     t.Start()
 
-    for element in target_elements:
-        category_name = element.Category.Name
-        for param_name, (value, storage_type) in source_values.items():
-            try:
-                if element.LookupParameter(param_name):
-                    set_parameter_value(element, param_name, value, storage_type)
-                else:
+    # Parameters 1x per categorie/type op naam opzoeken, daarna via de definitie
+    resolver = paramcache.ParameterResolver()
+    param_names = list(source_values.keys())
+    with timings.phase("wegschrijven", len(target_elements)):
+        for element in target_elements:
+            category_name = element.Category.Name
+            for param_name, param in zip(param_names, resolver.get_many(element, param_names)):
+                value, storage_type = source_values[param_name]
+                try:
+                    if param:
+                        set_parameter_value(param, value, storage_type)
+                    else:
+                        errors.setdefault(param_name, {}).setdefault(category_name, 0)
+                        errors[param_name][category_name] += 1
+                except Exception:
                     errors.setdefault(param_name, {}).setdefault(category_name, 0)
                     errors[param_name][category_name] += 1
-            except Exception:
-                errors.setdefault(param_name, {}).setdefault(category_name, 0)
-                errors[param_name][category_name] += 1
 
     if errors:
         sorted_errors = sorted(errors.items())
@@ -162,7 +153,8 @@ try:
         MessageBox.Show("\n".join(error_messages), "Copy Parameters to Parameters From/To | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Error)
     
     if t is not None and t.HasStarted():
-        t.Commit()
+        with timings.phase("commit", len(target_elements)):
+            t.Commit()
 except OperationCanceledException:
     MessageBox.Show("De gebruiker heeft de actie gestopt.", "Copy Parameters to Parameters From/To | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Information)
 finally:
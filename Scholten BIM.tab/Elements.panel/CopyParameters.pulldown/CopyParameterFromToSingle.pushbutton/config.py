@@ -1,6 +1,4 @@
 import clr
-import json
-import os
 import sys
 clr.AddReference('RevitAPI')
 clr.AddReference('RevitServices')
@@ -12,6 +10,7 @@ from Autodesk.Revit.UI.Selection import ObjectType
 from RevitServices.Persistence import DocumentManager
 from System.Windows.Forms import MessageBox, MessageBoxButtons, MessageBoxIcon, Keys, Control
 from pyrevit import forms
+from scholtenbim import configstore
 
 # Voeg deze regel toe
 from Autodesk.Revit.DB import StorageType
@@ -21,8 +20,8 @@ doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
 active_view = doc.ActiveView
 
-# Configuratiebestand pad
-config_path = os.path.join(os.path.dirname(__file__), 'config.json')
+# Instellingen van deze knop in het gebruikers-/projectprofiel
+TOOL = "CopyParameterFromToSingle"
 
 # Functie om parameters te selecteren met een PyRevit Form
 def select_parameters(element):
@@ -34,10 +33,9 @@ def select_parameters(element):
         raise Exception("De gebruiker heeft de actie gestopt.")
     return selected_params
 
-# Functie om parameters op te slaan in config.json
+# Functie om parameters op te slaan in het gebruikers-/projectprofiel
 def save_parameters_to_config(params):
-    with open(config_path, 'w') as config_file:
-        json.dump(params, config_file)
+    configstore.save(TOOL, params, doc)
 
 try:
     with forms.WarningBar(title="Pick reference element"):
@@ -2,7 +2,7 @@
 
 __title__ = "Copy Parameter to Parameter From/To (Single)"
 __author__ = "Scholten BIM Consultancy"
-__doc__ = """Version   = 1.3
+__doc__ = """Version   = 1.4
 Datum    = 22.10.2025
 __________________________________________________________________
 Description:
@@ -11,10 +11,13 @@ SHIFT-CLICK to display options.
 Met deze tool kan je parameters van een object uit je huidige model kopiëren naar één ander object.
 Houd de Shift-knop ingedrukt bij het uitvoeren van deze actie en je kan de parameters aanpassen.
 __________________________________________________________________
+Last update:
+
+- [18.10.2026] - 1.4 Instellingen per gebruiker en per project in plaats van een gedeelde config.json in de extensie.
+__________________________________________________________________
 """
 
 import clr
-import json
 import os
 import sys
 clr.AddReference('RevitAPI')
@@ -29,6 +32,7 @@ from RevitServices.Persistence import DocumentManager
 from RevitServices.Transactions import TransactionManager
 from System.Windows.Forms import MessageBox, MessageBoxButtons, MessageBoxIcon
 from pyrevit import forms
+from scholtenbim import configstore
 
 # Voeg deze regel toe
 from Autodesk.Revit.DB import StorageType
@@ -38,7 +42,8 @@ doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
 active_view = doc.ActiveView
 
-# Configuratiebestand pad
+# Instellingen van deze knop (Shift-klik); config.json naast het script geldt alleen nog als standaard
+TOOL = "CopyParameterFromToSingle"
 config_path = os.path.join(os.path.dirname(__file__), 'config.json')
 
 # Initialiseer de errors variabele
@@ -71,25 +76,15 @@ def set_parameter_value(element, param_name, value, storage_type):
         elif storage_type == StorageType.Double:
             param.Set(float(value))
 
-# Functie om parameters te laden uit config.json
+# Functie om parameters te laden uit het gebruikers-/projectprofiel
 def load_parameters_from_config():
-    if not os.path.exists(config_path) or os.stat(config_path).st_size == 0:
-        MessageBox.Show("Config-bestand niet gevonden of leeg. De gebruiker heeft de actie gestopt.",
+    params = configstore.load(TOOL, doc, defaults_file=config_path)
+    if not params:
+        MessageBox.Show("Geen parameters ingesteld. Houd Shift ingedrukt bij het uitvoeren om ze in te stellen.",
                         "Copy Parameters to Parameters From/To | Scholten BIM Consultancy",
                         MessageBoxButtons.OK, MessageBoxIcon.Information)
         sys.exit()
-
-    with open(config_path, 'r') as config_file:
-        try:
-            params = json.load(config_file)
-            if not params:
-                raise ValueError
-            return params
-        except Exception:
-            MessageBox.Show("Config-bestand bevat ongeldige of lege JSON. De gebruiker heeft de actie gestopt.",
-                            "Copy Parameters to Parameters From/To | Scholten BIM Consultancy",
-                            MessageBoxButtons.OK, MessageBoxIcon.Information)
-            sys.exit()
+    return params
 
 # Aangepaste filter om Revit-links uit te sluiten
 class ExcludeRevitLinks(ISelectionFilter):
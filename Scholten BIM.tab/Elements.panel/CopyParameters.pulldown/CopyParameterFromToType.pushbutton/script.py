@@ -2,7 +2,7 @@
 
 __title__ = "Copy Parameter to Parameter From/To (Type)"
 __author__ = "Scholten BIM Consultancy"
-__doc__ = """Version   = 1.2
+__doc__ = """Version   = 1.5
 Datum    = 17.02.2025
 __________________________________________________________________
 Description:
@@ -15,9 +15,13 @@ How-to:
 
 -> SHIFT-Click om parameters te selecteren.
 -> Single-Click om parameters uitlezen/wegschrijven tussen de elementen.
+-> Kies daarna of je de doeltypes via objecten in het model selecteert of direct uit een lijst met types.
 __________________________________________________________________
 Last update:
 
+- [18.10.2026] - 1.5 Tijdmetingen (typelijst, verzamelen, wegschrijven, commit) in het timing-log.
+- [18.10.2026] - 1.4 Instellingen per gebruiker en per project in plaats van een gedeelde config.json in de extensie.
+- [18.10.2026] - 1.3 Elk type wordt maar 1x weggeschreven (ook bij veel instanties), resultaat per type en types direct uit een lijst te kiezen.
 - [01.04.2025] - 1.2 Juiste manier van config.py gebruikt, geen veranderde werking van het script.
 - [04.03.2025] - 1.1 Update transaction & empty config file 
 - [17.02.2025] - 1.0 RELEASE
@@ -29,7 +33,6 @@ __________________________________________________________________
 """
 
 import clr
-import json
 import os
 import sys
 clr.AddReference('RevitAPI')
@@ -44,6 +47,7 @@ from RevitServices.Persistence import DocumentManager
 from RevitServices.Transactions import TransactionManager
 from System.Windows.Forms import MessageBox, MessageBoxButtons, MessageBoxIcon, Keys, Control
 from pyrevit import forms
+from scholtenbim import configstore, timing
 # Voeg deze regel toe
 from Autodesk.Revit.DB import StorageType
 
@@ -51,11 +55,14 @@ from Autodesk.Revit.DB import StorageType
 doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
 active_view = doc.ActiveView
-# Configuratiebestand pad
+# Instellingen van deze knop (Shift-klik); config.json naast het script geldt alleen nog als standaard
+TOOL = "CopyParameterFromToType"
 config_path = os.path.join(os.path.dirname(__file__), 'config.json')
+timings = timing.Timer("Copy Parameter From/To (Type)", doc)
 
-# Initialiseer de errors variabele
-errors = {}
+# Keuzes voor het selecteren van de doeltypes
+TARGET_PICK = "Objecten selecteren"
+TARGET_LIST = "Types uit lijst"
 
 # Initialiseer de transactievariabele
 t = None
@@ -76,9 +83,9 @@ def get_parameter_info(element, param_name):
         return value, param.StorageType
     return None, None
 
-# Functie om parameterwaarde in te stellen
-def set_parameter_value(element, param_name, value, storage_type):
-    param = element.Symbol.LookupParameter(param_name) if element.Symbol else None
+# Functie om parameterwaarde in te stellen (op het type zelf)
+def set_parameter_value(element_type, param_name, value, storage_type):
+    param = element_type.LookupParameter(param_name)
     if param and value is not None:
         if storage_type == StorageType.String:
             param.Set(value)
@@ -91,34 +98,58 @@ def set_parameter_value(element, param_name, value, storage_type):
         else:
             raise TypeError("Unsupported parameter storage type")
 
-# Functie om parameters te laden uit config.json
+# Functie om parameters te laden uit het gebruikers-/projectprofiel
 def load_parameters_from_config():
-    if not os.path.exists(config_path):
-        MessageBox.Show("Config-bestand niet gevonden. De gebruiker heeft de actie gestopt.", 
-                        "Copy Parameters to Parameters From/To | Scholten BIM Consultancy", 
+    params = configstore.load(TOOL, doc, defaults_file=config_path)
+    if not params:
+        MessageBox.Show("Geen parameters ingesteld. Houd Shift ingedrukt bij het uitvoeren om ze in te stellen.",
+                        "Copy Parameters to Parameters From/To | Scholten BIM Consultancy",
                         MessageBoxButtons.OK, MessageBoxIcon.Information)
         sys.exit()
-    
-    if os.stat(config_path).st_size == 0:
-        MessageBox.Show("Config-bestand is leeg. De gebruiker heeft de actie gestopt.", 
-                        "Copy Parameters to Parameters From/To | Scholten BIM Consultancy", 
-                        MessageBoxButtons.OK, MessageBoxIcon.Information)
-        sys.exit()
-    
-    with open(config_path, 'r') as config_file:
-        try:
-            params = json.load(config_file)
-            if not params:
-                MessageBox.Show("Geen parameters gevonden in het config-bestand. De gebruiker heeft de actie gestopt.", 
-                                "Copy Parameters to Parameters From/To | Scholten BIM Consultancy", 
-                                MessageBoxButtons.OK, MessageBoxIcon.Information)
-                sys.exit()
-            return params
-        except json.JSONDecodeError:
-            MessageBox.Show("Config-bestand bevat ongeldige JSON. De gebruiker heeft de actie gestopt.", 
-                            "Copy Parameters to Parameters From/To | Scholten BIM Consultancy", 
-                            MessageBoxButtons.OK, MessageBoxIcon.Information)
-            sys.exit()
+    return params
+
+def type_label(element_type):
+    family_name = element_type.FamilyName
+    return "{} : {}".format(family_name, element_type.Name) if family_name else element_type.Name
+
+
+# Unieke types van de geselecteerde objecten (op volgorde van selectie) + aantal instanties per type
+def types_of_elements(elements):
+    types = []
+    instance_count = {}
+    for element in elements:
+        type_id = element.GetTypeId()
+        if type_id == ElementId.InvalidElementId:
+            continue
+        if type_id not in instance_count:
+            types.append(doc.GetElement(type_id))
+            instance_count[type_id] = 0
+        instance_count[type_id] += 1
+    return types, instance_count
+
+
+# Types kiezen uit een lijst, gegroepeerd per categorie
+def pick_types_from_list():
+    grouped = {}
+    by_label = {}
+    # Alleen het opbouwen van de lijst; kiezen door de gebruiker telt niet mee
+    with timings.phase("typelijst") as phase:
+        for symbol in FilteredElementCollector(doc).OfClass(FamilySymbol):
+            if symbol.Category is None:
+                continue
+            label = type_label(symbol)
+            grouped.setdefault(symbol.Category.Name, []).append(label)
+            by_label[(symbol.Category.Name, label)] = symbol
+        for labels in grouped.values():
+            labels.sort()
+        phase.count = len(by_label)
+    selected = forms.SelectFromList.show(grouped, title="Selecteer de doeltypes", multiselect=True,
+                                         group_selector_title="Categorie:", button_name="Kopiëren")
+    if not selected:
+        raise OperationCanceledException()
+    labels = set(selected)
+    return [symbol for (category, label), symbol in sorted(by_label.items()) if label in labels]
+
 
 # Aangepaste filter om Revit-links uit te sluiten
 class ExcludeRevitLinks(ISelectionFilter):
@@ -135,35 +166,56 @@ try:
     
     source_values = {param_name: get_parameter_info(source_element, param_name) for param_name in selected_params}
     
-    with forms.WarningBar(title="Pick target element"):
-        target_references = uidoc.Selection.PickObjects(ObjectType.Element, ExcludeRevitLinks(), "Selecteer de doelobjecten")
-    target_elements = [doc.GetElement(ref.ElementId) for ref in target_references]
+    target_mode = forms.alert("Hoe wil je de doeltypes kiezen?", title="Copy Parameters to Parameters From/To | Scholten BIM Consultancy", options=[TARGET_PICK, TARGET_LIST])
+    if not target_mode:
+        raise OperationCanceledException()
+
+    instance_count = {}
+    if target_mode == TARGET_LIST:
+        target_types = pick_types_from_list()
+    else:
+        with forms.WarningBar(title="Pick target element"):
+            target_references = uidoc.Selection.PickObjects(ObjectType.Element, ExcludeRevitLinks(), "Selecteer de doelobjecten")
+        with timings.phase("verzamelen", len(target_references)):
+            target_elements = [doc.GetElement(ref.ElementId) for ref in target_references]
+            # Elk type maar 1x wegschrijven: iedere schrijfactie regenereert alle instanties van dat type
+            target_types, instance_count = types_of_elements(target_elements)
 
     t = Transaction(doc, "Copy Parameter to Parameter From/To")
     t.Start()
 
-    for element in target_elements:
-        category_name = element.Category.Name
-        for param_name, (value, storage_type) in source_values.items():
-            try:
-                if element.Symbol.LookupParameter(param_name):
-                    set_parameter_value(element, param_name, value, storage_type)
-                else:
-                    errors.setdefault(param_name, {}).setdefault(category_name, 0)
-                    errors[param_name][category_name] += 1
-            except Exception:
-                errors.setdefault(param_name, {}).setdefault(category_name, 0)
-                errors[param_name][category_name] += 1
-    if errors:
-        sorted_errors = sorted(errors.items())
-        error_messages = ["Parameter '{}': ontbreekt in categorieën: {}.".format(param, ", ".join(["{} ({} object(en))".format(category, count) for category, count in categories.items()])) for param, categories in sorted_errors]
-        MessageBox.Show("\n".join(error_messages), "Copy Parameters to Parameters From/To | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Error)
-    
+    # Per type: welke parameters ontbreken of konden niet worden geschreven
+    missing = {}
+    with timings.phase("wegschrijven", len(target_types)):
+        for element_type in target_types:
+            for param_name, (value, storage_type) in sorted(source_values.items()):
+                try:
+                    if element_type.LookupParameter(param_name):
+                        set_parameter_value(element_type, param_name, value, storage_type)
+                    else:
+                        missing.setdefault(element_type.Id, []).append(param_name)
+                except Exception:
+                    missing.setdefault(element_type.Id, []).append(param_name)
+
     if t is not None and t.HasStarted():
-        t.Commit()
+        with timings.phase("commit", len(target_types)):
+            t.Commit()
+
+    updated = [tp for tp in target_types if tp.Id not in missing]
+    messages = ["{} type(s) bijgewerkt{}.".format(
+        len(updated),
+        " ({} instantie(s))".format(sum(instance_count.get(tp.Id, 0) for tp in updated)) if instance_count else "")]
+    for element_type in sorted(target_types, key=type_label):
+        if element_type.Id in missing:
+            count = instance_count.get(element_type.Id)
+            messages.append("Type '{}'{}: ontbrekende parameter(s): {}.".format(
+                type_label(element_type),
+                " ({} object(en))".format(count) if count else "",
+                ", ".join(missing[element_type.Id])))
+    icon = MessageBoxIcon.Error if missing else MessageBoxIcon.Information
+    MessageBox.Show("\n".join(messages), "Copy Parameters to Parameters From/To | Scholten BIM Consultancy", MessageBoxButtons.OK, icon)
 except OperationCanceledException:
     MessageBox.Show("De gebruiker heeft de actie gestopt.", "Copy Parameters to Parameters From/To | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Information)
 finally:
-    if t is not None and t.HasStarted():
-        t.RollBack()
-
+    if t is not None and t.HasStarted() and not t.HasEnded():
+        t.RollBack()
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 __title__ = "Copy Parameters to Parameters From Link"
 __author__ = "Scholten BIM Consultancy"
-__doc__ = """Version   = 1.2
+__doc__ = """Version   = 1.6
 Datum    = 20.12.2024 
 __________________________________________________________________
 Description:
@@ -10,13 +10,20 @@ SHIFT-CLICK to display options.
 
 Met deze tool kan je parameters van een object uit een link kopieren naar een object uit je huidige model.
 Houdt de Shift knop ingedrukt bij het uitvoeren van deze actie en je kan de uit te lezen en weg te schrijven parameters aanpassen.
+Met "Automatisch op overlap" zoekt de tool per geselecteerd element zelf het element uit de link dat het omsluit
+of er het meest mee overlapt (bijv. het brandcompartiment of de ruimte waar een klep in staat).
 __________________________________________________________________
 How-to:
 
 -> Run het script.
+-> Kies "Eén element kiezen" om één element uit de link te selecteren, of "Automatisch op overlap".
 __________________________________________________________________
 Last update:
 
+- [18.10.2026] - 1.6 Automatisch op overlap: waarden omgezet naar het type van de doelparameter; alleen-lezen parameters en geweigerde waarden worden gemeld.
+- [18.10.2026] - 1.5 Instellingen per gebruiker en per project in plaats van een gedeelde config.json in de extensie.
+- [18.10.2026] - 1.4 Automatisch op overlap: gegevens van ongewijzigde links komen uit de linkcache
+- [18.10.2026] - 1.3 Modus "Automatisch op overlap": koppelt elk element aan het omsluitende element uit de link via een ruimtelijke index
 - [11.02.2025] - 1.2 Icons toegevoegd aan de meldingen
 - [29.01.2025] - 1.1 Melding toegevoegd voor lege parameterwaarde en script stopt. Waarde altijd omgezet naar string.
 - [20.12.2024] - 1.0 RELEASE
@@ -29,7 +36,6 @@ __________________________________________________________________
 
 import clr
 import os
-import json
 import sys
 clr.AddReference('RevitAPI')
 clr.AddReference('RevitServices')
@@ -44,14 +50,25 @@ from RevitServices.Transactions import TransactionManager
 from System.Drawing import Icon
 from System.Windows.Forms import Application, Form, Label, TextBox, Button, MessageBox, Keys, Control, FormBorderStyle, DialogResult, FormStartPosition, MessageBox, MessageBoxButtons, DialogResult, MessageBoxIcon
 from pyrevit import forms
+from scholtenbim import batch, configstore, linkcache, linkedrooms, paramcache, paramrules, spatialindex
 
 # Actief document en view ophalen
 doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
 active_view = doc.ActiveView
 
+# Instellingen van deze knop (Shift-klik); config.json naast het script geldt alleen nog als standaard
+TOOL = "CopyParameterLink"
+DEFAULT_CONFIG = {"read_param": "Comments", "write_param": ["Mark"]}
 config_file_path = os.path.join(os.path.dirname(__file__), 'config.json')
 
+TITLE = "Copy Parameters to Parameters From Link | Scholten BIM Consultancy"
+MODE_PICK = "Eén element kiezen"
+MODE_OVERLAP = "Automatisch op overlap"
+CHUNK_SIZE = 500
+# Zoveel elementen zonder overlap worden bij naam genoemd in de melding.
+MAX_LISTED = 25
+
 def get_linked_element(doc, ref):
     link_instance = doc.GetElement(ref)
     if isinstance(link_instance, RevitLinkInstance):
@@ -60,15 +77,98 @@ def get_linked_element(doc, ref):
         return link_doc.GetElement(link_element_id)
     return None
 
+def choose_link():
+    links = linkedrooms.loaded_links(doc)
+    if not links:
+        MessageBox.Show("Er zijn geen geladen links in dit model.", TITLE, MessageBoxButtons.OK, MessageBoxIcon.Error)
+        return None
+    if len(links) == 1:
+        return links[0]
+    links_by_name = dict((link.Name, link) for link in links)
+    link_name = forms.SelectFromList.show(sorted(links_by_name), title="Selecteer de link om uit te lezen", button_name="Selecteer")
+    return links_by_name.get(link_name)
+
+def category_name(element):
+    return element.Category.Name if element.Category else "N/A"
+
+def missing_elements_report(invalid_elements):
+    # Elementen die de parameter niet bevatten, gegroepeerd per parameter
+    missing_elements_info = ""
+    for param, elements in invalid_elements.items():
+        if elements:
+            elements_info = "\n".join(["• {} (ID: {})".format(name, element_id) for name, element_id in elements])
+            missing_elements_info += "Parameter '{}':\n{}\n\n".format(param, elements_info)
+    return missing_elements_info
+
+def copy_by_overlap(read_param_name, write_param_names):
+    """Per hostelement de waarde van het omsluitende (of meest overlappende) element uit de link overnemen."""
+    link = choose_link()
+    if link is None:
+        sys.exit()
+
+    MessageBox.Show("Selecteer één of meerdere elementen om de parameters naar te schrijven. Per element wordt het element uit '{}' gezocht dat het omsluit of er het meest mee overlapt.".format(link.Name), TITLE, MessageBoxButtons.OK, MessageBoxIcon.Question)
+    try:
+        selected_refs = uidoc.Selection.PickObjects(ObjectType.Element, "Selecteer meerdere elementen om de parameters naar te schrijven.")
+    except OperationCanceledException:
+        MessageBox.Show("De bewerking is onderbroken door de gebruiker.", TITLE, MessageBoxButtons.OK, MessageBoxIcon.Warning)
+        sys.exit()
+    target_elements = [doc.GetElement(ref.ElementId) for ref in selected_refs]
+
+    # Alleen elementen uit de link met een waarde voor de uit te lezen parameter komen in de index.
+    # Bounding boxes en waarden komen uit de linkcache zolang de link niet gewijzigd is.
+    cache = linkcache.LinkMetadataCache()
+    records = cache.records(link.GetLinkDocument(), parameters=[read_param_name])
+    cache.close()
+    link_values = dict((record.id, record.parameters.get(read_param_name)) for record in records.values()
+                       if record.bbox and record.parameters.get(read_param_name))
+    boxes = [(element_id, spatialindex.Box(records[element_id].bbox[:3], records[element_id].bbox[3:])) for element_id in link_values]
+    index = spatialindex.LinkedElementIndex(link, boxes=boxes)
+
+    resolver = paramcache.ParameterResolver()
+    invalid_elements = {param: [] for param in write_param_names}
+    matched, unmatched, writes = 0, [], []
+    for target_element in target_elements:
+        source_id = index.best_key(target_element.get_BoundingBox(None))
+        if source_id is None:
+            unmatched.append(target_element)
+            continue
+        matched += 1
+        # Ontbrekende en alleen-lezen parameters direct melden; de rest omgezet naar het type van de parameter wegschrijven
+        for write_param_name, write_param in zip(write_param_names, resolver.get_many(target_element, write_param_names)):
+            if write_param is None or write_param.IsReadOnly:
+                invalid_elements[write_param_name].append((category_name(target_element), target_element.Id))
+            else:
+                writes.append((target_element, write_param, link_values[source_id]))
+
+    result = batch.write_parameters(doc, "Copy Parameters to Parameters From Link", writes, chunk_size=CHUNK_SIZE,
+                                    title="Parameters uit link overnemen", ask_keep_on_cancel=False,
+                                    setter=paramrules.set_parameter_text)
+    if result.cancelled:
+        MessageBox.Show("De bewerking is onderbroken door de gebruiker. Er is niets aangepast.", TITLE, MessageBoxButtons.OK, MessageBoxIcon.Warning)
+        sys.exit()
+
+    message = "{} van {} element(en) gekoppeld aan een element uit '{}'.".format(matched, len(target_elements), link.Name)
+    if unmatched:
+        unmatched_info = "\n".join(["• {} (ID: {})".format(category_name(e), e.Id) for e in unmatched[:MAX_LISTED]])
+        if len(unmatched) > MAX_LISTED:
+            unmatched_info += "\n• ... en nog {}".format(len(unmatched) - MAX_LISTED)
+        message += "\n\nGeen element met een waarde voor '{}' gevonden voor (niet aangepast):\n{}".format(read_param_name, unmatched_info)
+    if result.failures:
+        failed_ids = set(element.Id for (element, _, _), _ in result.failures)
+        (_, param, value), error = result.failures[0]
+        message += "\n\n{} element(en) konden niet (volledig) worden aangepast, bijv. '{}' = '{}': {}".format(
+            len(failed_ids), param.Definition.Name, value, error)
+    missing_elements_info = missing_elements_report(invalid_elements)
+    if missing_elements_info:
+        message += "\n\nDe volgende elementen bevatten de parameter(s) niet (of alleen-lezen):\n\n{}".format(missing_elements_info)
+    icon = MessageBoxIcon.Warning if unmatched or result.failures or missing_elements_info else MessageBoxIcon.Information
+    MessageBox.Show(message, TITLE, MessageBoxButtons.OK, icon)
+
 def load_config():
-    if os.path.exists(config_file_path):
-        with open(config_file_path, 'r') as f:
-            return json.load(f)
-    return {"read_param": "Comments", "write_param": ["Mark"]}
+    return configstore.load(TOOL, doc, default=DEFAULT_CONFIG, defaults_file=config_file_path)
 
 def save_config(config):
-    with open(config_file_path, 'w') as f:
-        json.dump(config, f)
+    configstore.save(TOOL, config, doc)
 
 config = load_config()
 
@@ -130,6 +230,13 @@ try:
             MessageBox.Show("Geen parameters gevonden in het configuratiebestand. Voer het script opnieuw uit met Shift ingedrukt om parameters in te stellen.", "Copy Parameters to Parameters From Link | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Error)
             sys.exit()
 
+        mode = forms.alert("Hoe moet het element uit de link gekozen worden?", title=TITLE, options=[MODE_PICK, MODE_OVERLAP])
+        if not mode:
+            sys.exit()
+        if mode == MODE_OVERLAP:
+            copy_by_overlap(read_param_name, write_param_names)
+            sys.exit()
+
         # Stap 1: Selecteer een element om uit te lezen
         MessageBox.Show("Selecteer een element uit een link om uit te lezen.", "Copy Parameters to Parameters From Link | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Question)
         try:
@@ -172,16 +279,11 @@ try:
                     if write_param:
                         write_param.Set(read_value)
                     else:
-                        category_name = target_element.Category.Name if target_element.Category else "N/A"
-                        invalid_elements[write_param_name].append((category_name, target_element.Id))
+                        invalid_elements[write_param_name].append((category_name(target_element), target_element.Id))
             t.Commit()
 
         # Toon een MessageBox met de elementen die de parameter niet bevatten, gegroepeerd per parameter
-        missing_elements_info = ""
-        for param, elements in invalid_elements.items():
-            if elements:
-                elements_info = "\n".join(["• {} (ID: {})".format(category_name, id) for category_name, id in elements])
-                missing_elements_info += "Parameter '{}':\n{}\n\n".format(param, elements_info)
+        missing_elements_info = missing_elements_report(invalid_elements)
 
         if missing_elements_info:
             MessageBox.Show("De volgende elementen bevatten de parameter(s) niet:\n\n{}".format(missing_elements_info), "Copy Parameters to Parameters From Link | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Warning)
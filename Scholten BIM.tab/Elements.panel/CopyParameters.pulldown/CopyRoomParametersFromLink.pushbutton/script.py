@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+__title__ = "Copy Room Parameters From Link"
+__author__ = "Scholten BIM Consultancy"
+__doc__ = """Version   = 1.3
+Datum    = 18.10.2026
+__________________________________________________________________
+Description:
+SHIFT-CLICK to display options.
+
+Met deze tool kan je parameters van rooms (of spaces) uit een link, bijvoorbeeld het nummer en de naam,
+in 1x wegschrijven naar alle elementen in je huidige model die in die room staan.
+Elementen boven het plafond (tot het volgende level) horen bij de room eronder.
+Houdt de Shift knop ingedrukt bij het uitvoeren van deze actie en je kan de uit te lezen en weg te schrijven parameters aanpassen.
+__________________________________________________________________
+How-to:
+
+-> Shift-klik: kies de link, de room-parameters en per parameter de parameter om naar te schrijven.
+-> Run het script en kies de link en de selectie, de actieve view of het hele model.
+__________________________________________________________________
+Last update:
+
+- [18.10.2026] - 1.3 Waarden omgezet naar het type van de doelparameter; geweigerde waarden worden gemeld in plaats van als aangepast geteld.
+- [18.10.2026] - 1.2 Instellingen per gebruiker en per project in plaats van een gedeelde config.json in de extensie.
+- [18.10.2026] - 1.1 Selectie via een collector op de geselecteerde ids.
+- [18.10.2026] - 1.0 RELEASE
+__________________________________________________________________
+To-do:
+
+-
+__________________________________________________________________
+"""
+
+import clr
+import os
+import sys
+clr.AddReference('RevitAPI')
+clr.AddReference('System.Windows.Forms')
+
+from Autodesk.Revit.DB import BuiltInCategory, CategoryType, ElementId, FilteredElementCollector
+from System.Windows.Forms import Control, Keys, MessageBox, MessageBoxButtons, MessageBoxIcon
+from pyrevit import forms
+
+from scholtenbim import batch, configstore, linkedrooms, paramcache, paramrules, roomcontainment, selection
+
+doc = __revit__.ActiveUIDocument.Document
+uidoc = __revit__.ActiveUIDocument
+
+# Instellingen van deze knop (Shift-klik); config.json naast het script geldt alleen nog als standaard
+TOOL = "CopyRoomParametersFromLink"
+config_file_path = os.path.join(os.path.dirname(__file__), 'config.json')
+
+TITLE = "Copy Room Parameters From Link | Scholten BIM Consultancy"
+SCOPE_SELECTION = "Selectie"
+SCOPE_VIEW = "Actieve view"
+SCOPE_MODEL = "Hele model"
+CHUNK_SIZE = 500
+# Deze categorieën krijgen zelf geen room-gegevens.
+EXCLUDED_CATEGORIES = [ElementId(BuiltInCategory.OST_Rooms), ElementId(BuiltInCategory.OST_MEPSpaces),
+                       ElementId(BuiltInCategory.OST_RvtLinks)]
+
+
+def load_config():
+    return configstore.load(TOOL, doc, default={"read_param": [], "write_param": []}, defaults_file=config_file_path)
+
+
+def save_config(config):
+    configstore.save(TOOL, config, doc)
+
+
+def choose_link():
+    links = linkedrooms.loaded_links(doc)
+    if not links:
+        MessageBox.Show("Er zijn geen geladen links in dit model.", TITLE, MessageBoxButtons.OK, MessageBoxIcon.Error)
+        return None
+    if len(links) == 1:
+        return links[0]
+    links_by_name = dict((link.Name, link) for link in links)
+    link_name = forms.SelectFromList.show(sorted(links_by_name), title="Selecteer de link met de rooms", button_name="Selecteer")
+    return links_by_name.get(link_name)
+
+
+def configure(link):
+    footprints = roomcontainment.room_footprints(link)
+    if not footprints:
+        MessageBox.Show("Geen geplaatste rooms of spaces gevonden in '{}'.".format(link.Name), TITLE, MessageBoxButtons.OK, MessageBoxIcon.Error)
+        sys.exit()
+    param_names = sorted(set(param.Definition.Name for param in footprints[0].room.Parameters))
+    read_param_names = forms.SelectFromList.show(param_names, title="Selecteer de room-parameters om uit te lezen", button_name="Selecteer", multiselect=True)
+    if not read_param_names:
+        sys.exit()
+    write_param_names = []
+    for read_param_name in read_param_names:
+        write_param_name = forms.ask_for_string(default=read_param_name, prompt="Naar welke parameter moet '{}' geschreven worden?".format(read_param_name), title=TITLE)
+        if not write_param_name:
+            sys.exit()
+        write_param_names.append(write_param_name.strip())
+    save_config({"read_param": read_param_names, "write_param": write_param_names})
+    MessageBox.Show("Parameters opgeslagen. Voer het script opnieuw uit zonder Shift ingedrukt te houden.", TITLE, MessageBoxButtons.OK, MessageBoxIcon.Information)
+
+
+def collect_targets(scope):
+    if scope == SCOPE_SELECTION:
+        collector = selection.collector(doc, uidoc.Selection.GetElementIds())
+        elements = collector.WhereElementIsNotElementType() if collector is not None else []
+    elif scope == SCOPE_VIEW:
+        elements = FilteredElementCollector(doc, doc.ActiveView.Id).WhereElementIsNotElementType()
+    else:
+        elements = FilteredElementCollector(doc).WhereElementIsNotElementType().WhereElementIsViewIndependent()
+    return [element for element in elements
+            if element is not None and element.Category is not None
+            and element.Category.CategoryType == CategoryType.Model
+            and element.Category.Id not in EXCLUDED_CATEGORIES]
+
+
+def room_values(footprint, read_param_names):
+    params = [footprint.room.LookupParameter(name) for name in read_param_names]
+    return [(param.AsString() or param.AsValueString() or "") if param else None for param in params]
+
+
+config = load_config()
+
+if (Control.ModifierKeys & Keys.Shift) == Keys.Shift:
+    link = choose_link()
+    if link is not None:
+        configure(link)
+    sys.exit()
+
+read_param_names = config.get("read_param", [])
+write_param_names = config.get("write_param", [])
+if not read_param_names or len(read_param_names) != len(write_param_names):
+    MessageBox.Show("Geen parameters gevonden in het configuratiebestand. Voer het script opnieuw uit met Shift ingedrukt om parameters in te stellen.", TITLE, MessageBoxButtons.OK, MessageBoxIcon.Error)
+    sys.exit()
+
+link = choose_link()
+if link is None:
+    sys.exit()
+
+scopes = [SCOPE_VIEW, SCOPE_MODEL]
+if list(uidoc.Selection.GetElementIds()):
+    scopes.insert(0, SCOPE_SELECTION)
+scope = forms.alert("Welke elementen moeten de gegevens van hun room krijgen?", title=TITLE, options=scopes)
+if not scope:
+    sys.exit()
+
+footprints = roomcontainment.room_footprints(link)
+if not footprints:
+    MessageBox.Show("Geen geplaatste rooms of spaces gevonden in '{}'.".format(link.Name), TITLE, MessageBoxButtons.OK, MessageBoxIcon.Error)
+    sys.exit()
+
+# Elk element aan zijn room koppelen; IsPointInRoom alleen voor rooms in de buurt
+points = roomcontainment.element_points(collect_targets(scope))
+containment = roomcontainment.RoomContainment(footprints)
+assigned = containment.assign(points)
+
+values_by_room = {}
+resolver = paramcache.ParameterResolver()
+missing_counts = dict((name, 0) for name in write_param_names)
+writes = []
+for i, footprint in assigned.items():
+    if footprint.linked.id not in values_by_room:
+        values_by_room[footprint.linked.id] = room_values(footprint, read_param_names)
+    element = points[i][0]
+    # Ontbrekende en alleen-lezen parameters direct tellen; de rest omgezet naar het type van de parameter wegschrijven
+    for write_param_name, write_param, value in zip(write_param_names, resolver.get_many(element, write_param_names),
+                                                    values_by_room[footprint.linked.id]):
+        if write_param is None or write_param.IsReadOnly:
+            missing_counts[write_param_name] += 1
+        elif value is not None:
+            writes.append((element, write_param, value))
+
+result = batch.write_parameters(doc, "Copy Room Parameters From Link", writes, chunk_size=CHUNK_SIZE,
+                                title="Room-gegevens wegschrijven", ask_keep_on_cancel=False,
+                                setter=paramrules.set_parameter_text)
+if result.cancelled:
+    MessageBox.Show("De bewerking is onderbroken door de gebruiker. Er is niets aangepast.", TITLE, MessageBoxButtons.OK, MessageBoxIcon.Warning)
+    sys.exit()
+
+lines = ["{} van {} element(en) liggen in een room uit '{}' ({} rooms).".format(len(assigned), len(points), link.Name, len(values_by_room))]
+if len(points) > len(assigned):
+    lines.append("{} element(en) liggen niet in een room en zijn niet aangepast.".format(len(points) - len(assigned)))
+for write_param_name in write_param_names:
+    if missing_counts[write_param_name]:
+        lines.append("Parameter '{}' ontbreekt of is alleen-lezen bij {} element(en).".format(write_param_name, missing_counts[write_param_name]))
+if result.failures:
+    failed_ids = set(element.Id for (element, _, _), _ in result.failures)
+    (_, param, value), error = result.failures[0]
+    lines.append("{} element(en) konden niet (volledig) worden aangepast, bijv. '{}' = '{}': {}".format(
+        len(failed_ids), param.Definition.Name, value, error))
+icon = MessageBoxIcon.Warning if result.failures or any(missing_counts.values()) else MessageBoxIcon.Information
+MessageBox.Show("\n".join(lines), TITLE, MessageBoxButtons.OK, icon)
@@ -33,6 +33,7 @@ clr.AddReference('System.Windows.Forms')
 clr.AddReference('System.Drawing')
 from Autodesk.Revit.DB import *
 from RevitServices.Persistence import DocumentManager
+from scholtenbim import docindex
 from System.Windows.Forms import Application, Form, Button, ComboBox, Label, MessageBox, MessageBoxButtons, MessageBoxIcon, MessageBoxOptions, MessageBoxDefaultButton, GroupBox
 from System.Drawing import Point, Size
 import System
@@ -94,11 +95,8 @@ class LineStyleForm(Form):
         self.load_line_styles()
 
     def load_line_styles(self):
-        line_styles = FilteredElementCollector(doc).OfClass(GraphicsStyle).ToElements()
-        unique_styles = {style.Name: style for style in line_styles}
-        sorted_styles = sorted(unique_styles.values(), key=lambda x: x.Name)
-        for style in sorted_styles:
-            self.comboBox.Items.Add(style.Name)
+        for style_name in docindex.get_index(doc).graphics_style_names():
+            self.comboBox.Items.Add(style_name)
         self.comboBox.SelectedItem = "<Invisible lines>"
 
     def on_apply_button_click(self, sender, event):
@@ -107,12 +105,7 @@ class LineStyleForm(Form):
             return
 
         selected_style_name = self.comboBox.SelectedItem
-        invisible_line_style = None
-        line_styles = FilteredElementCollector(doc).OfClass(GraphicsStyle).ToElements()
-        for style in line_styles:
-            if style.Name == selected_style_name:
-                invisible_line_style = style
-                break
+        invisible_line_style = docindex.get_index(doc).graphics_style(selected_style_name)
 
         if invisible_line_style is None:
             MessageBox.Show("LineStyle '{}' niet gevonden.".format(selected_style_name), "Change LineStyle | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Error)
@@ -2,7 +2,7 @@
 
 __title__ = "Change dimension offset"
 __author__ = "Scholten BIM Consultancy"
-__doc__ = """Version   = 1.2
+__doc__ = """Version   = 1.3
 Datum    = 12.05.2025
 __________________________________________________________________
 Description:
@@ -19,6 +19,7 @@ How-to:
 __________________________________________________________________
 Last update:
 
+- [18.10.2026] - 1.3 Afstand per gebruiker en per project bewaard, alleen opgeslagen bij OK en als de waarde verandert.
 - [12.05.2025] - 1.2 Hij past nu juist de dimensions in een section aan.
 - [25.02.2025] - 1.1 Het is nu ook mogelijk om de dimensions in een section aan te passen.
 - [14.02.2025] - 1.0 RELEASE
@@ -35,13 +36,13 @@ clr.AddReference('RevitAPI')
 clr.AddReference('RevitServices')
 clr.AddReference('System.Windows.Forms')
 clr.AddReference('System.Drawing')
-import json
 import os
 import sys
 from Autodesk.Revit.DB import *
 from Autodesk.Revit.UI import *
 from RevitServices.Persistence import DocumentManager
 from System.Windows.Forms import Form, Label, TextBox, Button, DialogResult, MessageBox, MessageBoxIcon, MessageBoxButtons
+from scholtenbim import configstore
 
 # Actief document en view ophalen
 doc = __revit__.ActiveUIDocument.Document
@@ -49,6 +50,11 @@ uidoc = __revit__.ActiveUIDocument
 
 view_direction = doc.ActiveView.ViewDirection
 
+# Instellingen van deze knop (Shift-klik); config.json naast het script geldt alleen nog als standaard
+TOOL = "Dimensions"
+DEFAULT_DISTANCE = 4
+config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config.json")
+
 # Functie om de schaal van de actieve view uit te lezen
 def get_active_view_scale(doc):
     active_view = doc.ActiveView
@@ -75,7 +81,7 @@ class DistanceForm(Form):
         self.textBox.Top = 50
         self.textBox.Left = 20
         self.textBox.Width = 100
-        self.textBox.Text = "4"  # Default waarde instellen op 4 mm
+        self.textBox.Text = str(load_distance_value() or DEFAULT_DISTANCE)  # Huidige waarde, anders 4 mm
         self.Controls.Add(self.textBox)
 
         self.apply_button = Button()
@@ -92,16 +98,12 @@ class DistanceForm(Form):
         self.cancel_button.Click += self.on_cancel_button_click
         self.Controls.Add(self.cancel_button)
 
-        # Event afvangen bij sluiten van het formulier
-        self.FormClosing += self.on_form_closing
-
     def on_apply_button_click(self, sender, event):
         try:
             self.distance_value = float(self.textBox.Text)
         except ValueError:
             MessageBox.Show("Ongeldige invoer. De standaardwaarde van 4 mm wordt gebruikt.", "Change dimension offset | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Error)
-            self.distance_value = 4
-        save_distance_value(self.distance_value)  # Sla altijd de waarde op
+            self.distance_value = DEFAULT_DISTANCE
         self.DialogResult = DialogResult.OK
         self.Close()
 
@@ -110,27 +112,14 @@ class DistanceForm(Form):
         self.DialogResult = DialogResult.Cancel
         self.Close()
 
-    def on_form_closing(self, sender, event):
-        save_distance_value(4)  # Sla de standaardwaarde op als het formulier wordt gesloten
-
-# Functie om de afstandswaarde op te slaan in config.json in dezelfde directory als het script
+# Functie om de afstandswaarde op te slaan in het gebruikers-/projectprofiel (alleen als hij verandert)
 def save_distance_value(value):
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    config_path = os.path.join(script_dir, "config.json")
-    config = {"distance_value": value}
-    with open(config_path, "w") as f:
-        json.dump(config, f)
+    configstore.save(TOOL, {"distance_value": value}, doc)
 
-# Functie om de afstandswaarde te laden uit config.json in dezelfde directory als het script
+# Functie om de afstandswaarde te laden uit het gebruikers-/projectprofiel of de meegeleverde config.json
 def load_distance_value():
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    config_path = os.path.join(script_dir, "config.json")
-    if os.path.exists(config_path):
-        with open(config_path, "r") as f:
-            config = json.load(f)
-            return config.get("distance_value", None)
-    else:
-        return None
+    config = configstore.load(TOOL, doc, default={}, defaults_file=config_path)
+    return config.get("distance_value", None)
 
 # Functie om te controleren of een dimensie horizontaal is
 def is_horizontal(dimension, view_type, view_direction):
@@ -161,13 +150,10 @@ if shift_pressed:
     if form.ShowDialog() == DialogResult.OK:
         distance_value = form.distance_value
         save_distance_value(distance_value)
-    else:
-        MessageBox.Show("Ongeldige invoer. De standaardwaarde van 4 mm wordt gebruikt.", "Change dimension offset | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Warning)
-        distance_value = 4  # Default waarde van 4 mm
 else:
     distance_value = load_distance_value()
     if distance_value is None:
-        MessageBox.Show("Geen geldige afstandswaarde gevonden in config.json. Script wordt beëindigd.", "Change dimension offset | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Warning)
+        MessageBox.Show("Geen geldige afstandswaarde ingesteld. Script wordt beëindigd.", "Change dimension offset | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Warning)
         sys.exit()
 
     selected_element_ids = uidoc.Selection.GetElementIds()
@@ -2,19 +2,30 @@
 
 __title__ = "Get Linked Id's"
 __author__ = "Scholten BIM Consultancy"
-__doc__ = """Version   = 1.2
+__doc__ = """Version   = 1.8
 Datum    = 10.11.2025
 __________________________________________________________________
 Description:
+SHIFT-CLICK to display options.
 
 Met deze tool kan je element id's uitlezen van gelinkte elementen.
+Ook te exporteren naar CSV of JSON Lines (categorie, familie/type, linked file, ID, UniqueId en extra parameters),
+bijvoorbeeld voor clash detection.
 __________________________________________________________________
 How-to:
 
--> Run het script.
+-> Run het script en selecteer de gelinkte elementen.
+-> Knop 'Exporteren...': de geselecteerde elementen naar een bestand.
+-> Shift-klik: hele categorieën uit een of meer links exporteren, zonder te selecteren.
 __________________________________________________________________
 Last update:
 
+- [18.10.2026] - 1.8 Shift-klik: parameters eerst vragen, zodat elke link maar één keer wordt uitgelezen.
+- [18.10.2026] - 1.7 Laden op de achtergrond houdt de selectie en scrollpositie vast bij filteren, sorteren of groeperen.
+- [18.10.2026] - 1.6 Tijdmetingen (venster, export) in het timing-log.
+- [18.10.2026] - 1.5 Export naar CSV/JSON Lines; met Shift-klik hele categorieën uit links.
+- [18.10.2026] - 1.4 Lijst gevirtualiseerd: snel bij duizenden elementen, met sorteren (klik op kolomkop), filteren en groeperen.
+- [18.10.2026] - 1.3 Categorie en familie/type uit de linkcache; ongewijzigde links worden niet opnieuw uitgelezen.
 - [10.11.2025] - 1.2 GUI verbeterd met kopieer functies.
 - [07.04.2025] - 1.1 Toevoeging uitlezen welk linked file het betreft.
 - [31.03.2025] - 1.0 RELEASE
@@ -26,89 +37,139 @@ __________________________________________________________________
 """
 
 import clr
+import os
+import sys
 clr.AddReference('PresentationFramework')
 clr.AddReference('WindowsBase')
 
 from Autodesk.Revit.DB import RevitLinkInstance, BuiltInParameter
 from Autodesk.Revit.UI.Selection import ObjectType
-from pyrevit import script
+from pyrevit import forms, script
 from pyrevit.forms import WPFWindow
-from System.Windows import Clipboard, Thickness, TextWrapping, HorizontalAlignment, GridLength
+from System import TimeSpan
+from System.Collections.ObjectModel import ObservableCollection
+from System.Windows import Clipboard, Thickness, RoutedEventHandler
+from System.Windows.Controls import GridViewColumnHeader
 from System.Windows.Controls.Primitives import Popup, PlacementMode
-from System.Windows.Threading import DispatcherTimer
-from System.Windows.Forms import MessageBox, MessageBoxButtons, MessageBoxIcon
+from System.Windows.Data import CollectionViewSource, PropertyGroupDescription
+from System.Windows.Threading import DispatcherTimer, DispatcherPriority
+from System.Windows.Forms import Control, Keys, MessageBox, MessageBoxButtons, MessageBoxIcon
 import traceback
 
+from scholtenbim import batch, linkcache, linkedexport, linkedids, linkedrooms, timing
+
 doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
+timings = timing.Timer("Linked IDs", doc)
+
+TITLE = "Linked IDs \n Scholten BIM Consultancy"
+CSV = "CSV (.csv)"
+JSONL = "JSON Lines (.jsonl)"
+# Zoveel elementen per keer uit de linkcache halen
+ROW_CHUNK = 500
+GROUP_OPTIONS = [("Geen", None), ("Categorie", "Category"), ("Linked file", "LinkedFile")]
+COLUMNS_BY_LABEL = dict((label, column) for column, label in linkedids.COLUMN_LABELS.items())
 
 class LinkedIdsWindow(WPFWindow):
-    def __init__(self, xaml_path, element_infos):
+    def __init__(self, xaml_path, loader, export=None):
         WPFWindow.__init__(self, xaml_path)
-        for i, (info_text, element_id, parts) in enumerate(element_infos):
-            self.add_element_info(parts, element_id, i)
+        self.loader = loader
+        self.export = export
+        self.rows = []
+        self.sort_by = None
+        self.descending = False
+        self.items = ObservableCollection[object]()
+        self.list_rows.ItemsSource = self.items
+
+        for label, _ in GROUP_OPTIONS:
+            self.combo_group.Items.Add(label)
+        self.combo_group.SelectedIndex = 0
+        self.txt_filter.TextChanged += self.filter_changed
+        self.combo_group.SelectionChanged += self.group_changed
+        self.list_rows.AddHandler(GridViewColumnHeader.ClickEvent, RoutedEventHandler(self.header_click))
+
         self.btn_close.Click += self.close_action
+        self.btn_copy_selected.Click += self.copy_selected_action
+        self.btn_copy_selected_ids.Click += self.copy_selected_ids_action
         self.btn_copy_by_category.Click += self.copy_by_category_action
         self.btn_copy_by_linkedfile.Click += self.copy_by_linkedfile_action
         self.btn_copy_all.Click += self.copy_all_action
-        self.element_infos = element_infos
-
-    def add_element_info(self, parts, element_id, index):
-        from System.Windows.Controls import Grid, ColumnDefinition, TextBlock, Button, StackPanel, Orientation
-        from System.Windows.Media import Brushes
-
-        panel = Grid(Margin=Thickness(0, 3, 0, 3))
-        panel.ColumnDefinitions.Add(ColumnDefinition())
-        panel.ColumnDefinitions.Add(ColumnDefinition(Width=GridLength(220)))
-        base_color = Brushes.WhiteSmoke if index % 2 == 1 else Brushes.Transparent
-        panel.Background = base_color
-
-        def on_hover(sender, args): sender.Background = Brushes.LightGray
-        def on_leave(sender, args): sender.Background = base_color
-        panel.MouseEnter += on_hover
-        panel.MouseLeave += on_leave
-
-        tb = TextBlock(TextWrapping=TextWrapping.Wrap, Width=500)
-        tb.Inlines.Add(self._make_inline("Category: ", bold=True))
-        tb.Inlines.Add(self._make_inline(parts["Category"] + "\n"))
-        tb.Inlines.Add(self._make_inline("Family: ", bold=True))
-        tb.Inlines.Add(self._make_inline(parts["Family"] + "\n"))
-        tb.Inlines.Add(self._make_inline("Linked File: ", bold=True))
-        tb.Inlines.Add(self._make_inline(parts["Linked File"] + "\n"))
-        tb.Inlines.Add(self._make_inline("ID: ", bold=True))
-        tb.Inlines.Add(self._make_inline(str(parts["ID"])))
-        Grid.SetColumn(tb, 0)
-
-        btn_copy_line = Button(Content="Kopieer regel", Width=100, Height=30)
-        def copy_line(sender, args):
-            Clipboard.SetText(
-                "Category: {0}\nFamily: {1}\nLinked File: {2}\nID: {3}".format(
-                    parts["Category"], parts["Family"], parts["Linked File"], parts["ID"]
-                )
-            )
-            self.show_temporary_popup("Regel gekopieerd!", sender)
-
-        btn_copy_id = Button(Content="Kopieer ID", Width=100, Height=30)
-        def copy_id(sender, args):
-            Clipboard.SetText(str(parts["ID"]))
-            self.show_temporary_popup("ID gekopieerd!", sender)
-
-        btn_copy_line.Click += copy_line
-        btn_copy_id.Click += copy_id
-
-        btn_panel = StackPanel(Orientation=Orientation.Horizontal, HorizontalAlignment=HorizontalAlignment.Right)
-        btn_panel.Children.Add(btn_copy_line)
-        btn_panel.Children.Add(btn_copy_id)
-        Grid.SetColumn(btn_panel, 1)
-
-        panel.Children.Add(tb)
-        panel.Children.Add(btn_panel)
-        self.elementList.Children.Add(panel)
+        self.btn_export.Click += self.export_action
+
+        # Eerste rijen direct tonen, de rest op de achtergrond laden
+        self.timer = DispatcherTimer(DispatcherPriority.Background)
+        self.timer.Interval = TimeSpan.FromMilliseconds(1)
+        self.timer.Tick += self.load_tick
+        if self.load_next():
+            self.timer.Start()
+
+    @property
+    def group_by(self):
+        index = self.combo_group.SelectedIndex
+        return GROUP_OPTIONS[index][1] if 0 <= index < len(GROUP_OPTIONS) else None
+
+    @property
+    def filter_text(self):
+        return self.txt_filter.Text or ""
+
+    def load_next(self):
+        """Volgend blok rijen laden; False als alles geladen is."""
+        rows = self.loader.next_batch()
+        self.rows.extend(rows)
+        if self.sort_by or self.group_by or self.filter_text.strip():
+            # Alleen de nieuwe rijen invoegen: opnieuw opbouwen wist de selectie en de scrollpositie
+            linkedids.insert_arranged(self.items, rows, self.filter_text, self.sort_by, self.descending, self.group_by)
+        else:
+            for row in rows:
+                self.items.Add(row)
+        self.update_count()
+        return not self.loader.done
+
+    def load_all(self):
+        while self.load_next():
+            pass
+        self.timer.Stop()
+
+    def load_tick(self, sender, args):
+        if not self.load_next():
+            self.timer.Stop()
+
+    def refresh(self):
+        arranged = linkedids.arrange(self.rows, self.filter_text, self.sort_by, self.descending, self.group_by)
+        # Nieuwe collectie in 1x: geen CollectionChanged-event per rij
+        self.items = ObservableCollection[object](arranged)
+        self.list_rows.ItemsSource = self.items
+        if self.group_by:
+            view = CollectionViewSource.GetDefaultView(self.items)
+            view.GroupDescriptions.Add(PropertyGroupDescription(self.group_by))
+        self.update_count()
+
+    def update_count(self):
+        text = "{0} van {1} elementen".format(self.items.Count, len(self.rows))
+        if not self.loader.done:
+            text += " (laden...)"
+        self.txt_count.Text = text
+
+    def filter_changed(self, sender, args):
+        self.refresh()
+
+    def group_changed(self, sender, args):
+        self.refresh()
+
+    def header_click(self, sender, args):
+        header = args.OriginalSource
+        if not isinstance(header, GridViewColumnHeader) or header.Column is None:
+            return
+        column = COLUMNS_BY_LABEL.get(str(header.Column.Header))
+        if column is None:
+            return
+        self.descending = not self.descending if column == self.sort_by else False
+        self.sort_by = column
+        self.refresh()
 
     def show_temporary_popup(self, message, target_button, duration_ms=1500):
         from System.Windows.Controls import TextBlock
         from System.Windows.Media import Brushes
-        import System
 
         popup = Popup()
         popup.PlacementTarget = target_button
@@ -126,53 +187,57 @@ class LinkedIdsWindow(WPFWindow):
         popup.IsOpen = True
 
         timer = DispatcherTimer()
-        timer.Interval = System.TimeSpan.FromMilliseconds(duration_ms)
+        timer.Interval = TimeSpan.FromMilliseconds(duration_ms)
         def close_popup(sender, e):
             popup.IsOpen = False
             timer.Stop()
         timer.Tick += close_popup
         timer.Start()
 
-    def copy_by_category_action(self, sender, args):
-        categories = sorted(set(info[2]["Category"] for info in self.element_infos))
+    def selected_rows(self):
+        return [row for row in self.list_rows.SelectedItems]
+
+    def copy_selected_action(self, sender, args):
+        rows = self.selected_rows()
+        if rows:
+            Clipboard.SetText("\n\n".join(row.text() for row in rows))
+            self.show_temporary_popup("{0} regel(s) gekopieerd!".format(len(rows)), sender)
+
+    def copy_selected_ids_action(self, sender, args):
+        rows = self.selected_rows()
+        if rows:
+            Clipboard.SetText(linkedids.ids_text(rows))
+            self.show_temporary_popup("{0} ID('s) gekopieerd!".format(len(rows)), sender)
+
+    def _copy_by(self, column, sender, message):
+        self.load_all()
+        values = sorted(set(getattr(row, column) for row in self.rows))
         xaml_popup = script.get_bundle_file('SelectCategory.xaml')
-        popup = SelectCategoryWindow(xaml_popup, categories)
+        popup = SelectCategoryWindow(xaml_popup, values)
         popup.ShowDialog()
         if popup.selected_category:
-            ids = [str(info[2]["ID"]) for info in self.element_infos if info[2]["Category"] == popup.selected_category]
-            if ids:
-                Clipboard.SetText(";".join(ids))
-                self.show_temporary_popup("Gekopieerd: {0} ID's voor '{1}'".format(len(ids), popup.selected_category), sender)
+            rows = [row for row in self.rows if getattr(row, column) == popup.selected_category]
+            if rows:
+                Clipboard.SetText(linkedids.ids_text(rows))
+                self.show_temporary_popup(message.format(len(rows), popup.selected_category), sender)
+
+    def copy_by_category_action(self, sender, args):
+        self._copy_by("Category", sender, "Gekopieerd: {0} ID's voor '{1}'")
 
     def copy_by_linkedfile_action(self, sender, args):
-        linked_files = sorted(set(info[2]["Linked File"] for info in self.element_infos))
-        xaml_popup = script.get_bundle_file('SelectCategory.xaml')
-        popup = SelectCategoryWindow(xaml_popup, linked_files)
-        popup.ShowDialog()
-        if popup.selected_category:
-            ids = [str(info[2]["ID"]) for info in self.element_infos if info[2]["Linked File"] == popup.selected_category]
-            if ids:
-                Clipboard.SetText(";".join(ids))
-                self.show_temporary_popup("Gekopieerd: {0} ID's voor linked file '{1}'".format(len(ids), popup.selected_category), sender)
+        self._copy_by("LinkedFile", sender, "Gekopieerd: {0} ID's voor linked file '{1}'")
 
     def copy_all_action(self, sender, args):
-        all_text = "\n\n".join(
-            "Category: {0}\nFamily: {1}\nLinked File: {2}\nID: {3}".format(
-                parts["Category"], parts["Family"], parts["Linked File"], parts["ID"]
-            ) for _, _, parts in self.element_infos
-        )
-        Clipboard.SetText(all_text)
+        self.load_all()
+        Clipboard.SetText("\n\n".join(row.text() for row in self.rows))
         self.show_temporary_popup("Alle gegevens gekopieerd!", sender)
 
-    def _make_inline(self, text, bold=False):
-        from System.Windows.Documents import Run
-        from System.Windows import FontWeights
-        run = Run(text)
-        if bold:
-            run.FontWeight = FontWeights.Bold
-        return run
+    def export_action(self, sender, args):
+        if self.export is not None:
+            self.export()
 
     def close_action(self, sender, args):
+        self.timer.Stop()
         self.Close()
 
 class SelectCategoryWindow(WPFWindow):
@@ -194,52 +259,162 @@ class SelectCategoryWindow(WPFWindow):
         self.selected_category = None
         self.Close()
 
+def iter_rows(links, selected):
+    """LinkedIdRows in de volgorde van selectie; categorie en familie/type uit de linkcache."""
+    cache = linkcache.LinkMetadataCache()
+    try:
+        for chunk in batch.chunks(selected, ROW_CHUNK):
+            ids_by_link = {}
+            for link_id, element_id in chunk:
+                ids_by_link.setdefault(link_id, []).append(element_id)
+            records = {}
+            for link_id, element_ids in ids_by_link.items():
+                records[link_id] = cache.records(links[link_id][0].GetLinkDocument(), element_ids)
+            for link_id, element_id in chunk:
+                record = records[link_id].get(element_id)
+                if record is not None:
+                    yield linkedids.LinkedIdRow(record.category, record.family_type, links[link_id][1], element_id)
+    finally:
+        cache.close()
+
+def link_name(link_instance):
+    return link_instance.get_Parameter(BuiltInParameter.ELEM_TYPE_PARAM).AsValueString()
+
+def ask_parameters():
+    """Extra parameters voor de export; None bij annuleren."""
+    text = forms.ask_for_string(default="", prompt="Extra parameters om te exporteren (gescheiden door ;). Leeg laten voor geen.", title=TITLE)
+    if text is None:
+        return None
+    return [name.strip() for name in text.split(";") if name.strip()]
+
+def ask_export_path():
+    choice = forms.alert("Gelinkte elementen exporteren als:", title=TITLE, options=[CSV, JSONL])
+    if not choice:
+        return None
+    ext = "jsonl" if choice == JSONL else "csv"
+    return forms.save_file(file_ext=ext, default_name="Linked elementen {}".format(doc.Title))
+
+def export_records(path, parameters, sources, cache=None):
+    """
+    `sources`: (link instance, element ids of None voor alle elementen, categorienamen of None).
+    Schrijft regel voor regel; geeft het aantal geëxporteerde elementen terug.
+    Met `cache` wordt een al geopende linkcache gebruikt (en niet gesloten).
+    """
+    own_cache = cache is None
+    if own_cache:
+        cache = linkcache.LinkMetadataCache()
+    try:
+        with linkedexport.LinkedElementWriter(path, parameters) as writer:
+            for link_instance, element_ids, categories in sources:
+                name = link_name(link_instance)
+                records = cache.records(link_instance.GetLinkDocument(), element_ids, parameters)
+                for element_id in (element_ids if element_ids is not None else sorted(records)):
+                    record = records.get(element_id)
+                    if record is not None and (categories is None or record.category in categories):
+                        writer.write(name, record)
+    finally:
+        if own_cache:
+            cache.close()
+    return writer.count
+
+def run_export(sources, parameters=None, cache=None):
+    if parameters is None:
+        parameters = ask_parameters()
+    if parameters is None:
+        return
+    path = ask_export_path()
+    if not path:
+        return
+    try:
+        with timings.phase("export") as phase:
+            phase.count = count = export_records(path, parameters, sources, cache)
+    except Exception as e:
+        MessageBox.Show("Exporteren is mislukt:\n{}".format(e), TITLE, MessageBoxButtons.OK, MessageBoxIcon.Error)
+        return
+    MessageBox.Show("{} element(en) geëxporteerd naar:\n{}".format(count, os.path.normpath(path)), TITLE, MessageBoxButtons.OK, MessageBoxIcon.Information)
+
+def export_selected(links, selected):
+    ids_by_link = {}
+    for link_id, element_id in selected:
+        ids_by_link.setdefault(link_id, []).append(element_id)
+    run_export([(links[link_id][0], element_ids, None) for link_id, element_ids in ids_by_link.items()])
+
+def export_categories():
+    """Hele categorieën uit een of meer links, zonder elementen te selecteren."""
+    links = linkedrooms.loaded_links(doc)
+    if not links:
+        MessageBox.Show("Er zijn geen geladen links in dit model.", TITLE, MessageBoxButtons.OK, MessageBoxIcon.Error)
+        return
+    if len(links) > 1:
+        links_by_name = dict((link.Name, link) for link in links)
+        names = forms.SelectFromList.show(sorted(links_by_name), title="Selecteer de links", button_name="Selecteer", multiselect=True)
+        if not names:
+            return
+        links = [links_by_name[name] for name in names]
+
+    # Parameters eerst: met andere parameters leest de linkcache de link opnieuw uit
+    parameters = ask_parameters()
+    if parameters is None:
+        return
+    cache = linkcache.LinkMetadataCache()
+    try:
+        categories = set()
+        for link in links:
+            categories.update(record.category for record in cache.records(link.GetLinkDocument(), None, parameters).values())
+        chosen = forms.SelectFromList.show(sorted(categories), title="Selecteer de categorieën om te exporteren", button_name="Selecteer", multiselect=True)
+        if not chosen:
+            return
+        run_export([(link, None, set(chosen)) for link in links], parameters, cache)
+    finally:
+        cache.close()
+
 # Main execution
 try:
+    if (Control.ModifierKeys & Keys.Shift) == Keys.Shift:
+        export_categories()
+        sys.exit()
+
     try:
         selected_refs = uidoc.Selection.PickObjects(ObjectType.LinkedElement, "Selecteer elementen in gelinkte bestanden")
     except:
         selected_refs = []
 
-    element_infos = []
+    # Per link de naam; de elementen zelf worden pas in het venster geladen
+    links = {}
+    selected = []
     for ref in selected_refs:
         link_instance = doc.GetElement(ref)
         if isinstance(link_instance, RevitLinkInstance):
-            link_doc = link_instance.GetLinkDocument()
-            linked_element = link_doc.GetElement(ref.LinkedElementId)
-            link_type = link_instance.get_Parameter(BuiltInParameter.ELEM_TYPE_PARAM).AsValueString()
-            category = linked_element.Category.Name
-            family_type_name = linked_element.get_Parameter(BuiltInParameter.ELEM_FAMILY_AND_TYPE_PARAM).AsValueString()
-            parts = {
-                "Category": category,
-                "Family": family_type_name,
-                "Linked File": link_type,
-                "ID": linked_element.Id
-            }
-            element_infos.append((None, linked_element.Id, parts))
+            link_id = link_instance.Id.IntegerValue
+            if link_id not in links:
+                links[link_id] = (link_instance, link_name(link_instance))
+            selected.append((link_id, ref.LinkedElementId.IntegerValue))
 
     xaml_path = script.get_bundle_file('LinkedIds.xaml')
     if not xaml_path:
         MessageBox.Show(
             "LinkedIds.xaml niet gevonden in de bundle.\nZorg dat LinkedIds.xaml in dezelfde map staat als dit script.",
-            "Linked IDs \n Scholten BIM Consultancy",
+            TITLE,
             MessageBoxButtons.OK,
             MessageBoxIcon.Warning
         )
-    elif not element_infos:
+    elif not selected:
         MessageBox.Show(
             "Geen gekoppelde elementen gevonden.",
-            "Linked IDs \n Scholten BIM Consultancy",
+            TITLE,
             MessageBoxButtons.OK,
             MessageBoxIcon.Information
         )
     else:
-        LinkedIdsWindow(xaml_path, element_infos).ShowDialog()
+        with timings.phase("venster", len(selected)):
+            window = LinkedIdsWindow(xaml_path, linkedids.RowLoader(iter_rows(links, selected)),
+                                     export=lambda: export_selected(links, selected))
+        window.ShowDialog()
 
 except Exception as ex:
     MessageBox.Show(
         "Er ging iets mis:\n\n{0}\n\nTraceback:\n{1}".format(ex, traceback.format_exc()),
-        "Linked IDs \n Scholten BIM Consultancy",
+        TITLE,
         MessageBoxButtons.OK,
         MessageBoxIcon.Error
     )
\ No newline at end of file
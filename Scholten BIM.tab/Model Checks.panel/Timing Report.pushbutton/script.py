@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+__title__ = "Timing Report"
+__author__ = "Scholten BIM Consultancy"
+__doc__ = """Version   = 1.0
+Datum    = 18.10.2026
+__________________________________________________________________
+Description:
+SHIFT-CLICK to display options.
+
+Met deze tool kan je zien waar de tijd zit in de tools van Scholten BIM: per tool en fase (collector, transacties,
+venster openen, ...) het aantal runs, de mediaan (p50) en p95 in ms en het mediane aantal elementen.
+De tools schrijven hun metingen naar een lokaal log; logs van collega's kunnen samen worden samengevat.
+Houd de Shift knop ingedrukt om het meten aan of uit te zetten.
+__________________________________________________________________
+How-to:
+
+-> Run het script.
+-> Kies je eigen log, of kies de logs (ScholtenBIM_Timing.jsonl) die collega's hebben aangeleverd.
+__________________________________________________________________
+Last update:
+
+- [18.10.2026] - 1.0 RELEASE
+__________________________________________________________________
+To-do:
+
+-
+__________________________________________________________________
+"""
+
+import clr
+import sys
+clr.AddReference('System.Windows.Forms')
+
+from System.Windows.Forms import Control, Keys, MessageBox, MessageBoxButtons, MessageBoxIcon
+from pyrevit import forms, script
+
+from scholtenbim import configstore, timing
+
+TITLE = "Timing Report | Scholten BIM Consultancy"
+OWN = "Eigen log"
+COLLECTED = "Logs kiezen..."
+ON = "Aan"
+OFF = "Uit"
+
+output = script.get_output()
+
+if (Control.ModifierKeys & Keys.Shift) == Keys.Shift:
+    state = ON if timing.enabled() else OFF
+    choice = forms.alert("Tijdmetingen van de tools staan nu {0}.".format(state.lower()), title=TITLE, options=[ON, OFF])
+    if choice:
+        configstore.save(timing.CONFIG_TOOL, {"enabled": choice == ON})
+    sys.exit()
+
+choice = forms.alert("Welke timing-logs samenvatten?", title=TITLE, options=[OWN, COLLECTED])
+if not choice:
+    sys.exit()
+
+if choice == OWN:
+    paths = timing.log_files()
+else:
+    paths = forms.pick_file(files_filter="Timing logs|*.jsonl*|Alle bestanden|*.*", multi_file=True) or []
+    if not isinstance(paths, list):
+        paths = [paths]
+
+if not paths:
+    MessageBox.Show("Geen timing-logs gevonden.", TITLE, MessageBoxButtons.OK, MessageBoxIcon.Information)
+    sys.exit()
+
+try:
+    rows = timing.report(timing.read_records(paths))
+except Exception as e:
+    MessageBox.Show("Logs konden niet worden gelezen:\n{0}".format(e), TITLE, MessageBoxButtons.OK, MessageBoxIcon.Error)
+    sys.exit()
+
+if not rows:
+    MessageBox.Show("De logs bevatten nog geen metingen.", TITLE, MessageBoxButtons.OK, MessageBoxIcon.Information)
+    sys.exit()
+
+output.print_md("## Timing Report: {0} log(s), traagste p95 eerst".format(len(paths)))
+output.print_table([row.cells() for row in rows], columns=timing.REPORT_COLUMNS, title="Per tool en fase (ms)")
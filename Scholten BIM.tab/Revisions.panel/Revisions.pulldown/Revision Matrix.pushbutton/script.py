@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+__title__ = "Revision Matrix"
+__author__ = "Scholten BIM Consultancy"
+__doc__ = """Version   = 1.2
+Datum    = 18.10.2026
+__________________________________________________________________
+Description:
+
+Met deze tool kan je in 1x zien welke revisions op welke sheets staan en deze matrix exporteren naar Excel of CSV (bijv. voor een transmittal).
+__________________________________________________________________
+How-to:
+
+-> Run het script.
+-> Kies Excel of CSV.
+-> Kies de locatie van het bestand.
+__________________________________________________________________
+Last update:
+
+- [18.10.2026] - 1.2 Tijdmetingen (matrix, export) in het timing-log.
+- [18.10.2026] - 1.1 Matrix blijft per model bewaard tot het model verandert (rocket mode).
+- [18.10.2026] - 1.0 RELEASE
+__________________________________________________________________
+To-do:
+
+-
+__________________________________________________________________
+"""
+
+import clr
+import os
+clr.AddReference('RevitAPI')
+clr.AddReference('System.Windows.Forms')
+from pyrevit import forms, script
+from System.Windows.Forms import MessageBox, MessageBoxButtons, MessageBoxIcon
+
+from scholtenbim import revisionmatrix, timing
+
+doc = __revit__.ActiveUIDocument.Document
+output = script.get_output()
+timings = timing.Timer("Revision Matrix", doc)
+
+EXCEL = "Excel (.xlsx)"
+CSV = "CSV (.csv)"
+
+# Sheets x revisies in 1 pass
+with timings.phase("matrix") as phase:
+    matrix = revisionmatrix.cached(doc)
+    phase.count = len(matrix.sheets)
+
+if not matrix.revisions or not matrix.sheets:
+    MessageBox.Show("Geen sheets of revisions gevonden in dit model.", "Revision Matrix | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Information)
+    script.exit()
+
+# Overzicht per revisie
+output.print_md("## Revision Matrix: {} sheets x {} revisions".format(len(matrix.sheets), len(matrix.revisions)))
+for rev in matrix.revisions:
+    output.print_md("- {}: {} sheet(s)".format(matrix.revision_label(rev), len(matrix.sheet_ids_for_revision(rev.Id))))
+without = matrix.sheets_without_revisions()
+if without:
+    output.print_md("- Sheets zonder revision: {}".format(len(without)))
+
+# Exportformaat; Excel alleen als xlsxwriter (meegeleverd met pyRevit) beschikbaar is
+options = [EXCEL, CSV] if revisionmatrix.xlsxwriter is not None else [CSV]
+choice = forms.alert("Revision Matrix exporteren als:", title="Revision Matrix | Scholten BIM Consultancy", options=options)
+if not choice:
+    script.exit()
+
+ext = "xlsx" if choice == EXCEL else "csv"
+path = forms.save_file(file_ext=ext, default_name="Revision Matrix {}".format(doc.Title))
+if not path:
+    script.exit()
+
+try:
+    with timings.phase("export " + ext, len(matrix.sheets)):
+        if ext == "xlsx":
+            matrix.export_xlsx(path)
+        else:
+            matrix.export_csv(path)
+except Exception as e:
+    MessageBox.Show("Exporteren is mislukt:\n{}".format(e), "Revision Matrix | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Error)
+    script.exit()
+
+MessageBox.Show("Revision Matrix opgeslagen:\n{}".format(os.path.normpath(path)), "Revision Matrix | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Information)
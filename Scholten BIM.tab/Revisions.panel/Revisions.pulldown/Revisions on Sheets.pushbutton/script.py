@@ -2,21 +2,24 @@
 
 __title__ = "Revisions on Sheet"
 __author__ = "Scholten BIM Consultancy"
-__doc__ = """Version   = 1.0
+__doc__ = """Version   = 1.3
 Datum    = 28.03.2025
 __________________________________________________________________
 Description:
 
-Met deze tool kan je zien op welke sheets de geselecteerde revision te zien is.
+Met deze tool kan je zien op welke sheets de geselecteerde revision(s) te zien zijn.
 __________________________________________________________________
 How-to:
 
 -> Run het script.
--> Kies uit je pulldown menu de uit te lezen sequence.
--> Overzicht van sheets.
+-> Kies uit je pulldown menu de uit te lezen sequence(s).
+-> Overzicht van sheets per sequence.
 __________________________________________________________________
 Last update:
 
+- [18.10.2026] - 1.3 Tijdmetingen (matrix, keuzelijst, overzicht) in het timing-log.
+- [18.10.2026] - 1.2 Matrix blijft per model bewaard tot het model verandert (rocket mode).
+- [18.10.2026] - 1.1 Meerdere sequences tegelijk, sheets/revisies worden 1x uitgelezen.
 - [28.03.2025] - 1.0 RELEASE
 __________________________________________________________________
 To-do:
@@ -29,51 +32,47 @@ __________________________________________________________________
 import clr
 clr.AddReference('RevitAPI')
 clr.AddReference('RevitServices')
-from Autodesk.Revit.DB import FilteredElementCollector, BuiltInCategory, Revision, ViewSheet
 from RevitServices.Persistence import DocumentManager
 from pyrevit import forms, output
 
+from scholtenbim import revisionmatrix, timing
+
 doc = __revit__.ActiveUIDocument.Document
+timings = timing.Timer("Revisions on Sheets", doc)
+
+# Sheets x revisies in 1 pass (bewaard tussen klikken tot het model verandert)
+with timings.phase("matrix") as phase:
+    matrix = revisionmatrix.cached(doc)
+    phase.count = len(matrix.sheets)
+
+# Keuzelijst met "sequence - description" per revisie
+with timings.phase("keuzelijst", len(matrix.revisions)):
+    revision_items = [matrix.revision_label(rev) for rev in matrix.revisions]
+    revisions_by_item = dict(zip(revision_items, matrix.revisions))
+
+# Show a dropdown menu to select one or more revision sequences
+selected_items = forms.SelectFromList.show(revision_items, title="Select Revision Sequence | Scholten BIM Consultancy", width=300, button_name="Select", multiselect=True)
+
+if selected_items:
+    if not isinstance(selected_items, list):
+        selected_items = [selected_items]
 
-# Collect all revisions
-revisions = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Revisions).WhereElementIsNotElementType().ToElements()
-
-# Create a dictionary to store revision sequences and their descriptions
-revision_dict = {rev.SequenceNumber: "{} - {}".format(rev.SequenceNumber, rev.Description) for rev in revisions}
-
-# Create a list of revision sequences for the dropdown menu
-revision_sequences = list(revision_dict.values())
-
-# Show a dropdown menu to select a revision sequence
-selected_seq = forms.SelectFromList.show(revision_sequences, title="Select Revision Sequence | Scholten BIM Consultancy", width=300, button_name="Select")
-
-if selected_seq:
-    sheets_found = False
-    selected_seq_number = int(selected_seq.split(" - ")[0])  # Extract the sequence number from the selected item
-    selected_description = selected_seq.split(" - ")[1]  # Extract the description from the selected item
-    
-    # Collect sheets with the selected revision sequence
-    sheets = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Sheets).WhereElementIsNotElementType().ToElements()
-    sheet_list = []
-    for sheet in sheets:
-        revs_on_sheet = sheet.GetAllRevisionIds()
-        for rev_id in revs_on_sheet:
-            rev = doc.GetElement(rev_id)
-            if rev.SequenceNumber == selected_seq_number:
-                sheets_found = True
-                sheet_list.append(sheet)
-    
     output_window = output.get_output()
-    
-    # Print the selected sequence and description at the top
-    output_window.print_md("##**==== Selected Revision Sequence:** {} - {} ====##".format(selected_seq_number, selected_description))
-    
-    if sheets_found:
-        # Sort sheets by sheet number
-        sorted_sheets = sorted(sheet_list, key=lambda s: s.SheetNumber)
-        # Show sorted sheets without extra space
-        for sheet in sorted_sheets:
-            sheet_info = "Sheet: {} - {}".format(sheet.SheetNumber, sheet.Name)
-            output_window.print_md(sheet_info)
-    else:
-        output_window.print_md("No sheets found for the selected revision sequence.")
\ No newline at end of file
+
+    with timings.phase("overzicht") as phase:
+        phase.count = 0
+        for item in selected_items:
+            rev = revisions_by_item[item]
+            sheet_list = matrix.sheets_for_revision(rev.Id)
+            phase.count += len(sheet_list)
+
+            # Print the selected sequence and description at the top
+            output_window.print_md("##**==== Selected Revision Sequence:** {} - {} ====##".format(rev.SequenceNumber, rev.Description))
+
+            if sheet_list:
+                # Sheets staan al op sheetnummer gesorteerd
+                for sheet in sheet_list:
+                    sheet_info = "Sheet: {} - {}".format(sheet.SheetNumber, sheet.Name)
+                    output_window.print_md(sheet_info)
+            else:
+                output_window.print_md("No sheets found for the selected revision sequence.")
\ No newline at end of file
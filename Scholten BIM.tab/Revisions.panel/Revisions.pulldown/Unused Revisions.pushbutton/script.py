@@ -2,19 +2,23 @@
 
 __title__ = "Unused Revision Sequences"
 __author__ = "Scholten BIM Consultancy"
-__doc__ = """Version   = 1.0
+__doc__ = """Version   = 1.2
 Datum    = 28.03.2025
 __________________________________________________________________
 Description:
 
-Met deze tool kan je alle niet gebruikte Revision Sequences zien binnen je project.
+Met deze tool kan je alle niet gebruikte Revision Sequences zien binnen je project en in 1x verwijderen.
+Optioneel worden alle ongebruikte Revision Sequences in alle geopende modellen opgeschoond.
 __________________________________________________________________
 How-to:
 
 -> Run het script.
+-> Kies of je een selectie uit dit model of alles in alle open modellen wilt verwijderen.
 __________________________________________________________________
 Last update:
 
+- [18.10.2026] - 1.2 Tijdmetingen (zoeken, keuzelijst, verwijderen) in het timing-log.
+- [18.10.2026] - 1.1 Verwijderen in 1 Delete-aanroep, optie om alle open modellen op te schonen.
 - [28.03.2025] - 1.0 RELEASE
 __________________________________________________________________
 To-do:
@@ -27,86 +31,136 @@ import clr
 clr.AddReference('RevitAPI')
 clr.AddReference('RevitServices')
 clr.AddReference('System.Windows.Forms')
-from Autodesk.Revit.DB import FilteredElementCollector, BuiltInCategory, RevisionCloud, ViewSheet, Transaction
+from Autodesk.Revit.DB import FilteredElementCollector, RevisionCloud, Transaction, ElementId
 from RevitServices.Persistence import DocumentManager
 from pyrevit import forms
 from pyrevit import script
+from System.Collections.Generic import List
 from System.Windows.Forms import MessageBox, MessageBoxButtons, MessageBoxIcon
 
+from scholtenbim import timing
+from scholtenbim.revisionmatrix import RevisionMatrix
+
 # Collect current document
 doc = __revit__.ActiveUIDocument.Document
+timings = timing.Timer("Unused Revisions", doc)
+
+MODE_SELECTION = "Selectie verwijderen (dit model)"
+MODE_PURGE_ALL = "Alle ongebruikte verwijderen (alle open modellen)"
+
+
+def find_unused_revisions(document):
+    """Alle revisies, en de revisies zonder sheet en zonder cloud (op sequence gesorteerd)."""
+    with timings.phase("zoeken") as phase:
+        matrix = RevisionMatrix(document)
+        clouds = FilteredElementCollector(document).OfClass(RevisionCloud)
+        cloud_revision_ids = set(cloud.RevisionId for cloud in clouds)
+        phase.count = len(matrix.revisions)
+        return matrix.revisions, matrix.unused_revisions(cloud_revision_ids)
+
+
+def delete_revisions(document, revisions_to_delete, all_revisions):
+    """
+    Verwijdert de revisies in 1 transactie en 1 Delete-aanroep. Er blijft altijd
+    minimaal 1 revisie in het model: worden alle revisies geselecteerd, dan blijft
+    de eerste staan. Geeft (aantal verwijderd, behouden revisie of None) terug.
+    """
+    if len(all_revisions) <= 1:
+        return 0, all_revisions[0] if all_revisions else None
+
+    revisions_to_delete = list(revisions_to_delete)
+    retained = None
+    if len(revisions_to_delete) >= len(all_revisions):
+        retained = revisions_to_delete.pop(0)
+    if not revisions_to_delete:
+        return 0, retained
+
+    ids = List[ElementId]([rev.Id for rev in revisions_to_delete])
+    t = Transaction(document, 'Delete Selected Revisions')
+    try:
+        with timings.phase("verwijderen", len(revisions_to_delete)):
+            t.Start()
+            document.Delete(ids)
+            t.Commit()
+    except Exception:
+        if t.HasStarted():
+            t.RollBack()
+        raise
+    return len(revisions_to_delete), retained
+
+
+def open_project_documents():
+    docs = []
+    for document in doc.Application.Documents:
+        if document.IsLinked or document.IsFamilyDocument:
+            continue
+        docs.append(document)
+    return docs
+
+
+def run_selection():
+    revisions, unused_revisions = find_unused_revisions(doc)
+
+    # Selection map in 1 pass: "sequence - description" -> revision
+    with timings.phase("keuzelijst", len(unused_revisions)):
+        revisions_by_item = {}
+        revision_items = []
+        for rev in unused_revisions:
+            item = "{} - {}".format(rev.SequenceNumber, rev.Description)
+            revisions_by_item[item] = rev
+            revision_items.append(item)
+
+    # Show the form
+    selected_revisions = forms.SelectFromList.show(
+        revision_items,
+        title='Unused Revisions | Scholten BIM Consultancy',
+        button_name='Delete Selected',
+        multiselect=True
+    )
+    if not selected_revisions:
+        return
+
+    if len(revisions) <= 1:
+        # Show MessageBox with message
+        MessageBox.Show("Cannot delete the only remaining revision.", "Unused Revision Sequences | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Warning)
+        return
+
+    try:
+        deleted, retained = delete_revisions(doc, [revisions_by_item[item] for item in selected_revisions], revisions)
+    except Exception as e:
+        print("Error: {}".format(e))
+        return
 
-# Collect all revision clouds in the document
-revision_clouds = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_RevisionClouds).WhereElementIsNotElementType().ToElements()
-
-# Collect all revisions in the document
-revisions = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Revisions).WhereElementIsNotElementType().ToElements()
-
-# Collect all sheets in the document
-sheets = FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Sheets).WhereElementIsNotElementType().ToElements()
-
-# Create a set of used revision IDs from revision clouds
-used_revision_ids_clouds = set(cloud.RevisionId for cloud in revision_clouds)
-
-# Create a set of used revision IDs from sheets
-used_revision_ids_sheets = set()
-for sheet in sheets:
-    for revision_id in sheet.GetAllRevisionIds():
-        used_revision_ids_sheets.add(revision_id)
-
-# Combine both sets of used revision IDs
-used_revision_ids = used_revision_ids_clouds.union(used_revision_ids_sheets)
-
-# Find unused revisions
-unused_revisions = [revision for revision in revisions if revision.Id not in used_revision_ids]
-
-# Sort unused revisions by sequence number
-unused_revisions_sorted = sorted(unused_revisions, key=lambda rev: rev.SequenceNumber)
-
-# Create a list of unused revisions for the form
-revision_items = ["{} - {}".format(rev.SequenceNumber, rev.Description) for rev in unused_revisions_sorted]
-
-# Show the form
-selected_revisions = forms.SelectFromList.show(
-    revision_items,
-    title='Unused Revisions | Scholten BIM Consultancy',
-    button_name='Delete Selected',
-    multiselect=True
-)
-
-# Handle form results
-if selected_revisions:
-    selected_revision_ids = [unused_revisions_sorted[revision_items.index(rev)].Id for rev in selected_revisions]
-    
-    # Check if there is more than one revision
-    if len(revisions) > 1:
-        # Ensure at least one revision remains
-        if len(selected_revision_ids) >= len(revisions):
-            # Remove the first selected revision from the deletion list
-            first_revision_id = selected_revision_ids.pop(0)
-            first_revision = next(rev for rev in revisions if rev.Id == first_revision_id)
-            
-            t = Transaction(doc, 'Delete Selected Revisions')
-            try:
-                t.Start()
-                for rev_id in selected_revision_ids:
-                    doc.Delete(rev_id)
-                t.Commit()
-                # Show MessageBox with message
-                MessageBox.Show("Revision '{0} - {1}' has been retained.".format(first_revision.SequenceNumber, first_revision.Description), "Unused Revision Sequences | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Warning)
-            except Exception as e:
-                t.RollBack()
-                print("Error: {}".format(e))
-        else:
-            t = Transaction(doc, 'Delete Selected Revisions')
-            try:
-                t.Start()
-                for rev_id in selected_revision_ids:
-                    doc.Delete(rev_id)
-                t.Commit()
-            except Exception as e:
-                t.RollBack()
-                print("Error: {}".format(e))
-    else:
+    if retained is not None:
         # Show MessageBox with message
-        MessageBox.Show("Cannot delete the only remaining revision.", "Unused Revision Sequences | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Warning)
\ No newline at end of file
+        MessageBox.Show("Revision '{0} - {1}' has been retained.".format(retained.SequenceNumber, retained.Description), "Unused Revision Sequences | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Warning)
+
+
+def run_purge_all():
+    lines = []
+    total = 0
+    for document in open_project_documents():
+        try:
+            revisions, unused_revisions = find_unused_revisions(document)
+            deleted, retained = delete_revisions(document, unused_revisions, revisions)
+        except Exception as e:
+            lines.append("{}: fout - {}".format(document.Title, e))
+            continue
+        total += deleted
+        line = "{}: {} revision(s) verwijderd".format(document.Title, deleted)
+        if retained is not None:
+            line += ", '{} - {}' behouden".format(retained.SequenceNumber, retained.Description)
+        lines.append(line)
+
+    MessageBox.Show("Totaal {} revision(s) verwijderd.\n\n{}".format(total, "\n".join(lines)), "Unused Revision Sequences | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Information)
+
+
+# Alleen een keuze tonen als er meer dan 1 model open staat
+mode = MODE_SELECTION
+if len(open_project_documents()) > 1:
+    mode = forms.alert("Wat wil je doen?", title="Unused Revisions | Scholten BIM Consultancy", options=[MODE_SELECTION, MODE_PURGE_ALL])
+
+if mode == MODE_SELECTION:
+    run_selection()
+elif mode == MODE_PURGE_ALL:
+    run_purge_all()
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 __title__ = "Create Ceilingplan of Room"
 __author__ = "Scholten BIM Consultancy"
-__doc__ = """Version   = 1.0
+__doc__ = """Version   = 1.3
 Datum    = 26.06.2025
 __________________________________________________________________
 Description:
@@ -11,10 +11,13 @@ Met deze tool kan je op basis van te selecteren room(s) een ceilingplan aan late
 __________________________________________________________________
 How-to:
 
--> Run het script en selecteer room(s) in het gelinkte model.
+-> Run het script, kies de crop (bounding box of room-contour) en selecteer room(s) in het gelinkte model.
 __________________________________________________________________
 Last update:
 
+- [18.10.2026] - 1.3 Gedeelde code met Floorplan of Rooms naar scholtenbim.linkedrooms; crop klopt ook bij een gedraaide link.
+- [18.10.2026] - 1.2 Optie om te croppen op de room-contour (vereenvoudigd en 200mm naar buiten) i.p.v. de bounding box.
+- [18.10.2026] - 1.1 Alle ceilingplans in 1 batch (per blok een transactie, annuleerbaar), levels van de link 1x gekoppeld op naam of hoogte.
 - [26.06.2025] - 1.0 RELEASE
 __________________________________________________________________
 To-do:
@@ -29,16 +32,15 @@ clr.AddReference('RevitAPI')
 clr.AddReference('RevitAPIUI')
 
 import Autodesk.Revit.DB as RDB
-from pyrevit import revit, forms, script
+from pyrevit import forms, script
 from Autodesk.Revit.UI.Selection import ObjectType
+from scholtenbim import linkedrooms
 
 # Document en UI-document
 doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
 output = script.get_output()
 
-OFFSET = 200.0 / 304.8  # 200mm offset in feet
-
 # Failure preprocessor om automatisch prompts te negeren
 class SuppressFailuresPreprocessor(RDB.IFailuresPreprocessor):
     def PreprocessFailures(self, failuresAccessor):
@@ -54,126 +56,24 @@ class SuppressFailuresPreprocessor(RDB.IFailuresPreprocessor):
         return RDB.FailureProcessingResult.Continue
 
 
-def get_room_from_linked_element(reference):
-    linked_inst = doc.GetElement(reference.ElementId)
-    if not isinstance(linked_inst, RDB.RevitLinkInstance):
-        return None, None, None
-    linked_doc = linked_inst.GetLinkDocument()
-    room = linked_doc.GetElement(reference.LinkedElementId)
-    if room is None or room.Category is None or room.Category.Id != RDB.ElementId(RDB.BuiltInCategory.OST_Rooms):
-        return None, None, None
-    return room, linked_doc, linked_inst
-
-
-def ensure_unique_name(base_name):
-    collector = RDB.FilteredElementCollector(doc).OfClass(RDB.View)
-    names = {v.Name for v in collector}
-    name = base_name
-    counter = 1
-    while name in names:
-        name = "{} Copy {}".format(base_name, counter)
-        counter += 1
-    return name
-
+def create_room_ceilingplans(rooms, crop_mode=linkedrooms.CROP_BBOX):
+    """Maakt een ceilingplan per room in 1 batch. Geeft het BatchResult terug (of None)."""
+    return linkedrooms.create_room_plans(doc, rooms, RDB.ViewFamily.CeilingPlan, 'CeilingPlan', output,
+                                         crop_mode=crop_mode, name_suffix='CP', uidoc=uidoc,
+                                         failures_preprocessor=SuppressFailuresPreprocessor())
 
-def create_ceilingplan_view(room, linked_doc, linked_inst):
-    try:
-        # Room nummer en naam
-        num_param = room.get_Parameter(RDB.BuiltInParameter.ROOM_NUMBER)
-        room_number = num_param.AsString() if num_param else str(room.Id.IntegerValue)
-        name_param = room.get_Parameter(RDB.BuiltInParameter.ROOM_NAME)
-        room_name = name_param.AsString() if name_param else ''
-
-        # Basis view naam
-        if room_name:
-            base_name = "{} {} CP".format(room_number, room_name)
-        else:
-            base_name = "{} CP".format(room_number)
-        view_name = ensure_unique_name(base_name)
-
-        # Bepaal Level via linked model
-        level = None
+# Crop-keuze en selectie UI
+crop_mode = forms.alert("Waarop moeten de ceilingplans gecropt worden?", title="Create Ceilingplan of Room | Scholten BIM Consultancy",
+                        options=[linkedrooms.CROP_BBOX, linkedrooms.CROP_BOUNDARY])
+selected = []
+if crop_mode:
+    with forms.WarningBar(title='Selecteer ruimte(s) in gelinkte model(len)'):
         try:
-            linked_level = linked_doc.GetElement(room.LevelId)
-            if isinstance(linked_level, RDB.Level):
-                level_name = linked_level.Name
-                level = next(
-                    (l for l in RDB.FilteredElementCollector(doc).OfClass(RDB.Level) if l.Name == level_name),
-                    None
-                )
+            selected = uidoc.Selection.PickObjects(ObjectType.LinkedElement, 'Select Room(s)')
         except:
-            level = None
-
-        # Fallback: active view level
-        if level is None:
-            active_view = uidoc.ActiveView
-            if hasattr(active_view, 'GenLevel') and active_view.GenLevel:
-                level = doc.GetElement(active_view.GenLevel.Id)
-                output.print_md("ℹ️ Gebruik Level van actieve view: {}".format(level.Name))
-
-        if level is None:
-            output.print_md("❌ Kan Level niet bepalen voor Room {}".format(room.Id.IntegerValue))
-            return None
-
-        # Vind CeilingPlan viewtype
-        vft = next(
-            (v for v in RDB.FilteredElementCollector(doc).OfClass(RDB.ViewFamilyType).WhereElementIsElementType()
-             if v.ViewFamily == RDB.ViewFamily.CeilingPlan),
-            None
-        )
-        if not vft:
-            output.print_md('❌ Geen CeilingPlan ViewFamilyType gevonden.')
-            return None
-
-        # Start transaction with failure suppression
-        t = RDB.Transaction(doc, 'Create Room CeilingPlans')
-        fopts = t.GetFailureHandlingOptions()
-        fopts = fopts.SetFailuresPreprocessor(SuppressFailuresPreprocessor())
-        t.SetFailureHandlingOptions(fopts)
-        t.Start()
-
-        # Maak CeilingPlan view
-        view = RDB.ViewPlan.Create(doc, vft.Id, level.Id)
-        name_p = view.get_Parameter(RDB.BuiltInParameter.VIEW_NAME)
-        if name_p:
-            name_p.Set(view_name)
-
-        # Crop rond bounding box room
-        bbox = room.get_BoundingBox(None)
-        transform = linked_inst.GetTotalTransform()
-        min_pt = transform.OfPoint(bbox.Min)
-        max_pt = transform.OfPoint(bbox.Max)
-        crop_min = RDB.XYZ(min_pt.X - OFFSET, min_pt.Y - OFFSET, min_pt.Z)
-        crop_max = RDB.XYZ(max_pt.X + OFFSET, max_pt.Y + OFFSET, max_pt.Z)
-        crop_box = RDB.BoundingBoxXYZ()
-        crop_box.Min = crop_min
-        crop_box.Max = crop_max
-        view.CropBox = crop_box
-        view.CropBoxActive = True
-        view.CropBoxVisible = False
-
-        t.Commit()
-        output.print_md('✅ CeilingPlan aangemaakt en gecropt: {}'.format(view_name))
-        return view
-
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        output.print_md('❌ Fout bij Room {}: {}: {}'.format(room.Id.IntegerValue, type(e).__name__, e))
-        return None
-
-# Selectie UI
-with forms.WarningBar(title='Selecteer ruimte(s) in gelinkte model(len)'):
-    try:
-        selected = uidoc.Selection.PickObjects(ObjectType.LinkedElement, 'Select Room(s)')
-    except:
-        forms.alert('Geen selectie gemaakt. Script gestopt.')
-        selected = []
+            forms.alert('Geen selectie gemaakt. Script gestopt.')
+            selected = []
 
 # Verwerking selectie
 if selected:
-    for ref in selected:
-        room, linked_doc, linked_inst = get_room_from_linked_element(ref)
-        if not room:
-            continue
-        create_ceilingplan_view(room, linked_doc, linked_inst)
+    create_room_ceilingplans(linkedrooms.rooms_from_references(doc, selected), crop_mode)
@@ -2,7 +2,7 @@
 
 __title__ = "Create Sections of Room"
 __author__ = "Scholten BIM Consultancy"
-__doc__ = """Version   = 1.0
+__doc__ = """Version   = 1.2
 Datum    = 26.06.2025
 __________________________________________________________________
 Description:
@@ -15,11 +15,13 @@ How-to:
 __________________________________________________________________
 Last update:
 
+- [18.10.2026] - 1.2 Sections haaks op de wanden van de room (ook in een gedraaid raster/gedraaide link), met de kleinst mogelijke ver-clip.
+- [18.10.2026] - 1.1 Alle sections in 1 batch (per blok een transactie, annuleerbaar), bestaande namen krijgen een volgnummer.
 - [26.06.2025] - 1.0 RELEASE
 __________________________________________________________________
 To-do:
 
-- Zorgen dat als de views al bestaan er of een duplicate komt of de ruimte wordt overgeslagen.
+- Tips/Tricks?.
 __________________________________________________________________
 """
 
@@ -30,118 +32,151 @@ clr.AddReference('RevitAPIUI')
 import Autodesk.Revit.DB as RDB
 from pyrevit import revit, forms, script
 from Autodesk.Revit.UI.Selection import ObjectType
+from scholtenbim import batch, cropregion, docindex, linkedrooms
 
 # Document en UI-document
 doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
 output = script.get_output()
+index = docindex.get_index(doc)
 
 # Instellingen
 FAR_CLIP_MARGIN = 200.0 / 304.8  # 200mm voor ver-clip in feet
 VERTICAL_MARGIN = 200.0 / 304.8  # 200mm voor onder- en bovenclip in feet
+CHUNK_SIZE = 50  # sections per transactie
 
+# Achtervoegsel per kijkrichting, t.o.v. de assen van de room: A kijkt langs
+# de X-as, B langs de Y-as, C en D in tegengestelde richting.
+SUFFIXES = ['A', 'B', 'C', 'D']
 
-def get_room_from_linked_element(reference):
-    linked_inst = doc.GetElement(reference.ElementId)
-    if not isinstance(linked_inst, RDB.RevitLinkInstance):
+
+class RoomFrame(object):
+    """Georiënteerde rechthoek + hoogte van een gelinkte room in host-coördinaten."""
+
+    def __init__(self, info, rect, z_min, z_max):
+        self.info = info
+        self.id = info.id
+        self.rect = rect
+        self.z_min = z_min
+        self.z_max = z_max
+
+    def view_name(self, suffix):
+        return '{0}_{1}'.format(self.info.label(), suffix)
+
+    def directions(self):
+        """(kijkrichting, breedte/2, diepte/2, achtervoegsel) voor de 4 sections."""
+        rect = self.rect
+        return [
+            (rect.axis_x, rect.half_y, rect.half_x, SUFFIXES[0]),
+            (rect.axis_y, rect.half_x, rect.half_y, SUFFIXES[1]),
+            (rect.axis_x.Negate(), rect.half_y, rect.half_x, SUFFIXES[2]),
+            (rect.axis_y.Negate(), rect.half_x, rect.half_y, SUFFIXES[3]),
+        ]
+
+
+def room_frame(info):
+    """RoomFrame uit de room-boundary (of de bounding box als die ontbreekt), of None."""
+    host_bbox = info.host_bounding_box()
+    if host_bbox is None:
         return None
-    linked_doc = linked_inst.GetLinkDocument()
-    elem = linked_doc.GetElement(reference.LinkedElementId)
-    if elem.Category is None or elem.Category.Id != RDB.ElementId(RDB.BuiltInCategory.OST_Rooms):
+    min_pt, max_pt = host_bbox
+    points = info.host_boundary()
+    if len(points) < 3:
+        # Geen contour: de hoeken van de (getransformeerde) bounding box.
+        bbox = info.bounding_box()
+        points = [info.transform.OfPoint(RDB.XYZ(x, y, bbox.Min.Z))
+                  for x, y in ((bbox.Min.X, bbox.Min.Y), (bbox.Max.X, bbox.Min.Y),
+                               (bbox.Max.X, bbox.Max.Y), (bbox.Min.X, bbox.Max.Y))]
+    rect = cropregion.oriented_rectangle(points)
+    if rect is None:
         return None
-    return elem
+    return RoomFrame(info, rect, min(min_pt.Z, max_pt.Z), max(min_pt.Z, max_pt.Z))
+
+
+def collect_rooms(references):
+    """RoomFrames van de geselecteerde rooms; elke link en room wordt maar 1x opgezocht."""
+    frames = []
+    for info in linkedrooms.rooms_from_references(doc, references):
+        frame = room_frame(info)
+        if frame is None:
+            output.print_md('⚠️ Geen bounding box voor Room {0}'.format(info.id))
+            continue
+        frames.append(frame)
+    return frames
+
+
+def section_box_for(frame, view_dir, half_width, half_depth):
+    """Section box + diepte (ver-clip) voor 1 kijkrichting, vanuit het midden van de room."""
+    rect = frame.rect
+    center = RDB.XYZ(rect.center.X, rect.center.Y, (frame.z_min + frame.z_max) / 2.0)
+
+    up = RDB.XYZ.BasisZ
+    right = up.CrossProduct(view_dir).Normalize()
+
+    transform = RDB.Transform.Identity
+    transform.Origin = center
+    transform.BasisX = right
+    transform.BasisY = up
+    transform.BasisZ = view_dir
+
+    # Snede door het midden: tot de verste wand is het precies een halve diepte.
+    view_depth = half_depth + FAR_CLIP_MARGIN
+    half_height = (frame.z_max - frame.z_min) / 2.0
+
+    section_box = RDB.BoundingBoxXYZ()
+    section_box.Transform = transform
+    section_box.Min = RDB.XYZ(-half_width - FAR_CLIP_MARGIN, -half_height - VERTICAL_MARGIN, 0.0)
+    section_box.Max = RDB.XYZ(half_width + FAR_CLIP_MARGIN, half_height + VERTICAL_MARGIN, view_depth)
+    try:
+        section_box.MinEnabled = True
+        section_box.MaxEnabled = True
+    except:
+        pass
+    return section_box, view_depth
+
 
+def create_elevation_view(vft, frame, view_dir, half_width, half_depth, suffix):
+    view_name = index.unique_view_name(frame.view_name(suffix))
+    section_box, view_depth = section_box_for(frame, view_dir, half_width, half_depth)
+
+    view = RDB.ViewSection.CreateSection(doc, vft.Id, section_box)
+    name_p = view.get_Parameter(RDB.BuiltInParameter.VIEW_NAME)
+    if name_p:
+        name_p.Set(view_name)
 
-def create_elevation_view(room, direction, suffix):
     try:
-        num_param = room.get_Parameter(RDB.BuiltInParameter.ROOM_NUMBER)
-        room_number = num_param.AsString() if num_param else str(room.Id.IntegerValue)
-        name_param = room.get_Parameter(RDB.BuiltInParameter.ROOM_NAME)
-        room_name = name_param.AsString() if name_param else ''
-
-        if room_name:
-            view_name = '{0} {1}_{2}'.format(room_number, room_name, suffix)
-        else:
-            view_name = '{0}_{1}'.format(room_number, suffix)
-
-        bbox = room.get_BoundingBox(None)
-        if not bbox:
-            output.print_md('⚠️ Geen bounding box voor Room {0}'.format(room.Id.IntegerValue))
-            return None
-        center = RDB.XYZ(
-            (bbox.Min.X + bbox.Max.X) / 2.0,
-            (bbox.Min.Y + bbox.Max.Y) / 2.0,
-            (bbox.Min.Z + bbox.Max.Z) / 2.0
-        )
-
-        view_dir = RDB.XYZ(direction.X, direction.Y, direction.Z).Normalize()
-        up = RDB.XYZ.BasisZ
-        right = up.CrossProduct(view_dir).Normalize()
-
-        transform = RDB.Transform.Identity
-        transform.Origin = center
-        transform.BasisX = right
-        transform.BasisY = up
-        transform.BasisZ = view_dir
-
-        width = abs(bbox.Max.X - bbox.Min.X)
-        length = abs(bbox.Max.Y - bbox.Min.Y)
-        height = abs(bbox.Max.Z - bbox.Min.Z)
-
-        if abs(direction.X) > 0:  # Oost-West
-            hor_ext = length / 2.0
-            view_depth = width / 2.0 + FAR_CLIP_MARGIN
-        else:  # Noord-Zuid
-            hor_ext = width / 2.0
-            view_depth = length / 2.0 + FAR_CLIP_MARGIN
-
-        half_height = height / 2.0
-
-        min_pt = RDB.XYZ(-hor_ext - FAR_CLIP_MARGIN, -half_height - VERTICAL_MARGIN, 0.0)
-        max_pt = RDB.XYZ(hor_ext + FAR_CLIP_MARGIN, half_height + VERTICAL_MARGIN, view_depth)
-
-        section_box = RDB.BoundingBoxXYZ()
-        section_box.Transform = transform
-        section_box.Min = min_pt
-        section_box.Max = max_pt
-        try:
-            section_box.MinEnabled = True
-            section_box.MaxEnabled = True
-        except:
-            pass
-
-        vft = next(
-            (v for v in RDB.FilteredElementCollector(doc)
-                   .OfClass(RDB.ViewFamilyType)
-                   .WhereElementIsElementType()
-             if v.ViewFamily == RDB.ViewFamily.Section),
-            None
-        )
-        if not vft:
-            output.print_md('❌ Geen Section ViewFamilyType gevonden.')
-            return None
-
-        view = RDB.ViewSection.CreateSection(doc, vft.Id, section_box)
-        name_p = view.get_Parameter(RDB.BuiltInParameter.VIEW_NAME)
-        if name_p:
-            name_p.Set(view_name)
-
-        try:
-            offset_param = view.get_Parameter(RDB.BuiltInParameter.VIEWER_BOUND_OFFSET_FAR)
-            if offset_param and offset_param.StorageType == RDB.StorageType.Double:
-                offset_param.Set(view_depth)
-        except:
-            output.print_md('⚠️ Kon VIEWER_BOUND_OFFSET_FAR niet instellen.')
+        offset_param = view.get_Parameter(RDB.BuiltInParameter.VIEWER_BOUND_OFFSET_FAR)
+        if offset_param and offset_param.StorageType == RDB.StorageType.Double:
+            offset_param.Set(view_depth)
+    except:
+        output.print_md('⚠️ Kon VIEWER_BOUND_OFFSET_FAR niet instellen.')
+
+    return view_name
 
-        output.print_md('✅ Section aangemaakt: {0}'.format(view_name))
-        return view
 
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        output.print_md('❌ Fout bij Room {0}: {1}: {2}'.format(room.Id.IntegerValue, type(e).__name__, e))
+def create_room_sections(rooms):
+    """Maakt 4 sections per room in 1 batch. Geeft het BatchResult terug (of None)."""
+    vft = index.view_family_type(RDB.ViewFamily.Section)
+    if not vft:
+        output.print_md('❌ Geen Section ViewFamilyType gevonden.')
         return None
 
+    jobs = [(frame,) + direction for frame in rooms for direction in frame.directions()]
+    result = batch.run_chunked(
+        doc, 'Create Room Sections', jobs,
+        lambda job: create_elevation_view(vft, *job),
+        chunk_size=CHUNK_SIZE, title='Create Room Sections | {value} van {max_value}')
+
+    if result.cancelled:
+        output.print_md('⚠️ Geannuleerd, er zijn geen sections aangemaakt.')
+        return result
+    for view_name in result.succeeded:
+        output.print_md('✅ Section aangemaakt: {0}'.format(view_name))
+    for job, e in result.failures:
+        output.print_md('❌ Fout bij Room {0}: {1}: {2}'.format(job[0].id, type(e).__name__, e))
+    return result
+
+
 # Selectie UI
 with forms.WarningBar(title='Selecteer ruimte(s) in gelinkte model(len)'):
     try:
@@ -152,12 +187,4 @@ with forms.WarningBar(title='Selecteer ruimte(s) in gelinkte model(len)'):
 
 # Verwerking selectie
 if selected:
-    with revit.Transaction('Create Room Sections'):
-        for ref in selected:
-            room = get_room_from_linked_element(ref)
-            if not room:
-                continue
-            directions = [RDB.XYZ(1, 0, 0), RDB.XYZ(0, 1, 0), RDB.XYZ(-1, 0, 0), RDB.XYZ(0, -1, 0)]
-            for i, direction in enumerate(directions):
-                create_elevation_view(room, direction, chr(65 + i))
-output = script.get_output()
\ No newline at end of file
+    create_room_sections(collect_rooms(selected))
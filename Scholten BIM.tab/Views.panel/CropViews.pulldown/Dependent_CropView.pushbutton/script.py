@@ -45,6 +45,7 @@ from Autodesk.Revit.UI import *
 
 clr.AddReference('System.Windows.Forms')
 from System.Windows.Forms import MessageBox, MessageBoxButtons, MessageBoxIcon, DialogResult
+from scholtenbim import docindex
 
 # Actief document en view ophalen
 doc = __revit__.ActiveUIDocument.Document
@@ -114,13 +115,7 @@ try:
 
     # Genereer een unieke naam voor de nieuwe view
     base_name = active_view.Name + " - Dependent"
-    new_name = base_name
-    index = 1
-    view_names = [view.Name for view in FilteredElementCollector(doc).OfClass(DB.View)]
-
-    while new_name in view_names:
-        new_name = "{} {}".format(base_name, index)
-        index += 1
+    new_name = docindex.get_index(doc).unique_view_name(base_name, "{0} {1}")
 
     dependent_view.Name = new_name  # Geef de nieuwe view een unieke naam
 
@@ -42,6 +42,7 @@ from Autodesk.Revit.UI import *
 
 clr.AddReference('System.Windows.Forms')
 from System.Windows.Forms import MessageBox, MessageBoxButtons, MessageBoxIcon
+from scholtenbim import docindex
 
 # Active document en view
 doc   = __revit__.ActiveUIDocument.Document
@@ -114,12 +115,7 @@ try:
 
     # 2. Unieke naam "<origineel> - Copy", "<origineel> - Copy 1", etc.
     base_name = "{} - Copy".format(active_view.Name)
-    new_name = base_name
-    existing = {v.Name for v in FilteredElementCollector(doc).OfClass(View)}
-    idx = 1
-    while new_name in existing:
-        new_name = "{} {}".format(base_name, idx)
-        idx += 1
+    new_name = docindex.get_index(doc).unique_view_name(base_name, "{0} {1}")
     new_view.Name = new_name
 
     # 3. Scope box uitzetten
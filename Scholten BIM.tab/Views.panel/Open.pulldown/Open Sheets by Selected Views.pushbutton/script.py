@@ -1,11 +1,12 @@
 __title__ = "Open Sheets by Selected Views"
 __author__ = "Scholten BIM Consultancy"
-__doc__ = """Version   = 1.1
+__doc__ = """Version   = 1.4
 Datum    = 20.12.2024
 __________________________________________________________________
 Description:
 
 Met deze tool kan je de sheets op basis van de geselecteerde views uit de project browser in 1x openen ipv per stuk.
+Geselecteerde views (en schedules) die op geen enkele sheet staan worden na afloop gemeld.
 __________________________________________________________________
 How-to:
 -> Zorg dat je een of meerdere views in de 
@@ -14,6 +15,9 @@ How-to:
 __________________________________________________________________
 Last update:
 
+- [18.10.2026] - 1.4 Tijdmetingen (sheet-index, sheets openen) in het timing-log.
+- [18.10.2026] - 1.3 Sheet-index blijft per model bewaard tot het model verandert (rocket mode).
+- [18.10.2026] - 1.2 Sheets worden in 1 pass opgezocht (ook schedules), views zonder sheet worden gemeld.
 - [11.02.2025] - 1.1 PyRevit Forms omgezet naar Windows Forms.
 - [20.12.2024] - 1.0 RELEASE
 __________________________________________________________________
@@ -40,10 +44,13 @@ from pyrevit import revit, DB, HOST_APP
 clr.AddReference('System.Windows.Forms')
 from System.Windows.Forms import MessageBox, MessageBoxButtons, MessageBoxIcon, DialogResult
 
+from scholtenbim import sheetindex, timing
+
 # Actief document en view ophalen
 doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
 active_view = doc.ActiveView
+timings = timing.Timer("Open Sheets by Selected Views", doc)
 
 # Sla de geselecteerde elementen op
 selected_ids = uidoc.Selection.GetElementIds()
@@ -53,25 +60,39 @@ if not selected_ids:
     MessageBox.Show("Geen views geselecteerd.", "Open Selected Views | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Error)
     sys.exit()  # Stop het script als er geen views zijn geselecteerd
 else:
-    sheets_to_open = set()
+    # View -> sheets in 1 pass over alle viewports en schedule-instances
+    with timings.phase("sheet-index"):
+        index = sheetindex.cached(doc)
+    sheets_to_open = []
+    seen_sheets = set()
+    unplaced_views = []
 
     # Itereer door de selectie
     for id in selected_ids:
         element = doc.GetElement(id)
-        
-        # Controleer of het element een View is
-        if isinstance(element, View):
-            # Zoek de sheet waar deze view op staat
-            collector = FilteredElementCollector(doc).OfClass(ViewSheet)
-            for sheet in collector:
-                view_ids = [view_id for view_id in sheet.GetAllPlacedViews()]
-                if element.Id in view_ids:
-                    sheets_to_open.add(sheet)
+
+        # Controleer of het element een View is (sheets zelf worden overgeslagen)
+        if isinstance(element, View) and not isinstance(element, ViewSheet):
+            sheets = index.sheets_for_view(element.Id)
+            if not sheets:
+                unplaced_views.append(element)
+            for sheet in sheets:
+                if sheet.Id not in seen_sheets:
+                    seen_sheets.add(sheet.Id)
+                    sheets_to_open.append(sheet)
+
+    # Views zonder sheet
+    unplaced_msg = ""
+    if unplaced_views:
+        names = sorted(v.Name for v in unplaced_views)
+        unplaced_msg = "\n\n{} geselecteerde view(s) staan op geen enkele sheet:\n{}".format(
+            len(names), "\n".join("- " + name for name in names))
 
     # Open de gevonden sheets
     if sheets_to_open:
-        for sheet in sheets_to_open:
-            uidoc.RequestViewChange(sheet)
-        MessageBox.Show("Er zijn {} sheets geopend.".format(len(sheets_to_open)), "Open Selected Views | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Information)
+        with timings.phase("sheets openen", len(sheets_to_open)):
+            for sheet in sheets_to_open:
+                uidoc.RequestViewChange(sheet)
+        MessageBox.Show("Er zijn {} sheets geopend.{}".format(len(sheets_to_open), unplaced_msg), "Open Selected Views | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Information)
     else:
-        MessageBox.Show("Geen bijbehorende sheets gevonden.", "Open Selected Views | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Warning)
\ No newline at end of file
+        MessageBox.Show("Geen bijbehorende sheets gevonden.{}".format(unplaced_msg), "Open Selected Views | Scholten BIM Consultancy", MessageBoxButtons.OK, MessageBoxIcon.Warning)
\ No newline at end of file
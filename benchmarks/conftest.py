@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks draaien met:
+
+    python -m pytest benchmarks -q
+
+Grotere modellen via `SBC_BENCH_SCALE` (vermenigvuldigt de standaardmaten,
+bijv. 100 voor tot ~200k elementen). Met `SBC_BENCH_JSON=<pad>` worden alle
+curves als JSON weggeschreven.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "tests"))
+sys.path.insert(0, HERE)
+
+import fakerevit  # noqa: E402
+import scaling  # noqa: E402
+
+fakerevit.install()
+
+_curves = []
+_speedups = []
+
+
+def sizes(*base):
+    scale = int(os.environ.get("SBC_BENCH_SCALE", "1"))
+    return [n * scale for n in base]
+
+
+@pytest.fixture(autouse=True)
+def _reset_fakes():
+    from fakerevit import db, pyrevit, system
+    from scholtenbim import doccache, docindex
+    del db.default_application().Documents[:]
+    pyrevit.reset()
+    system.MessageBox.reset()
+    yield
+    docindex._indexes.clear()
+    doccache.invalidate()
+
+
+@pytest.fixture
+def bench():
+    def _bench(name, sizes, setup, run, repeats=3):
+        curve = scaling.measure(name, sizes, setup, run, repeats)
+        _curves.append(curve)
+        return curve
+    return _bench
+
+
+@pytest.fixture
+def compare():
+    """Vergelijkt een oude en een nieuwe aanpak op dezelfde maat (beste van `repeats`)."""
+    def _compare(name, size, setup, before, after, repeats=3):
+        result = scaling.compare(name, size, setup, before, after, repeats)
+        _speedups.append(result)
+        return result
+    return _compare
+
+
+def pytest_terminal_summary(terminalreporter):
+    write = terminalreporter.write_line
+    if _speedups:
+        terminalreporter.section("versnellingen")
+        write("{0:<40} {1:>8} {2:>10} {3:>10} {4:>8}".format("routine", "n", "oud ms", "nieuw ms", "factor"))
+        for result in _speedups:
+            write("{0:<40} {1:>8} {2:>10.1f} {3:>10.1f} {4:>8.1f}".format(*result.row()))
+    if not _curves:
+        return
+    terminalreporter.section("schaalcurves")
+    write("{0:<40} {1:>8} {2:>10} {3:>10} {4:>10} {5:>12}".format(
+        "routine", "n", "ms", "calls/el", "visit/el", "bytes/el"))
+    for curve in _curves:
+        for row in curve.rows():
+            write("{0:<40} {1:>8} {2:>10.2f} {3:>10.2f} {4:>10.2f} {5:>12.1f}".format(*row))
+        write("{0:<40} groeiorde: tijd {1:.2f}, calls {2:.2f}, visited {3:.2f}, geheugen {4:.2f}".format(
+            "", curve.exponent("seconds"), curve.exponent("calls"), curve.exponent("visited"),
+            curve.exponent("peak_bytes")))
+    path = os.environ.get("SBC_BENCH_JSON")
+    if path:
+        with open(path, "w") as out:
+            json.dump([c.as_dict() for c in _curves], out, indent=2)
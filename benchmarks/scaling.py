@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Schaalcurves meten voor de kernroutines van de pushbuttons.
+
+Per modelgrootte wordt gemeten:
+
+- wall-time (beste van `repeats` runs, zonder tracemalloc),
+- API-calls uit `doc.calls` (excl. `collector.visited`) en het aantal door
+  collectors bekeken elementen,
+- de piek aan Python-allocaties tijdens de run (tracemalloc).
+
+`Curve.exponent(metric)` schat de groeiorde met een log-log fit: ~1 is
+lineair, ~2 kwadratisch. `assert_linear()` laat de benchmark falen zodra een
+routine van lineair naar kwadratisch verschuift. API-calls zijn deterministisch
+en worden streng getoetst; tijd krijgt meer marge vanwege meetruis.
+"""
+
+import gc
+import math
+import time
+import tracemalloc
+
+# Maximale groeiorde voordat een routine als "niet lineair" geldt.
+MAX_CALL_EXPONENT = 1.3
+MAX_TIME_EXPONENT = 1.5
+MAX_ALLOC_EXPONENT = 1.5
+# Onder deze tijd (s) op de grootste maat is de tijdcurve te ruisgevoelig.
+MIN_TIME_FOR_FIT = 0.005
+
+
+class Point(object):
+    def __init__(self, size, seconds, calls, visited, peak_bytes):
+        self.size = size
+        self.seconds = seconds
+        self.calls = calls
+        self.visited = visited
+        self.peak_bytes = peak_bytes
+
+    def per_element(self, metric):
+        return getattr(self, metric) / float(self.size)
+
+
+class Curve(object):
+    def __init__(self, name):
+        self.name = name
+        self.points = []
+
+    def exponent(self, metric):
+        """Helling van log(metric) tegen log(size) (kleinste kwadraten)."""
+        pairs = [(math.log(p.size), math.log(getattr(p, metric)))
+                 for p in self.points if getattr(p, metric) > 0]
+        if len(pairs) < 2:
+            return 0.0
+        mean_x = sum(x for x, _ in pairs) / len(pairs)
+        mean_y = sum(y for _, y in pairs) / len(pairs)
+        sxx = sum((x - mean_x) ** 2 for x, _ in pairs)
+        sxy = sum((x - mean_x) * (y - mean_y) for x, y in pairs)
+        return sxy / sxx if sxx else 0.0
+
+    def rows(self):
+        for p in self.points:
+            yield (self.name, p.size, p.seconds * 1000.0, p.per_element("calls"),
+                   p.per_element("visited"), p.per_element("peak_bytes"))
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "points": [p.__dict__ for p in self.points],
+            "exponents": dict((m, self.exponent(m)) for m in ("seconds", "calls", "visited", "peak_bytes")),
+        }
+
+    def assert_linear(self):
+        problems = []
+        for metric, limit in (("calls", MAX_CALL_EXPONENT), ("visited", MAX_CALL_EXPONENT),
+                              ("peak_bytes", MAX_ALLOC_EXPONENT)):
+            exp = self.exponent(metric)
+            if exp > limit:
+                problems.append("{0}: groeiorde {1:.2f} > {2}".format(metric, exp, limit))
+        if self.points and self.points[-1].seconds >= MIN_TIME_FOR_FIT:
+            exp = self.exponent("seconds")
+            if exp > MAX_TIME_EXPONENT:
+                problems.append("seconds: groeiorde {0:.2f} > {1}".format(exp, MAX_TIME_EXPONENT))
+        assert not problems, "{0} schaalt niet lineair: {1}".format(self.name, "; ".join(problems))
+
+
+def _api_calls(doc):
+    return sum(v for k, v in doc.calls.items() if k != "collector.visited")
+
+
+def measure(name, sizes, setup, run, repeats=3):
+    """
+    Meet `run(state)` per grootte. `setup(size)` bouwt het model (niet getimed)
+    en geeft `(doc, state)` terug; voor elke run wordt opnieuw opgebouwd omdat
+    de routines het model wijzigen.
+    """
+    curve = Curve(name)
+    for size in sizes:
+        best = None
+        calls = visited = 0
+        for _ in range(repeats):
+            doc, state = setup(size)
+            doc.calls.clear()
+            gc.collect()
+            start = time.perf_counter()
+            run(state)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+            calls, visited = _api_calls(doc), doc.calls["collector.visited"]
+
+        doc, state = setup(size)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run(state)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        curve.points.append(Point(size, best, calls, visited, peak))
+    return curve
+
+
+class Speedup(object):
+    def __init__(self, name, size, before, after):
+        self.name = name
+        self.size = size
+        self.before = before
+        self.after = after
+
+    @property
+    def factor(self):
+        return self.before / self.after if self.after else float("inf")
+
+    def row(self):
+        return (self.name, self.size, self.before * 1000.0, self.after * 1000.0, self.factor)
+
+
+def _best_time(setup, size, run, repeats):
+    best = None
+    for _ in range(repeats):
+        doc, state = setup(size)
+        gc.collect()
+        start = time.perf_counter()
+        run(state)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def compare(name, size, setup, before, after, repeats=3):
+    """Beste wall-time van `before(state)` en `after(state)` op een vers model van `size`."""
+    return Speedup(name, size, _best_time(setup, size, before, repeats), _best_time(setup, size, after, repeats))
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+import fakerevit
+from fakerevit import db, models
+
+from conftest import sizes
+
+CLEAR_MARK = "Elements.panel/ClearMark.pushbutton/script.py"
+
+
+def _setup(size):
+    doc = models.generic_model(size, mark_ratio=0.8)
+    return doc, fakerevit.load_script(CLEAR_MARK, doc)
+
+
+def test_collect_whole_model(bench):
+    curve = bench("ClearMark: collect_whole_model_only_filled", sizes(500, 1000, 2000, 4000),
+                  _setup, lambda mod: mod.collect_whole_model_only_filled())
+    curve.assert_linear()
+
+
+def test_clear_mark_with_progress(bench):
+    def setup(size):
+        doc, mod = _setup(size)
+        return doc, (mod, mod.collect_whole_model_only_filled())
+
+    curve = bench("ClearMark: clear_mark_with_progress", sizes(500, 1000, 2000, 4000),
+                  setup, lambda state: state[0].clear_mark_with_progress(state[1]))
+    curve.assert_linear()
+
+
+def test_collect_selection(bench):
+    def setup(size):
+        doc = models.generic_model(size, mark_ratio=0.8)
+        uidoc = fakerevit.bind(doc)
+        uidoc.Selection.SetElementIds([e.Id for e in doc._iter_class(db.FamilyInstance)])
+        return doc, fakerevit.load_script(CLEAR_MARK, doc, uidoc=uidoc)
+
+    curve = bench("ClearMark: collect_selection_only_filled", sizes(500, 1000, 2000, 4000),
+                  setup, lambda mod: mod.collect_selection_only_filled())
+    curve.assert_linear()
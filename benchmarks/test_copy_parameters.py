@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""De source_values/set_parameter_value-lus van de CopyParameter-knoppen."""
+import fakerevit
+from fakerevit import db, models, pyrevit
+
+from conftest import sizes
+
+PULLDOWN = "Elements.panel/CopyParameters.pulldown/"
+SIZES = sizes(250, 500, 1000, 2000)
+
+
+def _picks(size):
+    doc = models.generic_model(size)
+    instances = list(doc._iter_class(db.FamilyInstance))
+    source = instances[0]
+    models.fill_parameters(source, dict((name, "Waarde {0}".format(i))
+                                        for i, name in enumerate(models.CT_PARAMETERS)))
+    models.fill_parameters(source, {"Comments": "Bron"})
+    picks = [models.reference(source), [models.reference(e) for e in instances[1:]]]
+    return doc, picks
+
+
+def _bench_script(bench, name, script, alerts=()):
+    def run(state):
+        doc, picks = state
+        pyrevit.answers.push("alert", *alerts)
+        fakerevit.load_script(PULLDOWN + script, doc, picks=picks)
+
+    def setup(size):
+        doc, picks = _picks(size)
+        return doc, (doc, picks)
+
+    return bench(name, SIZES, setup, run)
+
+
+def test_from_to_multiple(bench):
+    _bench_script(bench, "CopyParameterFromToMultiple", "CopyParameterFromToMultiple.pushbutton/script.py").assert_linear()
+
+
+def test_from_to_type(bench):
+    _bench_script(bench, "CopyParameterFromToType", "CopyParameterFromToType.pushbutton/script.py",
+                  alerts=["Objecten selecteren"]).assert_linear()
+
+
+def test_copy_parameter(bench):
+    _bench_script(bench, "CopyParameter", "CopyParameter.pushbutton/script.py").assert_linear()
+
+
+# ------------------------------
+# Parameter-resolutie (FromToMultiple)
+# ------------------------------
+SPEEDUP_SIZE = sizes(20000)[0]
+# Een brandklep in Revit heeft ~80 instance-parameters vóór de shared CT_-parameters.
+PARAMETERS_PER_ELEMENT = 80
+# Lookup alleen / lookup + Set; de Set-kosten zijn voor beide gelijk.
+MIN_LOOKUP_SPEEDUP = 2.0
+MIN_WRITE_SPEEDUP = 1.3
+
+
+def _target_loop(lookup, write=True):
+    def run(state):
+        doc, elements, names, values = state
+        t = db.Transaction(doc, "Bench")
+        t.Start()
+        for element in elements:
+            for param, value in zip(lookup(element, names), values):
+                if param and write:
+                    param.Set(value)
+        t.Commit()
+    return run
+
+
+def _by_name(element, names):
+    # Werking t/m 1.2: een check en een tweede lookup in set_parameter_value.
+    return [element.LookupParameter(name) if element.LookupParameter(name) else None for name in names]
+
+
+_resolution_models = {}
+
+
+def _resolution_setup(size):
+    # Elke run schrijft dezelfde waarden, dus één model per maat volstaat.
+    if size not in _resolution_models:
+        doc = models.generic_model(size, extra_parameters=PARAMETERS_PER_ELEMENT)
+        values = ["Waarde {0}".format(i) for i in range(len(models.CT_PARAMETERS))]
+        _resolution_models[size] = doc, (doc, list(doc._iter_class(db.FamilyInstance)),
+                                         list(models.CT_PARAMETERS), values)
+    return _resolution_models[size]
+
+
+def _resolved(write):
+    from scholtenbim import paramcache
+
+    def run(state):
+        resolver = paramcache.ParameterResolver()
+        _target_loop(resolver.get_many, write)(state)
+    return run
+
+
+def test_from_to_multiple_parameter_resolution(compare):
+    lookup = compare("FromToMultiple: alleen lookup", SPEEDUP_SIZE, _resolution_setup,
+                     _target_loop(_by_name, write=False), _resolved(write=False))
+    write = compare("FromToMultiple: lookup + Set", SPEEDUP_SIZE, _resolution_setup,
+                    _target_loop(_by_name), _resolved(write=True))
+    _resolution_models.clear()
+    assert lookup.factor >= MIN_LOOKUP_SPEEDUP
+    assert write.factor >= MIN_WRITE_SPEEDUP
+
+
+# ------------------------------
+# CopyParameterLink: automatisch op overlap
+# ------------------------------
+OVERLAP_SIZE = sizes(600)[0]
+MIN_OVERLAP_SPEEDUP = 5.0
+
+
+def _linked_setup(size):
+    model = models.linked_elements_model(size, sources=size // 2)
+    return model.doc, (model.doc, [models.reference(e) for e in model.targets])
+
+
+def test_copy_parameter_link_by_overlap(bench):
+    def run(state):
+        doc, refs = state
+        pyrevit.answers.push("alert", "Automatisch op overlap")
+        fakerevit.load_script(PULLDOWN + "CopyParameterLink.pushbutton/script.py", doc, picks=[refs])
+
+    bench("CopyParameterLink (overlap)", SIZES, _linked_setup, run).assert_linear()
+
+
+def _overlap_setup(size):
+    from scholtenbim import spatialindex
+
+    model = models.linked_elements_model(size, sources=size // 2)
+    boxes = [spatialindex.Box.from_bounding_box(e.get_BoundingBox(None)) for e in model.targets]
+    return model.doc, (model.link_instance, boxes)
+
+
+def _brute_force(state):
+    # Elk hostelement tegen alle elementen uit de link.
+    from scholtenbim import spatialindex
+
+    link, boxes = state
+    transform = link.GetTotalTransform()
+    sources = [spatialindex.Box.from_bounding_box(e.get_BoundingBox(None), transform)
+               for e in db.FilteredElementCollector(link.GetLinkDocument()).WhereElementIsNotElementType()
+               if e.Category is not None and e.get_BoundingBox(None) is not None]
+    for box in boxes:
+        max((s.overlap(box), -s.volume) for s in sources)
+
+
+def _indexed(state):
+    from scholtenbim import spatialindex
+
+    link, boxes = state
+    index = spatialindex.LinkedElementIndex(link)
+    for box in boxes:
+        index.grid.best_match(box)
+
+
+def test_overlap_matching_speedup(compare):
+    assert compare("CopyParameterLink: koppelen op overlap", OVERLAP_SIZE, _overlap_setup,
+                   _brute_force, _indexed).factor >= MIN_OVERLAP_SPEEDUP
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""Metadata van een link: live uitlezen tegenover de linkcache (ongewijzigde link)."""
+import os
+import tempfile
+
+from fakerevit import models
+
+from conftest import sizes
+
+SPEEDUP_SIZE = sizes(10000)[0]
+# De fake API is veel sneller dan Revit; in Revit is het verschil groter.
+MIN_SPEEDUP = 1.5
+PARAMETERS = ["Family and Type", "Comments"]
+
+
+def _setup(size):
+    from scholtenbim import linkcache
+
+    model = models.linked_elements_model(10, sources=size)
+    folder = tempfile.mkdtemp()
+    model.link_doc.PathName = os.path.join(folder, "Bouwkunde.rvt")
+    with open(model.link_doc.PathName, "w") as f:
+        f.write("rvt")
+    cache_file = os.path.join(folder, "cache.sqlite")
+    # Cache vullen zoals bij de eerste run.
+    linkcache.LinkMetadataCache(cache_file).records(model.link_doc, parameters=PARAMETERS)
+    return model.doc, (model.link_doc, cache_file)
+
+
+def _live(state):
+    from scholtenbim import linkcache
+
+    link_doc, _ = state
+    linkcache.LinkMetadataCache()._read_live(link_doc, PARAMETERS)
+
+
+def _cached(state):
+    from scholtenbim import linkcache
+
+    link_doc, cache_file = state
+    cache = linkcache.LinkMetadataCache(cache_file)
+    cache.records(link_doc, parameters=PARAMETERS)
+    cache.close()
+    assert cache.live_reads == 0
+
+
+def test_link_metadata_cache_speedup(compare):
+    assert compare("Linkmetadata: live / cache", SPEEDUP_SIZE, _setup, _live, _cached).factor >= MIN_SPEEDUP
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Elementen koppelen aan rooms uit een link (Copy Room Parameters From Link)."""
+from fakerevit import db, models
+
+from conftest import sizes
+
+ELEMENTS_PER_ROOM = 50
+SPEEDUP_SIZE = sizes(5000)[0]
+MIN_SPEEDUP = 3.0
+
+
+def _setup(size):
+    from scholtenbim import roomcontainment
+
+    model = models.linked_rooms_model(max(1, size // ELEMENTS_PER_ROOM), levels=4, rotation=0.3)
+    models.add_room_contents(model, per_room=ELEMENTS_PER_ROOM, outside=size // 20)
+    points = roomcontainment.element_points(model.doc._iter_class(db.FamilyInstance))
+    return model.doc, (model.link_instance, points)
+
+
+def _indexed(state):
+    from scholtenbim import roomcontainment
+
+    link, points = state
+    roomcontainment.RoomContainment(roomcontainment.room_footprints(link)).assign(points)
+
+
+def _every_room(state):
+    # Elk element tegen elke room tot de eerste treffer.
+    from scholtenbim import roomcontainment
+
+    link, points = state
+    footprints = roomcontainment.room_footprints(link)
+    for _, point in points:
+        for footprint in footprints:
+            if footprint.is_point_in_room(point):
+                break
+
+
+def test_room_containment(bench):
+    bench("RoomContainment.assign", sizes(2500, 5000, 10000, 20000), _setup, _indexed).assert_linear()
+
+
+def test_room_containment_speedup(compare):
+    assert compare("RoomContainment: alle rooms / raster", SPEEDUP_SIZE, _setup,
+                   _every_room, _indexed).factor >= MIN_SPEEDUP
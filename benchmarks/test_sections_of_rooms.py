@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+import fakerevit
+from fakerevit import models
+
+from conftest import sizes
+
+SECTIONS_OF_ROOMS = "Views.panel/Create SectionViews.pulldown/Sections of Rooms.pushbutton/script.py"
+
+
+def test_sections_of_rooms(bench):
+    def setup(size):
+        model = models.linked_rooms_model(size)
+        picks = [[models.reference(room, model.link_instance) for room in model.rooms]]
+        return model.doc, (model.doc, picks)
+
+    def run(state):
+        doc, picks = state
+        fakerevit.load_script(SECTIONS_OF_ROOMS, doc, picks=picks)
+
+    bench("Sections of Rooms", sizes(25, 50, 100, 200), setup, run).assert_linear()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Sheet-scans van Revisions on Sheets en Open Sheets by Selected Views."""
+import fakerevit
+from fakerevit import models, pyrevit
+
+from scholtenbim import doccache
+
+from conftest import sizes
+
+REVISIONS_ON_SHEETS = "Revisions.panel/Revisions.pulldown/Revisions on Sheets.pushbutton/script.py"
+OPEN_SHEETS_BY_VIEWS = "Views.panel/Open.pulldown/Open Sheets by Selected Views.pushbutton/script.py"
+SIZES = sizes(50, 100, 200, 400)
+WARM_SIZE = sizes(400)[0]
+MIN_WARM_SPEEDUP = 1.2
+
+
+def test_revisions_on_sheets(bench):
+    def setup(size):
+        model = models.sheet_model(size, revisions=10, revisions_per_sheet=3)
+        return model.doc, model.doc
+
+    def run(doc):
+        pyrevit.answers.push("SelectFromList", "1 - Revisie A")
+        fakerevit.load_script(REVISIONS_ON_SHEETS, doc)
+
+    bench("Revisions on Sheets", SIZES, setup, run).assert_linear()
+
+
+def test_open_sheets_by_selected_views(bench):
+    # Net als in de praktijk groeit de selectie mee met het project.
+    def setup(size):
+        model = models.sheet_model(size, views_per_sheet=2)
+        uidoc = fakerevit.bind(model.doc)
+        uidoc.Selection.SetElementIds([v.Id for v in model.views[::4]])
+        return model.doc, (model.doc, uidoc)
+
+    def run(state):
+        fakerevit.load_script(OPEN_SHEETS_BY_VIEWS, state[0], uidoc=state[1])
+
+    bench("Open Sheets by Selected Views", SIZES, setup, run).assert_linear()
+
+
+def test_open_sheets_second_click_uses_doccache(compare):
+    # Eerste klik (untimed) vult de cache; daarna koud (cache leeg) tegen warm.
+    def setup(size):
+        model = models.sheet_model(size, views_per_sheet=2)
+        uidoc = fakerevit.bind(model.doc)
+        uidoc.Selection.SetElementIds([v.Id for v in model.views[::4]])
+        fakerevit.load_script(OPEN_SHEETS_BY_VIEWS, model.doc, uidoc=uidoc)
+        return model.doc, (model.doc, uidoc)
+
+    def cold(state):
+        doccache.invalidate(state[0])
+        fakerevit.load_script(OPEN_SHEETS_BY_VIEWS, state[0], uidoc=state[1])
+
+    def warm(state):
+        fakerevit.load_script(OPEN_SHEETS_BY_VIEWS, state[0], uidoc=state[1])
+
+    result = compare("Open Sheets by Selected Views: 2e klik", WARM_SIZE, setup, cold, warm)
+    assert result.factor >= MIN_WARM_SPEEDUP
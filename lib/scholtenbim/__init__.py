@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""
+Gedeelde bibliotheek voor de Scholten BIM extensie.
+
+pyRevit zet de map `lib` van de extensie automatisch op het zoekpad, zodat
+elke pushbutton deze modules kan importeren met bijvoorbeeld:
+
+    from scholtenbim import docindex
+"""
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Batchverwerking in blokken binnen één TransactionGroup.
+
+Grote hoeveelheden wijzigingen (honderden views, duizenden parameters) in één
+transactie maken Revit traag en niet te annuleren; één transactie per item
+betekent een regeneratie per item. `run_chunked` zit ertussenin: elke
+`chunk_size` items één transactie, alles samen in één TransactionGroup zodat
+het voor de gebruiker één undo-stap is, met een voortgangsbalk die na elk
+blok kan annuleren. Bij annuleren kan de gebruiker kiezen of de al verwerkte
+blokken behouden blijven (`ask_keep_on_cancel`).
+
+De voortgangsbalk wordt hooguit ~10 keer per seconde bijgewerkt: bij
+honderdduizenden items kost elke UI-update anders meer dan het werk zelf.
+`write_parameters` is de variant voor het in bulk zetten van parameters.
+De tijd voor het verwerken van de items en voor de commits (inclusief
+regeneratie) gaat als twee fases naar `timing`, onder de naam van de groep.
+
+Gebruik:
+
+    from scholtenbim import batch
+
+    result = batch.run_chunked(doc, "Create Room Sections", jobs, create_section,
+                               chunk_size=50, title="Sections aanmaken")
+    if result.cancelled:
+        ...
+"""
+
+import time
+
+import Autodesk.Revit.DB as RDB
+
+from scholtenbim import timing
+
+DEFAULT_CHUNK_SIZE = 100
+# Parameters zetten is goedkoop; grotere blokken = minder transacties.
+WRITE_CHUNK_SIZE = 1000
+# Minimale tijd (s) tussen twee updates van de voortgangsbalk.
+PROGRESS_INTERVAL = 0.1
+KEEP = "Behouden"
+UNDO = "Terugdraaien"
+
+
+class BatchResult(object):
+    def __init__(self):
+        self.results = []
+        self.failures = []
+        self.processed = 0
+        self.cancelled = False
+        # Geannuleerd, maar de verwerkte blokken zijn op verzoek behouden.
+        self.kept = False
+
+    @property
+    def succeeded(self):
+        return [r for r in self.results if r is not None]
+
+
+class ProgressThrottle(object):
+    """
+    Geeft `update(done, total)` door aan de voortgangsbalk, maar hooguit eens
+    per `interval` seconden. De eerste en de laatste update gaan altijd door.
+    """
+
+    def __init__(self, update, interval=None, clock=time.time):
+        self._update = update
+        self.interval = PROGRESS_INTERVAL if interval is None else interval
+        self._clock = clock
+        self._last = None
+        self.updates = 0
+
+    def __call__(self, done, total):
+        now = self._clock()
+        if self._last is not None and done < total and now - self._last < self.interval:
+            return False
+        self._last = now
+        self.updates += 1
+        self._update(done, total)
+        return True
+
+
+def chunks(items, size):
+    items = list(items)
+    size = max(1, int(size))
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def run_chunked(doc, name, items, action, chunk_size=DEFAULT_CHUNK_SIZE, title=None, cancellable=True,
+                failures_preprocessor=None, ask_keep_on_cancel=False):
+    """
+    Roept `action(item)` aan voor elk item, in blokken van `chunk_size` per
+    transactie binnen één TransactionGroup `name`.
+
+    Een exception in `action` wordt per item opgevangen en komt in
+    `result.failures` als (item, exception). Bij annuleren wordt de hele groep
+    teruggedraaid, tenzij de gebruiker met `ask_keep_on_cancel` kiest om de al
+    verwerkte blokken te behouden (`result.kept`). Een `failures_preprocessor`
+    (IFailuresPreprocessor) wordt op elke transactie gezet.
+    """
+    from pyrevit import forms
+
+    items = list(items)
+    result = BatchResult()
+    if not items:
+        return result
+
+    timer = timing.Timer(name, doc)
+    work = commit = 0.0
+    commits = 0
+    group = RDB.TransactionGroup(doc, name)
+    group.Start()
+    try:
+        with forms.ProgressBar(title=title or name, cancellable=cancellable, step=1) as pb:
+            progress = ProgressThrottle(pb.update_progress)
+            for chunk in chunks(items, chunk_size):
+                if cancellable and pb.cancelled:
+                    result.cancelled = True
+                    break
+                t = RDB.Transaction(doc, name)
+                if failures_preprocessor is not None:
+                    options = t.GetFailureHandlingOptions()
+                    t.SetFailureHandlingOptions(options.SetFailuresPreprocessor(failures_preprocessor))
+                t.Start()
+                try:
+                    start = time.time()
+                    for item in chunk:
+                        try:
+                            result.results.append(action(item))
+                        except Exception as e:
+                            result.results.append(None)
+                            result.failures.append((item, e))
+                        result.processed += 1
+                        progress(result.processed, len(items))
+                    work += time.time() - start
+                    start = time.time()
+                    t.Commit()
+                    commit += time.time() - start
+                    commits += 1
+                except Exception:
+                    if t.HasStarted() and not t.HasEnded():
+                        t.RollBack()
+                    raise
+    except Exception:
+        group.RollBack()
+        raise
+
+    if result.cancelled and ask_keep_on_cancel and result.processed:
+        choice = forms.alert("Geannuleerd na {0} van {1} item(s). Wat moet er met de al verwerkte items gebeuren?"
+                             .format(result.processed, len(items)), title=title or name, options=[KEEP, UNDO])
+        result.kept = choice == KEEP
+    start = time.time()
+    if result.cancelled and not result.kept:
+        group.RollBack()
+        result.results = []
+    else:
+        group.Assimilate()
+    commit += time.time() - start
+    timer.record("verwerken", work, result.processed)
+    timer.record("commit", commit, commits)
+    return result
+
+
+def write_parameters(doc, name, writes, chunk_size=WRITE_CHUNK_SIZE, title=None, ask_keep_on_cancel=True,
+                     setter=None):
+    """
+    Zet parameters in bulk via `run_chunked`. `writes` zijn (element, parameter,
+    waarde)-tuples; de waarde wordt zonder verdere controle gezet, dus filter
+    vooraf (bijv. met een ElementParameterFilter in de collector) op elementen
+    die echt aangepast moeten worden. Ontbrekende of alleen-lezen parameters
+    en waarden die Revit weigert (`Set` geeft False) komen in
+    `result.failures`; `result.succeeded` bevat de aangepaste elementen.
+    Met `setter(parameter, waarde)` kan de waarde eerst worden omgezet
+    (bijv. `paramrules.set_parameter_text`); standaard `parameter.Set(waarde)`.
+    """
+    def write(job):
+        element, parameter, value = job
+        if parameter is None:
+            raise ValueError("Parameter ontbreekt")
+        if parameter.IsReadOnly:
+            raise ValueError("Parameter is alleen-lezen")
+        if setter is not None:
+            setter(parameter, value)
+        elif parameter.Set(value) is False:
+            raise ValueError("Parameter.Set gaf False")
+        return element
+
+    return run_chunked(doc, name, writes, write, chunk_size=chunk_size, title=title,
+                       ask_keep_on_cancel=ask_keep_on_cancel)
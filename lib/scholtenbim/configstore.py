@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Instellingen van de tools per gebruiker en per project.
+
+Eerder schreef elke knop zijn eigen `config.json` naast het script: in de
+geïnstalleerde extensie, dus gedeeld door iedereen op een netwerk- of Citrix-
+installatie. Gelijktijdige gebruikers overschreven elkaars instellingen en
+soms een half geschreven bestand. Nu staat alles in één bestand in de pyRevit
+app-data map van de gebruiker:
+
+    {"user": {tool: waarde}, "projects": {project: {tool: waarde}}}
+
+Opzoeken gaat op volgorde: het profiel van het project (centraal model of
+pad van het document), het gebruikersprofiel (laatst opgeslagen waarde) en
+als laatste de meegeleverde `config.json` naast het script, die alleen nog
+gelezen wordt. Het geparste bestand blijft in `doccache` tot de
+wijzigingsdatum verandert; opslaan gebeurt alleen als de waarde anders is,
+via een tijdelijk bestand dat in één keer het oude vervangt.
+
+Gebruik:
+
+    from scholtenbim import configstore
+
+    config = configstore.load("CopyParameter", doc, default={...},
+                              defaults_file=os.path.join(os.path.dirname(__file__), "config.json"))
+    configstore.save("CopyParameter", config, doc)
+"""
+
+import copy
+import io
+import json
+import os
+import uuid
+
+import Autodesk.Revit.DB as RDB
+
+from scholtenbim import doccache
+
+CONFIG_FILE_ID = "ScholtenBIM_Config"
+
+
+def store_path():
+    """Instellingenbestand in de pyRevit app-data map van de gebruiker."""
+    from pyrevit import script
+    return script.get_universal_data_file(CONFIG_FILE_ID, "json")
+
+
+def project_key(doc):
+    """Centraal model bij worksharing (alle lokale kopieën delen dan één profiel), anders het pad of de titel."""
+    path = doc.PathName
+    try:
+        if doc.IsWorkshared:
+            central = doc.GetWorksharingCentralModelPath()
+            path = RDB.ModelPathUtils.ConvertModelPathToUserVisiblePath(central) or path
+    except Exception:
+        pass
+    return os.path.normcase(path) if path else doc.Title
+
+
+def _read(path):
+    """Inhoud van een JSON-bestand, of None als het ontbreekt, leeg of beschadigd is."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with io.open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        return json.loads(text) if text.strip() else None
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def _read_store(path):
+    data = _read(path)
+    if not isinstance(data, dict):
+        data = {}
+    data.setdefault("user", {})
+    data.setdefault("projects", {})
+    return data
+
+
+def load(tool, doc=None, default=None, defaults_file=None):
+    """
+    Instellingen van `tool`: projectprofiel van `doc`, gebruikersprofiel,
+    `defaults_file` (meegeleverde config.json) of `default`. Geeft een kopie
+    terug; aanpassen en bewaren gaat via `save`.
+    """
+    data = doccache.load_file(store_path(), _read_store)
+    value = None
+    if doc is not None:
+        value = data["projects"].get(project_key(doc), {}).get(tool)
+    if value is None:
+        value = data["user"].get(tool)
+    if value is None and defaults_file:
+        value = doccache.load_file(defaults_file, _read)
+    if value is None:
+        value = default
+    return copy.deepcopy(value)
+
+
+def save(tool, value, doc=None):
+    """
+    Bewaar `value` voor `tool` in het gebruikersprofiel en, met `doc`, in het
+    projectprofiel. Geeft False terug (en schrijft niets) als er niets verandert.
+    """
+    path = store_path()
+    # Vers inlezen: een andere Revit-sessie van dezelfde gebruiker kan intussen geschreven hebben.
+    data = _read_store(path)
+    profiles = [data["user"]]
+    if doc is not None:
+        profiles.append(data["projects"].setdefault(project_key(doc), {}))
+    if all(profile.get(tool) == value for profile in profiles):
+        return False
+    for profile in profiles:
+        profile[tool] = copy.deepcopy(value)
+    _write_atomic(path, data)
+    doccache.invalidate_file(path)
+    return True
+
+
+def _write_atomic(path, data):
+    folder = os.path.dirname(path)
+    if folder and not os.path.isdir(folder):
+        os.makedirs(folder)
+    temp = u"{0}.{1}.tmp".format(path, uuid.uuid4().hex)
+    text = json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False)
+    try:
+        with io.open(temp, "w", encoding="utf-8") as f:
+            f.write(u"{0}".format(text))
+        _replace(temp, path)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+
+
+def _replace(source, target):
+    """`source` in één stap over `target` heen zetten."""
+    replace = getattr(os, "replace", None)
+    if replace is not None:
+        replace(source, target)
+        return
+    if os.path.exists(target):
+        # IronPython 2.7: os.rename overschrijft op Windows geen bestaand bestand.
+        from System.IO import File
+        File.Replace(source, target, None)
+    else:
+        os.rename(source, target)
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Crop regions op basis van een contour (bijvoorbeeld een room-boundary).
+
+Een room-boundary kan honderden segmenten hebben (bogen, getekende gevels).
+Zo'n crop-shape maakt elke regeneratie van de view traag. Daarom wordt de
+contour eerst vereenvoudigd (Douglas-Peucker met een tolerantie in feet), dan
+naar buiten verschoven en pas daarna als `CurveLoop` op de view gezet.
+`oriented_rectangle` geeft de kleinste rechthoek om een contour, uitgelijnd op
+de hoofdrichting van de wanden, voor sections die recht op een ruimte staan.
+
+Gebruik:
+
+    from scholtenbim import cropregion
+
+    points = cropregion.simplify(points, 20.0 / 304.8)
+    points = cropregion.offset_polygon(points, 200.0 / 304.8)
+    cropregion.set_crop_shape(view, cropregion.curve_loop(points))
+"""
+
+import math
+
+import Autodesk.Revit.DB as RDB
+
+# Afwijking (feet) die de vereenvoudigde contour mag hebben t.o.v. het origineel.
+SIMPLIFY_TOLERANCE = 20.0 / 304.8
+# Meer punten dan dit: tolerantie verdubbelen tot de contour klein genoeg is.
+MAX_POINTS = 64
+# Kortere zijden laat Revit niet toe in een CurveLoop.
+MIN_SEGMENT_LENGTH = 2.0 / 304.8
+# Scherpe hoeken verder dan dit x de offset uitsteken worden afgeschuind.
+MITER_LIMIT = 4.0
+# Rechthoek langs de hoofdrichting mag zoveel groter zijn dan de kleinste.
+DOMINANT_AREA_RATIO = 1.05
+
+
+def boundary_points(curves, transform=None):
+    """Hoekpunten van een gesloten reeks curves; bogen worden getesselleerd."""
+    points = []
+    for curve in curves:
+        if transform is not None:
+            curve = curve.CreateTransformed(transform)
+        tessellated = list(curve.Tessellate())
+        points.extend(tessellated[:-1])
+    return points
+
+
+def signed_area(points):
+    """Oppervlakte in het XY-vlak; positief als de punten tegen de klok in lopen."""
+    area = 0.0
+    for i in range(len(points)):
+        p, q = points[i - 1], points[i]
+        area += p.X * q.Y - q.X * p.Y
+    return area / 2.0
+
+
+def _dedupe(points, min_length):
+    out = []
+    for p in points:
+        if not out or _distance_2d(out[-1], p) >= min_length:
+            out.append(p)
+    while len(out) > 1 and _distance_2d(out[-1], out[0]) < min_length:
+        out.pop()
+    return out
+
+
+def _distance_2d(p, q):
+    return math.hypot(q.X - p.X, q.Y - p.Y)
+
+
+def _segment_distance(p, a, b):
+    dx, dy = b.X - a.X, b.Y - a.Y
+    length2 = dx * dx + dy * dy
+    if length2 == 0.0:
+        return _distance_2d(p, a)
+    t = max(0.0, min(1.0, ((p.X - a.X) * dx + (p.Y - a.Y) * dy) / length2))
+    return math.hypot(p.X - (a.X + t * dx), p.Y - (a.Y + t * dy))
+
+
+def _douglas_peucker(points, tolerance):
+    """Gesloten contour vereenvoudigen; iteratief i.v.m. recursielimiet in IronPython."""
+    count = len(points)
+    # Tweede ankerpunt: het punt het verst van punt 0, zodat beide helften
+    # een echte koorde hebben.
+    far = max(range(count), key=lambda i: _distance_2d(points[0], points[i]))
+    keep = set([0, far])
+    ring = points + [points[0]]
+    stack = [(0, far), (far, count)]
+    while stack:
+        start, end = stack.pop()
+        best, best_index = 0.0, None
+        for i in range(start + 1, end):
+            d = _segment_distance(ring[i], ring[start], ring[end])
+            if d > best:
+                best, best_index = d, i
+        if best_index is not None and best > tolerance:
+            keep.add(best_index)
+            stack.append((start, best_index))
+            stack.append((best_index, end))
+    return [points[i] for i in sorted(keep)]
+
+
+def simplify(points, tolerance=SIMPLIFY_TOLERANCE, max_points=MAX_POINTS, min_length=MIN_SEGMENT_LENGTH):
+    """
+    Vereenvoudigde gesloten contour. Punten binnen `tolerance` van de lijn
+    tussen hun buren vallen weg; heeft het resultaat nog meer dan
+    `max_points` punten, dan wordt de tolerantie verdubbeld.
+    """
+    points = _dedupe(points, min_length)
+    if len(points) <= 3:
+        return points
+    result = _douglas_peucker(points, tolerance)
+    while len(result) > max_points:
+        tolerance *= 2.0
+        result = _douglas_peucker(points, tolerance)
+    return result
+
+
+def offset_polygon(points, distance, miter_limit=MITER_LIMIT):
+    """Contour `distance` naar buiten verschoven (tegen de klok in georiënteerd)."""
+    if signed_area(points) < 0:
+        points = list(reversed(points))
+    count = len(points)
+    out = []
+    for i in range(count):
+        prev, cur, nxt = points[i - 1], points[i], points[(i + 1) % count]
+        n1 = _outward_normal(prev, cur)
+        n2 = _outward_normal(cur, nxt)
+        bisector = (n1[0] + n2[0], n1[1] + n2[1])
+        cos_half = math.sqrt(max(0.0, (1.0 + n1[0] * n2[0] + n1[1] * n2[1]) / 2.0))
+        length = math.hypot(bisector[0], bisector[1])
+        if cos_half < 1.0 / miter_limit:
+            convex = (cur.X - prev.X) * (nxt.Y - cur.Y) - (cur.Y - prev.Y) * (nxt.X - cur.X) > 0
+            if convex:
+                # Spitse buitenhoek: afschuinen in plaats van een lange punt.
+                out.append(RDB.XYZ(cur.X + n1[0] * distance, cur.Y + n1[1] * distance, cur.Z))
+                out.append(RDB.XYZ(cur.X + n2[0] * distance, cur.Y + n2[1] * distance, cur.Z))
+                continue
+            # Spitse binnenhoek: afschuinen zou de verschoven zijden laten kruisen;
+            # één punt op de bissectrice, begrensd op de miterlimiet.
+            scale = distance * miter_limit / length if length > 1e-12 else 0.0
+        else:
+            scale = distance / cos_half / length
+        out.append(RDB.XYZ(cur.X + bisector[0] * scale, cur.Y + bisector[1] * scale, cur.Z))
+    return out
+
+
+def _outward_normal(p, q):
+    dx, dy = q.X - p.X, q.Y - p.Y
+    length = math.hypot(dx, dy)
+    return (dy / length, -dx / length)
+
+
+def curve_loop(points, z=None):
+    """Gesloten CurveLoop van lijnen door `points`, optioneel op hoogte `z`."""
+    if z is not None:
+        points = [RDB.XYZ(p.X, p.Y, z) for p in points]
+    loop = RDB.CurveLoop()
+    for i in range(len(points)):
+        loop.Append(RDB.Line.CreateBound(points[i], points[(i + 1) % len(points)]))
+    return loop
+
+
+def set_crop_shape(view, loop):
+    """Zet `loop` als crop-shape; False als de view geen vrije crop-shape kan hebben."""
+    manager = view.GetCropRegionShapeManager()
+    if not manager.CanHaveShape:
+        return False
+    manager.SetCropShape(loop)
+    return True
+
+
+class OrientedRectangle(object):
+    """Rechthoek in het XY-vlak: middelpunt, eenheidsassen en halve maten."""
+
+    def __init__(self, center, axis_x, half_x, half_y):
+        self.center = center
+        self.axis_x = axis_x
+        self.axis_y = RDB.XYZ(-axis_x.Y, axis_x.X, 0)
+        self.half_x = half_x
+        self.half_y = half_y
+
+    @property
+    def area(self):
+        return 4.0 * self.half_x * self.half_y
+
+
+def _convex_hull(points):
+    """Monotone chain; tegen de klok in, zonder collineaire punten."""
+    pts = sorted(set((p.X, p.Y) for p in points))
+    if len(pts) <= 2:
+        return pts
+
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+    lower, upper = [], []
+    for p in pts:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    for p in reversed(pts):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return lower[:-1] + upper[:-1]
+
+
+def _normalize_angle(angle):
+    """Hoek terug naar (-45°, 45°]: een rechthoek is symmetrisch per 90°."""
+    quarter = math.pi / 2.0
+    angle = math.fmod(angle, quarter)
+    if angle > quarter / 2.0:
+        angle -= quarter
+    elif angle <= -quarter / 2.0:
+        angle += quarter
+    return angle
+
+
+def dominant_angle(points):
+    """Hoofdrichting van een gesloten contour: lengte-gewogen gemiddelde van de zijden (mod 90°)."""
+    # Gemiddelde over hoeken x4 zodat 0°, 90°, 180° en 270° samenvallen.
+    sx = sy = 0.0
+    for i in range(len(points)):
+        p, q = points[i - 1], points[i]
+        length = _distance_2d(p, q)
+        angle = math.atan2(q.Y - p.Y, q.X - p.X)
+        sx += length * math.cos(4.0 * angle)
+        sy += length * math.sin(4.0 * angle)
+    if abs(sx) < 1e-12 and abs(sy) < 1e-12:
+        return 0.0
+    return _normalize_angle(math.atan2(sy, sx) / 4.0)
+
+
+def _rectangle_at(hull, angle):
+    ux, uy = math.cos(angle), math.sin(angle)
+    xs = [x * ux + y * uy for x, y in hull]
+    ys = [-x * uy + y * ux for x, y in hull]
+    cx, cy = (min(xs) + max(xs)) / 2.0, (min(ys) + max(ys)) / 2.0
+    center = RDB.XYZ(cx * ux - cy * uy, cx * uy + cy * ux, 0)
+    return OrientedRectangle(center, RDB.XYZ(ux, uy, 0), (max(xs) - min(xs)) / 2.0, (max(ys) - min(ys)) / 2.0)
+
+
+def oriented_rectangle(points, area_ratio=DOMINANT_AREA_RATIO):
+    """
+    Kleinste omsluitende rechthoek (rotating calipers over de convex hull).
+    Is de rechthoek langs de hoofdrichting van de wanden hooguit `area_ratio`
+    groter, dan wint die: sections staan dan haaks op de wanden. De X-as ligt
+    altijd binnen 45° van de globale X-as, zodat A/B/C/D voorspelbaar blijven.
+    """
+    hull = _convex_hull(points)
+    if len(hull) < 3:
+        return None
+    best = None
+    for i in range(len(hull)):
+        (x0, y0), (x1, y1) = hull[i - 1], hull[i]
+        rect = _rectangle_at(hull, _normalize_angle(math.atan2(y1 - y0, x1 - x0)))
+        if best is None or rect.area < best.area:
+            best = rect
+    dominant = _rectangle_at(hull, dominant_angle(points))
+    if dominant.area <= best.area * area_ratio:
+        return dominant
+    return best
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""
+CSV schrijven zoals Excel (NL) het verwacht: `;` als scheidingsteken en
+aanhalingstekens alleen waar nodig. Bestanden openen met `utf-8-sig` en
+`newline=""`, zodat Excel accenten goed leest en regels op `\\r\\n` eindigen.
+
+Gebruik:
+
+    from scholtenbim import csvutil
+
+    with io.open(path, "w", encoding="utf-8-sig", newline="") as out:
+        out.write(csvutil.csv_row([u"Sheet Number", u"Sheet Name"]))
+"""
+
+CSV_DELIMITER = ";"
+
+
+def csv_cell(value, delimiter=CSV_DELIMITER):
+    """Eén CSV-cel; tussen aanhalingstekens als de waarde het scheidingsteken bevat."""
+    text = u"{0}".format(value) if value is not None else u""
+    if delimiter in text or u'"' in text or u"\n" in text:
+        text = u'"{0}"'.format(text.replace(u'"', u'""'))
+    return text
+
+
+def csv_row(values, delimiter=CSV_DELIMITER):
+    """Eén CSV-regel, inclusief regeleinde."""
+    return delimiter.join(csv_cell(v, delimiter) for v in values) + u"\r\n"
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+Cache per document die tussen klikken blijft bestaan (pyRevit rocket mode).
+
+In rocket mode blijft de IronPython-engine, en daarmee deze module, tussen
+twee klikken bestaan. Lookups die een tool bij elke klik opnieuw opbouwt
+(sheet-index, revisiematrix, tellingen) kunnen hier per document bewaard
+worden, zodat dezelfde tool op hetzelfde model de tweede keer bijna niets
+kost. Zonder rocket mode begint elke klik met een lege cache en werkt alles
+gewoon zoals zonder cache.
+
+Een document wordt herkend aan `doc.PathName` en `doc.GetHashCode()`. Per
+document loopt een teller mee die ophoogt zodra `DocumentChanged` toegevoegde,
+verwijderde of gewijzigde elementen meldt; waarden met `track_changes` zijn
+daarna verlopen. Bij `DocumentClosing`, `DocumentSynchronizedWithCentral` en
+`DocumentReloadedLatest` vervalt alles van dat document, bij het herladen van
+een link (`LinkedResourceOpened`) alles. De minst recent gebruikte waarden
+worden weggegooid boven MAX_ENTRIES waarden of MAX_WEIGHT (ruwe maat voor
+geheugen: het aantal items in de bewaarde lijsten en dicts).
+
+Gebruik:
+
+    from scholtenbim import doccache
+
+    index = doccache.get(doc, "sheetindex", lambda: SheetIndex(doc))
+"""
+
+from collections import OrderedDict
+import os
+
+MAX_ENTRIES = 64
+MAX_WEIGHT = 500000
+
+# Sleutel waaronder de actieve event handlers in het AppDomain worden bewaard,
+# zodat een herladen engine nooit een tweede set handlers achterlaat.
+_HANDLERS_SLOT = "ScholtenBIM.DocCache.Handlers"
+
+# (document key, naam) -> _Entry, minst recent gebruikt vooraan
+_entries = OrderedDict()
+# document key -> aantal wijzigingen sinds de eerste waarde
+_changes = {}
+_handlers = {}
+
+
+class _Entry(object):
+    __slots__ = ("value", "weight", "change")
+
+    def __init__(self, value, weight, change):
+        self.value = value
+        self.weight = weight
+        # None: blijft geldig bij wijzigingen in het model
+        self.change = change
+
+
+def document_key(doc):
+    return (doc.PathName or doc.Title, doc.GetHashCode())
+
+
+def _weight(value):
+    try:
+        return max(1, len(value))
+    except TypeError:
+        return 1
+
+
+def _lookup(key, change):
+    entry = _entries.get(key)
+    if entry is None:
+        return None
+    if entry.change is not None and entry.change != change:
+        del _entries[key]
+        return None
+    # Achteraan = meest recent gebruikt
+    del _entries[key]
+    _entries[key] = entry
+    return entry
+
+
+def _store(key, value, weight, change):
+    _entries.pop(key, None)
+    _entries[key] = _Entry(value, weight(value) if callable(weight) else weight, change)
+    _evict()
+    return value
+
+
+def _evict():
+    total = sum(entry.weight for entry in _entries.values())
+    while len(_entries) > 1 and (len(_entries) > MAX_ENTRIES or total > MAX_WEIGHT):
+        _, entry = _entries.popitem(last=False)
+        total -= entry.weight
+
+
+def peek(doc, name):
+    """Bewaarde (niet verlopen) waarde, of None."""
+    doc_key = document_key(doc)
+    entry = _lookup((doc_key, name), _changes.get(doc_key, 0))
+    return entry.value if entry is not None else None
+
+
+def put(doc, name, value, track_changes=True, weight=_weight):
+    doc_key = document_key(doc)
+    _subscribe(doc.Application)
+    return _store((doc_key, name), value, weight, _changes.get(doc_key, 0) if track_changes else None)
+
+
+def get(doc, name, factory, track_changes=True, weight=_weight):
+    """
+    Waarde `name` voor `doc`; zo nodig opnieuw gemaakt met `factory()`. Met
+    `track_changes=False` blijft de waarde geldig als het model verandert.
+    `weight` is een getal of een functie van de waarde (standaard: len).
+    """
+    value = peek(doc, name)
+    if value is None:
+        value = put(doc, name, factory(), track_changes, weight)
+    return value
+
+
+def _file_key(path):
+    return (None, os.path.normcase(os.path.abspath(path)))
+
+
+def load_file(path, loader):
+    """`loader(path)`, bewaard tot de wijzigingsdatum of grootte van het bestand verandert."""
+    key = _file_key(path)
+    stamp = (os.path.getmtime(path), os.path.getsize(path)) if os.path.exists(path) else ()
+    entry = _lookup(key, stamp)
+    if entry is not None:
+        return entry.value
+    return _store(key, loader(path), _weight, stamp)
+
+
+def invalidate_file(path):
+    _entries.pop(_file_key(path), None)
+
+
+def invalidate(doc=None, name=None):
+    """Alles (doc None), alles van `doc`, of alleen waarde `name` van `doc` weggooien."""
+    if doc is None:
+        _entries.clear()
+        return
+    doc_key = document_key(doc)
+    for key in [k for k in _entries if k[0] == doc_key and (name is None or k[1] == name)]:
+        del _entries[key]
+
+
+def stats():
+    return {"entries": len(_entries), "weight": sum(entry.weight for entry in _entries.values())}
+
+
+# ------------------------------
+# Events
+# ------------------------------
+def _on_document_changed(sender, args):
+    if args.GetAddedElementIds().Count or args.GetDeletedElementIds().Count or args.GetModifiedElementIds().Count:
+        doc_key = document_key(args.GetDocument())
+        _changes[doc_key] = _changes.get(doc_key, 0) + 1
+
+
+def _on_document_event(sender, args):
+    invalidate(args.Document)
+
+
+def _on_link_reloaded(sender, args):
+    invalidate()
+
+
+def _events(app):
+    return [(app.DocumentChanged, _on_document_changed),
+            (app.DocumentClosing, _on_document_event),
+            (app.DocumentSynchronizedWithCentral, _on_document_event),
+            (app.DocumentReloadedLatest, _on_document_event),
+            (app.LinkedResourceOpened, _on_link_reloaded)]
+
+
+def _subscribe(app):
+    if _handlers:
+        return
+    previous = _get_domain_slot()
+    if previous:
+        try:
+            for event, handler in previous["events"]:
+                event -= handler
+        except Exception:
+            pass
+    events = _events(app)
+    for event, handler in events:
+        event += handler
+    _handlers.update({"app": app, "events": events})
+    _set_domain_slot(dict(_handlers))
+
+
+def _get_domain_slot():
+    try:
+        from System import AppDomain
+        return AppDomain.CurrentDomain.GetData(_HANDLERS_SLOT)
+    except Exception:
+        return None
+
+
+def _set_domain_slot(value):
+    try:
+        from System import AppDomain
+        AppDomain.CurrentDomain.SetData(_HANDLERS_SLOT, value)
+    except Exception:
+        pass
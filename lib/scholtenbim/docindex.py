@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+"""
+Document-index met views, levels, view family types en graphics styles.
+
+Het index wordt per document pas opgebouwd bij het eerste gebruik (per sectie)
+en daarna bijgewerkt via het `DocumentChanged` event van Revit. Zo kost een
+volledige collector-pass maar één keer per sessie in plaats van bij elke klik.
+
+Gebruik:
+
+    from scholtenbim import docindex
+
+    index = docindex.get_index(doc)
+    level = index.level_by_name("00 Begane grond")
+    vft = index.view_family_type(RDB.ViewFamily.Section)
+    view_name = index.unique_view_name("0.01 Hal")
+"""
+
+import Autodesk.Revit.DB as RDB
+
+# Sleutel waaronder de actieve event handlers in het AppDomain worden bewaard,
+# zodat een herladen engine nooit een tweede set handlers achterlaat.
+_HANDLERS_SLOT = "ScholtenBIM.DocIndex.Handlers"
+
+_indexes = {}
+_handlers = {}
+
+
+# ------------------------------
+# Secties
+# ------------------------------
+class _Section(object):
+    """Eén groep elementen (bijv. alle levels) met sleutel -> [ElementId]."""
+
+    def __init__(self, element_class, key_func, element_types=False):
+        self.element_class = element_class
+        self.key_func = key_func
+        self.element_types = element_types
+        self.by_key = None
+        self.key_by_id = {}
+
+    @property
+    def is_built(self):
+        return self.by_key is not None
+
+    def build(self, doc):
+        self.by_key = {}
+        self.key_by_id = {}
+        collector = RDB.FilteredElementCollector(doc).OfClass(self.element_class)
+        if self.element_types:
+            collector = collector.WhereElementIsElementType()
+        for elem in collector:
+            self.add(elem)
+
+    def matches(self, elem):
+        return isinstance(elem, self.element_class)
+
+    def add(self, elem):
+        try:
+            key = self.key_func(elem)
+        except Exception:
+            return
+        self.by_key.setdefault(key, []).append(elem.Id)
+        self.key_by_id[elem.Id] = key
+
+    def remove(self, elem_id):
+        key = self.key_by_id.pop(elem_id, None)
+        if key is None:
+            return
+        ids = self.by_key.get(key)
+        if ids is None:
+            return
+        try:
+            ids.remove(elem_id)
+        except ValueError:
+            pass
+        if not ids:
+            del self.by_key[key]
+
+    def ids(self, key):
+        return self.by_key.get(key, [])
+
+
+class DocumentIndex(object):
+    """Lui opgebouwd, incrementeel bijgewerkt index van één document."""
+
+    def __init__(self, doc):
+        self.doc = doc
+        self._views = _Section(RDB.View, lambda v: v.Name)
+        self._levels = _Section(RDB.Level, lambda l: l.Name)
+        self._view_family_types = _Section(RDB.ViewFamilyType, lambda v: v.ViewFamily, element_types=True)
+        self._graphics_styles = _Section(RDB.GraphicsStyle, lambda s: s.Name)
+        self._level_elevations = {}
+        # Namen die in de lopende transactie al zijn uitgedeeld maar nog niet
+        # via DocumentChanged zijn teruggekomen.
+        self._pending_view_names = set()
+
+    def _sections(self):
+        return (self._views, self._levels, self._view_family_types, self._graphics_styles)
+
+    def _section(self, section):
+        if not section.is_built:
+            section.build(self.doc)
+            if section is self._levels:
+                self._level_elevations = dict(
+                    (eid, self.doc.GetElement(eid).Elevation) for eid in section.key_by_id)
+        return section
+
+    def _elements(self, ids):
+        return [e for e in (self.doc.GetElement(i) for i in ids) if e is not None]
+
+    # ---------- Views ----------
+    def view_names(self):
+        """Set met alle view-namen (inclusief templates), zoals `OfClass(View)`."""
+        names = set(self._section(self._views).by_key)
+        names.update(self._pending_view_names)
+        return names
+
+    def views_by_name(self, name):
+        return self._elements(self._section(self._views).ids(name))
+
+    def unique_view_name(self, base_name, pattern="{0} Copy {1}"):
+        """
+        Geeft een nog niet gebruikte view-naam terug en reserveert die direct,
+        zodat meerdere views binnen één transactie geen dubbele naam krijgen.
+        """
+        names = self._section(self._views).by_key
+        pending = self._pending_view_names
+        name = base_name
+        counter = 1
+        while name in names or name in pending:
+            name = pattern.format(base_name, counter)
+            counter += 1
+        pending.add(name)
+        return name
+
+    # ---------- Levels ----------
+    def levels(self):
+        """Alle levels gesorteerd op hoogte."""
+        ids = self._section(self._levels).key_by_id
+        return self._elements(sorted(ids, key=lambda i: self._level_elevations.get(i, 0.0)))
+
+    def level_by_name(self, name):
+        ids = self._section(self._levels).ids(name)
+        return self.doc.GetElement(ids[0]) if ids else None
+
+    def level_by_elevation(self, elevation, tolerance=1e-6):
+        """Level met de dichtstbijzijnde hoogte binnen `tolerance` (feet)."""
+        self._section(self._levels)
+        best_id = None
+        best_delta = None
+        for eid, elev in self._level_elevations.items():
+            delta = abs(elev - elevation)
+            if delta <= tolerance and (best_delta is None or delta < best_delta):
+                best_id, best_delta = eid, delta
+        return self.doc.GetElement(best_id) if best_id is not None else None
+
+    # ---------- View family types ----------
+    def view_family_types(self, view_family):
+        return self._elements(self._section(self._view_family_types).ids(view_family))
+
+    def view_family_type(self, view_family):
+        """Eerste ViewFamilyType van de opgegeven `ViewFamily`, of None."""
+        ids = self._section(self._view_family_types).ids(view_family)
+        return self.doc.GetElement(ids[0]) if ids else None
+
+    # ---------- Graphics styles ----------
+    def graphics_style_names(self):
+        return sorted(self._section(self._graphics_styles).by_key)
+
+    def graphics_style(self, name):
+        ids = self._section(self._graphics_styles).ids(name)
+        return self.doc.GetElement(ids[0]) if ids else None
+
+    # ---------- Incrementele updates ----------
+    def apply_changes(self, added_ids, deleted_ids, modified_ids):
+        """Verwerk de id's uit een `DocumentChangedEventArgs`."""
+        built = [s for s in self._sections() if s.is_built]
+        self._pending_view_names.clear()
+        if not built:
+            return
+
+        for eid in deleted_ids:
+            for section in built:
+                section.remove(eid)
+            self._level_elevations.pop(eid, None)
+
+        # Alleen gewijzigde elementen die al in een sectie staan kunnen van
+        # sleutel veranderen; de klasse van een element verandert nooit.
+        for eid in modified_ids:
+            owners = [s for s in built if eid in s.key_by_id]
+            if not owners:
+                continue
+            elem = self.doc.GetElement(eid)
+            for section in owners:
+                section.remove(eid)
+                if elem is not None:
+                    section.add(elem)
+            if elem is not None and eid in self._level_elevations:
+                self._level_elevations[eid] = elem.Elevation
+
+        for eid in added_ids:
+            elem = self.doc.GetElement(eid)
+            if elem is None:
+                continue
+            for section in built:
+                if section.matches(elem):
+                    if section.element_types and not _is_element_type(elem):
+                        continue
+                    section.add(elem)
+                    if section is self._levels:
+                        self._level_elevations[eid] = elem.Elevation
+
+    def invalidate(self):
+        for section in self._sections():
+            section.by_key = None
+            section.key_by_id = {}
+        self._level_elevations = {}
+        self._pending_view_names.clear()
+
+
+def _is_element_type(elem):
+    return isinstance(elem, RDB.ElementType)
+
+
+# ------------------------------
+# Registry + events
+# ------------------------------
+def get_index(doc):
+    """Geeft het (gedeelde) index voor `doc` terug; maakt het zo nodig aan."""
+    index = _indexes.get(doc)
+    if index is None:
+        index = DocumentIndex(doc)
+        _indexes[doc] = index
+        _subscribe(doc.Application)
+    return index
+
+
+def drop_index(doc):
+    _indexes.pop(doc, None)
+
+
+def _on_document_changed(sender, args):
+    index = _indexes.get(args.GetDocument())
+    if index is None:
+        return
+    try:
+        index.apply_changes(args.GetAddedElementIds(),
+                            args.GetDeletedElementIds(),
+                            args.GetModifiedElementIds())
+    except Exception:
+        # Een index dat niet meer klopt is erger dan een volgende scan.
+        index.invalidate()
+
+
+def _on_document_closing(sender, args):
+    drop_index(args.Document)
+
+
+def _subscribe(app):
+    if _handlers:
+        return
+    previous = _get_domain_slot()
+    if previous:
+        try:
+            previous["app"].DocumentChanged -= previous["changed"]
+            previous["app"].DocumentClosing -= previous["closing"]
+        except Exception:
+            pass
+    app.DocumentChanged += _on_document_changed
+    app.DocumentClosing += _on_document_closing
+    _handlers.update({"app": app, "changed": _on_document_changed, "closing": _on_document_closing})
+    _set_domain_slot(dict(_handlers))
+
+
+def _get_domain_slot():
+    try:
+        from System import AppDomain
+        return AppDomain.CurrentDomain.GetData(_HANDLERS_SLOT)
+    except Exception:
+        return None
+
+
+def _set_domain_slot(value):
+    try:
+        from System import AppDomain
+        AppDomain.CurrentDomain.SetData(_HANDLERS_SLOT, value)
+    except Exception:
+        pass
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""
+Metadata van gelinkte modellen op schijf bewaren (SQLite in de pyRevit app-data).
+
+Elke run opnieuw alle elementen van een link uitlezen (categorie,
+familie/type, parameters, bounding box) kost bij 15 links van 200+ MB
+veel tijd, terwijl de links meestal niet veranderd zijn. `LinkMetadataCache`
+bewaart die gegevens per link, met het pad en de wijzigingsdatum van het
+bestand als sleutel. Is het bestand niet gewijzigd, dan komen de gegevens
+uit de cache en wordt de Revit API niet aangeroepen.
+
+De gegevens komen uit de geladen link, niet uit het bestand: de
+wijzigingsdatum wordt daarom vastgelegd op het moment dat de link voor het
+eerst gezien wordt (in `doccache`; vervalt als de link herladen wordt). Is
+het bestand daarna opgeslagen zonder dat de link herladen is (andere
+wijzigingsdatum, of in Revit 2021+ een andere `DocumentVersion`), dan wordt
+alles live uitgelezen en niets in de cache geschreven.
+
+Elementen worden pas uitgelezen als ze gevraagd worden: alleen de
+geselecteerde elementen, of met `records(link_doc)` alle elementen. Vraagt
+een tool een parameter die nog niet in de cache staat, dan wordt de link
+opnieuw uitgelezen met alle tot dan toe gevraagde parameters.
+
+Zonder `sqlite3` (of voor links zonder bestand op schijf, zoals cloudmodellen)
+wordt alles gewoon live uitgelezen.
+
+Gebruik:
+
+    from scholtenbim import linkcache
+
+    cache = linkcache.LinkMetadataCache()
+    records = cache.records(link_doc, parameters=["Comments"])
+    record = records[element_id.IntegerValue]
+"""
+
+import json
+import os
+
+import Autodesk.Revit.DB as RDB
+
+from scholtenbim import doccache
+
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+
+CACHE_FILE_ID = "ScholtenBIM_linkcache"
+# Ophogen bij een ander tabelformaat; oude caches worden dan leeggemaakt.
+SCHEMA_VERSION = 2
+# SQLite staat maximaal 999 parameters per query toe.
+QUERY_CHUNK_SIZE = 900
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    parameters TEXT NOT NULL,
+    complete INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS elements (
+    path TEXT NOT NULL,
+    element_id INTEGER NOT NULL,
+    unique_id TEXT,
+    category_id INTEGER,
+    category TEXT,
+    family_type TEXT,
+    bbox TEXT,
+    parameters TEXT NOT NULL,
+    PRIMARY KEY (path, element_id)
+);
+"""
+
+
+class ElementRecord(object):
+    """Metadata van één element uit een link (coördinaten van de link zelf)."""
+
+    __slots__ = ("id", "unique_id", "category_id", "category", "family_type", "bbox", "parameters")
+
+    def __init__(self, element_id, unique_id, category_id, category, family_type, bbox, parameters):
+        self.id = element_id
+        self.unique_id = unique_id
+        self.category_id = category_id
+        self.category = category
+        self.family_type = family_type
+        # (xmin, ymin, zmin, xmax, ymax, zmax) of None
+        self.bbox = bbox
+        self.parameters = parameters
+
+    @staticmethod
+    def from_element(element, parameters):
+        category = element.Category
+        family_type = element.get_Parameter(RDB.BuiltInParameter.ELEM_FAMILY_AND_TYPE_PARAM)
+        bbox = element.get_BoundingBox(None)
+        if bbox is not None:
+            bbox = (bbox.Min.X, bbox.Min.Y, bbox.Min.Z, bbox.Max.X, bbox.Max.Y, bbox.Max.Z)
+        values = {}
+        for name in parameters:
+            param = element.LookupParameter(name)
+            if param is not None:
+                values[name] = param.AsValueString() or param.AsString()
+        return ElementRecord(element.Id.IntegerValue, element.UniqueId,
+                             category.Id.IntegerValue if category is not None else None,
+                             category.Name if category is not None else None,
+                             family_type.AsValueString() if family_type is not None else None,
+                             bbox, values)
+
+    def row(self, path):
+        return (path, self.id, self.unique_id, self.category_id, self.category, self.family_type,
+                json.dumps(self.bbox) if self.bbox is not None else None, json.dumps(self.parameters))
+
+    @staticmethod
+    def from_row(row):
+        element_id, unique_id, category_id, category, family_type, bbox, parameters = row
+        return ElementRecord(element_id, unique_id, category_id, category, family_type,
+                             tuple(json.loads(bbox)) if bbox else None, json.loads(parameters))
+
+
+def default_cache_path():
+    """Cachebestand in de pyRevit app-data map van de gebruiker."""
+    from pyrevit import script
+    return script.get_universal_data_file(CACHE_FILE_ID, "sqlite")
+
+
+def _disk_version_differs(link_doc, path):
+    """True als het bestand op schijf een andere versie is dan de geladen link (Revit 2021+)."""
+    get_version = getattr(RDB.Document, "GetDocumentVersion", None)
+    if get_version is None or not hasattr(RDB, "BasicFileInfo"):
+        return False
+    try:
+        loaded = get_version(link_doc)
+        on_disk = RDB.BasicFileInfo.Extract(path).GetDocumentVersion()
+    except Exception:
+        return False
+    return loaded is not None and on_disk is not None and not loaded.IsEqual(on_disk)
+
+
+def link_key(link_doc):
+    """
+    (pad, wijzigingsdatum bij het laden) van de link, of None als de link niet
+    op schijf staat of het bestand sinds het laden opnieuw is opgeslagen.
+    """
+    path = link_doc.PathName if link_doc is not None else None
+    if not path or not os.path.isfile(path):
+        return None
+    mtime = os.path.getmtime(path)
+    loaded_mtime = doccache.get(link_doc, "linkcache.mtime", lambda: mtime, track_changes=False, weight=1)
+    if loaded_mtime != mtime or _disk_version_differs(link_doc, path):
+        return None
+    return os.path.normcase(os.path.abspath(path)), loaded_mtime
+
+
+def _live_elements(link_doc, element_ids=None):
+    if element_ids is None:
+        return [e for e in RDB.FilteredElementCollector(link_doc).WhereElementIsNotElementType()
+                if e.Category is not None]
+    elements = [link_doc.GetElement(RDB.ElementId(element_id)) for element_id in element_ids]
+    return [e for e in elements if e is not None]
+
+
+class LinkMetadataCache(object):
+    """Per link (pad + wijzigingsdatum) de ElementRecords van de uitgelezen elementen."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self._connection = None
+        # Aantal elementen dat live via de Revit API is uitgelezen.
+        self.live_reads = 0
+
+    @property
+    def available(self):
+        return sqlite3 is not None
+
+    def _connect(self):
+        if self._connection is None:
+            path = self.path or default_cache_path()
+            folder = os.path.dirname(path)
+            if folder and not os.path.isdir(folder):
+                os.makedirs(folder)
+            connection = sqlite3.connect(path)
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                connection.executescript("DROP TABLE IF EXISTS links; DROP TABLE IF EXISTS elements;")
+                connection.execute("PRAGMA user_version = {0}".format(SCHEMA_VERSION))
+            connection.executescript(_SCHEMA)
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _read_live(self, link_doc, parameters, element_ids=None):
+        records = [ElementRecord.from_element(e, parameters) for e in _live_elements(link_doc, element_ids)]
+        self.live_reads += len(records)
+        return records
+
+    def _prepare(self, connection, key, parameters):
+        """Linkrij bijwerken; geeft (alle parameters, complete) terug."""
+        path, mtime = key
+        row = connection.execute("SELECT mtime, parameters, complete FROM links WHERE path = ?", (path,)).fetchone()
+        if row is not None and row[0] == mtime:
+            cached = json.loads(row[1])
+            if set(parameters) <= set(cached):
+                return cached, bool(row[2])
+            parameters = sorted(set(cached) | set(parameters))
+        else:
+            parameters = sorted(set(parameters))
+        # Gewijzigde link of nieuwe parameters: alles van deze link opnieuw.
+        connection.execute("DELETE FROM elements WHERE path = ?", (path,))
+        connection.execute("INSERT OR REPLACE INTO links (path, mtime, parameters, complete) VALUES (?, ?, ?, 0)",
+                           (path, mtime, json.dumps(parameters)))
+        return parameters, False
+
+    def _store(self, connection, path, records):
+        connection.executemany("INSERT OR REPLACE INTO elements VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                               [record.row(path) for record in records])
+
+    def _load(self, connection, path, element_ids=None):
+        columns = "SELECT element_id, unique_id, category_id, category, family_type, bbox, parameters FROM elements WHERE path = ?"
+        if element_ids is None:
+            rows = connection.execute(columns, (path,)).fetchall()
+        else:
+            rows = []
+            element_ids = list(element_ids)
+            for start in range(0, len(element_ids), QUERY_CHUNK_SIZE):
+                chunk = element_ids[start:start + QUERY_CHUNK_SIZE]
+                query = columns + " AND element_id IN ({0})".format(", ".join("?" * len(chunk)))
+                rows.extend(connection.execute(query, [path] + chunk).fetchall())
+        return dict((row[0], ElementRecord.from_row(row)) for row in rows)
+
+    def records(self, link_doc, element_ids=None, parameters=()):
+        """
+        {element id (int): ElementRecord} voor `element_ids` (ints), of voor
+        alle elementen met een categorie als `element_ids` None is.
+        """
+        parameters = list(parameters)
+        key = link_key(link_doc) if self.available else None
+        if key is None:
+            return dict((r.id, r) for r in self._read_live(link_doc, parameters, element_ids))
+
+        path = key[0]
+        connection = self._connect()
+        with connection:
+            all_parameters, complete = self._prepare(connection, key, parameters)
+            if element_ids is None:
+                if not complete:
+                    self._store(connection, path, self._read_live(link_doc, all_parameters))
+                    connection.execute("UPDATE links SET complete = 1 WHERE path = ?", (path,))
+                return self._load(connection, path)
+
+            element_ids = list(element_ids)
+            found = self._load(connection, path, element_ids)
+            missing = [element_id for element_id in element_ids if element_id not in found]
+            if missing and not complete:
+                records = self._read_live(link_doc, all_parameters, missing)
+                self._store(connection, path, records)
+                found.update((r.id, r) for r in records)
+            return found
+
+    def clear(self):
+        """Cache van alle links wissen."""
+        if not self.available:
+            return
+        connection = self._connect()
+        with connection:
+            connection.execute("DELETE FROM elements")
+            connection.execute("DELETE FROM links")
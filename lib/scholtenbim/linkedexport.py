@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Gelinkte elementen exporteren naar CSV of JSON Lines (bijvoorbeeld voor clash detection).
+
+Per element: categorie, familie/type, linked file, element ID, UniqueId en
+eventueel extra parameters. Elke regel wordt direct naar het bestand
+geschreven, zodat ook 100.000+ elementen geen klembord of venster nodig hebben.
+De gegevens komen uit `linkcache.ElementRecord`s.
+
+Gebruik:
+
+    from scholtenbim import linkedexport
+
+    with linkedexport.LinkedElementWriter(path, parameters=["Mark"]) as writer:
+        for record in records.values():
+            writer.write(link_name, record)
+"""
+
+import io
+import json
+import os
+
+from scholtenbim.csvutil import CSV_DELIMITER, csv_row
+
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+COLUMNS = [u"Category", u"Family and Type", u"Linked File", u"Element ID", u"UniqueId"]
+
+
+def format_for(path):
+    """Exportformaat op basis van de extensie; alles behalve .jsonl/.json wordt CSV."""
+    ext = os.path.splitext(path)[1].lower()
+    return FORMAT_JSONL if ext in (".jsonl", ".json") else FORMAT_CSV
+
+
+class LinkedElementWriter(object):
+    """Schrijft ElementRecords regel voor regel weg; `count` is het aantal regels."""
+
+    def __init__(self, path, parameters=(), file_format=None, delimiter=CSV_DELIMITER):
+        self.path = path
+        self.parameters = list(parameters)
+        self.format = file_format or format_for(path)
+        self.delimiter = delimiter
+        self.count = 0
+        self._out = None
+
+    def __enter__(self):
+        if self.format == FORMAT_CSV:
+            # utf-8-sig zodat Excel accenten goed leest
+            self._out = io.open(self.path, "w", encoding="utf-8-sig", newline="")
+            self._write_csv(COLUMNS + self.parameters)
+        else:
+            self._out = io.open(self.path, "w", encoding="utf-8", newline="")
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self._out.close()
+        self._out = None
+
+    def _write_csv(self, values):
+        self._out.write(csv_row(values, self.delimiter))
+
+    def write(self, linked_file, record):
+        values = [record.parameters.get(name) for name in self.parameters]
+        if self.format == FORMAT_CSV:
+            self._write_csv([record.category, record.family_type, linked_file, record.id, record.unique_id] + values)
+        else:
+            row = {"category": record.category, "family_type": record.family_type, "linked_file": linked_file,
+                   "element_id": record.id, "unique_id": record.unique_id,
+                   "parameters": dict(zip(self.parameters, values))}
+            self._out.write(u"{0}\n".format(json.dumps(row, sort_keys=True)))
+        self.count += 1
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Rijen voor het Linked IDs-venster: compact rijmodel, filteren, sorteren en groeperen.
+
+Het venster toont duizenden gelinkte elementen in een gevirtualiseerde
+ListView; per rij is er alleen een `LinkedIdRow` (vier velden), geen eigen
+controls. Filteren, sorteren en groeperen gebeurt hier in Python op de lijst
+met rijen; de ListView krijgt alleen het resultaat. `RowLoader` levert de
+rijen in steeds grotere blokken, zodat de eerste rijen direct zichtbaar zijn.
+
+Gebruik:
+
+    from scholtenbim import linkedids
+
+    rows = linkedids.arrange(all_rows, text="deur", sort_by="Id", group_by="Category")
+"""
+
+COLUMNS = ["Category", "Family", "LinkedFile", "Id"]
+COLUMN_LABELS = {"Category": "Category", "Family": "Family", "LinkedFile": "Linked File", "Id": "ID"}
+# Eerste blok rijen; elk volgend blok is twee keer zo groot (tot MAX_BATCH).
+FIRST_BATCH = 200
+MAX_BATCH = 5000
+
+
+class LinkedIdRow(object):
+    """Eén gelinkt element; attributen met hoofdletter voor de WPF-binding."""
+
+    __slots__ = ("Category", "Family", "LinkedFile", "Id", "_search")
+
+    def __init__(self, category, family, linked_file, element_id):
+        self.Category = category or ""
+        self.Family = family or ""
+        self.LinkedFile = linked_file or ""
+        self.Id = element_id
+        self._search = None
+
+    def text(self):
+        """Regel zoals de kopieerknoppen hem op het klembord zetten."""
+        return "Category: {0}\nFamily: {1}\nLinked File: {2}\nID: {3}".format(
+            self.Category, self.Family, self.LinkedFile, self.Id)
+
+    def matches(self, text):
+        """`text` (kleine letters) komt voor in een van de kolommen."""
+        if self._search is None:
+            self._search = u"{0}\t{1}\t{2}\t{3}".format(self.Category, self.Family, self.LinkedFile, self.Id).lower()
+        return text in self._search
+
+
+def _sort_key(column):
+    if column == "Id":
+        return lambda row: row.Id
+    return lambda row: getattr(row, column).lower()
+
+
+def arrange(rows, text="", sort_by=None, descending=False, group_by=None):
+    """
+    Gefilterde en gesorteerde kopie van `rows`. Met `group_by` staan de rijen
+    per groep bij elkaar (groepen op naam), binnen de groep gesorteerd op `sort_by`.
+    """
+    text = (text or "").strip().lower()
+    result = [row for row in rows if row.matches(text)] if text else list(rows)
+    if sort_by:
+        result.sort(key=_sort_key(sort_by), reverse=descending)
+    if group_by:
+        # Stabiele sortering: de volgorde binnen een groep blijft behouden.
+        result.sort(key=_sort_key(group_by))
+    return result
+
+
+def insert_arranged(items, rows, text="", sort_by=None, descending=False, group_by=None):
+    """
+    Nieuwe `rows` die door het filter komen op hun plek in `items` (het
+    resultaat van `arrange`) invoegen, in dezelfde volgorde als `arrange` ze
+    zou zetten. De bestaande rijen blijven staan, dus de selectie en de
+    scrollpositie van de ListView ook. Geeft het aantal ingevoegde rijen.
+    """
+    text = (text or "").strip().lower()
+    sort_key = _sort_key(sort_by) if sort_by else None
+    group_key = _sort_key(group_by) if group_by else None
+
+    def before(a, b):
+        # `a` hoort strikt voor `b`; bij gelijke sleutels komt de nieuwe rij achteraan.
+        if group_key is not None and group_key(a) != group_key(b):
+            return group_key(a) < group_key(b)
+        if sort_key is not None and sort_key(a) != sort_key(b):
+            return sort_key(b) < sort_key(a) if descending else sort_key(a) < sort_key(b)
+        return False
+
+    inserted = 0
+    for row in rows:
+        if text and not row.matches(text):
+            continue
+        lo, hi = 0, items.Count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if before(row, items[mid]):
+                hi = mid
+            else:
+                lo = mid + 1
+        items.Insert(lo, row)
+        inserted += 1
+    return inserted
+
+
+def ids_text(rows):
+    """ID's gescheiden door ';', zoals de knoppen 'Kopieer ID's per ...'."""
+    return ";".join(str(row.Id) for row in rows)
+
+
+class RowLoader(object):
+    """Haalt rijen uit een iterator in blokken van FIRST_BATCH, 2x FIRST_BATCH, ... rijen."""
+
+    def __init__(self, iterator, first_batch=FIRST_BATCH, max_batch=MAX_BATCH):
+        self._iterator = iter(iterator)
+        self._batch = first_batch
+        self._max_batch = max_batch
+        self.done = False
+
+    def next_batch(self):
+        """Volgend blok rijen; een lege lijst als alles geladen is."""
+        rows = []
+        if self.done:
+            return rows
+        for row in self._iterator:
+            rows.append(row)
+            if len(rows) >= self._batch:
+                break
+        else:
+            self.done = True
+        self._batch = min(self._batch * 2, self._max_batch)
+        return rows
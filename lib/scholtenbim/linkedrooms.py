@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""
+Rooms uit gelinkte modellen, 1x uitgelezen per run.
+
+`rooms_from_references` zet de references van een `PickObjects(LinkedElement)`
+om naar `LinkedRoom`-objecten. Elke link wordt maar één keer opgezocht en
+dubbel geselecteerde rooms vallen af. `HostLevelMap` koppelt de levels van
+het gelinkte model aan die van het hostmodel: eerst op naam, anders op hoogte.
+`create_room_plans` maakt per room een floorplan of ceilingplan (de
+view family is een parameter), gecropt op de bounding box of de contour.
+
+Gebruik:
+
+    from scholtenbim import docindex, linkedrooms
+
+    rooms = linkedrooms.rooms_from_references(doc, selected)
+    levels = linkedrooms.HostLevelMap(docindex.get_index(doc))
+    level = levels.host_level(rooms[0])
+
+    linkedrooms.create_room_plans(doc, rooms, RDB.ViewFamily.FloorPlan, "FloorPlan", output)
+"""
+
+import Autodesk.Revit.DB as RDB
+
+from scholtenbim import batch, cropregion, docindex
+
+# Maximaal hoogteverschil (feet) om een host-level op hoogte te koppelen.
+ELEVATION_TOLERANCE = 10.0 / 304.8
+# Ruimte (feet) tussen de room en de crop van een plattegrond.
+CROP_OFFSET = 200.0 / 304.8
+# Plattegronden per transactie
+PLAN_CHUNK_SIZE = 50
+
+CROP_BBOX = 'Bounding box'
+CROP_BOUNDARY = 'Room-contour'
+
+
+class LinkedRoom(object):
+    """Room in een link met de gegevens die de room-tools steeds nodig hebben."""
+
+    def __init__(self, room, link_instance, link_doc):
+        self.room = room
+        self.link_instance = link_instance
+        self.link_doc = link_doc
+        self.transform = link_instance.GetTotalTransform()
+        self.id = room.Id.IntegerValue
+        num_param = room.get_Parameter(RDB.BuiltInParameter.ROOM_NUMBER)
+        self.number = num_param.AsString() if num_param else str(self.id)
+        name_param = room.get_Parameter(RDB.BuiltInParameter.ROOM_NAME)
+        self.name = name_param.AsString() if name_param else ''
+        self.level_id = room.LevelId
+
+    def label(self, suffix=None):
+        """'<nummer> <naam>' met optioneel achtervoegsel, zoals de view-namen."""
+        label = '{0} {1}'.format(self.number, self.name) if self.name else self.number
+        return '{0} {1}'.format(label, suffix) if suffix else label
+
+    def bounding_box(self):
+        return self.room.get_BoundingBox(None)
+
+    def host_bounding_box(self):
+        """
+        (min, max) in host-coördinaten om alle 8 hoeken van de room-bounding
+        box, of None. Zo blijft min < max ook bij een gedraaide link.
+        """
+        bbox = self.bounding_box()
+        if not bbox:
+            return None
+        corners = [self.transform.OfPoint(RDB.XYZ(x, y, z))
+                   for x in (bbox.Min.X, bbox.Max.X) for y in (bbox.Min.Y, bbox.Max.Y) for z in (bbox.Min.Z, bbox.Max.Z)]
+        return (RDB.XYZ(min(p.X for p in corners), min(p.Y for p in corners), min(p.Z for p in corners)),
+                RDB.XYZ(max(p.X for p in corners), max(p.Y for p in corners), max(p.Z for p in corners)))
+
+    def host_boundary(self, options=None):
+        """
+        Hoekpunten van de buitencontour in host-coördinaten (bogen
+        getesselleerd), of een lege lijst als de room niet begrensd is.
+        """
+        if options is None:
+            options = RDB.SpatialElementBoundaryOptions()
+        loops = [cropregion.boundary_points([s.GetCurve() for s in loop], self.transform)
+                 for loop in self.room.GetBoundarySegments(options) or []]
+        loops = [points for points in loops if len(points) >= 3]
+        if not loops:
+            return []
+        # Gaten (kolommen, schachten) zijn altijd kleiner dan de buitencontour.
+        return max(loops, key=lambda points: abs(cropregion.signed_area(points)))
+
+
+def loaded_links(doc):
+    """RevitLinkInstances in `doc` waarvan het gelinkte model geladen is."""
+    return [link for link in RDB.FilteredElementCollector(doc).OfClass(RDB.RevitLinkInstance)
+            if link.GetLinkDocument() is not None]
+
+
+def rooms_from_references(doc, references):
+    """LinkedRooms voor de geselecteerde references; overige elementen vallen af."""
+    links = {}
+    seen = set()
+    rooms = []
+    room_cat_id = RDB.ElementId(RDB.BuiltInCategory.OST_Rooms)
+    for reference in references:
+        key = (reference.ElementId, reference.LinkedElementId)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        if reference.ElementId not in links:
+            link_instance = doc.GetElement(reference.ElementId)
+            if isinstance(link_instance, RDB.RevitLinkInstance):
+                links[reference.ElementId] = (link_instance, link_instance.GetLinkDocument())
+            else:
+                links[reference.ElementId] = (None, None)
+        link_instance, link_doc = links[reference.ElementId]
+        if link_doc is None:
+            continue
+
+        room = link_doc.GetElement(reference.LinkedElementId)
+        if room is None or room.Category is None or room.Category.Id != room_cat_id:
+            continue
+        rooms.append(LinkedRoom(room, link_instance, link_doc))
+    return rooms
+
+
+class HostLevelMap(object):
+    """Gelinkt level -> host-level, per gelinkt level maar één keer opgezocht."""
+
+    def __init__(self, index, tolerance=ELEVATION_TOLERANCE):
+        self.index = index
+        self.tolerance = tolerance
+        self._cache = {}
+
+    def host_level(self, linked_room):
+        key = (linked_room.link_instance.Id, linked_room.level_id)
+        if key not in self._cache:
+            self._cache[key] = self._resolve(linked_room)
+        return self._cache[key]
+
+    def _resolve(self, linked_room):
+        linked_level = linked_room.link_doc.GetElement(linked_room.level_id)
+        if not isinstance(linked_level, RDB.Level):
+            return None
+        level = self.index.level_by_name(linked_level.Name)
+        if level is not None:
+            return level
+        # Andere naam in het hostmodel: zoek het level op dezelfde hoogte.
+        elevation = linked_room.transform.OfPoint(RDB.XYZ(0, 0, linked_level.Elevation)).Z
+        return self.index.level_by_elevation(elevation, self.tolerance)
+
+
+# ------------------------------
+# Plattegronden per room
+# ------------------------------
+def active_view_level(uidoc):
+    """Level van de actieve view, als fallback voor rooms zonder host-level."""
+    try:
+        gen_level = uidoc.ActiveView.GenLevel
+        return uidoc.Document.GetElement(gen_level.Id) if gen_level else None
+    except Exception:
+        return None
+
+
+def crop_box_for(linked_room, offset=CROP_OFFSET):
+    """Crop box (host) om de room, `offset` naar buiten."""
+    min_pt, max_pt = linked_room.host_bounding_box()
+    crop_box = RDB.BoundingBoxXYZ()
+    crop_box.Min = RDB.XYZ(min_pt.X - offset, min_pt.Y - offset, min_pt.Z)
+    crop_box.Max = RDB.XYZ(max_pt.X + offset, max_pt.Y + offset, max_pt.Z)
+    return crop_box
+
+
+def crop_shape_for(linked_room, offset=CROP_OFFSET):
+    """Vereenvoudigde room-contour, `offset` naar buiten verschoven, of None."""
+    points = linked_room.host_boundary()
+    if len(points) < 3:
+        return None
+    return cropregion.offset_polygon(cropregion.simplify(points), offset)
+
+
+def create_plan_view(doc, index, vft, linked_room, level, shape=None, name_suffix=None, output=None):
+    """Eén gecropte plattegrond van `linked_room`; geeft de view-naam terug."""
+    view_name = index.unique_view_name(linked_room.label(name_suffix))
+    view = RDB.ViewPlan.Create(doc, vft.Id, level.Id)
+    try:
+        name_p = view.get_Parameter(RDB.BuiltInParameter.VIEW_NAME)
+        if name_p:
+            name_p.Set(view_name)
+
+        view.CropBox = crop_box_for(linked_room)
+        view.CropBoxActive = True
+        view.CropBoxVisible = False
+    except Exception:
+        # Geen ongecropte view zonder naam achterlaten; de rest van de batch gaat door.
+        doc.Delete(view.Id)
+        raise
+    if shape:
+        try:
+            cropregion.set_crop_shape(view, cropregion.curve_loop(shape))
+        except Exception:
+            if output is not None:
+                output.print_md('⚠️ Room-contour niet bruikbaar voor {0}, bounding box gebruikt.'.format(view_name))
+    return view_name
+
+
+def create_room_plans(doc, rooms, view_family, plan_name, output, crop_mode=CROP_BBOX, name_suffix=None,
+                      uidoc=None, failures_preprocessor=None, chunk_size=PLAN_CHUNK_SIZE):
+    """
+    Maakt per room een plattegrond van `view_family` (bijv. FloorPlan of
+    CeilingPlan) in 1 batch en meldt het resultaat in `output`. `plan_name`
+    komt in de meldingen en de naam van de transactie. Rooms zonder
+    host-level krijgen het level van de actieve view van `uidoc`. Geeft het
+    BatchResult terug (of None).
+    """
+    index = docindex.get_index(doc)
+    vft = index.view_family_type(view_family)
+    if not vft:
+        output.print_md('❌ Geen {0} ViewFamilyType gevonden.'.format(plan_name))
+        return None
+
+    levels = HostLevelMap(index)
+    fallback = None
+    jobs = []
+    for info in rooms:
+        if not info.bounding_box():
+            output.print_md('❌ Geen bounding box voor Room {0}'.format(info.id))
+            continue
+        level = levels.host_level(info)
+        if level is None and uidoc is not None:
+            if fallback is None:
+                fallback = active_view_level(uidoc)
+                if fallback is not None:
+                    output.print_md("ℹ️ Gebruik Level van actieve view: {0}".format(fallback.Name))
+            level = fallback
+        if level is None:
+            output.print_md("❌ Kan Level niet bepalen voor Room {0}".format(info.id))
+            continue
+        shape = crop_shape_for(info) if crop_mode == CROP_BOUNDARY else None
+        jobs.append((info, level, shape))
+
+    name = 'Create Room {0}s'.format(plan_name)
+    result = batch.run_chunked(
+        doc, name, jobs,
+        lambda job: create_plan_view(doc, index, vft, *job, name_suffix=name_suffix, output=output),
+        chunk_size=chunk_size, title=name + ' | {value} van {max_value}',
+        failures_preprocessor=failures_preprocessor)
+    if result.cancelled:
+        output.print_md('⚠️ Geannuleerd, er zijn geen {0}s aangemaakt.'.format(plan_name.lower()))
+        return result
+    for view_name in result.succeeded:
+        output.print_md('✅ {0} aangemaakt en gecropt: {1}'.format(plan_name, view_name))
+    for (info, level, shape), e in result.failures:
+        output.print_md('❌ Fout bij Room {0}: {1}: {2}'.format(info.id, type(e).__name__, e))
+    return result
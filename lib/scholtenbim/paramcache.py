@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+Parameters op naam 1x per (categorie, type) opzoeken.
+
+`element.LookupParameter(naam)` loopt alle parameters van het element af en
+vergelijkt op naam. Voor dezelfde categorie en hetzelfde type levert dat
+steeds dezelfde definitie op, dus `ParameterResolver` zoekt de naam maar één
+keer op en leest/schrijft daarna via `get_Parameter` met de
+BuiltInParameter, de shared GUID of de Definition.
+
+Gebruik:
+
+    from scholtenbim import paramcache
+
+    resolver = paramcache.ParameterResolver()
+    for element in elements:
+        for param, value in zip(resolver.get_many(element, names), values):
+            if param:
+                param.Set(value)
+"""
+
+import Autodesk.Revit.DB as RDB
+
+_MISSING = object()
+
+
+class ResolvedParameter(object):
+    """Definitie van een parameter, met de snelste manier om hem op te halen."""
+
+    __slots__ = ("name", "definition", "built_in", "guid", "storage_type")
+
+    def __init__(self, param):
+        self.definition = param.Definition
+        self.name = self.definition.Name
+        self.storage_type = param.StorageType
+        built_in = getattr(self.definition, "BuiltInParameter", RDB.BuiltInParameter.INVALID)
+        self.built_in = built_in if built_in != RDB.BuiltInParameter.INVALID else None
+        self.guid = param.GUID if self.built_in is None and param.IsShared else None
+
+    def get(self, element):
+        if self.built_in is not None:
+            return element.get_Parameter(self.built_in)
+        if self.guid is not None:
+            return element.get_Parameter(self.guid)
+        return element.get_Parameter(self.definition)
+
+
+class ParameterResolver(object):
+    """(categorie, type, naam) -> ResolvedParameter, voor de duur van één run."""
+
+    def __init__(self):
+        self._cache = {}
+        self.lookups = 0
+
+    @staticmethod
+    def key(element):
+        category = element.Category
+        return (category.Id.IntegerValue if category is not None else None,
+                element.GetTypeId().IntegerValue)
+
+    def _names(self, element):
+        names = self._cache.get(self.key(element))
+        if names is None:
+            names = self._cache[self.key(element)] = {}
+        return names
+
+    def _resolve(self, names, element, name):
+        resolved = names.get(name, _MISSING)
+        if resolved is _MISSING:
+            self.lookups += 1
+            param = element.LookupParameter(name)
+            resolved = names[name] = ResolvedParameter(param) if param is not None else None
+        return resolved
+
+    def resolve(self, element, name):
+        """ResolvedParameter voor `name` op dit soort element, of None als hij ontbreekt."""
+        return self._resolve(self._names(element), element, name)
+
+    def get(self, element, name):
+        """Parameter `name` van `element`, of None."""
+        return self._get(self._names(element), element, name)
+
+    def get_many(self, element, names):
+        """Parameters voor `names` (in dezelfde volgorde, None als hij ontbreekt)."""
+        cached = self._names(element)
+        return [self._get(cached, element, name) for name in names]
+
+    def _get(self, cached, element, name):
+        resolved = self._resolve(cached, element, name)
+        if resolved is None:
+            return None
+        param = resolved.get(element)
+        if param is None:
+            # Binnen hetzelfde type hoort de parameterset gelijk te zijn;
+            # voor de zekerheid dan toch op naam.
+            param = element.LookupParameter(name)
+        return param
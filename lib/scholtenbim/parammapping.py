@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+"""
+Parameters kopiëren op basis van een mapping-tabel (CSV of Excel).
+
+Elke regel van de tabel zegt: neem parameter X van het bronobject met sleutel A
+en schrijf hem naar parameter Y van het doelobject met sleutel B. Sleutels
+worden via een index opgezocht die 1x per sleuteltype wordt opgebouwd (Mark,
+ElementId, IfcGUID of een willekeurige parameter), zodat duizenden regels geen
+duizenden collectors of selecties kosten. Het wegschrijven gaat in blokken via
+`batch.run_chunked`.
+
+Kolommen (kopregel, hoofdletterongevoelig; de scheidingsteken ; , of tab
+wordt herkend):
+
+    Source Key;Target Key;Source Parameter;Target Parameter;Unit
+
+`Target Parameter` mag leeg zijn (dan dezelfde naam als de bron). `Unit` is
+optioneel en geldt voor tekst/getal <-> lengte/oppervlakte/... conversies,
+bijv. "mm" als een tekstparameter "1200" naar een lengteparameter moet.
+
+Gebruik:
+
+    from scholtenbim import parammapping
+
+    rows = parammapping.read_mapping(path)
+    plan = parammapping.build_plan(doc, rows, parammapping.KEY_MARK, parammapping.KEY_MARK)
+    result = parammapping.apply_plan(doc, plan)
+"""
+
+import io
+import math
+import os
+
+import Autodesk.Revit.DB as RDB
+
+from scholtenbim import batch, paramcache
+
+try:
+    import xlrd
+except ImportError:
+    xlrd = None
+
+KEY_MARK = "Mark"
+KEY_ELEMENT_ID = "ElementId"
+KEY_IFC_GUID = "IfcGUID"
+KEY_TYPES = [KEY_MARK, KEY_ELEMENT_ID, KEY_IFC_GUID]
+
+COLUMNS = ["source key", "target key", "source parameter", "target parameter", "unit"]
+REQUIRED_COLUMNS = COLUMNS[:3]
+
+CHUNK_SIZE = 500
+
+# Eenheid in de tabel -> factor naar de interne Revit-eenheid (feet, ft², ft³, radialen).
+UNIT_FACTORS = {
+    "": 1.0,
+    "ft": 1.0,
+    "in": 1.0 / 12.0,
+    "mm": 1.0 / 304.8,
+    "cm": 1.0 / 30.48,
+    "m": 1.0 / 0.3048,
+    "mm2": 1.0 / (304.8 ** 2),
+    "m2": 1.0 / (0.3048 ** 2),
+    "m3": 1.0 / (0.3048 ** 3),
+    "deg": math.pi / 180.0,
+}
+
+# Redenen in het overzicht
+ISSUE_SOURCE_NOT_FOUND = "Bronobject niet gevonden"
+ISSUE_SOURCE_AMBIGUOUS = "Bronsleutel niet uniek"
+ISSUE_TARGET_NOT_FOUND = "Doelobject niet gevonden"
+ISSUE_SOURCE_PARAMETER = "Bronparameter ontbreekt"
+ISSUE_TARGET_PARAMETER = "Doelparameter ontbreekt"
+ISSUE_READ_ONLY = "Doelparameter is alleen-lezen"
+ISSUE_EMPTY = "Bronwaarde leeg"
+ISSUE_CONVERSION = "Waarde niet om te zetten"
+ISSUE_UNIT = "Onbekende eenheid"
+
+
+class MappingError(Exception):
+    """Tabel niet te lezen of verplichte kolommen ontbreken."""
+
+
+class MappingRow(object):
+    __slots__ = ("line", "source_key", "target_key", "source_parameter", "target_parameter", "unit")
+
+    def __init__(self, line, source_key, target_key, source_parameter, target_parameter=None, unit=None):
+        self.line = line
+        self.source_key = source_key
+        self.target_key = target_key
+        self.source_parameter = source_parameter
+        self.target_parameter = target_parameter or source_parameter
+        self.unit = (unit or "").strip().lower()
+
+
+# ------------------------------
+# Inlezen
+# ------------------------------
+def read_mapping(path):
+    """MappingRows uit een CSV- of XLSX-bestand."""
+    if os.path.splitext(path)[1].lower() in (".xlsx", ".xls"):
+        table = _read_excel(path)
+    else:
+        table = _read_csv(path)
+    return rows_from_table(table)
+
+
+def _read_csv(path):
+    with io.open(path, "r", encoding="utf-8-sig") as handle:
+        lines = handle.read().splitlines()
+    if not lines:
+        raise MappingError("Het bestand is leeg.")
+    delimiter = max([";", ",", "\t"], key=lambda d: lines[0].count(d))
+    return [_split_csv_line(line, delimiter) for line in lines]
+
+
+def _split_csv_line(line, delimiter):
+    cells, cell, quoted, i = [], [], False, 0
+    while i < len(line):
+        char = line[i]
+        if quoted:
+            if char == '"' and line[i + 1:i + 2] == '"':
+                cell.append('"')
+                i += 1
+            elif char == '"':
+                quoted = False
+            else:
+                cell.append(char)
+        elif char == '"':
+            quoted = True
+        elif char == delimiter:
+            cells.append("".join(cell))
+            cell = []
+        else:
+            cell.append(char)
+        i += 1
+    cells.append("".join(cell))
+    return cells
+
+
+def _read_excel(path):
+    if xlrd is None:
+        raise MappingError("Excel-bestanden kunnen hier niet gelezen worden; sla de mapping op als CSV.")
+    sheet = xlrd.open_workbook(path).sheet_by_index(0)
+    return [[_excel_cell(sheet.cell_value(r, c)) for c in range(sheet.ncols)] for r in range(sheet.nrows)]
+
+
+def _excel_cell(value):
+    # Excel geeft getallen als float: 1200.0 moet als sleutel "1200" zijn.
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return u"{0}".format(value)
+
+
+def rows_from_table(table):
+    """MappingRows uit een tabel (lijst van lijsten) met kopregel."""
+    if not table:
+        raise MappingError("Het bestand is leeg.")
+    header = [cell.strip().lower() for cell in table[0]]
+    missing = [c for c in REQUIRED_COLUMNS if c not in header]
+    if missing:
+        raise MappingError("Kolom(men) ontbreken: {0}.".format(", ".join(missing)))
+    columns = [header.index(c) if c in header else None for c in COLUMNS]
+
+    rows = []
+    for line, cells in enumerate(table[1:], 2):
+        values = [cells[i].strip() if i is not None and i < len(cells) else "" for i in columns]
+        if not any(values):
+            continue
+        rows.append(MappingRow(line, *values))
+    return rows
+
+
+# ------------------------------
+# Sleutels
+# ------------------------------
+def parameter_text(param):
+    """Waarde van een parameter als tekst, zoals hij als sleutel in een tabel staat."""
+    if param is None:
+        return None
+    storage = param.StorageType
+    if storage == RDB.StorageType.String:
+        return param.AsString()
+    if storage == RDB.StorageType.Integer:
+        return str(param.AsInteger())
+    if storage == RDB.StorageType.ElementId:
+        return str(param.AsElementId().IntegerValue)
+    if storage == RDB.StorageType.Double:
+        return param.AsValueString()
+    return None
+
+
+class KeyIndex(object):
+    """Sleutel -> elementen voor één sleuteltype, in 1 pass opgebouwd."""
+
+    def __init__(self, doc, key_type, resolver=None):
+        self.doc = doc
+        self.key_type = key_type
+        self._elements = {}
+        if key_type != KEY_ELEMENT_ID:
+            self._build(resolver or paramcache.ParameterResolver())
+
+    def _build(self, resolver):
+        if self.key_type == KEY_MARK:
+            read = lambda e: e.get_Parameter(RDB.BuiltInParameter.ALL_MODEL_MARK)
+        elif self.key_type == KEY_IFC_GUID:
+            read = lambda e: e.get_Parameter(RDB.BuiltInParameter.IFC_GUID)
+        else:
+            read = lambda e: resolver.get(e, self.key_type)
+        collector = RDB.FilteredElementCollector(self.doc).WhereElementIsNotElementType()
+        for element in collector:
+            key = parameter_text(read(element))
+            if key:
+                self._elements.setdefault(key.strip(), []).append(element)
+
+    def lookup(self, key):
+        if self.key_type == KEY_ELEMENT_ID:
+            try:
+                element = self.doc.GetElement(RDB.ElementId(int(key)))
+            except ValueError:
+                return []
+            return [element] if element is not None else []
+        return self._elements.get(key, [])
+
+
+# ------------------------------
+# Plan en uitvoeren
+# ------------------------------
+class Write(object):
+    __slots__ = ("row", "element", "param", "value")
+
+    def __init__(self, row, element, param, value):
+        self.row = row
+        self.element = element
+        self.param = param
+        self.value = value
+
+
+class MappingPlan(object):
+    def __init__(self, rows):
+        self.rows = rows
+        self.writes = []
+        self.issues = []
+
+    def issue(self, row, reason, detail=""):
+        self.issues.append((row, reason, detail))
+
+    def issue_counts(self):
+        counts = {}
+        for _, reason, _ in self.issues:
+            counts[reason] = counts.get(reason, 0) + 1
+        return counts
+
+
+def _read_value(param):
+    storage = param.StorageType
+    if storage == RDB.StorageType.String:
+        return param.AsString()
+    if storage == RDB.StorageType.Integer:
+        return param.AsInteger()
+    if storage == RDB.StorageType.Double:
+        return param.AsDouble()
+    if storage == RDB.StorageType.ElementId:
+        return param.AsElementId()
+    return None
+
+
+def _format_number(value):
+    text = "{0:.6f}".format(value).rstrip("0").rstrip(".")
+    return text if text not in ("", "-0") else "0"
+
+
+def _to_float(value):
+    if isinstance(value, RDB.ElementId):
+        return float(value.IntegerValue)
+    if isinstance(value, (int, float)):
+        return float(value)
+    return float(value.strip().replace(",", "."))
+
+
+def convert_value(value, source_storage, target_storage, factor=1.0):
+    """
+    Bronwaarde omzetten naar de opslag van de doelparameter. `factor` zet de
+    tabel-eenheid om naar de interne eenheid en geldt alleen tussen een
+    Double-parameter en tekst/getallen. Geeft ValueError als het niet kan.
+    """
+    if source_storage == target_storage:
+        return value
+    if target_storage == RDB.StorageType.String:
+        if source_storage == RDB.StorageType.Double:
+            return _format_number(value / factor)
+        if source_storage == RDB.StorageType.ElementId:
+            return str(value.IntegerValue)
+        return str(value)
+    if target_storage == RDB.StorageType.Double:
+        number = _to_float(value)
+        return number if source_storage == RDB.StorageType.Double else number * factor
+    if target_storage == RDB.StorageType.Integer:
+        number = _to_float(value)
+        if source_storage == RDB.StorageType.Double:
+            number /= factor
+        return int(round(number))
+    if target_storage == RDB.StorageType.ElementId:
+        return RDB.ElementId(int(_to_float(value)))
+    raise ValueError("Onbekend opslagtype")
+
+
+def build_plan(doc, rows, source_key_type, target_key_type):
+    """
+    Zoekt alle sleutels en parameters op en zet de waarden om, zonder iets te
+    wijzigen. Regels die niet kunnen worden uitgevoerd komen in `plan.issues`.
+    Een doelsleutel die bij meerdere objecten hoort, schrijft naar allemaal.
+    """
+    resolver = paramcache.ParameterResolver()
+    source_index = KeyIndex(doc, source_key_type, resolver)
+    target_index = source_index if target_key_type == source_key_type else KeyIndex(doc, target_key_type, resolver)
+
+    plan = MappingPlan(rows)
+    for row in rows:
+        factor = UNIT_FACTORS.get(row.unit)
+        if factor is None:
+            plan.issue(row, ISSUE_UNIT, row.unit)
+            continue
+        sources = source_index.lookup(row.source_key)
+        if not sources:
+            plan.issue(row, ISSUE_SOURCE_NOT_FOUND, row.source_key)
+            continue
+        if len(sources) > 1:
+            plan.issue(row, ISSUE_SOURCE_AMBIGUOUS, "{0} ({1}x)".format(row.source_key, len(sources)))
+            continue
+        targets = target_index.lookup(row.target_key)
+        if not targets:
+            plan.issue(row, ISSUE_TARGET_NOT_FOUND, row.target_key)
+            continue
+
+        source_param = resolver.get(sources[0], row.source_parameter)
+        if source_param is None:
+            plan.issue(row, ISSUE_SOURCE_PARAMETER, row.source_parameter)
+            continue
+        value = _read_value(source_param)
+        if value is None or (source_param.StorageType == RDB.StorageType.String and not value):
+            plan.issue(row, ISSUE_EMPTY, row.source_parameter)
+            continue
+
+        for target in targets:
+            param = resolver.get(target, row.target_parameter)
+            if param is None:
+                plan.issue(row, ISSUE_TARGET_PARAMETER, row.target_parameter)
+                continue
+            if param.IsReadOnly:
+                plan.issue(row, ISSUE_READ_ONLY, row.target_parameter)
+                continue
+            try:
+                converted = convert_value(value, source_param.StorageType, param.StorageType, factor)
+            except (ValueError, TypeError, AttributeError):
+                plan.issue(row, ISSUE_CONVERSION, u"{0} -> {1}".format(value, row.target_parameter))
+                continue
+            plan.writes.append(Write(row, target, param, converted))
+    return plan
+
+
+def _write(write):
+    if write.param.Set(write.value) is False:
+        raise ValueError("Parameter.Set gaf False")
+    return write
+
+
+def apply_plan(doc, plan, name="Parameter Mapping", chunk_size=CHUNK_SIZE, title=None):
+    """Voert de writes uit in blokken; geeft het BatchResult terug."""
+    return batch.run_chunked(doc, name, plan.writes, _write, chunk_size=chunk_size,
+                             title=title or name + " | {value} van {max_value}")
+
+
+def summary(plan, result):
+    """Regels voor het eindoverzicht."""
+    lines = ["{0} regel(s) in de mapping.".format(len(plan.rows))]
+    if result is not None and result.cancelled:
+        lines.append("Geannuleerd: er is niets gewijzigd.")
+    else:
+        written = len(result.succeeded) if result is not None else 0
+        lines.append("{0} parameter(s) weggeschreven.".format(written))
+        if result is not None and result.failures:
+            lines.append("{0} parameter(s) konden niet worden weggeschreven.".format(len(result.failures)))
+    for reason, count in sorted(plan.issue_counts().items()):
+        lines.append("{0}: {1}".format(reason, count))
+    return lines
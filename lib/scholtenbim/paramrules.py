@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Elementen selecteren op een parameterregel en die parameter in bulk aanpassen.
+
+Regels op tekstparameters (leeg, niet leeg, gelijk aan, bevat) en op
+getal-, lengte- en id-parameters (leeg, niet leeg, gelijk aan) worden als
+ElementParameterFilter in de collector gezet: Revit filtert dan zelf en
+`count()` telt met `GetElementCount()` zonder elementen op te halen. Regex,
+"bevat" op niet-tekstparameters en waarden die Revit niet kan omzetten
+worden in Python gecontroleerd op de elementen die de collector oplevert.
+Vergelijkingen zijn niet hoofdlettergevoelig, net als de filters in Revit.
+
+Gebruik:
+
+    from scholtenbim import paramrules
+
+    rule = paramrules.ParameterRule("Mark", paramrules.RULE_CONTAINS, "BC-")
+    query = paramrules.RuleQuery(doc, rule, paramrules.SCOPE_VIEW)
+    print(query.count())
+    writes = query.writes(paramrules.ACTION_SET, "BC-01")
+"""
+
+import re
+
+import Autodesk.Revit.DB as RDB
+
+from scholtenbim import paramcache, selection
+
+RULE_EMPTY = "empty"
+RULE_NOT_EMPTY = "not_empty"
+RULE_EQUALS = "equals"
+RULE_CONTAINS = "contains"
+RULE_REGEX = "regex"
+RULES = [RULE_EMPTY, RULE_NOT_EMPTY, RULE_EQUALS, RULE_CONTAINS, RULE_REGEX]
+
+SCOPE_SELECTION = "selection"
+SCOPE_VIEW = "view"
+SCOPE_MODEL = "model"
+SCOPE_VIEWS = "views"
+
+ACTION_CLEAR = "clear"
+ACTION_SET = "set"
+ACTION_COPY = "copy"
+
+# Marge voor "gelijk aan" op lengtes e.d. (interne eenheden, voet).
+DOUBLE_EPSILON = 1e-6
+
+
+def parameter_text(parameter):
+    """Waarde als tekst: AsString voor tekst, anders de weergave met eenheden."""
+    if parameter is None:
+        return ""
+    if parameter.StorageType == RDB.StorageType.String:
+        return parameter.AsString() or ""
+    return parameter.AsValueString() or ""
+
+
+def set_parameter_text(parameter, text):
+    """Zet `text` op de parameter, omgezet naar het type van de parameter."""
+    storage_type = parameter.StorageType
+    if storage_type == RDB.StorageType.String:
+        if parameter.Set(text) is False:
+            raise ValueError("Ongeldige waarde '{0}'".format(text))
+    elif not text:
+        raise ValueError("Alleen tekstparameters kunnen leeg gemaakt worden")
+    elif storage_type == RDB.StorageType.Integer:
+        if parameter.Set(int(text)) is False:
+            raise ValueError("Ongeldige waarde '{0}'".format(text))
+    elif storage_type == RDB.StorageType.Double:
+        if not parameter.SetValueString(text):
+            raise ValueError("Ongeldige waarde '{0}'".format(text))
+    else:
+        raise ValueError("Parametertype {0} wordt niet ondersteund".format(storage_type))
+
+
+def raw_text(parameter):
+    """Getal of element-id als tekst, zoals het Revit-filter ze vergelijkt."""
+    if parameter.StorageType == RDB.StorageType.Integer:
+        return str(parameter.AsInteger())
+    if parameter.StorageType == RDB.StorageType.ElementId:
+        return str(parameter.AsElementId().IntegerValue)
+    return None
+
+
+def _string_rule(create, parameter_id, value):
+    try:
+        return create(parameter_id, value)
+    except TypeError:
+        # Revit 2022 en ouder: alleen de variant met caseSensitive.
+        return create(parameter_id, value, False)
+
+
+class ParameterRule(object):
+    """Regel op één parameter (op naam); `value` voor gelijk aan, bevat en regex."""
+
+    def __init__(self, parameter_name, kind, value=""):
+        if kind not in RULES:
+            raise ValueError("Onbekende regel '{0}'".format(kind))
+        self.parameter_name = parameter_name
+        self.kind = kind
+        self.value = value or ""
+        self._regex = re.compile(self.value, re.IGNORECASE | re.UNICODE) if kind == RULE_REGEX else None
+
+    def native_filter(self, parameter_id, storage_type, to_internal=None):
+        """
+        ElementParameterFilter voor deze regel, of None als Python moet
+        controleren. `to_internal` zet de tekst van "gelijk aan" om naar de
+        interne waarde van een Double-parameter (None als dat niet lukt).
+        """
+        if parameter_id is None or storage_type is None or self.kind == RULE_REGEX:
+            return None
+        factory = RDB.ParameterFilterRuleFactory
+        if storage_type != RDB.StorageType.String:
+            return self._native_value_filter(factory, parameter_id, storage_type, to_internal)
+        if self.kind in (RULE_EMPTY, RULE_NOT_EMPTY):
+            # NOT(waarde == "") => gevuld
+            rule = _string_rule(factory.CreateEqualsRule, parameter_id, "")
+            return RDB.ElementParameterFilter(rule, self.kind == RULE_NOT_EMPTY)
+        create = factory.CreateEqualsRule if self.kind == RULE_EQUALS else factory.CreateContainsRule
+        return RDB.ElementParameterFilter(_string_rule(create, parameter_id, self.value))
+
+    def _native_value_filter(self, factory, parameter_id, storage_type, to_internal):
+        if self.kind in (RULE_EMPTY, RULE_NOT_EMPTY):
+            # HasValue/HasNoValue-regels bestaan pas vanaf Revit 2022.
+            name = "CreateHasNoValueParameterRule" if self.kind == RULE_EMPTY else "CreateHasValueParameterRule"
+            create = getattr(factory, name, None)
+            return RDB.ElementParameterFilter(create(parameter_id)) if create is not None else None
+        if self.kind != RULE_EQUALS:
+            return None
+        try:
+            if storage_type == RDB.StorageType.Integer:
+                rule = factory.CreateEqualsRule(parameter_id, int(self.value))
+            elif storage_type == RDB.StorageType.ElementId:
+                rule = factory.CreateEqualsRule(parameter_id, RDB.ElementId(int(self.value)))
+            elif storage_type == RDB.StorageType.Double and to_internal is not None:
+                value = to_internal(self.value)
+                if value is None:
+                    return None
+                rule = factory.CreateEqualsRule(parameter_id, value, DOUBLE_EPSILON)
+            else:
+                return None
+        except ValueError:
+            # Geen getal (bijv. "Ja" of een levelnaam): in Python vergelijken.
+            return None
+        return RDB.ElementParameterFilter(rule)
+
+    def matches(self, parameter):
+        """Controle in Python, voor regels die niet in de collector kunnen."""
+        if parameter is None:
+            return False
+        text = parameter_text(parameter)
+        if self.kind == RULE_EMPTY:
+            return not text
+        if self.kind == RULE_NOT_EMPTY:
+            return bool(text)
+        if self.kind == RULE_EQUALS:
+            return text.lower() == self.value.lower() or raw_text(parameter) == self.value.strip()
+        if self.kind == RULE_CONTAINS:
+            return self.value.lower() in text.lower()
+        return self._regex.search(text) is not None
+
+
+def scope_collectors(doc, scope, element_ids=None, view_ids=None):
+    """Nieuwe collectors (zonder types) voor de scope; één per view bij SCOPE_VIEWS."""
+    if scope == SCOPE_SELECTION:
+        collector = selection.collector(doc, element_ids)
+        return [collector.WhereElementIsNotElementType()] if collector is not None else []
+    if scope == SCOPE_VIEW:
+        view_ids = [doc.ActiveView.Id] if doc.ActiveView is not None else []
+    elif scope == SCOPE_MODEL:
+        return [RDB.FilteredElementCollector(doc).WhereElementIsNotElementType()]
+    return [RDB.FilteredElementCollector(doc, view_id).WhereElementIsNotElementType() for view_id in view_ids or []]
+
+
+class RuleQuery(object):
+    """Elementen in een scope die aan een ParameterRule voldoen."""
+
+    def __init__(self, doc, rule, scope, element_ids=None, view_ids=None):
+        self.doc = doc
+        self.rule = rule
+        self._collectors = lambda: scope_collectors(doc, scope, element_ids, view_ids)
+        self.parameter_id, self.storage_type, self._definition = self._resolve()
+        self.native = rule.native_filter(self.parameter_id, self.storage_type, self._to_internal)
+
+    def _resolve(self):
+        """
+        Id, type en definitie van de parameter, van het eerste element in de
+        scope dat hem heeft. Per (categorie, type) wordt maar één keer op naam
+        gezocht; elementen van een al bekeken soort kosten alleen een dict-lookup.
+        """
+        resolver = paramcache.ParameterResolver()
+        for collector in self._collectors():
+            for element in collector:
+                parameter = resolver.get(element, self.rule.parameter_name)
+                if parameter is not None:
+                    return parameter.Id, parameter.StorageType, parameter.Definition
+        return None, None, None
+
+    def _to_internal(self, text):
+        """Tekst met eenheden (bijv. "2500 mm") als interne waarde, of None."""
+        try:
+            # GetDataType bestaat pas vanaf Revit 2022.
+            spec = self._definition.GetDataType()
+            parsed, value = RDB.UnitFormatUtils.TryParse(self.doc.GetUnits(), spec, text)
+        except (AttributeError, TypeError):
+            return None
+        return value if parsed else None
+
+    def _filtered(self):
+        collectors = self._collectors()
+        if self.native is not None:
+            for collector in collectors:
+                collector.WherePasses(self.native)
+        return collectors
+
+    def count(self):
+        """Aantal elementen dat aan de regel voldoet (dry-run)."""
+        if self.parameter_id is None:
+            return 0
+        if self.native is None:
+            return len(self.elements())
+        collectors = self._filtered()
+        if len(collectors) == 1:
+            return collectors[0].GetElementCount()
+        # Meerdere views: elementen die in meer views staan maar één keer tellen.
+        ids = set()
+        for collector in collectors:
+            ids.update(collector.ToElementIds())
+        return len(ids)
+
+    def elements(self):
+        """(element, parameter) voor elk element dat aan de regel voldoet."""
+        if self.parameter_id is None:
+            return []
+        found = []
+        seen = set()
+        name = self.rule.parameter_name
+        for collector in self._filtered():
+            for element in collector:
+                if element.Id in seen:
+                    continue
+                seen.add(element.Id)
+                parameter = element.LookupParameter(name)
+                if parameter is not None and (self.native is not None or self.rule.matches(parameter)):
+                    found.append((element, parameter))
+        return found
+
+    def writes(self, action, value=""):
+        """
+        (element, parameter, tekst) voor `batch.write_parameters`. Bij ACTION_COPY
+        is `value` de naam van de parameter waaruit gekopieerd wordt.
+        """
+        if action == ACTION_CLEAR:
+            return [(element, parameter, "") for element, parameter in self.elements()]
+        if action == ACTION_SET:
+            return [(element, parameter, value) for element, parameter in self.elements()]
+        writes = []
+        for element, parameter in self.elements():
+            source = element.LookupParameter(value)
+            # Zonder bronparameter niets overschrijven.
+            if source is not None:
+                writes.append((element, parameter, parameter_text(source)))
+        return writes
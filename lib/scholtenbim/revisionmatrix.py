@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Revisie-matrix: welke revisies staan op welke sheets.
+
+De matrix wordt in één pass opgebouwd: één `GetAllRevisionIds()` per sheet en
+één `GetElement` per revisie. Daarna is elke vraag (sheets van een revisie,
+revisies van een sheet, ongebruikte revisies) een dictionary-lookup, en kan de
+hele matrix naar CSV of Excel worden geëxporteerd voor documentbeheer.
+
+Gebruik:
+
+    from scholtenbim import revisionmatrix
+
+    matrix = revisionmatrix.cached(doc)     # of RevisionMatrix(doc) zonder cache
+    sheets = matrix.sheets_for_sequence(3)
+    matrix.export_csv(r"C:\\temp\\revisies.csv")
+"""
+
+import io
+
+import Autodesk.Revit.DB as RDB
+
+from scholtenbim import doccache
+from scholtenbim.csvutil import CSV_DELIMITER, csv_row
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+MARK = "X"
+
+
+class RevisionMatrix(object):
+    """Sheets x revisies voor één document, opgebouwd bij aanmaken."""
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.revisions = []
+        self.sheets = []
+        self.seq_by_id = {}
+        self._revision_by_seq = {}
+        self._revision_ids_by_sheet = {}
+        self._sheet_ids_by_revision = {}
+        self._build()
+
+    def _build(self):
+        revisions = RDB.FilteredElementCollector(self.doc).OfClass(RDB.Revision).ToElements()
+        self.revisions = sorted(revisions, key=lambda r: r.SequenceNumber)
+        self.seq_by_id = dict((r.Id, r.SequenceNumber) for r in self.revisions)
+        self._revision_by_seq = dict((r.SequenceNumber, r) for r in self.revisions)
+        self._sheet_ids_by_revision = dict((r.Id, []) for r in self.revisions)
+
+        sheets = RDB.FilteredElementCollector(self.doc).OfClass(RDB.ViewSheet).ToElements()
+        self.sheets = sorted([s for s in sheets if not s.IsTemplate], key=lambda s: s.SheetNumber)
+        for sheet in self.sheets:
+            rev_ids = list(sheet.GetAllRevisionIds())
+            self._revision_ids_by_sheet[sheet.Id] = rev_ids
+            for rev_id in rev_ids:
+                self._sheet_ids_by_revision.setdefault(rev_id, []).append(sheet.Id)
+
+    # ---------- Vragen ----------
+    def revision_by_sequence(self, sequence_number):
+        return self._revision_by_seq.get(sequence_number)
+
+    def sheet_ids_for_revision(self, revision_id):
+        return list(self._sheet_ids_by_revision.get(revision_id, []))
+
+    def sheets_for_revision(self, revision_id):
+        """Sheets waarop de revisie staat, in volgorde van sheetnummer."""
+        ids = set(self._sheet_ids_by_revision.get(revision_id, []))
+        return [s for s in self.sheets if s.Id in ids]
+
+    def sheets_for_sequence(self, sequence_number):
+        revision = self.revision_by_sequence(sequence_number)
+        return self.sheets_for_revision(revision.Id) if revision else []
+
+    def revision_ids_on_sheet(self, sheet_id):
+        return list(self._revision_ids_by_sheet.get(sheet_id, []))
+
+    def has_revision(self, sheet_id, revision_id):
+        return revision_id in self._revision_ids_by_sheet.get(sheet_id, ())
+
+    def sheets_without_revisions(self):
+        return [s for s in self.sheets if not self._revision_ids_by_sheet.get(s.Id)]
+
+    def unused_revisions(self, cloud_revision_ids=None):
+        """
+        Revisies die op geen enkele sheet staan. Geef `cloud_revision_ids` mee om
+        ook revisies met clouds in views die niet op een sheet staan als gebruikt
+        te tellen.
+        """
+        used = set(cloud_revision_ids or ())
+        return [r for r in self.revisions
+                if not self._sheet_ids_by_revision.get(r.Id) and r.Id not in used]
+
+    # ---------- Export ----------
+    def revision_label(self, revision):
+        return u"{0} - {1}".format(revision.SequenceNumber, revision.Description)
+
+    def rows(self):
+        """Kopregel + één regel per sheet met `MARK` per revisie."""
+        header = [u"Sheet Number", u"Sheet Name"] + [self.revision_label(r) for r in self.revisions]
+        yield header
+        for sheet in self.sheets:
+            rev_ids = set(self._revision_ids_by_sheet.get(sheet.Id, ()))
+            yield [sheet.SheetNumber, sheet.Name] + [MARK if r.Id in rev_ids else u"" for r in self.revisions]
+
+    def export_csv(self, path, delimiter=CSV_DELIMITER):
+        # utf-8-sig zodat Excel accenten in sheetnamen goed leest
+        with io.open(path, "w", encoding="utf-8-sig", newline="") as out:
+            for row in self.rows():
+                out.write(csv_row(row, delimiter))
+        return path
+
+    def export_xlsx(self, path):
+        if xlsxwriter is None:
+            raise ImportError("xlsxwriter is niet beschikbaar; exporteer naar CSV.")
+        workbook = xlsxwriter.Workbook(path)
+        try:
+            sheet = workbook.add_worksheet("Revisies")
+            bold = workbook.add_format({"bold": True})
+            center = workbook.add_format({"align": "center"})
+            for r, row in enumerate(self.rows()):
+                for c, value in enumerate(row):
+                    if r == 0:
+                        sheet.write(r, c, value, bold)
+                    elif c >= 2:
+                        sheet.write(r, c, value, center)
+                    else:
+                        sheet.write(r, c, value)
+            sheet.freeze_panes(1, 2)
+            sheet.set_column(0, 0, 14)
+            sheet.set_column(1, 1, 40)
+        finally:
+            workbook.close()
+        return path
+
+
+def cached(doc):
+    """RevisionMatrix van `doc` uit `doccache`; opnieuw opgebouwd na elke wijziging in het model."""
+    return doccache.get(doc, "revisionmatrix", lambda: RevisionMatrix(doc),
+                        weight=lambda matrix: len(matrix.sheets) * max(1, len(matrix.revisions)))
+
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""
+Hostelementen koppelen aan de room (of space) uit een link waar ze in staan.
+
+`Room.IsPointInRoom` is nauwkeurig maar duur; elk element tegen elke room
+testen is bij een installatiemodel van 50k elementen en een paar honderd
+rooms onwerkbaar. `RoomContainment` verdeelt de punten van de elementen
+over een 2D-raster en test per room alleen de punten in de cellen onder de
+footprint, binnen de bounding box en binnen de hoogteband van de room.
+
+De hoogteband loopt van het level van de room tot het volgende level in de
+link, zodat ook elementen boven het plafond (kanalen, leidingen) bij de
+room eronder horen. Zo'n punt wordt voor `IsPointInRoom` naar de halve
+hoogte van de room verplaatst.
+
+Gebruik:
+
+    from scholtenbim import roomcontainment
+
+    footprints = roomcontainment.room_footprints(link_instance)
+    containment = roomcontainment.RoomContainment(footprints)
+    rooms = containment.assign(roomcontainment.element_points(elements))
+"""
+
+import Autodesk.Revit.DB as RDB
+from Autodesk.Revit.DB.Mechanical import Space
+
+from scholtenbim import linkedrooms, spatialindex
+
+ROOM_CATEGORIES = (RDB.BuiltInCategory.OST_Rooms, RDB.BuiltInCategory.OST_MEPSpaces)
+
+
+class RoomFootprint(object):
+    """LinkedRoom met zijn bounding box in host-coördinaten en de hoogteband."""
+
+    def __init__(self, linked_room, band_top=None):
+        self.linked = linked_room
+        self.room = linked_room.room
+        self.inverse = linked_room.transform.Inverse
+        bbox = linked_room.bounding_box()
+        self.box = spatialindex.Box.from_bounding_box(bbox, linked_room.transform)
+        # Testhoogte in link-coördinaten: halverwege de room zelf.
+        self.test_z = (bbox.Min.Z + bbox.Max.Z) / 2.0
+        self.z_min = self.box.lo[2]
+        self.z_max = max(self.box.hi[2], band_top if band_top is not None else self.box.hi[2])
+
+    def in_band(self, point):
+        """Snelle test: `point` (host) binnen de bounding box en de hoogteband."""
+        lo, hi = self.box.lo, self.box.hi
+        return lo[0] <= point.X <= hi[0] and lo[1] <= point.Y <= hi[1] and self.z_min <= point.Z < self.z_max
+
+    def is_point_in_room(self, point):
+        """
+        `IsPointInRoom` (of `IsPointInSpace` voor een space) voor `point`
+        (host), op de testhoogte van de room.
+        """
+        local = self.inverse.OfPoint(point)
+        local = RDB.XYZ(local.X, local.Y, self.test_z)
+        if isinstance(self.room, Space):
+            return self.room.IsPointInSpace(local)
+        return self.room.IsPointInRoom(local)
+
+    def contains(self, point):
+        return self.in_band(point) and self.is_point_in_room(point)
+
+
+def _level_tops(link_doc, transform):
+    """
+    Level-id -> hoogte (host) van het eerstvolgende level erboven. Het
+    bovenste level krijgt dezelfde verdiepingshoogte als het level eronder.
+    """
+    levels = sorted(RDB.FilteredElementCollector(link_doc).OfClass(RDB.Level), key=lambda l: l.Elevation)
+    elevations = [level.Elevation for level in levels]
+    if len(levels) > 1:
+        elevations.append(2 * elevations[-1] - elevations[-2])
+    tops = {}
+    for level, above in zip(levels, elevations[1:]):
+        tops[level.Id.IntegerValue] = transform.OfPoint(RDB.XYZ(0, 0, above)).Z
+    return tops
+
+
+def room_footprints(link_instance, categories=ROOM_CATEGORIES):
+    """RoomFootprints van alle geplaatste rooms/spaces in de link."""
+    link_doc = link_instance.GetLinkDocument()
+    if link_doc is None:
+        return []
+    footprints = []
+    tops = None
+    for bic in categories:
+        collector = RDB.FilteredElementCollector(link_doc).OfCategory(bic).WhereElementIsNotElementType()
+        for room in collector:
+            # Niet geplaatste of niet begrensde rooms hebben geen oppervlakte.
+            if not room.Area or room.get_BoundingBox(None) is None:
+                continue
+            if tops is None:
+                tops = _level_tops(link_doc, link_instance.GetTotalTransform())
+            linked_room = linkedrooms.LinkedRoom(room, link_instance, link_doc)
+            footprints.append(RoomFootprint(linked_room, tops.get(linked_room.level_id.IntegerValue)))
+    return footprints
+
+
+def element_point(element):
+    """Punt van een element: LocationPoint, midden van de LocationCurve of midden van de bounding box."""
+    location = element.Location
+    if isinstance(location, RDB.LocationPoint):
+        return location.Point
+    if isinstance(location, RDB.LocationCurve):
+        return location.Curve.Evaluate(0.5, True)
+    bbox = element.get_BoundingBox(None)
+    if bbox is None:
+        return None
+    return (bbox.Min + bbox.Max) / 2.0
+
+
+def element_points(elements):
+    """[(element, punt)] voor elementen met een punt."""
+    points = []
+    for element in elements:
+        point = element_point(element)
+        if point is not None:
+            points.append((element, point))
+    return points
+
+
+class RoomContainment(object):
+    """Punten in een 2D-raster; per room alleen de punten onder de footprint testen."""
+
+    def __init__(self, footprints, cell_size=None):
+        self.footprints = footprints
+        self.cell_size = float(cell_size or spatialindex.cell_size_for([f.box for f in footprints]))
+        # Aantal IsPointInRoom/IsPointInSpace-aanroepen van de laatste `assign`.
+        self.tests = 0
+
+    def _cell(self, x, y):
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def assign(self, points):
+        """
+        {index in `points`: RoomFootprint} voor de punten die in een room
+        vallen. Rooms overlappen niet; de eerste treffer telt.
+        """
+        buckets = {}
+        for i, (_, point) in enumerate(points):
+            buckets.setdefault(self._cell(point.X, point.Y), []).append(i)
+
+        self.tests = 0
+        assigned = {}
+        for footprint in self.footprints:
+            (x0, y0), (x1, y1) = (self._cell(footprint.box.lo[0], footprint.box.lo[1]),
+                                  self._cell(footprint.box.hi[0], footprint.box.hi[1]))
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    for i in buckets.get((cx, cy), ()):
+                        if i in assigned:
+                            continue
+                        point = points[i][1]
+                        if not footprint.in_band(point):
+                            continue
+                        self.tests += 1
+                        if footprint.is_point_in_room(point):
+                            assigned[i] = footprint
+        return assigned
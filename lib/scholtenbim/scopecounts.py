@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""
+Tellingen per document bewaren tot het document verandert.
+
+Tools die vooraf tellen hoeveel elementen ze gaan aanpassen (bijv. Clear Mark
+per scope) hoeven dat niet bij elke klik of elke keer dat het venster opent
+opnieuw te doen. De tellingen staan in `doccache` en blijven geldig tot het
+`DocumentChanged` event van Revit toegevoegde, verwijderde of gewijzigde
+elementen meldt.
+
+Gebruik:
+
+    from scholtenbim import scopecounts
+
+    key = ("ClearMark", "model")
+    count = scopecounts.get(doc, key)
+    if count is None:
+        count = scopecounts.put(doc, key, collector.GetElementCount())
+"""
+
+from scholtenbim import doccache
+
+_NAME = "scopecounts"
+
+
+def get(doc, key):
+    """Bewaarde telling voor `key`, of None."""
+    return (doccache.peek(doc, _NAME) or {}).get(key)
+
+
+def put(doc, key, count):
+    doccache.get(doc, _NAME, dict)[key] = count
+    return count
+
+
+def invalidate(doc):
+    doccache.invalidate(doc, _NAME)
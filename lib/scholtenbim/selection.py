@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+"""
+Collectors op de huidige selectie.
+
+`FilteredElementCollector(doc, ICollection[ElementId])` bekijkt alleen de
+opgegeven elementen, maar met dezelfde (native) filters als een collector op
+een view of het hele model. Een tool met "huidige selectie" als scope hoeft
+dan niet per id `doc.GetElement` en `get_Parameter` in Python aan te roepen;
+bij een selectie van 30.000 elementen uit een schedule scheelt dat het meest.
+
+Gebruik:
+
+    from scholtenbim import selection
+
+    col = selection.collector(doc, uidoc.Selection.GetElementIds())
+    if col is not None:
+        elements = col.WhereElementIsNotElementType().WherePasses(mark_filter).ToElements()
+"""
+
+import Autodesk.Revit.DB as RDB
+from System.Collections.Generic import List
+
+
+def collector(doc, element_ids):
+    """Collector op `element_ids`, of None als er geen ids zijn (Revit accepteert geen lege set)."""
+    ids = list(element_ids or [])
+    if not ids:
+        return None
+    return RDB.FilteredElementCollector(doc, List[RDB.ElementId](ids))
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Omgekeerd index van view -> sheets.
+
+Eén pass over alle `Viewport`- en `ScheduleSheetInstance`-elementen levert
+per view de sheets waarop hij geplaatst is. Daarna is elke vraag een
+dictionary-lookup in plaats van een sheet-collector per view.
+
+Gebruik:
+
+    from scholtenbim import sheetindex
+
+    index = sheetindex.cached(doc)      # of SheetIndex(doc) zonder cache
+    sheets = index.sheets_for_view(view.Id)
+    unplaced = index.unplaced_views()
+"""
+
+import Autodesk.Revit.DB as RDB
+
+from scholtenbim import doccache
+
+# Views van deze types kunnen niet op een sheet geplaatst worden.
+_NOT_PLACEABLE = (
+    RDB.ViewType.DrawingSheet,
+    RDB.ViewType.ProjectBrowser,
+    RDB.ViewType.SystemBrowser,
+    RDB.ViewType.Internal,
+    RDB.ViewType.Undefined,
+)
+
+
+class SheetIndex(object):
+    """View -> sheets en sheet -> views voor één document, opgebouwd bij aanmaken."""
+
+    def __init__(self, doc):
+        self.doc = doc
+        self._sheets_by_view = {}
+        self._views_by_sheet = {}
+        self._build()
+
+    def _link(self, view_id, sheet_id):
+        sheets = self._sheets_by_view.setdefault(view_id, [])
+        if sheet_id not in sheets:
+            sheets.append(sheet_id)
+        views = self._views_by_sheet.setdefault(sheet_id, [])
+        if view_id not in views:
+            views.append(view_id)
+
+    def _build(self):
+        for viewport in RDB.FilteredElementCollector(self.doc).OfClass(RDB.Viewport):
+            self._link(viewport.ViewId, viewport.SheetId)
+
+        # Schedules staan niet in een Viewport maar in een ScheduleSheetInstance.
+        # Revisieschema's in de titelhoek tellen niet als geplaatste view.
+        schedules = RDB.FilteredElementCollector(self.doc).OfClass(RDB.ScheduleSheetInstance)
+        for instance in schedules:
+            if instance.IsTitleblockRevisionSchedule:
+                continue
+            self._link(instance.ScheduleId, instance.OwnerViewId)
+
+    # ---------- Vragen ----------
+    def sheet_ids_for_view(self, view_id):
+        return list(self._sheets_by_view.get(view_id, []))
+
+    def sheets_for_view(self, view_id):
+        """Sheets waarop de view staat, gesorteerd op sheetnummer."""
+        sheets = [self.doc.GetElement(i) for i in self._sheets_by_view.get(view_id, [])]
+        return sorted([s for s in sheets if s is not None], key=lambda s: s.SheetNumber)
+
+    def view_ids_on_sheet(self, sheet_id):
+        return list(self._views_by_sheet.get(sheet_id, []))
+
+    def is_placed(self, view_id):
+        return view_id in self._sheets_by_view
+
+    def unplaced_views(self):
+        """Alle plaatsbare views (geen templates/sheets) die op geen enkele sheet staan."""
+        out = []
+        for view in RDB.FilteredElementCollector(self.doc).OfClass(RDB.View):
+            if view.Id in self._sheets_by_view or not is_placeable(view):
+                continue
+            out.append(view)
+        return sorted(out, key=lambda v: v.Name)
+
+
+def is_placeable(view):
+    if view.IsTemplate or view.ViewType in _NOT_PLACEABLE:
+        return False
+    if isinstance(view, RDB.ViewSchedule):
+        if view.IsTitleblockRevisionSchedule or view.IsInternalKeynoteSchedule:
+            return False
+    return True
+
+
+def cached(doc):
+    """SheetIndex van `doc` uit `doccache`; opnieuw opgebouwd na elke wijziging in het model."""
+    return doccache.get(doc, "sheetindex", lambda: SheetIndex(doc),
+                        weight=lambda index: len(index._sheets_by_view) + len(index._views_by_sheet))
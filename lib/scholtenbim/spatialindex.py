@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+"""
+Ruimtelijke index op bounding boxes (3D-raster).
+
+Elementen uit een link koppelen aan elementen in het hostmodel is zonder
+index een N x M vergelijking. `BoxGrid` verdeelt de ruimte in cellen; een
+box staat in alle cellen die hij raakt, zodat een zoekvraag alleen de
+elementen in dezelfde cellen bekijkt. `LinkedElementIndex` vult zo'n raster
+met de elementen van een gelinkt model, omgerekend met `GetTotalTransform()`.
+
+Gebruik:
+
+    from scholtenbim import spatialindex
+
+    index = spatialindex.LinkedElementIndex(link_instance, accept=lambda e: ...)
+    match = index.best_match(host_element.get_BoundingBox(None))
+"""
+
+import Autodesk.Revit.DB as RDB
+
+# Boxen dunner dan dit (feet) tellen met deze dikte mee, zodat vlakke
+# elementen (plafonds, vloeren van 0 mm) toch een overlapvolume hebben.
+MIN_EXTENT = 1.0 / 304.8
+# Grenzen voor de automatisch bepaalde celgrootte (feet).
+MIN_CELL_SIZE = 1.0
+MAX_CELL_SIZE = 100.0
+# Een box die meer cellen zou raken dan dit wordt in één "grote" lijst gezet.
+MAX_CELLS_PER_BOX = 512
+
+
+class Box(object):
+    """As-uitgelijnde box als tuples (xmin, ymin, zmin), (xmax, ymax, zmax)."""
+
+    __slots__ = ("lo", "hi")
+
+    def __init__(self, lo, hi):
+        self.lo = tuple(min(a, b) for a, b in zip(lo, hi))
+        self.hi = tuple(max(a, b) for a, b in zip(lo, hi))
+
+    @staticmethod
+    def from_bounding_box(bbox, transform=None):
+        """Box om een BoundingBoxXYZ, optioneel omgerekend (alle 8 hoeken) met `transform`."""
+        if bbox is None:
+            return None
+        lo, hi = bbox.Min, bbox.Max
+        if bbox.Transform is not None and not bbox.Transform.IsIdentity:
+            transform = bbox.Transform if transform is None else transform.Multiply(bbox.Transform)
+        return Box((lo.X, lo.Y, lo.Z), (hi.X, hi.Y, hi.Z)).transformed(transform)
+
+    def transformed(self, transform):
+        """Box om alle 8 hoeken na `transform` (None of identiteit: deze box)."""
+        if transform is None or transform.IsIdentity:
+            return self
+        corners = [transform.OfPoint(RDB.XYZ(x, y, z))
+                   for x in (self.lo[0], self.hi[0]) for y in (self.lo[1], self.hi[1]) for z in (self.lo[2], self.hi[2])]
+        return Box((min(p.X for p in corners), min(p.Y for p in corners), min(p.Z for p in corners)),
+                   (max(p.X for p in corners), max(p.Y for p in corners), max(p.Z for p in corners)))
+
+    def extents(self):
+        return tuple(max(h - l, MIN_EXTENT) for l, h in zip(self.lo, self.hi))
+
+    @property
+    def volume(self):
+        x, y, z = self.extents()
+        return x * y * z
+
+    def overlap(self, other):
+        """Overlapvolume (met MIN_EXTENT voor platte boxen), 0.0 als ze elkaar niet raken."""
+        volume = 1.0
+        for i in range(3):
+            lo = max(self.lo[i], other.lo[i])
+            hi = min(self.hi[i], other.hi[i])
+            if hi < lo:
+                return 0.0
+            volume *= max(hi - lo, MIN_EXTENT)
+        return volume
+
+    def contains(self, other):
+        return all(self.lo[i] <= other.lo[i] and other.hi[i] <= self.hi[i] for i in range(3))
+
+
+class BoxGrid(object):
+    """Raster van cellen met zijde `cell_size`; elke cel bevat de keys van de boxen die hem raken."""
+
+    def __init__(self, cell_size):
+        self.cell_size = float(cell_size)
+        self._cells = {}
+        self._large = []
+        self.boxes = {}
+
+    def _range(self, box):
+        size = self.cell_size
+        return [(int(l // size), int(h // size)) for l, h in zip(box.lo, box.hi)]
+
+    def insert(self, key, box):
+        self.boxes[key] = box
+        (x0, x1), (y0, y1), (z0, z1) = self._range(box)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) * (z1 - z0 + 1) > MAX_CELLS_PER_BOX:
+            self._large.append(key)
+            return
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                for z in range(z0, z1 + 1):
+                    self._cells.setdefault((x, y, z), []).append(key)
+
+    def candidates(self, box):
+        """Keys van boxen die in dezelfde cellen liggen als `box` (kan vals-positief zijn)."""
+        found = set(self._large)
+        (x0, x1), (y0, y1), (z0, z1) = self._range(box)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) * (z1 - z0 + 1) > MAX_CELLS_PER_BOX:
+            return set(self.boxes)
+        cells = self._cells
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                for z in range(z0, z1 + 1):
+                    keys = cells.get((x, y, z))
+                    if keys:
+                        found.update(keys)
+        return found
+
+    def best_match(self, box):
+        """
+        Key van de box die `box` omvat of er het meest mee overlapt, of None.
+        Bij gelijke overlap wint de kleinste box (de meest specifieke).
+        """
+        best_key, best = None, None
+        for key in self.candidates(box):
+            other = self.boxes[key]
+            overlap = other.overlap(box)
+            if overlap <= 0.0:
+                continue
+            score = (overlap, -other.volume)
+            if best is None or score > best:
+                best_key, best = key, score
+        return best_key
+
+    def __len__(self):
+        return len(self.boxes)
+
+
+def cell_size_for(boxes):
+    """Celgrootte ~ 2x de gemiddelde grootste zijde, binnen MIN/MAX_CELL_SIZE."""
+    if not boxes:
+        return MIN_CELL_SIZE
+    mean = sum(max(b.extents()) for b in boxes) / float(len(boxes))
+    return min(MAX_CELL_SIZE, max(MIN_CELL_SIZE, 2.0 * mean))
+
+
+class LinkedElementIndex(object):
+    """
+    BoxGrid over de elementen van een gelinkt model, in host-coördinaten.
+    Met `boxes` ([(element id (int), Box in link-coördinaten)], bijvoorbeeld
+    uit de linkcache) wordt de link zelf niet uitgelezen.
+    """
+
+    def __init__(self, link_instance, accept=None, cell_size=None, boxes=None):
+        self.link_instance = link_instance
+        self.link_doc = link_instance.GetLinkDocument()
+        self.transform = link_instance.GetTotalTransform()
+        self.elements = {}
+        if boxes is not None:
+            entries = [(key, box.transformed(self.transform)) for key, box in boxes]
+        else:
+            entries = []
+            collector = RDB.FilteredElementCollector(self.link_doc).WhereElementIsNotElementType()
+            for element in collector:
+                if element.Category is None or (accept is not None and not accept(element)):
+                    continue
+                box = Box.from_bounding_box(element.get_BoundingBox(None), self.transform)
+                if box is None:
+                    continue
+                entries.append((element.Id.IntegerValue, box))
+                self.elements[element.Id.IntegerValue] = element
+        self.grid = BoxGrid(cell_size or cell_size_for([box for _, box in entries]))
+        for key, box in entries:
+            self.grid.insert(key, box)
+
+    def best_key(self, bbox):
+        """Element id (int) van het gelinkte element dat de (host-)bounding box omvat of er het meest mee overlapt."""
+        box = Box.from_bounding_box(bbox)
+        if box is None:
+            return None
+        return self.grid.best_match(box)
+
+    def best_match(self, bbox):
+        """Gelinkt element dat de (host-)bounding box omvat of er het meest mee overlapt."""
+        key = self.best_key(bbox)
+        if key is None:
+            return None
+        if key not in self.elements:
+            self.elements[key] = self.link_doc.GetElement(RDB.ElementId(key))
+        return self.elements[key]
+
+    def __len__(self):
+        return len(self.grid)
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Tijdmetingen per tool en fase, als JSON Lines in een lokaal log.
+
+Om te zien waar de tijd zit (collector-passes, parameters opzoeken,
+transacties/regeneratie of het opbouwen van een venster) meten de tools hun
+fases met een `Timer`. Elke fase wordt één regel in het log in de pyRevit
+app-data map van de gebruiker:
+
+    {"tool": "Clear Mark", "phase": "tellen", "ms": 12.5, "count": 3400,
+     "model_mb": 184.2, "revit": "2025", "user": "...", "time": "...", "ok": true}
+
+`model_mb` is de bestandsgrootte van het model op schijf: een maat voor de
+modelgrootte zonder extra collector-pass. Het log wordt boven MAX_BYTES
+doorgeschoven naar `.1`, `.2`, ... (hooguit BACKUPS oude logs). Meten mag een
+tool nooit laten falen: fouten bij het schrijven worden genegeerd. Uitzetten
+kan met `{"enabled": false}` voor "Timing" in `configstore`.
+
+`report` vat logs (ook verzamelde logs van collega's) samen tot p50/p95 per
+tool en fase; zie de knop Timing Report.
+
+Gebruik:
+
+    from scholtenbim import timing
+
+    timer = timing.Timer("Clear Mark", doc)
+    with timer.phase("collector") as phase:
+        elements = collector.ToElements()
+        phase.count = len(elements)
+
+    @timer.timed("venster")
+    def build_window():
+        ...
+"""
+
+import datetime
+import functools
+import io
+import json
+import os
+import time
+
+LOG_FILE_ID = "ScholtenBIM_Timing"
+MAX_BYTES = 1024 * 1024
+BACKUPS = 3
+CONFIG_TOOL = "Timing"
+
+
+def log_path():
+    """Log in de pyRevit app-data map van de gebruiker."""
+    from pyrevit import script
+    return script.get_universal_data_file(LOG_FILE_ID, "jsonl")
+
+
+def log_files(path=None):
+    """Het log en de doorgeschoven oude logs die bestaan (nieuwste eerst)."""
+    path = path or log_path()
+    names = [path] + ["{0}.{1}".format(path, i) for i in range(1, BACKUPS + 1)]
+    return [name for name in names if os.path.exists(name)]
+
+
+def enabled():
+    from scholtenbim import configstore
+    return bool((configstore.load(CONFIG_TOOL, default={}) or {}).get("enabled", True))
+
+
+def _model_mb(doc):
+    path = doc.PathName if doc is not None else None
+    try:
+        return round(os.path.getsize(path) / (1024.0 * 1024.0), 1) if path and os.path.isfile(path) else None
+    except (IOError, OSError):
+        return None
+
+
+def _user():
+    return os.environ.get("USERNAME") or os.environ.get("USER")
+
+
+class Phase(object):
+    """Eén gemeten fase; `count` (aantal elementen) kan binnen het `with`-blok worden gezet."""
+
+    def __init__(self, timer, name, count=None):
+        self.timer = timer
+        self.name = name
+        self.count = count
+        self.seconds = None
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.seconds = time.time() - self._start
+        self.timer.record(self.name, self.seconds, self.count, ok=exc_type is None)
+        return False
+
+
+class Timer(object):
+    """Meet fases van één tool; schrijft niets als timing uit staat."""
+
+    def __init__(self, tool, doc=None, path=None):
+        self.tool = tool
+        self.doc = doc
+        self.path = path
+        self.enabled = _safe(enabled, False)
+        self._base = None
+
+    def phase(self, name, count=None):
+        return Phase(self, name, count)
+
+    def timed(self, name):
+        """Decorator: meet elke aanroep; `count` is len() van het resultaat als dat kan."""
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.phase(name) as phase:
+                    result = func(*args, **kwargs)
+                    try:
+                        phase.count = len(result)
+                    except TypeError:
+                        pass
+                    return result
+            return wrapper
+        return decorate
+
+    def record(self, name, seconds, count=None, ok=True):
+        if not self.enabled:
+            return
+        if self._base is None:
+            self._base = {"tool": self.tool, "user": _user(), "model_mb": _model_mb(self.doc),
+                          "revit": _safe(lambda: self.doc.Application.VersionNumber)}
+        entry = dict(self._base)
+        entry.update({"phase": name, "ms": round(seconds * 1000.0, 1), "count": count, "ok": ok,
+                      "time": datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")})
+        _safe(lambda: _append(self.path or log_path(), entry))
+
+
+def _safe(func, default=None):
+    try:
+        return func()
+    except Exception:
+        return default
+
+
+def _append(path, entry):
+    if os.path.exists(path) and os.path.getsize(path) > MAX_BYTES:
+        _rotate(path)
+    with io.open(path, "a", encoding="utf-8") as f:
+        f.write(u"{0}\n".format(json.dumps(entry, sort_keys=True)))
+
+
+def _rotate(path):
+    oldest = "{0}.{1}".format(path, BACKUPS)
+    if os.path.exists(oldest):
+        os.remove(oldest)
+    for i in range(BACKUPS - 1, 0, -1):
+        name = "{0}.{1}".format(path, i)
+        if os.path.exists(name):
+            os.rename(name, "{0}.{1}".format(path, i + 1))
+    os.rename(path, "{0}.1".format(path))
+
+
+# ------------------------------
+# Rapport
+# ------------------------------
+def read_records(paths):
+    """Alle regels uit de logs; kapotte regels (bijv. half geschreven) worden overgeslagen."""
+    for path in paths:
+        with io.open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and "tool" in entry and "phase" in entry and "ms" in entry:
+                    yield entry
+
+
+def percentile(values, pct):
+    """Percentiel (0-100) met lineaire interpolatie; `values` gesorteerd."""
+    if not values:
+        return None
+    position = (len(values) - 1) * pct / 100.0
+    low = int(position)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (position - low)
+
+
+class ReportRow(object):
+    def __init__(self, tool, phase, durations, counts, users):
+        self.tool = tool
+        self.phase = phase
+        self.runs = len(durations)
+        self.p50 = percentile(durations, 50)
+        self.p95 = percentile(durations, 95)
+        self.max = durations[-1]
+        self.count_p50 = percentile(counts, 50)
+        self.users = users
+
+    def cells(self):
+        count = int(self.count_p50) if self.count_p50 is not None else ""
+        return [self.tool, self.phase, self.runs, "{0:.1f}".format(self.p50), "{0:.1f}".format(self.p95),
+                "{0:.1f}".format(self.max), count, self.users]
+
+
+REPORT_COLUMNS = ["Tool", "Fase", "Runs", "p50 ms", "p95 ms", "Max ms", "Elementen (p50)", "Gebruikers"]
+
+
+def report(records):
+    """ReportRow per (tool, fase), traagste p95 eerst."""
+    groups = {}
+    for entry in records:
+        group = groups.setdefault((entry["tool"], entry["phase"]), ([], [], set()))
+        group[0].append(float(entry["ms"]))
+        if entry.get("count") is not None:
+            group[1].append(float(entry["count"]))
+        if entry.get("user"):
+            group[2].add(entry["user"])
+    rows = [ReportRow(tool, phase, sorted(durations), sorted(counts), len(users))
+            for (tool, phase), (durations, counts, users) in groups.items()]
+    return sorted(rows, key=lambda row: (-row.p95, row.tool, row.phase))
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import fakerevit  # noqa: E402
+
+fakerevit.install()
+
+
+@pytest.fixture(autouse=True)
+def _reset_fakes():
+    from fakerevit import db, pyrevit, system
+    from scholtenbim import doccache, docindex
+    del db.default_application().Documents[:]
+    db.BasicFileInfo.saved_elsewhere.clear()
+    pyrevit.reset()
+    system.MessageBox.reset()
+    yield
+    docindex._indexes.clear()
+    doccache.invalidate()
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Offline fake van de Revit API voor tests en benchmarks.
+
+`install()` registreert `Autodesk.Revit.*`, `clr`, `System.*`, `RevitServices`
+en `pyrevit` in `sys.modules`, zodat de pushbutton-scripts buiten Revit
+geïmporteerd kunnen worden. `load_script()` voert een script uit tegen een
+(synthetisch) document en geeft de module-namespace terug, zodat de functies
+erin los aangeroepen kunnen worden:
+
+    from fakerevit import models, load_script
+
+    doc = models.generic_model(10000)
+    mod = load_script("Scholten BIM.tab/Elements.panel/ClearMark.pushbutton/script.py", doc)
+    mod.clear_mark_with_progress(mod.collect_whole_model_only_filled())
+"""
+
+import os
+import sys
+import types
+
+from . import db
+from . import errors
+from . import pyrevit
+from . import system
+from . import ui
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+TAB_ROOT = os.path.join(REPO_ROOT, "Scholten BIM.tab")
+
+
+def _package(name, **attrs):
+    module = types.ModuleType(name)
+    module.__path__ = []
+    for key, value in attrs.items():
+        setattr(module, key, value)
+    return module
+
+
+def install():
+    """Registreer de fake modules (idempotent)."""
+    if getattr(sys.modules.get("Autodesk"), "_fakerevit", False):
+        return
+    # pyRevit zet de lib-map van de extensie op het zoekpad.
+    lib = os.path.join(REPO_ROOT, "lib")
+    if lib not in sys.path:
+        sys.path.insert(0, lib)
+    db_sub = {}
+    for name in ("Architecture", "Mechanical", "Structure", "Plumbing", "Electrical", "ExtensibleStorage"):
+        db_sub[name] = system.StubModule("Autodesk.Revit.DB." + name)
+    db_sub["Architecture"].Room = db.Room
+    db_sub["Mechanical"].Space = db.Space
+    for name, module in db_sub.items():
+        setattr(db, name, module)
+
+    revit = _package("Autodesk.Revit", DB=db, UI=ui, Exceptions=errors)
+    autodesk = _package("Autodesk", Revit=revit, _fakerevit=True)
+    selection = _package("Autodesk.Revit.UI.Selection", ObjectType=ui.ObjectType,
+                         ISelectionFilter=ui.ISelectionFilter)
+    ui.Selection = selection
+
+    modules = {
+        "Autodesk": autodesk,
+        "Autodesk.Revit": revit,
+        "Autodesk.Revit.DB": db,
+        "Autodesk.Revit.UI": ui,
+        "Autodesk.Revit.UI.Selection": selection,
+        "Autodesk.Revit.Exceptions": errors,
+    }
+    for name, module in db_sub.items():
+        modules["Autodesk.Revit.DB." + name] = module
+    modules.update(system.modules())
+    modules.update(pyrevit.modules())
+    sys.modules.update(modules)
+
+
+def resolve(path):
+    """Pad relatief aan de repo of aan `Scholten BIM.tab`."""
+    for root in ("", REPO_ROOT, TAB_ROOT):
+        candidate = os.path.join(root, path) if root else path
+        if os.path.exists(candidate):
+            return os.path.abspath(candidate)
+    raise IOError("Script niet gevonden: {0}".format(path))
+
+
+def bind(doc, uidoc=None):
+    """Maak `doc` het actieve document voor pyrevit en RevitServices."""
+    uidoc = uidoc or ui.UIDocument(doc)
+    pyrevit.state.doc = doc
+    pyrevit.state.uidoc = uidoc
+    system.bind_revitservices(doc, uidoc.Application)
+    return uidoc
+
+
+def load_script(path, doc, uidoc=None, picks=None):
+    """
+    Voer een pushbutton-script uit en geef de namespace terug als module.
+
+    `picks` wordt de antwoordenlijst voor PickObject(s); zonder picks breekt de
+    gebruiker de eerste selectie af, zodat alleen de functies geladen worden.
+    `sys.exit()` in het script wordt opgevangen (`module.exited`).
+    """
+    install()
+    path = resolve(path)
+    uidoc = bind(doc, uidoc)
+    if picks is not None:
+        uidoc.Selection.picks = list(picks)
+    pyrevit.state.bundle_dir = os.path.dirname(path)
+
+    module = types.ModuleType("__main__")
+    module.__file__ = path
+    module.__revit__ = uidoc.Application
+    module.exited = False
+    with open(path, "rb") as script_file:
+        code = compile(script_file.read(), path, "exec")
+    try:
+        exec(code, module.__dict__)
+    except SystemExit:
+        module.exited = True
+    return module
@@ -0,0 +1,2420 @@
+# -*- coding: utf-8 -*-
+"""
+Pure-Python stand-in voor het deel van `Autodesk.Revit.DB` dat de scripts in
+deze extensie gebruiken.
+
+Het model is bewust eenvoudig: een `Document` bewaart zijn elementen in een
+dict en houdt per klasse en per categorie een index bij, zodat collectors ook
+op synthetische modellen met een miljoen elementen snel blijven. Elke
+API-aanroep die in Revit geld kost (collectors, `LookupParameter`,
+`GetElement`, commits, ...) wordt geteld in `doc.calls`, zodat benchmarks naast
+wall-time ook het aantal API-calls kunnen vergelijken.
+"""
+
+import collections
+import itertools
+import math
+import types
+
+from . import errors
+
+
+# ------------------------------
+# Enums
+# ------------------------------
+class _EnumMember(int):
+    def __new__(cls, enum_name, name, value):
+        obj = int.__new__(cls, value)
+        obj._enum_name = enum_name
+        obj._name = name
+        return obj
+
+    def __repr__(self):
+        return "{0}.{1}".format(self._enum_name, self._name)
+
+    def __str__(self):
+        return self._name
+
+    def ToString(self):
+        return self._name
+
+    __hash__ = int.__hash__
+
+
+class _Enum(object):
+    """
+    Enum met int-waarden. Met `lazy=True` wordt elk opgevraagd lid automatisch
+    aangemaakt (handig voor BuiltInCategory/BuiltInParameter met duizenden
+    leden); anders geeft een onbekend lid een AttributeError.
+    """
+
+    def __init__(self, name, members=(), base=0, step=1, lazy=False):
+        self._enum_name = name
+        self._base = base
+        self._step = step
+        self._lazy = lazy
+        self._members = collections.OrderedDict()
+        for member in members:
+            self._add(member)
+
+    def _add(self, member):
+        value = self._base + self._step * (len(self._members) + 1)
+        item = _EnumMember(self._enum_name, member, value)
+        self._members[member] = item
+        return item
+
+    def __getattr__(self, attr):
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        member = self._members.get(attr)
+        if member is None:
+            if not self._lazy:
+                raise AttributeError("{0} heeft geen lid '{1}'".format(self._enum_name, attr))
+            member = self._add(attr)
+        return member
+
+    def __iter__(self):
+        return iter(self._members.values())
+
+    def GetValues(self):
+        return list(self._members.values())
+
+
+BuiltInCategory = _Enum("BuiltInCategory", base=-2000000, step=-1, lazy=True)
+BuiltInParameter = _Enum("BuiltInParameter", ["INVALID"], base=-1000000, step=-1, lazy=True)
+StorageType = _Enum("StorageType", ["None", "Integer", "Double", "String", "ElementId"], base=100)
+ViewFamily = _Enum("ViewFamily", [
+    "Invalid", "ThreeDimensional", "Walkthrough", "ImageView", "CostReport", "Legend",
+    "Schedule", "StructuralPlan", "FloorPlan", "CeilingPlan", "AreaPlan", "Elevation",
+    "Section", "Detail", "Drafting", "Sheet", "GraphicalColumnSchedule", "PanelSchedule",
+    "SystemsAnalysisReport"], base=200)
+ViewType = _Enum("ViewType", [
+    "Undefined", "FloorPlan", "EngineeringPlan", "AreaPlan", "CeilingPlan", "Elevation",
+    "Section", "Detail", "ThreeD", "Schedule", "DraftingView", "DrawingSheet", "Legend",
+    "Report", "ProjectBrowser", "SystemBrowser", "CostReport", "Walkthrough", "Rendering",
+    "Internal", "PanelSchedule", "ColumnSchedule"], base=400)
+ViewDuplicateOption = _Enum("ViewDuplicateOption", ["Duplicate", "AsDependent", "WithDetailing"], base=500)
+TransactionStatus = _Enum("TransactionStatus", [
+    "Uninitialized", "Started", "RolledBack", "Committed", "Pending", "Error", "Proceed"], base=600)
+FailureProcessingResult = _Enum("FailureProcessingResult", [
+    "Continue", "ProceedWithCommit", "ProceedWithRollBack", "WaitForUserInput"], base=700)
+CategoryType = _Enum("CategoryType", ["Invalid", "Model", "Annotation", "Internal", "AnalyticalModel"], base=900)
+FamilyPlacementType = _Enum("FamilyPlacementType", [
+    "Invalid", "OneLevelBased", "OneLevelBasedHosted", "TwoLevelsBased", "ViewBased",
+    "WorkPlaneBased", "CurveBased", "CurveBasedDetail", "CurveDrivenStructural", "Adaptive"], base=800)
+
+
+def _category_name(bic):
+    """OST_MechanicalEquipment -> 'Mechanical Equipment'."""
+    raw = str(bic)
+    if raw.startswith("OST_"):
+        raw = raw[4:]
+    out = []
+    for i, ch in enumerate(raw):
+        if ch.isupper() and i and not raw[i - 1].isupper():
+            out.append(" ")
+        out.append(ch)
+    return "".join(out)
+
+
+# ------------------------------
+# Ids, referenties en collecties
+# ------------------------------
+class ElementId(object):
+    __slots__ = ("_value",)
+
+    def __init__(self, value):
+        self._value = int(value)
+
+    @property
+    def IntegerValue(self):
+        return self._value
+
+    @property
+    def Value(self):
+        return self._value
+
+    def __eq__(self, other):
+        return isinstance(other, ElementId) and other._value == self._value
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __lt__(self, other):
+        return self._value < other._value
+
+    def __hash__(self):
+        return hash(self._value)
+
+    def __repr__(self):
+        return "ElementId({0})".format(self._value)
+
+    def __str__(self):
+        return str(self._value)
+
+    def ToString(self):
+        return str(self._value)
+
+    def Compare(self, other):
+        return (self._value > other._value) - (self._value < other._value)
+
+
+ElementId.InvalidElementId = ElementId(-1)
+
+
+class Reference(object):
+    def __init__(self, element_id, linked_element_id=None):
+        self.ElementId = element_id
+        self.LinkedElementId = linked_element_id or ElementId.InvalidElementId
+
+    def __repr__(self):
+        return "Reference({0}, {1})".format(self.ElementId, self.LinkedElementId)
+
+
+class _List(list):
+    """`List[T]` / `ICollection[T]`: gewone lijst met .NET-achtige extra's."""
+
+    def __class_getitem__(cls, item):
+        return cls
+
+    @property
+    def Count(self):
+        return len(self)
+
+    def Add(self, item):
+        self.append(item)
+
+    def Insert(self, index, item):
+        self.insert(index, item)
+
+    def Contains(self, item):
+        return item in self
+
+
+# ------------------------------
+# Geometrie
+# ------------------------------
+class XYZ(object):
+    __slots__ = ("X", "Y", "Z")
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.X = float(x)
+        self.Y = float(y)
+        self.Z = float(z)
+
+    def __add__(self, other):
+        return XYZ(self.X + other.X, self.Y + other.Y, self.Z + other.Z)
+
+    def __sub__(self, other):
+        return XYZ(self.X - other.X, self.Y - other.Y, self.Z - other.Z)
+
+    def __mul__(self, factor):
+        return XYZ(self.X * factor, self.Y * factor, self.Z * factor)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, factor):
+        return XYZ(self.X / factor, self.Y / factor, self.Z / factor)
+
+    __div__ = __truediv__
+
+    def __neg__(self):
+        return XYZ(-self.X, -self.Y, -self.Z)
+
+    def __repr__(self):
+        return "XYZ({0:.4f}, {1:.4f}, {2:.4f})".format(self.X, self.Y, self.Z)
+
+    def Add(self, other):
+        return self + other
+
+    def Subtract(self, other):
+        return self - other
+
+    def Multiply(self, factor):
+        return self * factor
+
+    def Divide(self, factor):
+        return self / factor
+
+    def Negate(self):
+        return -self
+
+    def GetLength(self):
+        return math.sqrt(self.X * self.X + self.Y * self.Y + self.Z * self.Z)
+
+    def Normalize(self):
+        length = self.GetLength()
+        if length == 0:
+            return XYZ(0, 0, 0)
+        return XYZ(self.X / length, self.Y / length, self.Z / length)
+
+    def DotProduct(self, other):
+        return self.X * other.X + self.Y * other.Y + self.Z * other.Z
+
+    def CrossProduct(self, other):
+        return XYZ(self.Y * other.Z - self.Z * other.Y,
+                   self.Z * other.X - self.X * other.Z,
+                   self.X * other.Y - self.Y * other.X)
+
+    def DistanceTo(self, other):
+        return (self - other).GetLength()
+
+    def IsAlmostEqualTo(self, other, tolerance=1e-9):
+        return self.DistanceTo(other) <= tolerance
+
+    def AngleTo(self, other):
+        denom = self.GetLength() * other.GetLength()
+        if denom == 0:
+            return 0.0
+        return math.acos(max(-1.0, min(1.0, self.DotProduct(other) / denom)))
+
+
+XYZ.Zero = XYZ(0, 0, 0)
+XYZ.BasisX = XYZ(1, 0, 0)
+XYZ.BasisY = XYZ(0, 1, 0)
+XYZ.BasisZ = XYZ(0, 0, 1)
+
+
+class UV(object):
+    def __init__(self, u=0.0, v=0.0):
+        self.U = float(u)
+        self.V = float(v)
+
+
+class _TransformMeta(type):
+    @property
+    def Identity(cls):
+        # In Revit levert Transform.Identity telkens een nieuw object op; de
+        # scripts passen het resultaat direct aan.
+        return cls()
+
+
+class Transform(_TransformMeta("_TransformBase", (object,), {})):
+    def __init__(self, other=None):
+        if other is not None:
+            self.Origin, self.BasisX, self.BasisY, self.BasisZ = (
+                other.Origin, other.BasisX, other.BasisY, other.BasisZ)
+        else:
+            self.Origin = XYZ(0, 0, 0)
+            self.BasisX = XYZ(1, 0, 0)
+            self.BasisY = XYZ(0, 1, 0)
+            self.BasisZ = XYZ(0, 0, 1)
+
+    @staticmethod
+    def CreateTranslation(vector):
+        t = Transform()
+        t.Origin = vector
+        return t
+
+    @staticmethod
+    def CreateRotation(axis, angle):
+        return Transform.CreateRotationAtPoint(axis, angle, XYZ(0, 0, 0))
+
+    @staticmethod
+    def CreateRotationAtPoint(axis, angle, point):
+        a = axis.Normalize()
+        c, s = math.cos(angle), math.sin(angle)
+
+        def rot(v):
+            # Rodrigues
+            return (v * c) + (a.CrossProduct(v) * s) + (a * (a.DotProduct(v) * (1 - c)))
+
+        t = Transform()
+        t.BasisX = rot(XYZ.BasisX)
+        t.BasisY = rot(XYZ.BasisY)
+        t.BasisZ = rot(XYZ.BasisZ)
+        t.Origin = point - rot(point)
+        return t
+
+    @property
+    def IsIdentity(self):
+        return (self.Origin.IsAlmostEqualTo(XYZ.Zero) and self.BasisX.IsAlmostEqualTo(XYZ.BasisX)
+                and self.BasisY.IsAlmostEqualTo(XYZ.BasisY) and self.BasisZ.IsAlmostEqualTo(XYZ.BasisZ))
+
+    def OfVector(self, v):
+        return XYZ(self.BasisX.X * v.X + self.BasisY.X * v.Y + self.BasisZ.X * v.Z,
+                   self.BasisX.Y * v.X + self.BasisY.Y * v.Y + self.BasisZ.Y * v.Z,
+                   self.BasisX.Z * v.X + self.BasisY.Z * v.Y + self.BasisZ.Z * v.Z)
+
+    def OfPoint(self, p):
+        return self.OfVector(p) + self.Origin
+
+    def Multiply(self, other):
+        t = Transform()
+        t.BasisX = self.OfVector(other.BasisX)
+        t.BasisY = self.OfVector(other.BasisY)
+        t.BasisZ = self.OfVector(other.BasisZ)
+        t.Origin = self.OfPoint(other.Origin)
+        return t
+
+    @property
+    def Inverse(self):
+        # Alleen orthonormale transformaties (zoals link-transforms).
+        t = Transform()
+        t.BasisX = XYZ(self.BasisX.X, self.BasisY.X, self.BasisZ.X)
+        t.BasisY = XYZ(self.BasisX.Y, self.BasisY.Y, self.BasisZ.Y)
+        t.BasisZ = XYZ(self.BasisX.Z, self.BasisY.Z, self.BasisZ.Z)
+        t.Origin = -t.OfVector(self.Origin)
+        return t
+
+
+class BoundingBoxXYZ(object):
+    def __init__(self):
+        self.Min = XYZ(0, 0, 0)
+        self.Max = XYZ(0, 0, 0)
+        self.Transform = Transform()
+        self.Enabled = True
+        self.MinEnabled = True
+        self.MaxEnabled = True
+
+
+class Outline(object):
+    def __init__(self, min_point, max_point):
+        self.MinimumPoint = min_point
+        self.MaximumPoint = max_point
+
+    def Contains(self, point, tolerance):
+        return (self.MinimumPoint.X - tolerance <= point.X <= self.MaximumPoint.X + tolerance
+                and self.MinimumPoint.Y - tolerance <= point.Y <= self.MaximumPoint.Y + tolerance
+                and self.MinimumPoint.Z - tolerance <= point.Z <= self.MaximumPoint.Z + tolerance)
+
+    def Intersects(self, other, tolerance):
+        return not (other.MinimumPoint.X > self.MaximumPoint.X + tolerance
+                    or other.MaximumPoint.X < self.MinimumPoint.X - tolerance
+                    or other.MinimumPoint.Y > self.MaximumPoint.Y + tolerance
+                    or other.MaximumPoint.Y < self.MinimumPoint.Y - tolerance
+                    or other.MinimumPoint.Z > self.MaximumPoint.Z + tolerance
+                    or other.MaximumPoint.Z < self.MinimumPoint.Z - tolerance)
+
+
+class Curve(object):
+    def GetEndPoint(self, index):
+        raise NotImplementedError
+
+    def CreateTransformed(self, transform):
+        raise NotImplementedError
+
+
+class Line(Curve):
+    def __init__(self, start, end):
+        self._start = start
+        self._end = end
+
+    @staticmethod
+    def CreateBound(start, end):
+        if start.DistanceTo(end) < 1e-6:
+            raise errors.ArgumentsInconsistentException("Curve length is too small")
+        return Line(start, end)
+
+    def GetEndPoint(self, index):
+        return self._start if index == 0 else self._end
+
+    @property
+    def Direction(self):
+        return (self._end - self._start).Normalize()
+
+    @property
+    def Length(self):
+        return self._start.DistanceTo(self._end)
+
+    def Evaluate(self, parameter, normalized):
+        return self._start + (self._end - self._start) * parameter
+
+    def CreateTransformed(self, transform):
+        return Line(transform.OfPoint(self._start), transform.OfPoint(self._end))
+
+    def Tessellate(self):
+        return _List([self._start, self._end])
+
+
+class CurveLoop(object):
+    def __init__(self):
+        self._curves = []
+
+    @staticmethod
+    def Create(curves):
+        loop = CurveLoop()
+        for curve in curves:
+            loop.Append(curve)
+        return loop
+
+    def Append(self, curve):
+        if self._curves and not self._curves[-1].GetEndPoint(1).IsAlmostEqualTo(curve.GetEndPoint(0), 1e-6):
+            raise errors.ArgumentException("This curve will make the loop not contiguous.")
+        self._curves.append(curve)
+
+    def __iter__(self):
+        return iter(self._curves)
+
+    def __len__(self):
+        return len(self._curves)
+
+    def NumberOfCurves(self):
+        return len(self._curves)
+
+    def IsOpen(self):
+        if not self._curves:
+            return True
+        return not self._curves[-1].GetEndPoint(1).IsAlmostEqualTo(self._curves[0].GetEndPoint(0), 1e-6)
+
+
+# ------------------------------
+# Parameters
+# ------------------------------
+class Definition(object):
+    __slots__ = ("Name", "StorageType", "BuiltInParameter", "GUID", "IsReadOnly", "Id")
+
+    def __init__(self, name, storage_type, bip=None, guid=None, read_only=False, def_id=None):
+        self.Name = name
+        self.StorageType = storage_type
+        self.BuiltInParameter = bip if bip is not None else BuiltInParameter.INVALID
+        self.GUID = guid
+        self.IsReadOnly = read_only
+        self.Id = def_id
+
+    def __repr__(self):
+        return "Definition({0!r})".format(self.Name)
+
+    def GetDataType(self):
+        # Alle Double-parameters in de fakes zijn lengtes.
+        return SpecTypeId.Length if self.StorageType == StorageType.Double else SpecTypeId.Empty
+
+
+InternalDefinition = Definition
+ExternalDefinition = Definition
+
+
+class Parameter(object):
+    """Dunne wrapper, net als in Revit: elke lookup geeft een nieuw object."""
+
+    __slots__ = ("Element", "Definition")
+
+    def __init__(self, element, definition):
+        self.Element = element
+        self.Definition = definition
+
+    def __eq__(self, other):
+        return (isinstance(other, Parameter) and other.Element is self.Element
+                and other.Definition is self.Definition)
+
+    def __hash__(self):
+        return hash((id(self.Element), id(self.Definition)))
+
+    @property
+    def Id(self):
+        return self.Definition.Id
+
+    @property
+    def StorageType(self):
+        return self.Definition.StorageType
+
+    @property
+    def IsReadOnly(self):
+        return self.Definition.IsReadOnly
+
+    @property
+    def IsShared(self):
+        return self.Definition.GUID is not None
+
+    @property
+    def GUID(self):
+        if self.Definition.GUID is None:
+            raise errors.InvalidOperationException("Parameter is not shared")
+        return self.Definition.GUID
+
+    @property
+    def HasValue(self):
+        return self.Element._values.get(self.Definition) is not None
+
+    def _value(self):
+        return self.Element._values.get(self.Definition)
+
+    def AsString(self):
+        value = self._value()
+        if self.StorageType == StorageType.String:
+            return value
+        return None
+
+    def AsInteger(self):
+        value = self._value()
+        return int(value) if value is not None and self.StorageType == StorageType.Integer else 0
+
+    def AsDouble(self):
+        value = self._value()
+        return float(value) if value is not None and self.StorageType == StorageType.Double else 0.0
+
+    def AsElementId(self):
+        value = self._value()
+        if self.StorageType != StorageType.ElementId or value is None:
+            return ElementId.InvalidElementId
+        return value
+
+    def AsValueString(self):
+        value = self._value()
+        if value is None:
+            return None
+        if self.StorageType == StorageType.Double:
+            return "{0:g}".format(round(value * 304.8, 3))
+        if self.StorageType == StorageType.ElementId:
+            elem = self.Element.Document.GetElement(value)
+            return elem.Name if elem is not None else None
+        return str(value)
+
+    def Set(self, value):
+        doc = self.Element.Document
+        doc._require_transaction("Parameter.Set")
+        doc.calls["Parameter.Set"] += 1
+        if self.IsReadOnly:
+            raise errors.InvalidOperationException(
+                "The parameter '{0}' is read-only.".format(self.Definition.Name))
+        st = self.StorageType
+        if st == StorageType.String:
+            if not isinstance(value, str):
+                raise errors.ArgumentException("Expected a string value")
+        elif st == StorageType.Integer:
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise errors.ArgumentException("Expected an integer value")
+        elif st == StorageType.Double:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise errors.ArgumentException("Expected a double value")
+            value = float(value)
+        elif st == StorageType.ElementId:
+            if not isinstance(value, ElementId):
+                raise errors.ArgumentException("Expected an ElementId value")
+        self.Element._set_value(self.Definition, value)
+        return True
+
+    def SetValueString(self, text):
+        return self.Set(float(text) / 304.8)
+
+
+# ------------------------------
+# Elementen
+# ------------------------------
+# Categorieën die in Revit geen modelcategorie zijn.
+_ANNOTATION_CATEGORIES = frozenset((
+    "OST_Views", "OST_Sheets", "OST_Viewports", "OST_Levels", "OST_Grids", "OST_Revisions",
+    "OST_RevisionClouds", "OST_TextNotes", "OST_Dimensions", "OST_GenericAnnotation",
+    "OST_Schedules", "OST_ScheduleGraphics", "OST_TitleBlocks",
+))
+
+
+class Category(object):
+    def __init__(self, bic, name=None):
+        self.BuiltInCategory = bic
+        self.Id = ElementId(int(bic))
+        self.Name = name or _category_name(bic)
+        self.CategoryType = CategoryType.Annotation if str(bic) in _ANNOTATION_CATEGORIES else CategoryType.Model
+
+    def __eq__(self, other):
+        return isinstance(other, Category) and other.Id == self.Id
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.Id)
+
+    @staticmethod
+    def GetCategory(doc, bic):
+        return doc._category(bic)
+
+
+class Location(object):
+    def Move(self, vector):
+        raise NotImplementedError
+
+
+class LocationPoint(Location):
+    def __init__(self, point, rotation=0.0):
+        self.Point = point
+        self.Rotation = rotation
+
+    def Move(self, vector):
+        self.Point = self.Point + vector
+        return True
+
+
+class LocationCurve(Location):
+    def __init__(self, curve):
+        self.Curve = curve
+
+    def Move(self, vector):
+        self.Curve = self.Curve.CreateTransformed(Transform.CreateTranslation(vector))
+        return True
+
+
+class Element(object):
+    __slots__ = ("Document", "Id", "_category", "_name", "_values", "_type_id",
+                 "_owner_view_id", "_level_id", "_location", "_bbox", "_pinned", "__dict__")
+
+    _default_category = None
+
+    def __init__(self, doc, name="", category=None):
+        self.Document = doc
+        self.Id = None
+        self._name = name
+        self._category = category if category is not None else self._default_category
+        self._values = {}
+        self._type_id = None
+        self._owner_view_id = None
+        self._level_id = None
+        self._location = None
+        self._bbox = None
+        self._pinned = False
+
+    def __repr__(self):
+        return "<{0} {1} {2!r}>".format(type(self).__name__, self.Id, self.Name)
+
+    # ---------- Eigenschappen ----------
+    @property
+    def Name(self):
+        return self._name
+
+    @Name.setter
+    def Name(self, value):
+        self.Document._require_transaction("Element.Name")
+        self._set_name(value)
+
+    def _set_name(self, value):
+        old = self._name
+        self._name = value
+        self.Document._touch(self, lambda: setattr(self, "_name", old))
+
+    @property
+    def UniqueId(self):
+        return "00000000-0000-0000-0000-{0:012x}-{1:08x}".format(id(self.Document) & 0xffffffffffff, self.Id.IntegerValue)
+
+    @property
+    def Category(self):
+        if self._category is None:
+            return None
+        return self.Document._category(self._category)
+
+    @property
+    def OwnerViewId(self):
+        return self._owner_view_id or ElementId.InvalidElementId
+
+    @property
+    def LevelId(self):
+        return self._level_id or ElementId.InvalidElementId
+
+    @property
+    def Location(self):
+        return self._location
+
+    @property
+    def Pinned(self):
+        return self._pinned
+
+    @Pinned.setter
+    def Pinned(self, value):
+        self.Document._require_transaction("Element.Pinned")
+        old = self._pinned
+        self._pinned = bool(value)
+        self.Document._touch(self, lambda: setattr(self, "_pinned", old))
+
+    @property
+    def IsValidObject(self):
+        return self.Document._elements.get(self.Id) is self
+
+    @property
+    def Parameters(self):
+        self.Document.calls["Element.Parameters"] += 1
+        return _List(Parameter(self, d) for d in self._values)
+
+    def GetOrderedParameters(self):
+        return self.Parameters
+
+    def GetTypeId(self):
+        return self._type_id or ElementId.InvalidElementId
+
+    def ChangeTypeId(self, type_id):
+        self.Document._require_transaction("ChangeTypeId")
+        old = self._type_id
+        self._type_id = type_id
+        self.Document._touch(self, lambda: setattr(self, "_type_id", old))
+        return self.Id
+
+    # ---------- Parameters ----------
+    def LookupParameter(self, name):
+        # Revit loopt de parameters van het element af en vergelijkt op naam;
+        # dat is de kost die get_Parameter(definition) vermijdt.
+        doc = self.Document
+        doc.calls["LookupParameter"] += 1
+        for definition in self._values:
+            if definition.Name == name:
+                return Parameter(self, definition)
+        return None
+
+    def GetParameters(self, name):
+        definition = self.Document._definitions_by_name.get(name)
+        if definition is None or definition not in self._values:
+            return _List()
+        return _List([Parameter(self, definition)])
+
+    def get_Parameter(self, key):
+        doc = self.Document
+        doc.calls["get_Parameter"] += 1
+        if isinstance(key, Definition):
+            definition = key
+        elif isinstance(key, _EnumMember):
+            definition = doc._definitions_by_bip.get(int(key))
+        else:
+            definition = doc._definitions_by_guid.get(key)
+        if definition is None or definition not in self._values:
+            return None
+        return Parameter(self, definition)
+
+    def _set_value(self, definition, value):
+        old = self._values.get(definition)
+        self._values[definition] = value
+        self.Document._touch(self, lambda: self._values.__setitem__(definition, old))
+
+    # ---------- Geometrie ----------
+    def get_BoundingBox(self, view):
+        self.Document.calls["get_BoundingBox"] += 1
+        if self._bbox is None:
+            return None
+        bbox = BoundingBoxXYZ()
+        bbox.Min, bbox.Max = self._bbox
+        return bbox
+
+    def GetDependentElements(self, element_filter):
+        return _List(self.Document._dependents.get(self.Id, ()))
+
+
+class ElementType(Element):
+    __slots__ = ()
+
+    @property
+    def FamilyName(self):
+        return ""
+
+
+class FamilySymbol(ElementType):
+    __slots__ = ("_family_name",)
+
+    def __init__(self, doc, name="", category=None, family_name=""):
+        ElementType.__init__(self, doc, name, category)
+        self._family_name = family_name
+
+    @property
+    def FamilyName(self):
+        return self._family_name
+
+    @property
+    def Family(self):
+        return _Family(self._family_name)
+
+    @property
+    def IsActive(self):
+        return True
+
+    def Activate(self):
+        pass
+
+
+class _Family(object):
+    def __init__(self, name):
+        self.Name = name
+
+
+class Family(Element):
+    pass
+
+
+class Instance(Element):
+    __slots__ = ("_transform",)
+
+    def GetTransform(self):
+        return getattr(self, "_transform", None) or Transform()
+
+    def GetTotalTransform(self):
+        return self.GetTransform()
+
+
+class FamilyInstance(Instance):
+    __slots__ = ()
+
+    @property
+    def Symbol(self):
+        return self.Document.GetElement(self._type_id) if self._type_id else None
+
+    @property
+    def Host(self):
+        return None
+
+
+class HostObject(Element):
+    pass
+
+
+class Wall(HostObject):
+    _default_category = BuiltInCategory.OST_Walls
+
+
+class Floor(HostObject):
+    _default_category = BuiltInCategory.OST_Floors
+
+
+class Ceiling(HostObject):
+    _default_category = BuiltInCategory.OST_Ceilings
+
+
+class MEPCurve(Element):
+    @property
+    def ReferenceLevel(self):
+        return self.Document.GetElement(self._level_id) if self._level_id else None
+
+    @ReferenceLevel.setter
+    def ReferenceLevel(self, level):
+        self.Document._require_transaction("MEPCurve.ReferenceLevel")
+        old = self._level_id
+        self._level_id = level.Id
+        self.Document._touch(self, lambda: setattr(self, "_level_id", old))
+
+
+class CurveElement(Element):
+    def __init__(self, doc, curve=None, name="", category=None):
+        Element.__init__(self, doc, name, category or BuiltInCategory.OST_Lines)
+        self._curve = curve
+        self._line_style_id = None
+
+    @property
+    def GeometryCurve(self):
+        return self._curve
+
+    @property
+    def LineStyle(self):
+        return self.Document.GetElement(self._line_style_id) if self._line_style_id else None
+
+    @LineStyle.setter
+    def LineStyle(self, style):
+        self.Document._require_transaction("CurveElement.LineStyle")
+        old = self._line_style_id
+        self._line_style_id = style.Id
+        self.Document._touch(self, lambda: setattr(self, "_line_style_id", old))
+
+
+class DetailCurve(CurveElement):
+    pass
+
+
+class DetailLine(DetailCurve):
+    pass
+
+
+class ModelCurve(CurveElement):
+    pass
+
+
+class GraphicsStyle(Element):
+    _default_category = BuiltInCategory.OST_Lines
+
+    def __init__(self, doc, name="", graphics_style_type=None):
+        Element.__init__(self, doc, name)
+        self.GraphicsStyleType = graphics_style_type
+
+
+class TextElement(Element):
+    def __init__(self, doc, text="", width=0.0):
+        Element.__init__(self, doc, "", BuiltInCategory.OST_TextNotes)
+        self.Text = text
+        self.Width = width
+
+
+class TextNote(TextElement):
+    pass
+
+
+class Level(Element):
+    _default_category = BuiltInCategory.OST_Levels
+
+    def __init__(self, doc, name="", elevation=0.0):
+        Element.__init__(self, doc, name)
+        self._elevation = float(elevation)
+
+    @property
+    def Elevation(self):
+        return self._elevation
+
+    @Elevation.setter
+    def Elevation(self, value):
+        self.Document._require_transaction("Level.Elevation")
+        old = self._elevation
+        self._elevation = float(value)
+        self.Document._touch(self, lambda: setattr(self, "_elevation", old))
+
+    @property
+    def ProjectElevation(self):
+        return self._elevation
+
+    @staticmethod
+    def Create(doc, elevation):
+        doc._require_transaction("Level.Create")
+        return doc._create(Level(doc, "Level {0}".format(len(doc._by_class.get(Level, ())) + 1), elevation))
+
+
+class Grid(Element):
+    _default_category = BuiltInCategory.OST_Grids
+
+
+class ViewFamilyType(ElementType):
+    _default_category = None
+
+    def __init__(self, doc, name="", view_family=None):
+        ElementType.__init__(self, doc, name)
+        self.ViewFamily = view_family
+
+
+class View(Element):
+    """View; de naam komt (zoals in Revit) uit de parameter VIEW_NAME."""
+
+    _view_type = ViewType.Undefined
+    _default_category = BuiltInCategory.OST_Views
+
+    def __init__(self, doc, name="", view_type=None, is_template=False, scale=100):
+        Element.__init__(self, doc, "")
+        self._values[doc._bip_definition(BuiltInParameter.VIEW_NAME, "View Name", StorageType.String)] = name
+        self._view_type_value = view_type if view_type is not None else self._view_type
+        self.IsTemplate = is_template
+        self.Scale = scale
+        self.ViewDirection = XYZ(0, 0, -1)
+        self.CropBox = None
+        self.CropBoxActive = False
+        self.CropBoxVisible = True
+        self.GenLevel = None
+        self.ViewTemplateId = ElementId.InvalidElementId
+        self._visible_ids = set()
+
+    @property
+    def ViewType(self):
+        return self._view_type_value
+
+    @property
+    def Name(self):
+        return self._values.get(self.Document._bip_definition(BuiltInParameter.VIEW_NAME))
+
+    @Name.setter
+    def Name(self, value):
+        self.Document._require_transaction("View.Name")
+        Parameter(self, self.Document._bip_definition(BuiltInParameter.VIEW_NAME)).Set(value)
+
+    def _set_value(self, definition, value):
+        if definition.BuiltInParameter != BuiltInParameter.VIEW_NAME:
+            Element._set_value(self, definition, value)
+            return
+        old = self.Name
+        if value == old:
+            return
+        if self.Document._view_names.get(value):
+            raise errors.ArgumentException(
+                "Name must be unique. Another view with name '{0}' already exists.".format(value))
+        self._rename(old, value)
+        self.Document._touch(self, lambda: self._rename(value, old))
+
+    def _rename(self, old, new):
+        doc = self.Document
+        names = doc._view_names
+        names[old] -= 1
+        if not names[old]:
+            del names[old]
+        names[new] = names.get(new, 0) + 1
+        self._values[doc._bip_definition(BuiltInParameter.VIEW_NAME)] = new
+
+    @property
+    def CanBePrinted(self):
+        return not self.IsTemplate
+
+    def GetCropRegionShapeManager(self):
+        return ViewCropRegionShapeManager(self)
+
+    def Duplicate(self, option):
+        doc = self.Document
+        doc._require_transaction("View.Duplicate")
+        copy = type(self).__new__(type(self))
+        View.__init__(copy, doc, "", self.ViewType, self.IsTemplate, self.Scale)
+        copy.__dict__.update(dict((k, v) for k, v in self.__dict__.items() if k != "_visible_ids"))
+        copy._visible_ids = set(self._visible_ids)
+        base = self.Name + " Copy"
+        name, i = base, 1
+        while doc._view_names.get(name):
+            i += 1
+            name = "{0} {1}".format(base, i)
+        copy._values[doc._bip_definition(BuiltInParameter.VIEW_NAME)] = name
+        return doc._create(copy).Id
+
+
+class ViewCropRegionShapeManager(object):
+    def __init__(self, view):
+        self._view = view
+
+    @property
+    def CanHaveShape(self):
+        return self._view.ViewType in (ViewType.FloorPlan, ViewType.CeilingPlan, ViewType.EngineeringPlan,
+                                       ViewType.AreaPlan, ViewType.Detail, ViewType.Section, ViewType.Elevation)
+
+    @property
+    def ShapeSet(self):
+        return getattr(self._view, "_crop_shape", None) is not None
+
+    def SetCropShape(self, loop):
+        self._view.Document._require_transaction("SetCropShape")
+        if loop.IsOpen():
+            raise errors.ArgumentException("The boundary should be a closed curve loop.")
+        self._view.Document.calls["SetCropShape"] += 1
+        self._view._crop_shape = loop
+
+    def GetCropShape(self):
+        shape = getattr(self._view, "_crop_shape", None)
+        return _List([shape]) if shape is not None else _List()
+
+    def RemoveCropRegionShape(self):
+        self._view._crop_shape = None
+
+
+class ViewPlan(View):
+    _view_type = ViewType.FloorPlan
+
+    @staticmethod
+    def Create(doc, view_family_type_id, level_id):
+        doc._require_transaction("ViewPlan.Create")
+        doc.calls["ViewPlan.Create"] += 1
+        vft = doc.GetElement(view_family_type_id)
+        level = doc.GetElement(level_id)
+        if vft is None or level is None:
+            raise errors.ArgumentException("Invalid view family type or level")
+        view_type = ViewType.CeilingPlan if vft.ViewFamily == ViewFamily.CeilingPlan else ViewType.FloorPlan
+        name = level.Name
+        i = 1
+        while doc._view_names.get(name):
+            i += 1
+            name = "{0}({1})".format(level.Name, i)
+        view = ViewPlan(doc, name, view_type)
+        view.GenLevel = level
+        view._type_id = view_family_type_id
+        return doc._create(view)
+
+
+class ViewSection(View):
+    _view_type = ViewType.Section
+
+    @staticmethod
+    def CreateSection(doc, view_family_type_id, section_box):
+        doc._require_transaction("ViewSection.CreateSection")
+        doc.calls["ViewSection.CreateSection"] += 1
+        vft = doc.GetElement(view_family_type_id)
+        if vft is None or vft.ViewFamily != ViewFamily.Section:
+            raise errors.ArgumentException("viewFamilyTypeId is not a section view family type")
+        counter = len(doc._by_class.get(ViewSection, ())) + 1
+        while doc._view_names.get("Section {0}".format(counter)):
+            counter += 1
+        view = ViewSection(doc, "Section {0}".format(counter))
+        view.ViewDirection = section_box.Transform.BasisZ
+        view.CropBox = section_box
+        view.CropBoxActive = True
+        view._type_id = view_family_type_id
+        far = doc._bip_definition(BuiltInParameter.VIEWER_BOUND_OFFSET_FAR, "Far Clip Offset", StorageType.Double)
+        view._values[far] = section_box.Max.Z - section_box.Min.Z
+        return doc._create(view)
+
+    @staticmethod
+    def CreateDetail(doc, view_family_type_id, section_box):
+        return ViewSection.CreateSection(doc, view_family_type_id, section_box)
+
+
+class View3D(View):
+    _view_type = ViewType.ThreeD
+
+
+class ViewDrafting(View):
+    _view_type = ViewType.DraftingView
+
+
+class TableView(View):
+    pass
+
+
+class ViewSchedule(TableView):
+    _view_type = ViewType.Schedule
+    _default_category = BuiltInCategory.OST_Schedules
+    IsTitleblockRevisionSchedule = False
+    IsInternalKeynoteSchedule = False
+
+
+class ViewSheet(View):
+    _view_type = ViewType.DrawingSheet
+    _default_category = BuiltInCategory.OST_Sheets
+
+    def __init__(self, doc, number="", name=""):
+        View.__init__(self, doc, name)
+        self._sheet_number = number
+        self._revision_ids = []
+
+    @property
+    def SheetNumber(self):
+        return self._sheet_number
+
+    def GetAllPlacedViews(self):
+        doc = self.Document
+        doc.calls["GetAllPlacedViews"] += 1
+        ids = set()
+        for vp_id in doc._owned.get(self.Id, ()):
+            vp = doc._elements.get(vp_id)
+            if isinstance(vp, Viewport):
+                ids.add(vp.ViewId)
+        return _List(ids)
+
+    def GetAllViewports(self):
+        doc = self.Document
+        return _List(i for i in doc._owned.get(self.Id, ()) if isinstance(doc._elements.get(i), Viewport))
+
+    def GetAllRevisionIds(self):
+        doc = self.Document
+        doc.calls["GetAllRevisionIds"] += 1
+        ids = list(self._revision_ids)
+        for cloud_id in doc._owned.get(self.Id, ()):
+            cloud = doc._elements.get(cloud_id)
+            if isinstance(cloud, RevisionCloud) and cloud.RevisionId not in ids:
+                ids.append(cloud.RevisionId)
+        return _List(sorted(ids, key=lambda i: doc._elements[i].SequenceNumber if i in doc._elements else 0))
+
+    def GetAdditionalRevisionIds(self):
+        return _List(self._revision_ids)
+
+    def SetAdditionalRevisionIds(self, ids):
+        self.Document._require_transaction("SetAdditionalRevisionIds")
+        old = self._revision_ids
+        self._revision_ids = list(ids)
+        self.Document._touch(self, lambda: setattr(self, "_revision_ids", old))
+
+
+class Viewport(Element):
+    _default_category = BuiltInCategory.OST_Viewports
+
+    def __init__(self, doc, sheet_id, view_id):
+        Element.__init__(self, doc)
+        self.SheetId = sheet_id
+        self.ViewId = view_id
+        self._owner_view_id = sheet_id
+
+    @staticmethod
+    def Create(doc, sheet_id, view_id, point):
+        doc._require_transaction("Viewport.Create")
+        return doc._create(Viewport(doc, sheet_id, view_id))
+
+
+class ScheduleSheetInstance(Element):
+    _default_category = BuiltInCategory.OST_ScheduleGraphics
+
+    def __init__(self, doc, sheet_id, schedule_id):
+        Element.__init__(self, doc)
+        self.ScheduleId = schedule_id
+        self._owner_view_id = sheet_id
+        self.IsTitleblockRevisionSchedule = False
+
+
+class Revision(Element):
+    _default_category = BuiltInCategory.OST_Revisions
+
+    def __init__(self, doc, sequence_number=1, description="", revision_number=None, date=""):
+        Element.__init__(self, doc)
+        self.SequenceNumber = sequence_number
+        self.Description = description
+        self.RevisionNumber = revision_number if revision_number is not None else str(sequence_number)
+        self.RevisionDate = date
+        self.Issued = False
+
+    @staticmethod
+    def Create(doc):
+        doc._require_transaction("Revision.Create")
+        seq = len(doc._by_class.get(Revision, ())) + 1
+        return doc._create(Revision(doc, seq))
+
+    @staticmethod
+    def GetAllRevisionIds(doc):
+        revs = list(doc._iter_class(Revision))
+        return _List(r.Id for r in sorted(revs, key=lambda r: r.SequenceNumber))
+
+
+class RevisionCloud(Element):
+    _default_category = BuiltInCategory.OST_RevisionClouds
+
+    def __init__(self, doc, view_id, revision_id):
+        Element.__init__(self, doc)
+        self.RevisionId = revision_id
+        self._owner_view_id = view_id
+
+
+class Dimension(Element):
+    _default_category = BuiltInCategory.OST_Dimensions
+
+
+class SpatialElement(Element):
+    pass
+
+
+class _BoundedSpatialElement(SpatialElement):
+    """Rechthoekige of polygonale room/space; de contour ligt in lokale coordinaten."""
+
+    def __init__(self, doc, number="", name="", level_id=None, boundary=None, height=3.0):
+        SpatialElement.__init__(self, doc)
+        self._values[doc._bip_definition(BuiltInParameter.ROOM_NUMBER, "Number", StorageType.String)] = number
+        self._values[doc._bip_definition(BuiltInParameter.ROOM_NAME, "Name", StorageType.String)] = name
+        self._level_id = level_id
+        self._boundary = list(boundary or [])
+        self._height = float(height)
+        if self._boundary:
+            level = doc._elements.get(level_id) if level_id else None
+            z = level.Elevation if level is not None else 0.0
+            xs = [p.X for p in self._boundary]
+            ys = [p.Y for p in self._boundary]
+            self._bbox = (XYZ(min(xs), min(ys), z), XYZ(max(xs), max(ys), z + self._height))
+            cx = sum(xs) / len(xs)
+            cy = sum(ys) / len(ys)
+            self._location = LocationPoint(XYZ(cx, cy, z))
+
+    @property
+    def Number(self):
+        return self._values.get(self.Document._bip_definition(BuiltInParameter.ROOM_NUMBER))
+
+    @property
+    def Name(self):
+        return self._values.get(self.Document._bip_definition(BuiltInParameter.ROOM_NAME))
+
+    @property
+    def Level(self):
+        return self.Document.GetElement(self._level_id) if self._level_id else None
+
+    @property
+    def Area(self):
+        pts = self._boundary
+        return abs(sum(pts[i].X * pts[i - 1].Y - pts[i - 1].X * pts[i].Y for i in range(len(pts)))) / 2.0
+
+    @property
+    def UnboundedHeight(self):
+        return self._height
+
+    def GetBoundarySegments(self, options):
+        self.Document.calls["GetBoundarySegments"] += 1
+        pts = self._boundary
+        loop = _List()
+        for i in range(len(pts)):
+            loop.Add(BoundarySegment(Line(pts[i], pts[(i + 1) % len(pts)])))
+        return _List([loop])
+
+    def _contains(self, point):
+        if self._bbox is None:
+            return False
+        lo, hi = self._bbox
+        if not (lo.Z - 1e-9 <= point.Z <= hi.Z + 1e-9):
+            return False
+        return _point_in_polygon(point.X, point.Y, self._boundary)
+
+
+def _point_in_polygon(x, y, pts):
+    inside = False
+    j = len(pts) - 1
+    for i in range(len(pts)):
+        xi, yi = pts[i].X, pts[i].Y
+        xj, yj = pts[j].X, pts[j].Y
+        if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
+
+
+class Room(_BoundedSpatialElement):
+    _default_category = BuiltInCategory.OST_Rooms
+
+    def IsPointInRoom(self, point):
+        self.Document.calls["IsPointInRoom"] += 1
+        return self._contains(point)
+
+
+class Space(_BoundedSpatialElement):
+    """Space kent (net als in de API) alleen IsPointInSpace."""
+
+    _default_category = BuiltInCategory.OST_MEPSpaces
+
+    def IsPointInSpace(self, point):
+        self.Document.calls["IsPointInSpace"] += 1
+        return self._contains(point)
+
+
+class BoundarySegment(object):
+    def __init__(self, curve, element_id=None):
+        self._curve = curve
+        self.ElementId = element_id or ElementId.InvalidElementId
+
+    def GetCurve(self):
+        return self._curve
+
+
+class SpatialElementBoundaryOptions(object):
+    def __init__(self):
+        self.SpatialElementBoundaryLocation = None
+        self.StoreFreeBoundaryFaces = False
+
+
+class SpatialElementBoundaryLocation(object):
+    Finish = "Finish"
+    Center = "Center"
+    CoreBoundary = "CoreBoundary"
+    CoreCenter = "CoreCenter"
+
+
+class RevitLinkType(ElementType):
+    _default_category = BuiltInCategory.OST_RvtLinks
+
+
+class RevitLinkInstance(Instance):
+    _default_category = BuiltInCategory.OST_RvtLinks
+
+    def __init__(self, doc, link_doc, name="", transform=None, type_id=None):
+        Instance.__init__(self, doc, name)
+        self._link_doc = link_doc
+        self._transform = transform or Transform()
+        self._type_id = type_id
+
+    def GetLinkDocument(self):
+        self.Document.calls["GetLinkDocument"] += 1
+        return self._link_doc
+
+
+# ------------------------------
+# Filters
+# ------------------------------
+class ElementFilter(object):
+    Inverted = False
+
+    def PassesFilter(self, *args):
+        elem = args[-1]
+        if isinstance(elem, ElementId):
+            elem = args[0].GetElement(elem)
+        return self._passes(elem) != self.Inverted
+
+    def _passes(self, elem):
+        raise NotImplementedError
+
+
+class ElementQuickFilter(ElementFilter):
+    pass
+
+
+class ElementSlowFilter(ElementFilter):
+    pass
+
+
+class ElementClassFilter(ElementQuickFilter):
+    def __init__(self, cls, inverted=False):
+        self.cls = cls
+        self.Inverted = inverted
+
+    def _passes(self, elem):
+        return isinstance(elem, self.cls)
+
+
+class ElementCategoryFilter(ElementQuickFilter):
+    def __init__(self, category, inverted=False):
+        self.category_id = category if isinstance(category, ElementId) else ElementId(int(category))
+        self.Inverted = inverted
+
+    def _passes(self, elem):
+        return elem._category is not None and ElementId(int(elem._category)) == self.category_id
+
+
+class ElementMulticategoryFilter(ElementQuickFilter):
+    def __init__(self, categories, inverted=False):
+        self.category_ids = set(ElementId(int(c)) if not isinstance(c, ElementId) else c for c in categories)
+        self.Inverted = inverted
+
+    def _passes(self, elem):
+        return elem._category is not None and ElementId(int(elem._category)) in self.category_ids
+
+
+class ElementIsElementTypeFilter(ElementQuickFilter):
+    def __init__(self, inverted=False):
+        self.Inverted = inverted
+
+    def _passes(self, elem):
+        return isinstance(elem, ElementType)
+
+
+class LogicalAndFilter(ElementFilter):
+    def __init__(self, *filters):
+        if len(filters) == 1:
+            filters = tuple(filters[0])
+        self.filters = filters
+
+    def _passes(self, elem):
+        return all(f._passes(elem) != f.Inverted for f in self.filters)
+
+
+class LogicalOrFilter(ElementFilter):
+    def __init__(self, *filters):
+        if len(filters) == 1:
+            filters = tuple(filters[0])
+        self.filters = filters
+
+    def _passes(self, elem):
+        return any(f._passes(elem) != f.Inverted for f in self.filters)
+
+
+class ParameterValueProvider(object):
+    def __init__(self, parameter_id):
+        self.Parameter = parameter_id
+
+    def _definition(self, doc):
+        value = self.Parameter.IntegerValue
+        definition = doc._definitions_by_bip.get(value)
+        if definition is None:
+            definition = doc._definitions_by_id.get(value)
+        return definition
+
+
+class FilterStringRuleEvaluator(object):
+    def _evaluate(self, value, rule_value, case_sensitive):
+        raise NotImplementedError
+
+
+def _string_evaluator(name, func):
+    def _evaluate(self, value, rule_value, case_sensitive):
+        if not case_sensitive:
+            value, rule_value = value.lower(), rule_value.lower()
+        return func(value, rule_value)
+    return type(name, (FilterStringRuleEvaluator,), {"_evaluate": _evaluate})
+
+
+FilterStringEquals = _string_evaluator("FilterStringEquals", lambda v, r: v == r)
+FilterStringContains = _string_evaluator("FilterStringContains", lambda v, r: r in v)
+FilterStringBeginsWith = _string_evaluator("FilterStringBeginsWith", lambda v, r: v.startswith(r))
+FilterStringEndsWith = _string_evaluator("FilterStringEndsWith", lambda v, r: v.endswith(r))
+FilterStringGreater = _string_evaluator("FilterStringGreater", lambda v, r: v > r)
+FilterStringLess = _string_evaluator("FilterStringLess", lambda v, r: v < r)
+
+
+class FilterNumericRuleEvaluator(object):
+    pass
+
+
+def _numeric_evaluator(name, func):
+    return type(name, (FilterNumericRuleEvaluator,), {"_evaluate": lambda self, v, r, eps: func(v, r, eps)})
+
+
+FilterNumericEquals = _numeric_evaluator("FilterNumericEquals", lambda v, r, e: abs(v - r) <= e)
+FilterNumericGreater = _numeric_evaluator("FilterNumericGreater", lambda v, r, e: v > r + e)
+FilterNumericGreaterOrEqual = _numeric_evaluator("FilterNumericGreaterOrEqual", lambda v, r, e: v >= r - e)
+FilterNumericLess = _numeric_evaluator("FilterNumericLess", lambda v, r, e: v < r - e)
+FilterNumericLessOrEqual = _numeric_evaluator("FilterNumericLessOrEqual", lambda v, r, e: v <= r + e)
+
+
+class FilterRule(object):
+    def _matches(self, elem):
+        raise NotImplementedError
+
+
+class FilterStringRule(FilterRule):
+    def __init__(self, provider, evaluator, value, case_sensitive=True):
+        self.provider = provider
+        self.evaluator = evaluator
+        self.value = value
+        self.case_sensitive = case_sensitive
+
+    def _matches(self, elem):
+        definition = self.provider._definition(elem.Document)
+        if definition is None or definition not in elem._values:
+            return None
+        if definition.StorageType != StorageType.String:
+            return None
+        value = elem._values.get(definition) or ""
+        return self.evaluator._evaluate(value, self.value, self.case_sensitive)
+
+
+class _NumericRule(FilterRule):
+    def __init__(self, provider, evaluator, value, epsilon=1e-9):
+        self.provider = provider
+        self.evaluator = evaluator
+        self.value = value
+        self.epsilon = epsilon
+
+    def _matches(self, elem):
+        definition = self.provider._definition(elem.Document)
+        if definition is None or definition not in elem._values:
+            return None
+        value = elem._values.get(definition)
+        if value is None:
+            return False
+        if isinstance(value, ElementId):
+            value = value.IntegerValue
+        rule_value = self.value.IntegerValue if isinstance(self.value, ElementId) else self.value
+        return self.evaluator._evaluate(value, rule_value, self.epsilon)
+
+
+FilterDoubleRule = _NumericRule
+FilterIntegerRule = _NumericRule
+FilterElementIdRule = _NumericRule
+
+
+class HasValueFilterRule(FilterRule):
+    def __init__(self, parameter_id):
+        self.provider = ParameterValueProvider(parameter_id)
+
+    def _matches(self, elem):
+        definition = self.provider._definition(elem.Document)
+        if definition is None or definition not in elem._values:
+            return None
+        return elem._values.get(definition) is not None
+
+
+class HasNoValueFilterRule(HasValueFilterRule):
+    def _matches(self, elem):
+        result = HasValueFilterRule._matches(self, elem)
+        return None if result is None else not result
+
+
+class FilterInverseRule(FilterRule):
+    def __init__(self, rule):
+        self.rule = rule
+
+    def _matches(self, elem):
+        result = self.rule._matches(elem)
+        return None if result is None else not result
+
+
+class ElementParameterFilter(ElementSlowFilter):
+    """
+    Net als in Revit passeren elementen zonder de parameter nooit, ook niet
+    als het filter geinverteerd is.
+    """
+
+    def __init__(self, rules, inverted=False):
+        if isinstance(rules, FilterRule):
+            rules = [rules]
+        self.rules = list(rules)
+        self.Inverted = inverted
+
+    def PassesFilter(self, *args):
+        elem = args[-1]
+        if isinstance(elem, ElementId):
+            elem = args[0].GetElement(elem)
+        results = [rule._matches(elem) for rule in self.rules]
+        if any(r is None for r in results):
+            return False
+        return all(results) != self.Inverted
+
+    def _passes(self, elem):
+        results = [rule._matches(elem) for rule in self.rules]
+        if any(r is None for r in results):
+            return None
+        return all(results)
+
+
+class ParameterFilterRuleFactory(object):
+    @staticmethod
+    def CreateEqualsRule(parameter_id, value, *args):
+        provider = ParameterValueProvider(parameter_id)
+        if isinstance(value, str):
+            return FilterStringRule(provider, FilterStringEquals(), value)
+        return _NumericRule(provider, FilterNumericEquals(), value, args[0] if args else 1e-9)
+
+    @staticmethod
+    def CreateNotEqualsRule(parameter_id, value, *args):
+        return FilterInverseRule(ParameterFilterRuleFactory.CreateEqualsRule(parameter_id, value, *args))
+
+    @staticmethod
+    def CreateContainsRule(parameter_id, value, *args):
+        return FilterStringRule(ParameterValueProvider(parameter_id), FilterStringContains(), value)
+
+    @staticmethod
+    def CreateNotContainsRule(parameter_id, value, *args):
+        return FilterInverseRule(ParameterFilterRuleFactory.CreateContainsRule(parameter_id, value))
+
+    @staticmethod
+    def CreateBeginsWithRule(parameter_id, value, *args):
+        return FilterStringRule(ParameterValueProvider(parameter_id), FilterStringBeginsWith(), value)
+
+    @staticmethod
+    def CreateEndsWithRule(parameter_id, value, *args):
+        return FilterStringRule(ParameterValueProvider(parameter_id), FilterStringEndsWith(), value)
+
+    @staticmethod
+    def CreateHasValueParameterRule(parameter_id):
+        return HasValueFilterRule(parameter_id)
+
+    @staticmethod
+    def CreateHasNoValueParameterRule(parameter_id):
+        return HasNoValueFilterRule(parameter_id)
+
+
+class BoundingBoxIntersectsFilter(ElementQuickFilter):
+    def __init__(self, outline, inverted=False):
+        self.outline = outline
+        self.Inverted = inverted
+
+    def _passes(self, elem):
+        if elem._bbox is None:
+            return False
+        return self.outline.Intersects(Outline(*elem._bbox), 0.0)
+
+
+class BoundingBoxIsInsideFilter(BoundingBoxIntersectsFilter):
+    def _passes(self, elem):
+        if elem._bbox is None:
+            return False
+        lo, hi = elem._bbox
+        return self.outline.Contains(lo, 0.0) and self.outline.Contains(hi, 0.0)
+
+
+class ElementIdSetFilter(ElementQuickFilter):
+    def __init__(self, ids, inverted=False):
+        self.ids = set(ids)
+        self.Inverted = inverted
+
+    def _passes(self, elem):
+        return elem.Id in self.ids
+
+
+ExclusionFilter = lambda ids: ElementIdSetFilter(ids, True)
+
+
+# ------------------------------
+# Collector
+# ------------------------------
+class FilteredElementCollector(object):
+    """
+    `FilteredElementCollector(doc)`, `(doc, view_id)` of `(doc, ICollection[ElementId])`.
+
+    Filters worden pas bij iteratie toegepast. `doc.calls["collector.visited"]`
+    telt hoeveel elementen een collector moest bekijken: zo zijn herhaalde
+    volledige scans in benchmarks direct zichtbaar.
+    """
+
+    def __init__(self, doc, scope=None):
+        doc.calls["FilteredElementCollector"] += 1
+        self._doc = doc
+        self._classes = None
+        self._category = None
+        self._filters = []
+        self._scope_ids = None
+        if isinstance(scope, ElementId):
+            view = doc.GetElement(scope)
+            if not isinstance(view, View):
+                raise errors.ArgumentException("viewId is not a view")
+            self._scope_ids = doc._ids_in_view(view)
+        elif scope is not None:
+            ids = list(scope)
+            if not ids:
+                raise errors.ArgumentException("The input element id set is empty.")
+            self._scope_ids = ids
+
+    # ---------- Filters ----------
+    def OfClass(self, cls):
+        self._classes = cls
+        return self
+
+    def OfCategory(self, bic):
+        self._category = int(bic)
+        return self
+
+    def OfCategoryId(self, category_id):
+        self._category = category_id.IntegerValue
+        return self
+
+    def WhereElementIsNotElementType(self):
+        self._filters.append(ElementIsElementTypeFilter(True))
+        return self
+
+    def WhereElementIsElementType(self):
+        self._filters.append(ElementIsElementTypeFilter())
+        return self
+
+    def WhereElementIsViewIndependent(self):
+        self._filters.append(_Predicate(lambda e: e._owner_view_id is None))
+        return self
+
+    def WherePasses(self, element_filter):
+        self._filters.append(element_filter)
+        return self
+
+    def Excluding(self, ids):
+        self._filters.append(ElementIdSetFilter(ids, True))
+        return self
+
+    def IntersectWith(self, other):
+        ids = set(other.ToElementIds())
+        self._filters.append(ElementIdSetFilter(ids))
+        return self
+
+    # ---------- Uitvoer ----------
+    def _candidates(self):
+        doc = self._doc
+        if self._scope_ids is not None:
+            pool = [doc._elements.get(i) for i in self._scope_ids]
+            pool = [e for e in pool if e is not None]
+            if self._classes is not None:
+                pool = [e for e in pool if isinstance(e, self._classes)]
+            if self._category is not None:
+                pool = [e for e in pool if e._category is not None and int(e._category) == self._category]
+            return pool
+        if self._category is not None:
+            pool = [doc._elements[i] for i in doc._by_category.get(self._category, ())]
+            if self._classes is not None:
+                pool = [e for e in pool if isinstance(e, self._classes)]
+            return pool
+        if self._classes is not None:
+            return list(doc._iter_class(self._classes))
+        return list(doc._elements.values())
+
+    def _iter(self):
+        pool = self._candidates()
+        self._doc.calls["collector.visited"] += len(pool)
+        filters = self._filters
+        for elem in pool:
+            if all(f.PassesFilter(elem) for f in filters):
+                yield elem
+
+    def __iter__(self):
+        return self._iter()
+
+    def ToElements(self):
+        return _List(self._iter())
+
+    def ToElementIds(self):
+        return _List(e.Id for e in self._iter())
+
+    def GetElementCount(self):
+        return sum(1 for _ in self._iter())
+
+    def GetElementIterator(self):
+        return self._iter()
+
+    def FirstElement(self):
+        return next(self._iter(), None)
+
+    def FirstElementId(self):
+        elem = self.FirstElement()
+        return elem.Id if elem is not None else ElementId.InvalidElementId
+
+    def Any(self):
+        return self.FirstElement() is not None
+
+
+class _Predicate(ElementFilter):
+    def __init__(self, func):
+        self.func = func
+
+    def _passes(self, elem):
+        return self.func(elem)
+
+
+# ------------------------------
+# Transacties
+# ------------------------------
+class FailureHandlingOptions(object):
+    def __init__(self):
+        self.preprocessor = None
+        self.clear_after_rollback = False
+
+    def SetFailuresPreprocessor(self, preprocessor):
+        self.preprocessor = preprocessor
+        return self
+
+    def SetClearAfterRollback(self, value):
+        self.clear_after_rollback = value
+        return self
+
+    def SetForcedModalHandling(self, value):
+        return self
+
+
+class IFailuresPreprocessor(object):
+    def PreprocessFailures(self, failures_accessor):
+        return FailureProcessingResult.Continue
+
+
+class Transaction(object):
+    def __init__(self, doc, name="Transaction"):
+        self._doc = doc
+        self._name = name
+        self._status = TransactionStatus.Uninitialized
+        self._options = FailureHandlingOptions()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._status == TransactionStatus.Started:
+            self.RollBack()
+        return False
+
+    def Dispose(self):
+        if self._status == TransactionStatus.Started:
+            self.RollBack()
+
+    def GetName(self):
+        return self._name
+
+    def SetName(self, name):
+        self._name = name
+
+    def GetFailureHandlingOptions(self):
+        return self._options
+
+    def SetFailureHandlingOptions(self, options):
+        self._options = options
+
+    def Start(self, name=None):
+        if name:
+            self._name = name
+        if self._doc._tx is not None:
+            raise errors.InvalidOperationException("A transaction is already active.")
+        self._doc.calls["Transaction.Start"] += 1
+        self._doc._begin(self)
+        self._status = TransactionStatus.Started
+        return self._status
+
+    def Commit(self):
+        if self._status != TransactionStatus.Started:
+            raise errors.InvalidOperationException("The transaction has not been started.")
+        self._doc._commit(self)
+        self._status = TransactionStatus.Committed
+        return self._status
+
+    def RollBack(self):
+        if self._status != TransactionStatus.Started:
+            raise errors.InvalidOperationException("The transaction has not been started.")
+        self._doc._rollback(self)
+        self._status = TransactionStatus.RolledBack
+        return self._status
+
+    def HasStarted(self):
+        return self._status == TransactionStatus.Started
+
+    def HasEnded(self):
+        return self._status in (TransactionStatus.Committed, TransactionStatus.RolledBack)
+
+    def GetStatus(self):
+        return self._status
+
+
+class SubTransaction(object):
+    def __init__(self, doc):
+        self._doc = doc
+        self._mark = None
+
+    def Start(self):
+        self._doc._require_transaction("SubTransaction.Start")
+        self._mark = len(self._doc._undo)
+        return TransactionStatus.Started
+
+    def Commit(self):
+        self._mark = None
+        return TransactionStatus.Committed
+
+    def RollBack(self):
+        self._doc._undo_to(self._mark)
+        self._mark = None
+        return TransactionStatus.RolledBack
+
+
+class TransactionGroup(object):
+    def __init__(self, doc, name="TransactionGroup"):
+        self._doc = doc
+        self._name = name
+        self._status = TransactionStatus.Uninitialized
+        self._undo = []
+        self._changes = (set(), set(), set())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._status == TransactionStatus.Started:
+            self.RollBack()
+        return False
+
+    def Start(self, name=None):
+        if self._doc._group is not None or self._doc._tx is not None:
+            raise errors.InvalidOperationException("A transaction or group is already active.")
+        self._doc.calls["TransactionGroup.Start"] += 1
+        self._doc._group = self
+        self._status = TransactionStatus.Started
+        return self._status
+
+    def Assimilate(self):
+        return self.Commit()
+
+    def Commit(self):
+        if self._status != TransactionStatus.Started:
+            raise errors.InvalidOperationException("The group has not been started.")
+        self._doc._group = None
+        self._status = TransactionStatus.Committed
+        return self._status
+
+    def RollBack(self):
+        if self._status != TransactionStatus.Started:
+            raise errors.InvalidOperationException("The group has not been started.")
+        doc = self._doc
+        if doc._tx is not None:
+            raise errors.InvalidOperationException("Cannot roll back a group with an open transaction.")
+        for undo in reversed(self._undo):
+            undo()
+        added, deleted, modified = self._changes
+        doc._group = None
+        self._status = TransactionStatus.RolledBack
+        doc._fire_changed(deleted, added, modified - added - deleted, [self._name])
+        return self._status
+
+    def HasStarted(self):
+        return self._status == TransactionStatus.Started
+
+    def HasEnded(self):
+        return self._status in (TransactionStatus.Committed, TransactionStatus.RolledBack)
+
+    def GetStatus(self):
+        return self._status
+
+
+# ------------------------------
+# Document en events
+# ------------------------------
+class _Event(object):
+    """`app.DocumentChanged += handler` / `-= handler`, zoals een .NET event."""
+
+    def __init__(self):
+        self._handlers = []
+
+    def __iadd__(self, handler):
+        self._handlers.append(handler)
+        return self
+
+    def __isub__(self, handler):
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+        return self
+
+    def __len__(self):
+        return len(self._handlers)
+
+    def fire(self, sender, args):
+        for handler in list(self._handlers):
+            handler(sender, args)
+
+
+class DocumentChangedEventArgs(object):
+    def __init__(self, doc, added, deleted, modified, names):
+        self._doc = doc
+        self._added = _List(added)
+        self._deleted = _List(deleted)
+        self._modified = _List(modified)
+        self._names = _List(names)
+
+    def GetDocument(self):
+        return self._doc
+
+    def GetAddedElementIds(self, *args):
+        return self._added
+
+    def GetDeletedElementIds(self):
+        return self._deleted
+
+    def GetModifiedElementIds(self, *args):
+        return self._modified
+
+    def GetTransactionNames(self):
+        return self._names
+
+
+class _DocumentEventArgs(object):
+    def __init__(self, doc):
+        self.Document = doc
+        self.Cancellable = False
+
+
+class Application(object):
+    def __init__(self, version="2025"):
+        self.VersionNumber = version
+        self.VersionName = "Autodesk Revit {0}".format(version)
+        self.Username = "tester"
+        self.Documents = _List()
+        self.DocumentChanged = _Event()
+        self.DocumentClosing = _Event()
+        self.DocumentClosed = _Event()
+        self.DocumentOpened = _Event()
+        self.DocumentSaved = _Event()
+        self.DocumentSynchronizedWithCentral = _Event()
+        self.DocumentReloadedLatest = _Event()
+        self.LinkedResourceOpened = _Event()
+
+
+_default_app = []
+
+
+def default_application():
+    """
+    Gedeelde `Application`, net als de ene Revit-sessie: modules die zich
+    eenmalig op `DocumentChanged` abonneren zien zo alle documenten.
+    """
+    if not _default_app:
+        _default_app.append(Application())
+    return _default_app[0]
+
+
+class DocumentVersion(object):
+    """Versie van een document; elke keer opslaan geeft een nieuwe VersionGUID."""
+
+    _guids = itertools.count(1)
+
+    def __init__(self, saves=0):
+        self.VersionGUID = "version-{0}".format(next(DocumentVersion._guids))
+        self.NumberOfSaves = saves
+
+    def IsEqual(self, other):
+        return other is not None and self.VersionGUID == other.VersionGUID
+
+
+class BasicFileInfo(object):
+    """
+    Bestandsinfo zonder het model te openen. De versie op schijf is die van
+    het geopende document met dat pad, tenzij `saved_elsewhere` (bijvoorbeeld
+    opgeslagen door een collega) een nieuwere versie voor het pad geeft.
+    """
+
+    saved_elsewhere = {}
+
+    def __init__(self, version):
+        self._version = version
+
+    @staticmethod
+    def Extract(path):
+        version = BasicFileInfo.saved_elsewhere.get(path)
+        if version is None:
+            for doc in default_application().Documents:
+                if doc.PathName == path:
+                    version = doc._version
+                    break
+        return BasicFileInfo(version)
+
+    def GetDocumentVersion(self):
+        return self._version
+
+
+class Document(object):
+    """Synthetisch Revit-document."""
+
+    _ids = itertools.count(1000)
+
+    def __init__(self, title="Model", application=None, path_name=None, is_linked=False):
+        self.Title = title
+        self.PathName = path_name if path_name is not None else "C:\\Projects\\{0}.rvt".format(title)
+        self.IsLinked = is_linked
+        self.IsWorkshared = False
+        self.IsFamilyDocument = False
+        self.IsModifiable = False
+        self.Application = application or default_application()
+        self.Application.Documents.Add(self)
+        self.ActiveView = None
+        self.calls = collections.Counter()
+        self._elements = {}
+        self._by_class = {}
+        self._by_category = {}
+        self._view_names = {}
+        self._owned = {}
+        self._dependents = {}
+        self._categories = {}
+        self._definitions_by_name = {}
+        self._definitions_by_bip = {}
+        self._definitions_by_guid = {}
+        self._definitions_by_id = {}
+        self._tx = None
+        self._group = None
+        self._undo = []
+        self._changes = None
+        self._closed = False
+        self._version = DocumentVersion()
+
+    def __repr__(self):
+        return "<Document {0!r}>".format(self.Title)
+
+    def GetHashCode(self):
+        return id(self) & 0x7fffffff
+
+    def Equals(self, other):
+        return self is other
+
+    @staticmethod
+    def GetDocumentVersion(doc):
+        return doc._version
+
+    def GetUnits(self):
+        return Units()
+
+    # ---------- Definities ----------
+    def define_parameter(self, name, storage_type, bip=None, guid=None, read_only=False):
+        """Registreer (idempotent) een parameter-definitie in dit document."""
+        if bip is not None:
+            existing = self._definitions_by_bip.get(int(bip))
+        elif guid is not None:
+            existing = self._definitions_by_guid.get(guid)
+        else:
+            existing = self._definitions_by_name.get(name)
+        if existing is not None:
+            return existing
+        def_id = int(bip) if bip is not None else next(Document._ids)
+        definition = Definition(name, storage_type, bip, guid, read_only, ElementId(def_id))
+        self._definitions_by_name.setdefault(name, definition)
+        self._definitions_by_id[def_id] = definition
+        if bip is not None:
+            self._definitions_by_bip[int(bip)] = definition
+        if guid is not None:
+            self._definitions_by_guid[guid] = definition
+        return definition
+
+    def _bip_definition(self, bip, name=None, storage_type=None):
+        definition = self._definitions_by_bip.get(int(bip))
+        if definition is None:
+            definition = self.define_parameter(name or str(bip), storage_type or StorageType.String, bip=bip)
+        return definition
+
+    def _category(self, bic):
+        category = self._categories.get(int(bic))
+        if category is None:
+            category = self._categories[int(bic)] = Category(bic)
+        return category
+
+    # ---------- Elementen ----------
+    def add(self, elem, owner_view_id=None):
+        """Voeg een element toe zonder transactie (alleen voor modelgeneratoren)."""
+        elem.Id = ElementId(next(Document._ids))
+        if owner_view_id is not None:
+            elem._owner_view_id = owner_view_id
+        self._index(elem)
+        return elem
+
+    def _create(self, elem):
+        self.add(elem)
+        self._touch_added(elem)
+        return elem
+
+    def _index(self, elem):
+        self._elements[elem.Id] = elem
+        if isinstance(elem, View):
+            self._view_names[elem.Name] = self._view_names.get(elem.Name, 0) + 1
+        self._by_class.setdefault(type(elem), {})[elem.Id] = None
+        if elem._category is not None:
+            self._by_category.setdefault(int(elem._category), {})[elem.Id] = None
+        if elem._owner_view_id is not None:
+            self._owned.setdefault(elem._owner_view_id, {})[elem.Id] = None
+
+    def _unindex(self, elem):
+        if self._elements.pop(elem.Id, None) is not None and isinstance(elem, View):
+            count = self._view_names.get(elem.Name, 0) - 1
+            if count > 0:
+                self._view_names[elem.Name] = count
+            else:
+                self._view_names.pop(elem.Name, None)
+        self._by_class.get(type(elem), {}).pop(elem.Id, None)
+        if elem._category is not None:
+            self._by_category.get(int(elem._category), {}).pop(elem.Id, None)
+        if elem._owner_view_id is not None:
+            self._owned.get(elem._owner_view_id, {}).pop(elem.Id, None)
+
+    def _iter_class(self, cls):
+        for klass, ids in list(self._by_class.items()):
+            if issubclass(klass, cls):
+                for i in ids:
+                    yield self._elements[i]
+
+    def _ids_in_view(self, view):
+        ids = list(view._visible_ids)
+        ids.extend(self._owned.get(view.Id, ()))
+        return ids
+
+    def GetElement(self, key):
+        self.calls["GetElement"] += 1
+        if isinstance(key, Reference):
+            key = key.ElementId
+        elif isinstance(key, str):
+            for elem in self._elements.values():
+                if elem.UniqueId == key:
+                    return elem
+            return None
+        return self._elements.get(key)
+
+    def Delete(self, ids):
+        self._require_transaction("Document.Delete")
+        self.calls["Delete"] += 1
+        self.calls["Regenerate"] += 1
+        if isinstance(ids, ElementId):
+            ids = [ids]
+        deleted = _List()
+        for eid in list(ids):
+            elem = self._elements.get(eid)
+            if elem is None:
+                raise errors.ArgumentException("The element {0} does not exist.".format(eid))
+            cascade = [elem] + [self._elements[i] for i in list(self._owned.get(eid, ()))]
+            for item in cascade:
+                if item.Id not in self._elements:
+                    continue
+                self._unindex(item)
+                self._record(lambda item=item: self._index(item))
+                self._changes[1].add(item.Id)
+                deleted.Add(item.Id)
+        return deleted
+
+    def Regenerate(self):
+        self.calls["Regenerate"] += 1
+
+    def Close(self, save_modified=False):
+        self.Application.DocumentClosing.fire(self.Application, _DocumentEventArgs(self))
+        if self in self.Application.Documents:
+            self.Application.Documents.remove(self)
+        self._closed = True
+        return True
+
+    def SynchronizeWithCentral(self, *args):
+        self.Application.DocumentSynchronizedWithCentral.fire(self.Application, _DocumentEventArgs(self))
+
+    # ---------- Transactie-intern ----------
+    def _require_transaction(self, what):
+        if self._tx is None and self._changes is None:
+            raise errors.ModificationOutsideTransactionException(
+                "Attempt to modify the model outside of transaction ({0}).".format(what))
+
+    def _begin(self, tx):
+        self._tx = tx
+        self._undo = []
+        self._changes = (set(), set(), set())
+        self.IsModifiable = True
+
+    def _record(self, undo):
+        if self._changes is not None:
+            self._undo.append(undo)
+
+    def _touch(self, elem, undo):
+        if self._changes is None:
+            return
+        self._undo.append(undo)
+        self._changes[2].add(elem.Id)
+
+    def _touch_added(self, elem):
+        if self._changes is None:
+            return
+        self._undo.append(lambda: self._unindex(elem))
+        self._changes[0].add(elem.Id)
+
+    def _undo_to(self, mark):
+        while len(self._undo) > mark:
+            self._undo.pop()()
+
+    def _commit(self, tx):
+        added, deleted, modified = self._changes
+        undo = self._undo
+        self._tx = None
+        self._changes = None
+        self._undo = []
+        self.IsModifiable = False
+        self.calls["Transaction.Commit"] += 1
+        self.calls["Regenerate"] += 1
+        if self._group is not None:
+            self._group._undo.extend(undo)
+            for mine, theirs in zip(self._group._changes, (added, deleted, modified)):
+                mine.update(theirs)
+        self._fire_changed(added - deleted, deleted - added, modified - added - deleted, [tx.GetName()])
+
+    def _rollback(self, tx):
+        for undo in reversed(self._undo):
+            undo()
+        self._tx = None
+        self._changes = None
+        self._undo = []
+        self.IsModifiable = False
+        self.calls["Transaction.RollBack"] += 1
+
+    def _fire_changed(self, added, deleted, modified, names):
+        if not (added or deleted or modified):
+            return
+        args = DocumentChangedEventArgs(self, added, deleted, modified, names)
+        self.Application.DocumentChanged.fire(self.Application, args)
+
+
+class ElementTransformUtils(object):
+    @staticmethod
+    def MoveElement(doc, element_id, vector):
+        doc._require_transaction("MoveElement")
+        doc.calls["MoveElement"] += 1
+        elem = doc.GetElement(element_id)
+        if elem is not None and elem._location is not None:
+            elem._location.Move(vector)
+        if elem is not None:
+            doc._touch(elem, lambda: None)
+
+    @staticmethod
+    def MoveElements(doc, element_ids, vector):
+        for eid in element_ids:
+            ElementTransformUtils.MoveElement(doc, eid, vector)
+
+
+class StartingViewSettings(Element):
+    @staticmethod
+    def GetStartingViewSettings(doc):
+        settings = StartingViewSettings(doc)
+        settings.ViewId = doc.ActiveView.Id if doc.ActiveView is not None else ElementId.InvalidElementId
+        return settings
+
+
+class UnitUtils(object):
+    @staticmethod
+    def ConvertToInternalUnits(value, unit):
+        return value / _UNIT_FACTORS.get(unit, 1.0)
+
+    @staticmethod
+    def ConvertFromInternalUnits(value, unit):
+        return value * _UNIT_FACTORS.get(unit, 1.0)
+
+
+class UnitTypeId(object):
+    Millimeters = "autodesk.unit.unit:millimeters-1.0.1"
+    Centimeters = "autodesk.unit.unit:centimeters-1.0.1"
+    Meters = "autodesk.unit.unit:meters-1.0.0"
+    Feet = "autodesk.unit.unit:feet-1.0.1"
+    SquareMeters = "autodesk.unit.unit:squareMeters-1.0.1"
+    CubicMeters = "autodesk.unit.unit:cubicMeters-1.0.1"
+    Degrees = "autodesk.unit.unit:degrees-1.0.1"
+
+
+class SpecTypeId(object):
+    Empty = ""
+    Length = "autodesk.spec.aec:length-2.0.0"
+
+
+class Units(object):
+    """Projecteenheden: lengtes in mm, net als in `Parameter.AsValueString`."""
+
+
+class UnitFormatUtils(object):
+    @staticmethod
+    def TryParse(units, spec, text):
+        # IronPython geeft de out-parameter terug als tweede waarde.
+        try:
+            value = float(text.strip().replace("mm", ""))
+        except ValueError:
+            return False, 0.0
+        return True, value / 304.8 if spec == SpecTypeId.Length else value
+
+
+_UNIT_FACTORS = {
+    UnitTypeId.Millimeters: 304.8,
+    UnitTypeId.Centimeters: 30.48,
+    UnitTypeId.Meters: 0.3048,
+    UnitTypeId.Feet: 1.0,
+    UnitTypeId.SquareMeters: 0.3048 ** 2,
+    UnitTypeId.CubicMeters: 0.3048 ** 3,
+    UnitTypeId.Degrees: 180.0 / math.pi,
+}
+
+
+__all__ = [n for n, v in list(globals().items())
+           if not n.startswith("_") and not isinstance(v, types.ModuleType)]
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""`Autodesk.Revit.Exceptions` voor de fake Revit API."""
+
+
+class ApplicationException(Exception):
+    pass
+
+
+class ArgumentException(ApplicationException):
+    pass
+
+
+class ArgumentNullException(ArgumentException):
+    pass
+
+
+class ArgumentOutOfRangeException(ArgumentException):
+    pass
+
+
+class ArgumentsInconsistentException(ArgumentException):
+    pass
+
+
+class InvalidOperationException(ApplicationException):
+    pass
+
+
+class ModificationOutsideTransactionException(InvalidOperationException):
+    pass
+
+
+class InvalidObjectException(InvalidOperationException):
+    pass
+
+
+class OperationCanceledException(ApplicationException):
+    pass
@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""
+Synthetische modellen voor tests en benchmarks.
+
+Elke generator is deterministisch (vaste `seed`) en bouwt het document zonder
+transacties, zodat `doc.calls` na het genereren leeg is en alleen het werk
+van het geteste script meet. Typische groottes: 1k tot 1M elementen.
+"""
+
+import collections
+import math
+import random
+
+from . import db
+
+BIC = db.BuiltInCategory
+BIP = db.BuiltInParameter
+ST = db.StorageType
+
+# Categorieën waarover generieke modelelementen verdeeld worden.
+MODEL_CATEGORIES = (
+    BIC.OST_GenericModel, BIC.OST_MechanicalEquipment, BIC.OST_DuctAccessory,
+    BIC.OST_PipeAccessory, BIC.OST_Doors, BIC.OST_Windows, BIC.OST_Furniture,
+    BIC.OST_ElectricalFixtures,
+)
+
+# Gedeelde parameters zoals in config.json van de CopyParameter-knoppen.
+CT_PARAMETERS = (
+    "CT_compartment01", "CT_compartment01_size", "CT_compartment02", "CT_compartment02_size",
+    "CT_compartment03", "CT_compartment03_size", "CT_compartment04", "CT_compartment04_size",
+    "CT_compartment05", "CT_compartment05_size", "NLRS_C_uitvoering_code (key)",
+    "Service Type (key)", "scheidingsschot",
+)
+
+LinkedModel = collections.namedtuple("LinkedModel", "doc link_doc link_instance rooms levels")
+LinkedElementsModel = collections.namedtuple("LinkedElementsModel", "doc link_doc link_instance sources targets expected")
+SheetModel = collections.namedtuple("SheetModel", "doc sheets views schedules revisions")
+
+
+# ------------------------------
+# Basis
+# ------------------------------
+def define_standard_parameters(doc):
+    """Mark, Comments, view/room-parameters en de CT_-parameters."""
+    doc.define_parameter("Mark", ST.String, bip=BIP.ALL_MODEL_MARK)
+    doc.define_parameter("Comments", ST.String, bip=BIP.ALL_MODEL_INSTANCE_COMMENTS)
+    doc.define_parameter("Type Mark", ST.String, bip=BIP.ALL_MODEL_TYPE_MARK)
+    doc.define_parameter("Description", ST.String, bip=BIP.ALL_MODEL_DESCRIPTION)
+    doc.define_parameter("Family and Type", ST.ElementId, bip=BIP.ELEM_FAMILY_AND_TYPE_PARAM, read_only=True)
+    doc.define_parameter("Type", ST.ElementId, bip=BIP.ELEM_TYPE_PARAM, read_only=True)
+    doc.define_parameter("View Name", ST.String, bip=BIP.VIEW_NAME)
+    doc.define_parameter("Far Clip Offset", ST.Double, bip=BIP.VIEWER_BOUND_OFFSET_FAR)
+    doc.define_parameter("Number", ST.String, bip=BIP.ROOM_NUMBER)
+    doc.define_parameter("Name", ST.String, bip=BIP.ROOM_NAME)
+    doc.define_parameter("Offset", ST.Double)
+    doc.define_parameter("Count", ST.Integer)
+    for i, name in enumerate(CT_PARAMETERS):
+        doc.define_parameter(name, ST.String, guid="5c1e0000-0000-0000-0000-{0:012d}".format(i))
+
+
+def empty_document(title="Model", levels=3, level_height=3.0, application=None):
+    """Document met levels, de standaard view family types, lijnstijlen en een actieve view."""
+    doc = db.Document(title, application=application)
+    define_standard_parameters(doc)
+    for i in range(levels):
+        doc.add(db.Level(doc, "{0:02d} Verdieping".format(i), i * level_height))
+    for family, name in ((db.ViewFamily.FloorPlan, "Floor Plan"),
+                         (db.ViewFamily.CeilingPlan, "Ceiling Plan"),
+                         (db.ViewFamily.Section, "Building Section"),
+                         (db.ViewFamily.ThreeDimensional, "3D View"),
+                         (db.ViewFamily.Sheet, "Sheet")):
+        doc.add(db.ViewFamilyType(doc, name, family))
+    for name in ("<Thin Lines>", "<Medium Lines>", "<Wide Lines>", "<Hidden>", "SBC_Stippel"):
+        doc.add(db.GraphicsStyle(doc, name))
+    first_level = next(doc._iter_class(db.Level), None)
+    view = db.ViewPlan(doc, "Plattegrond")
+    view.GenLevel = first_level
+    doc.add(view)
+    doc.ActiveView = view
+    return doc
+
+
+# ------------------------------
+# Generieke elementen
+# ------------------------------
+def generic_model(count, mark_ratio=0.5, types_per_category=5, in_view_ratio=0.25,
+                  extra_parameters=0, seed=0, title="Generic"):
+    """
+    `count` instanties verdeeld over `MODEL_CATEGORIES`, met Mark (deels gevuld),
+    Comments en de CT_-parameters. Een deel staat zichtbaar in de actieve view.
+    `extra_parameters` voegt per instantie zoveel (lege) parameters toe vóór de
+    rest, zoals de Phase/Workset/Offset-parameters van een echte familie.
+    """
+    rng = random.Random(seed)
+    doc = empty_document(title)
+    view = doc.ActiveView
+    mark = doc._definitions_by_bip[int(BIP.ALL_MODEL_MARK)]
+    comments = doc._definitions_by_bip[int(BIP.ALL_MODEL_INSTANCE_COMMENTS)]
+    type_mark = doc._definitions_by_bip[int(BIP.ALL_MODEL_TYPE_MARK)]
+    ct = [doc._definitions_by_name[name] for name in CT_PARAMETERS]
+    extra = [doc.define_parameter("Parameter {0:03d}".format(i + 1), ST.Double) for i in range(extra_parameters)]
+    levels = list(doc._iter_class(db.Level))
+
+    types = []
+    for bic in MODEL_CATEGORIES:
+        for t in range(types_per_category):
+            symbol = db.FamilySymbol(doc, "Type {0}".format(t + 1), bic, family_name=db._category_name(bic))
+            symbol._values[type_mark] = "T{0}".format(t + 1)
+            types.append(doc.add(symbol))
+
+    visible = view._visible_ids
+    for i in range(count):
+        symbol = types[i % len(types)]
+        elem = db.FamilyInstance(doc, symbol.Name, symbol._category)
+        elem._type_id = symbol.Id
+        elem._level_id = levels[i % len(levels)].Id
+        values = elem._values
+        for definition in extra:
+            values[definition] = 0.0
+        values[mark] = "M-{0}".format(i) if rng.random() < mark_ratio else ""
+        values[comments] = "" if i % 3 else "Opmerking {0}".format(i)
+        for definition in ct:
+            values[definition] = None
+        x, y = rng.uniform(0, 1000), rng.uniform(0, 1000)
+        z = levels[i % len(levels)].Elevation
+        elem._location = db.LocationPoint(db.XYZ(x, y, z))
+        elem._bbox = (db.XYZ(x - 0.5, y - 0.5, z), db.XYZ(x + 0.5, y + 0.5, z + 1.0))
+        doc.add(elem)
+        if rng.random() < in_view_ratio:
+            visible.add(elem.Id)
+    return doc
+
+
+def fill_parameters(elem, values):
+    """Zet parameterwaarden (op naam) zonder transactie, voor het opbouwen van fixtures."""
+    for name, value in values.items():
+        elem._values[elem.Document._definitions_by_name[name]] = value
+    return elem
+
+
+def reference(elem, linked=None):
+    """`Reference` naar `elem`; met `linked` (RevitLinkInstance) een link-reference."""
+    if linked is not None:
+        return db.Reference(linked.Id, elem.Id)
+    return db.Reference(elem.Id)
+
+
+# ------------------------------
+# Sheets, views en revisies
+# ------------------------------
+def sheet_model(sheets, views_per_sheet=3, unplaced_views=0, schedules_per_sheet=1,
+                revisions=10, revisions_per_sheet=2, clouds_per_sheet=1, seed=0, title="Sheets"):
+    """Sheets met viewports, schedules op sheet, losse views en revisies (additioneel en via clouds)."""
+    rng = random.Random(seed)
+    doc = empty_document(title)
+    level = next(doc._iter_class(db.Level))
+
+    revision_elems = []
+    for i in range(revisions):
+        revision_elems.append(doc.add(db.Revision(doc, i + 1, "Revisie {0}".format(chr(65 + i % 26)),
+                                                  date="{0:02d}.01.2026".format(i % 28 + 1))))
+
+    sheet_elems, view_elems, schedule_elems = [], [], []
+    for s in range(sheets):
+        sheet = doc.add(db.ViewSheet(doc, "A{0:03d}".format(s + 1), "Blad {0}".format(s + 1)))
+        sheet_elems.append(sheet)
+        for v in range(views_per_sheet):
+            view = db.ViewPlan(doc, "Plan {0}-{1}".format(s + 1, v + 1))
+            view.GenLevel = level
+            doc.add(view)
+            view_elems.append(view)
+            doc.add(db.Viewport(doc, sheet.Id, view.Id), owner_view_id=sheet.Id)
+        for k in range(schedules_per_sheet):
+            schedule = doc.add(db.ViewSchedule(doc, "Staat {0}-{1}".format(s + 1, k + 1)))
+            schedule_elems.append(schedule)
+            doc.add(db.ScheduleSheetInstance(doc, sheet.Id, schedule.Id), owner_view_id=sheet.Id)
+        if revision_elems:
+            chosen = rng.sample(revision_elems, min(revisions_per_sheet, len(revision_elems)))
+            sheet._revision_ids = [r.Id for r in chosen]
+            for c in range(clouds_per_sheet):
+                revision = revision_elems[rng.randrange(len(revision_elems))]
+                doc.add(db.RevisionCloud(doc, sheet.Id, revision.Id), owner_view_id=sheet.Id)
+
+    for u in range(unplaced_views):
+        view = db.ViewPlan(doc, "Los {0}".format(u + 1))
+        view.GenLevel = level
+        view_elems.append(doc.add(view))
+    return SheetModel(doc, sheet_elems, view_elems, schedule_elems, revision_elems)
+
+
+# ------------------------------
+# Gelinkt model met rooms
+# ------------------------------
+def linked_rooms_model(rooms, levels=3, room_size=(4.0, 5.0), level_height=3.0, offset=None,
+                       rotation=0.0, seed=0, title="Host", room_class=None):
+    """
+    Hostmodel met een RevitLinkInstance naar een architectenmodel met `rooms`
+    rechthoekige rooms, verdeeld over `levels` levels op een raster.
+    Met `room_class=db.Space` worden het spaces.
+    """
+    room_class = room_class or db.Room
+    rng = random.Random(seed)
+    doc = empty_document(title, levels=levels, level_height=level_height)
+    link_doc = empty_document(title + "_ARC", levels=levels, level_height=level_height,
+                              application=doc.Application)
+    link_doc.IsLinked = True
+    link_levels = list(link_doc._iter_class(db.Level))
+
+    per_level = max(1, (rooms + len(link_levels) - 1) // len(link_levels))
+    columns = max(1, int(per_level ** 0.5))
+    width, depth = room_size
+    room_elems = []
+    for i in range(rooms):
+        level = link_levels[i // per_level % len(link_levels)]
+        slot = i % per_level
+        # Rooms worden tot 1.2x zo groot: zo raken buren elkaar nooit.
+        x0 = (slot % columns) * (width * 1.2 + 0.5)
+        y0 = (slot // columns) * (depth * 1.2 + 0.5)
+        w = width * rng.uniform(0.8, 1.2)
+        d = depth * rng.uniform(0.8, 1.2)
+        boundary = [db.XYZ(x0, y0, 0), db.XYZ(x0 + w, y0, 0), db.XYZ(x0 + w, y0 + d, 0), db.XYZ(x0, y0 + d, 0)]
+        number = "{0}.{1:02d}".format(link_levels.index(level), slot + 1)
+        room = room_class(link_doc, number, "Ruimte {0}".format(i + 1), level.Id, boundary, level_height)
+        room_elems.append(link_doc.add(room))
+
+    link = add_link(doc, link_doc, link_transform(offset, rotation))
+    return LinkedModel(doc, link_doc, link, room_elems, link_levels)
+
+
+def add_room_contents(model, per_room, outside=0, seed=0):
+    """
+    `per_room` FamilyInstances (Generic Model, met Mark en Comments) per room
+    van een `linked_rooms_model`, in host-coördinaten, plus `outside`
+    elementen buiten alle rooms. Geeft {element id: room-nummer} terug.
+    """
+    rng = random.Random(seed)
+    doc = model.doc
+    transform = model.link_instance.GetTotalTransform()
+    mark = doc._definitions_by_bip[int(BIP.ALL_MODEL_MARK)]
+    comments = doc._definitions_by_bip[int(BIP.ALL_MODEL_INSTANCE_COMMENTS)]
+    symbol = doc.add(db.FamilySymbol(doc, "Kanaal", BIC.OST_GenericModel, family_name="Generic"))
+
+    def place(point):
+        elem = db.FamilyInstance(doc, symbol.Name, BIC.OST_GenericModel)
+        elem._type_id = symbol.Id
+        elem._values[mark] = ""
+        elem._values[comments] = ""
+        elem._location = db.LocationPoint(transform.OfPoint(point))
+        return doc.add(elem)
+
+    expected = {}
+    for room in model.rooms:
+        lo, hi = room._bbox
+        for _ in range(per_room):
+            point = db.XYZ(rng.uniform(lo.X + 0.1, hi.X - 0.1), rng.uniform(lo.Y + 0.1, hi.Y - 0.1),
+                           rng.uniform(lo.Z, hi.Z - 0.1))
+            expected[place(point).Id] = room.Number
+    for _ in range(outside):
+        place(db.XYZ(rng.uniform(-500.0, -100.0), rng.uniform(-500.0, -100.0), 0.5))
+    return expected
+
+
+def link_transform(offset=None, rotation=0.0):
+    """Link-transform: rotatie om Z, daarna verschuiving over `offset`."""
+    transform = db.Transform()
+    if rotation:
+        transform = db.Transform.CreateRotation(db.XYZ.BasisZ, rotation)
+    if offset is not None:
+        transform.Origin = offset
+    return transform
+
+
+def add_link(doc, link_doc, transform=None):
+    """RevitLinkType + RevitLinkInstance van `link_doc` in `doc`."""
+    link_type = doc.add(db.RevitLinkType(doc, link_doc.Title + ".rvt"))
+    link = db.RevitLinkInstance(doc, link_doc, link_doc.Title + ".rvt : 1", transform, link_type.Id)
+    link._values[doc._definitions_by_bip[int(BIP.ELEM_TYPE_PARAM)]] = link_type.Id
+    return doc.add(link)
+
+
+# ------------------------------
+# Gelinkt model met volumes
+# ------------------------------
+def linked_elements_model(targets, sources=100, cell_size=20.0, offset=None, rotation=0.0, seed=0,
+                          title="Host"):
+    """
+    Hostmodel met `targets` kleine elementen (zoals `generic_model`) en een link
+    met ongeveer `sources` aansluitende volumes (bijv. brandcompartimenten) van
+    `cell_size` feet in een raster over de levels. Elk volume heeft een eigen
+    type "Compartiment <n>"; elk hostelement ligt binnen één volume.
+    `expected` is {host element id: typenaam van het omsluitende volume}.
+    """
+    rng = random.Random(seed)
+    doc = generic_model(targets, seed=seed, title=title)
+    link_doc = empty_document(title + "_BWK", application=doc.Application)
+    link_doc.IsLinked = True
+    levels = list(link_doc._iter_class(db.Level))
+    height = levels[1].Elevation - levels[0].Elevation if len(levels) > 1 else 3.0
+    family_and_type = link_doc._definitions_by_bip[int(BIP.ELEM_FAMILY_AND_TYPE_PARAM)]
+    columns = max(1, int(math.ceil(math.sqrt(float(sources) / len(levels)))))
+
+    cells = []
+    for level in levels:
+        for row in range(columns):
+            for column in range(columns):
+                name = "Compartiment {0}".format(len(cells) + 1)
+                symbol = link_doc.add(db.FamilySymbol(link_doc, name, BIC.OST_GenericModel, family_name="Volume"))
+                elem = db.FamilyInstance(link_doc, name, BIC.OST_GenericModel)
+                elem._type_id = symbol.Id
+                elem._level_id = level.Id
+                elem._values[family_and_type] = symbol.Id
+                lo = db.XYZ(column * cell_size, row * cell_size, level.Elevation)
+                elem._bbox = (lo, lo + db.XYZ(cell_size, cell_size, height))
+                cells.append(link_doc.add(elem))
+
+    transform = link_transform(offset, rotation)
+    expected = {}
+    target_elems = list(doc._iter_class(db.FamilyInstance))
+    for elem in target_elems:
+        cell = rng.choice(cells)
+        lo, hi = cell._bbox
+        # Hostelement (1 x 1 x 1 ft) ruim binnen het volume.
+        point = db.XYZ(rng.uniform(lo.X + 1.0, hi.X - 2.0), rng.uniform(lo.Y + 1.0, hi.Y - 2.0), lo.Z + 0.5)
+        corners = [transform.OfPoint(point + db.XYZ(dx, dy, dz)) for dx in (0, 1) for dy in (0, 1) for dz in (0, 1)]
+        elem._location = db.LocationPoint(transform.OfPoint(point))
+        elem._bbox = (db.XYZ(min(p.X for p in corners), min(p.Y for p in corners), min(p.Z for p in corners)),
+                      db.XYZ(max(p.X for p in corners), max(p.Y for p in corners), max(p.Z for p in corners)))
+        expected[elem.Id] = cell.Name
+    link = add_link(doc, link_doc, transform)
+    return LinkedElementsModel(doc, link_doc, link, cells, target_elems, expected)
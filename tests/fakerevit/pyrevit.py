@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""
+Minimale `pyrevit`-stub: `revit`, `forms`, `script`, `output`, `DB` en `HOST_APP`.
+
+Dialogen geven vooraf ingestelde antwoorden terug (`forms.answers`), de
+voortgangsbalk telt updates en kan na een aantal stappen "geannuleerd" worden
+(`ProgressBar.cancel_after`).
+"""
+
+import os
+import re
+import sys
+import tempfile
+import types
+
+from . import db
+from . import system
+
+
+class _State(object):
+    doc = None
+    uidoc = None
+    bundle_dir = None
+    # Per test een eigen (tijdelijke) pyRevit app-data map.
+    appdata_dir = None
+
+
+state = _State()
+
+
+# ------------------------------
+# pyrevit.revit
+# ------------------------------
+class _RevitTransaction(object):
+    def __init__(self, name=None, doc=None, clear_after_rollback=False, show_error_dialog=True,
+                 swallow_errors=False, log_errors=True, nested=False):
+        self._tx = db.Transaction(doc or state.doc, name or "pyRevit Transaction")
+
+    def __enter__(self):
+        self._tx.Start()
+        return self._tx
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self._tx.Commit()
+        else:
+            self._tx.RollBack()
+        return False
+
+
+class _RevitModule(types.ModuleType):
+    @property
+    def doc(self):
+        return state.doc
+
+    @property
+    def uidoc(self):
+        return state.uidoc
+
+    @property
+    def active_view(self):
+        return state.doc.ActiveView if state.doc else None
+
+
+# ------------------------------
+# pyrevit.forms
+# ------------------------------
+class _Answers(object):
+    """Per dialoogsoort een wachtrij met antwoorden."""
+
+    def __init__(self):
+        self.queues = {}
+
+    def push(self, kind, *values):
+        self.queues.setdefault(kind, []).extend(values)
+
+    def pop(self, kind, default=None):
+        queue = self.queues.get(kind)
+        if queue:
+            return queue.pop(0)
+        return default
+
+    def clear(self):
+        self.queues.clear()
+
+
+answers = _Answers()
+alerts = []
+
+
+def alert(msg, title=None, sub_msg=None, expanded=None, footer="", ok=True, cancel=False, yes=False,
+          no=False, retry=False, warn_icon=True, options=None, exitscript=False):
+    alerts.append(msg)
+    if exitscript:
+        sys.exit()
+    if options:
+        return answers.pop("alert", None)
+    return answers.pop("alert", True)
+
+
+def ask_for_string(default=None, prompt=None, title=None, **kwargs):
+    return answers.pop("ask_for_string", default)
+
+
+def save_file(file_ext="", files_filter="", init_dir="", default_name="", restore_dir=True, unc_paths=False):
+    return answers.pop("save_file")
+
+
+def pick_file(file_ext="*", files_filter="", init_dir="", restore_dir=True, multi_file=False, unc_paths=False):
+    return answers.pop("pick_file")
+
+
+class SelectFromList(object):
+    @staticmethod
+    def show(context, title="Select", width=500, height=400, button_name="Select", multiselect=False, **kwargs):
+        return answers.pop("SelectFromList")
+
+
+class WarningBar(object):
+    def __init__(self, height=32, **kwargs):
+        self.title = kwargs.get("title")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class ProgressBar(object):
+    """Telt `update_progress`; na `cancel_after` updates staat `cancelled` op True."""
+
+    cancel_after = None
+    updates = 0
+
+    def __init__(self, height=32, **kwargs):
+        self.title = kwargs.get("title")
+        self.cancellable = kwargs.get("cancellable", False)
+        self.step = kwargs.get("step", kwargs.get("step_count", 0))
+        self._updates = 0
+        self.cancelled = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def update_progress(self, new_value, max_value=1):
+        self._updates += 1
+        ProgressBar.updates += 1
+        limit = ProgressBar.cancel_after
+        if self.cancellable and limit is not None and self._updates >= limit:
+            self.cancelled = True
+
+    @property
+    def is_cancelled(self):
+        return self.cancelled
+
+
+class _Control(system.Stub):
+    """WPF-control uit de XAML; events zijn echte `+=`-events."""
+
+    _EVENTS = ("Click", "Checked", "Unchecked", "TextChanged", "SelectionChanged", "Loaded",
+               "Closed", "Closing", "MouseDoubleClick", "KeyDown", "Tick")
+
+    def __getattr__(self, name):
+        if name in self._EVENTS:
+            event = db._Event()
+            self.__dict__["_attrs"][name] = event
+            return event
+        return system.Stub.__getattr__(self, name)
+
+
+_NAMED = re.compile(r"<([\w:.]+)([^>]*?)\bx:Name=\"(\w+)\"([^>]*)>", re.S)
+_ATTR = re.compile(r"(\w+)=\"([^\"]*)\"")
+
+
+def _xaml_value(value):
+    if value in ("True", "False"):
+        return value == "True"
+    return value
+
+
+class WPFWindow(object):
+    def __init__(self, xaml_source, literal_string=False, handle_esc=True, set_owner=True):
+        self.__dict__["_controls"] = {}
+        text = xaml_source
+        if not literal_string:
+            with open(xaml_source, "rb") as xaml_file:
+                text = xaml_file.read().decode("utf-8-sig")
+        for match in _NAMED.finditer(text):
+            control = _Control()
+            for key, value in _ATTR.findall(match.group(2) + match.group(4)):
+                if key != "Name":
+                    setattr(control, key, _xaml_value(value))
+            self._controls[match.group(3)] = control
+        self.closed = False
+
+    def __getattr__(self, name):
+        controls = self.__dict__.get("_controls", {})
+        if name in controls:
+            return controls[name]
+        raise AttributeError(name)
+
+    def ShowDialog(self):
+        return None
+
+    def show_dialog(self):
+        return self.ShowDialog()
+
+    def Show(self):
+        return None
+
+    def show(self, modal=False):
+        return None
+
+    def Close(self):
+        self.closed = True
+
+
+# ------------------------------
+# pyrevit.script / pyrevit.output
+# ------------------------------
+class _Output(object):
+    def __init__(self):
+        self.lines = []
+
+    def print_md(self, text):
+        self.lines.append(text)
+
+    def print_html(self, text):
+        self.lines.append(text)
+
+    def print_table(self, table_data, columns=None, title="", **kwargs):
+        self.lines.append((title, columns, table_data))
+
+    def linkify(self, element_ids, title=None):
+        return title or ""
+
+    def set_title(self, title):
+        pass
+
+    def close(self):
+        pass
+
+
+_output = []
+
+
+def get_output():
+    if not _output:
+        _output.append(_Output())
+    return _output[0]
+
+
+def get_bundle_file(file_name):
+    if state.bundle_dir is None:
+        return None
+    path = os.path.join(state.bundle_dir, file_name)
+    return path if os.path.exists(path) else None
+
+
+def get_universal_data_file(file_id, file_ext, add_cmd_name=False):
+    if state.appdata_dir is None:
+        state.appdata_dir = tempfile.mkdtemp(prefix="pyRevit_")
+    return os.path.join(state.appdata_dir, "pyRevit_{0}.{1}".format(file_id, file_ext))
+
+
+def script_exit():
+    sys.exit()
+
+
+# ------------------------------
+# HOST_APP
+# ------------------------------
+class _HostApp(object):
+    @property
+    def doc(self):
+        return state.doc
+
+    @property
+    def uidoc(self):
+        return state.uidoc
+
+    @property
+    def uiapp(self):
+        return state.uidoc.Application if state.uidoc else None
+
+    @property
+    def app(self):
+        return state.doc.Application if state.doc else None
+
+    @property
+    def version(self):
+        return self.app.VersionNumber if self.app else "2025"
+
+
+def reset():
+    """Wis antwoorden, meldingen en output tussen tests."""
+    answers.clear()
+    del alerts[:]
+    del _output[:]
+    ProgressBar.cancel_after = None
+    ProgressBar.updates = 0
+    state.appdata_dir = None
+
+
+def modules():
+    pkg = types.ModuleType("pyrevit")
+    pkg.__path__ = []
+
+    revit = _RevitModule("pyrevit.revit")
+    revit.Transaction = _RevitTransaction
+
+    forms = types.ModuleType("pyrevit.forms")
+    for name in ("alert", "ask_for_string", "save_file", "pick_file", "SelectFromList", "WarningBar", "ProgressBar", "WPFWindow"):
+        setattr(forms, name, globals()[name])
+    revit.forms = forms
+
+    script = types.ModuleType("pyrevit.script")
+    script.get_output = get_output
+    script.get_bundle_file = get_bundle_file
+    script.get_universal_data_file = get_universal_data_file
+    script.exit = script_exit
+
+    output = types.ModuleType("pyrevit.output")
+    output.get_output = get_output
+
+    pkg.revit = revit
+    pkg.forms = forms
+    pkg.script = script
+    pkg.output = output
+    pkg.DB = db
+    pkg.HOST_APP = _HostApp()
+    return {
+        "pyrevit": pkg,
+        "pyrevit.revit": revit,
+        "pyrevit.forms": forms,
+        "pyrevit.script": script,
+        "pyrevit.output": output,
+    }
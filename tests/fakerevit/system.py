@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+`clr`, `System.*` en `RevitServices` voor de fake Revit API.
+
+Alles wat de scripts alleen voor hun GUI importeren (WinForms, WPF, Drawing)
+wordt door `StubModule` als lege stub aangeleverd. Alleen `MessageBox` houdt
+bij wat er getoond is, zodat tests meldingen kunnen controleren.
+"""
+
+import types
+
+from . import db
+
+
+class Stub(object):
+    """Neutraal object: elke attribuut, aanroep of event-koppeling werkt."""
+
+    def __init__(self, *args, **kwargs):
+        self.__dict__["_attrs"] = {}
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        attrs = self.__dict__["_attrs"]
+        if name not in attrs:
+            attrs[name] = Stub()
+        return attrs[name]
+
+    def __setattr__(self, name, value):
+        self.__dict__["_attrs"][name] = value
+
+    def __call__(self, *args, **kwargs):
+        return Stub()
+
+    def __iadd__(self, handler):
+        return self
+
+    def __isub__(self, handler):
+        return self
+
+    def __iter__(self):
+        return iter(())
+
+    def __bool__(self):
+        return False
+
+    __nonzero__ = __bool__
+
+
+class _StubClass(type):
+    """Ook klasse-attributen (`Brushes.Transparent`, `Visibility.Collapsed`) zijn stubs."""
+
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = Stub()
+        setattr(cls, name, value)
+        return value
+
+
+class StubModule(types.ModuleType):
+    """Module waarvan elke onbekende naam een stub-klasse oplevert."""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        stub = _StubClass(name, (Stub,), {})
+        setattr(self, name, stub)
+        return stub
+
+
+# ------------------------------
+# clr
+# ------------------------------
+def _make_clr():
+    clr = types.ModuleType("clr")
+    clr.AddReference = lambda *args: None
+    clr.AddReferenceByName = lambda *args: None
+    clr.AddReferenceToFileAndPath = lambda *args: None
+    clr.GetClrType = lambda cls: cls
+    clr.Reference = lambda *args: None
+    return clr
+
+
+# ------------------------------
+# System
+# ------------------------------
+class _AppDomain(object):
+    def __init__(self):
+        self._data = {}
+
+    def GetData(self, key):
+        return self._data.get(key)
+
+    def SetData(self, key, value):
+        self._data[key] = value
+
+
+class AppDomain(object):
+    CurrentDomain = _AppDomain()
+
+
+class _Enum(object):
+    def __init__(self, *names):
+        for name in names:
+            setattr(self, name, name)
+
+
+DialogResult = _Enum("OK", "Cancel", "Yes", "No", "Abort", "Retry", "Ignore", "None")
+MessageBoxButtons = _Enum("OK", "OKCancel", "YesNo", "YesNoCancel", "RetryCancel", "AbortRetryIgnore")
+MessageBoxIcon = _Enum("Information", "Warning", "Error", "Question", "Exclamation", "Asterisk",
+                       "Hand", "Stop", "None")
+
+
+class MessageBox(object):
+    """Houdt elke melding bij; `answers` bepaalt het antwoord (standaard OK)."""
+
+    shown = []
+    answers = []
+
+    @staticmethod
+    def Show(text, caption="", *args):
+        MessageBox.shown.append((text, caption))
+        if MessageBox.answers:
+            return MessageBox.answers.pop(0)
+        return DialogResult.OK
+
+    @staticmethod
+    def reset():
+        del MessageBox.shown[:]
+        del MessageBox.answers[:]
+
+
+class Keys(object):
+    """Flags zoals System.Windows.Forms.Keys, zodat `ModifierKeys & Keys.Shift` werkt."""
+    None_ = 0
+    Enter = 13
+    Escape = 27
+    Shift = 0x10000
+    Control = 0x20000
+    Alt = 0x40000
+
+
+class Control(object):
+    ModifierKeys = Keys.None_
+
+
+def _make_system():
+    modules = {}
+
+    system = StubModule("System")
+    system.AppDomain = AppDomain
+    system.Guid = type("Guid", (str,), {"NewGuid": staticmethod(lambda: "00000000-0000-0000-0000-000000000000")})
+    system.Array = db._List
+    system.String = str
+    system.Int32 = int
+    system.Double = float
+    system.Exception = Exception
+    system.Action = lambda func: func
+    system.EventHandler = lambda func: func
+    modules["System"] = system
+
+    collections = StubModule("System.Collections")
+    generic = StubModule("System.Collections.Generic")
+    generic.List = db._List
+    generic.ICollection = db._List
+    generic.IList = db._List
+    collections.Generic = generic
+    system.Collections = collections
+    modules["System.Collections"] = collections
+    modules["System.Collections.Generic"] = generic
+
+    forms = StubModule("System.Windows.Forms")
+    forms.MessageBox = MessageBox
+    forms.MessageBoxButtons = MessageBoxButtons
+    forms.MessageBoxIcon = MessageBoxIcon
+    forms.DialogResult = DialogResult
+    forms.Control = Control
+    forms.Keys = Keys
+
+    windows = StubModule("System.Windows")
+    windows.Forms = forms
+    system.Windows = windows
+    modules["System.Windows"] = windows
+    modules["System.Windows.Forms"] = forms
+    for name in ("Controls", "Controls.Primitives", "Media", "Documents", "Threading", "Input", "Data"):
+        full = "System.Windows." + name
+        modules[full] = StubModule(full)
+    windows.Controls = modules["System.Windows.Controls"]
+    windows.Controls.Primitives = modules["System.Windows.Controls.Primitives"]
+    windows.Media = modules["System.Windows.Media"]
+    windows.Threading = modules["System.Windows.Threading"]
+    for name in ("Drawing", "IO", "Diagnostics", "Windows.Markup", "ComponentModel", "Collections.ObjectModel"):
+        modules["System." + name] = StubModule("System." + name)
+    modules["System.Collections.ObjectModel"].ObservableCollection = db._List
+    system.Drawing = modules["System.Drawing"]
+    system.IO = modules["System.IO"]
+    return modules
+
+
+# ------------------------------
+# RevitServices (Dynamo)
+# ------------------------------
+class DocumentManager(object):
+    Instance = None
+
+
+class _DocumentManagerInstance(object):
+    def __init__(self, doc, uiapp):
+        self.CurrentDBDocument = doc
+        self.CurrentUIApplication = uiapp
+        self.CurrentUIDocument = uiapp.ActiveUIDocument if uiapp else None
+
+
+class TransactionManager(object):
+    Instance = None
+
+
+class _TransactionManagerInstance(object):
+    def __init__(self, doc):
+        self._doc = doc
+        self._tx = None
+
+    def EnsureInTransaction(self, doc):
+        if self._tx is None:
+            self._tx = db.Transaction(doc, "Dynamo")
+            self._tx.Start()
+
+    def TransactionTaskDone(self):
+        if self._tx is not None:
+            self._tx.Commit()
+            self._tx = None
+
+    def ForceCloseTransaction(self):
+        self.TransactionTaskDone()
+
+
+def _make_revitservices():
+    root = types.ModuleType("RevitServices")
+    persistence = types.ModuleType("RevitServices.Persistence")
+    persistence.DocumentManager = DocumentManager
+    transactions = types.ModuleType("RevitServices.Transactions")
+    transactions.TransactionManager = TransactionManager
+    root.Persistence = persistence
+    root.Transactions = transactions
+    return {
+        "RevitServices": root,
+        "RevitServices.Persistence": persistence,
+        "RevitServices.Transactions": transactions,
+    }
+
+
+def bind_revitservices(doc, uiapp):
+    DocumentManager.Instance = _DocumentManagerInstance(doc, uiapp)
+    TransactionManager.Instance = _TransactionManagerInstance(doc)
+
+
+def modules():
+    out = {"clr": _make_clr()}
+    out.update(_make_system())
+    out.update(_make_revitservices())
+    return out
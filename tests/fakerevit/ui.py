@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""`Autodesk.Revit.UI` en `Autodesk.Revit.UI.Selection` voor de fake Revit API."""
+
+import types
+
+from . import db
+from . import errors
+
+
+ObjectType = db._Enum("ObjectType", ["Nothing", "Element", "PointOnElement", "Edge", "Face",
+                                     "LinkedElement", "Subelement"], base=900)
+
+
+class ISelectionFilter(object):
+    def AllowElement(self, element):
+        return True
+
+    def AllowReference(self, reference, position):
+        return True
+
+
+class _Selection(object):
+    """
+    Selectie met vooraf ingestelde antwoorden.
+
+    `picks` is een lijst met antwoorden voor opeenvolgende PickObject(s)-aanroepen:
+    een `Reference`, een lijst met references, of een exception-instantie. Zonder
+    antwoord gedraagt de fake zich als een gebruiker die op Escape drukt.
+    """
+
+    def __init__(self, doc):
+        self._doc = doc
+        self._ids = []
+        self.picks = []
+
+    def GetElementIds(self):
+        return db._List(self._ids)
+
+    def SetElementIds(self, ids):
+        self._ids = list(ids)
+
+    def _next_pick(self):
+        if not self.picks:
+            raise errors.OperationCanceledException("The user aborted the pick operation.")
+        answer = self.picks.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    def _allowed(self, refs, selection_filter):
+        if selection_filter is None:
+            return refs
+        out = db._List()
+        for ref in refs:
+            elem = self._doc.GetElement(ref.ElementId)
+            if selection_filter.AllowElement(elem):
+                out.Add(ref)
+        return out
+
+    def PickObject(self, object_type, *args):
+        selection_filter = args[0] if args and isinstance(args[0], ISelectionFilter) else None
+        ref = self._next_pick()
+        if isinstance(ref, (list, tuple)):
+            ref = ref[0]
+        if selection_filter is not None and not self._allowed([ref], selection_filter):
+            raise errors.OperationCanceledException("The user aborted the pick operation.")
+        return ref
+
+    def PickObjects(self, object_type, *args):
+        selection_filter = args[0] if args and isinstance(args[0], ISelectionFilter) else None
+        refs = self._next_pick()
+        if not isinstance(refs, (list, tuple)):
+            refs = [refs]
+        return self._allowed(db._List(refs), selection_filter)
+
+    def PickElementsByRectangle(self, *args):
+        refs = self._next_pick()
+        return db._List(self._doc.GetElement(r.ElementId) for r in refs)
+
+    def PickPoint(self, *args):
+        return self._next_pick()
+
+
+class UIDocument(object):
+    def __init__(self, doc):
+        self.Document = doc
+        self.Selection = _Selection(doc)
+        self._open_views = []
+        self.Application = UIApplication(doc.Application, self)
+
+    @property
+    def ActiveView(self):
+        return self.Document.ActiveView
+
+    @ActiveView.setter
+    def ActiveView(self, view):
+        self.Document.ActiveView = view
+
+    def RequestViewChange(self, view):
+        self.Document.ActiveView = view
+
+    def ShowElements(self, ids):
+        pass
+
+    def RefreshActiveView(self):
+        pass
+
+    def GetOpenUIViews(self):
+        return db._List(UIView(v) for v in self._open_views)
+
+
+class UIView(object):
+    def __init__(self, view_id):
+        self.ViewId = view_id
+
+    def Close(self):
+        pass
+
+
+class UIApplication(object):
+    def __init__(self, app, uidoc=None):
+        self.Application = app
+        self.ActiveUIDocument = uidoc
+
+    def PostCommand(self, command_id):
+        pass
+
+
+class TaskDialog(object):
+    shown = []
+
+    def __init__(self, title=""):
+        self.Title = title
+        self.MainInstruction = ""
+        self.MainContent = ""
+
+    @staticmethod
+    def Show(title, message, *args):
+        TaskDialog.shown.append((title, message))
+
+
+class RevitCommandId(object):
+    @staticmethod
+    def LookupPostableCommandId(command):
+        return command
+
+
+class _PostableCommand(object):
+    def __getattr__(self, name):
+        return name
+
+
+PostableCommand = _PostableCommand()
+
+
+__all__ = [n for n, v in list(globals().items())
+           if not n.startswith("_") and not isinstance(v, types.ModuleType)]
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+import fakerevit
+from fakerevit import models, pyrevit
+
+from scholtenbim import configstore
+
+FROM_TO_SINGLE = "Elements.panel/CopyParameters.pulldown/CopyParameterFromToSingle.pushbutton"
+
+
+def test_project_profile_before_user_profile_before_shipped_defaults(tmp_path):
+    defaults = str(tmp_path / "config.json")
+    with open(defaults, "w") as f:
+        json.dump(["Mark"], f)
+    project = models.empty_document(title="Project A")
+    other = models.empty_document(title="Project B")
+
+    assert configstore.load("Tool", project, defaults_file=defaults) == ["Mark"]
+    assert configstore.save("Tool", ["Comments"], project)
+    assert configstore.load("Tool", project, defaults_file=defaults) == ["Comments"]
+    # Laatst opgeslagen waarde geldt als standaard voor andere projecten.
+    assert configstore.load("Tool", other, defaults_file=defaults) == ["Comments"]
+    assert configstore.save("Tool", ["Width"], other)
+    assert configstore.load("Tool", project) == ["Comments"]
+
+    path = configstore.store_path()
+    stamp = os.path.getmtime(path), os.path.getsize(path)
+    assert not configstore.save("Tool", ["Width"], other)
+    assert (os.path.getmtime(path), os.path.getsize(path)) == stamp
+    assert [name for name in os.listdir(os.path.dirname(path)) if name.endswith(".tmp")] == []
+
+    # Aanpassen van de teruggegeven waarde verandert de bewaarde niet.
+    configstore.load("Tool", project).append("X")
+    assert configstore.load("Tool", project) == ["Comments"]
+
+
+def test_shift_click_no_longer_writes_into_the_extension():
+    doc = models.generic_model(5)
+    source = next(iter(doc._iter_class(fakerevit.db.FamilyInstance)))
+    shipped = os.path.join(fakerevit.resolve(FROM_TO_SINGLE), "config.json")
+    with open(shipped) as f:
+        before = f.read()
+
+    pyrevit.answers.push("SelectFromList", ["Mark"])
+    fakerevit.load_script(os.path.join(FROM_TO_SINGLE, "config.py"), doc, picks=[models.reference(source)])
+
+    with open(shipped) as f:
+        assert f.read() == before
+    assert configstore.load("CopyParameterFromToSingle", doc) == ["Mark"]
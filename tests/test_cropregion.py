@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+import math
+
+import fakerevit
+from fakerevit import db, errors, models, pyrevit
+
+from scholtenbim import cropregion, linkedrooms
+
+FLOORPLANS_OF_ROOMS = "Views.panel/Create SectionViews.pulldown/Floorplan of Rooms.pushbutton/script.py"
+
+
+def _circle(radius, count, cx=0.0, cy=0.0):
+    return [db.XYZ(cx + radius * math.cos(2 * math.pi * i / count), cy + radius * math.sin(2 * math.pi * i / count), 0)
+            for i in range(count)]
+
+
+def _l_shape():
+    return [db.XYZ(0, 0, 0), db.XYZ(10, 0, 0), db.XYZ(10, 4, 0), db.XYZ(4, 4, 0), db.XYZ(4, 10, 0), db.XYZ(0, 10, 0)]
+
+
+def test_simplify_drops_collinear_points_and_caps_count():
+    # Zijden opgeknipt in korte stukjes: alleen de 6 hoeken blijven over.
+    pts = []
+    corners = _l_shape()
+    for i, p in enumerate(corners):
+        q = corners[(i + 1) % len(corners)]
+        pts.extend(p + (q - p) * (k / 20.0) for k in range(20))
+    assert len(cropregion.simplify(pts)) == 6
+    assert len(cropregion.simplify(_circle(20.0, 500))) <= cropregion.MAX_POINTS
+
+
+def test_offset_polygon_grows_outward_for_either_orientation():
+    square = [db.XYZ(0, 0, 0), db.XYZ(0, 4, 0), db.XYZ(4, 4, 0), db.XYZ(4, 0, 0)]  # met de klok mee
+    out = cropregion.offset_polygon(square, 1.0)
+    assert abs(cropregion.signed_area(out) - 36.0) < 1e-9
+    # L-vorm: ook de binnenhoek schuift mee naar buiten.
+    l_out = cropregion.offset_polygon(_l_shape(), 0.5)
+    assert [(round(p.X, 9), round(p.Y, 9)) for p in l_out] == [(-0.5, -0.5), (10.5, -0.5), (10.5, 4.5), (4.5, 4.5), (4.5, 10.5), (-0.5, 10.5)]
+
+
+def _crosses(a, b, c, d):
+    def side(p, q, r):
+        return (q.X - p.X) * (r.Y - p.Y) - (q.Y - p.Y) * (r.X - p.X)
+    return side(a, b, c) * side(a, b, d) < 0 and side(c, d, a) * side(c, d, b) < 0
+
+
+def test_offset_polygon_keeps_sharp_notch_simple():
+    # Room met een smalle, diepe inkeping: de punt van de inkeping is een spitse binnenhoek.
+    notched = [db.XYZ(0, 0, 0), db.XYZ(10, 0, 0), db.XYZ(10, 10, 0), db.XYZ(5.2, 10, 0),
+               db.XYZ(5, 2, 0), db.XYZ(4.8, 10, 0), db.XYZ(0, 10, 0)]
+    out = cropregion.offset_polygon(notched, 0.5)
+    assert len(out) == len(notched)
+    tip = out[4]
+    assert abs(tip.X - 5.0) < 1e-9 and 2.0 < tip.Y <= 2.0 + cropregion.MITER_LIMIT * 0.5 + 1e-9
+    edges = [(out[i], out[(i + 1) % len(out)]) for i in range(len(out))]
+    for i in range(len(edges)):
+        for j in range(i + 2, len(edges)):
+            if (i, j) != (0, len(edges) - 1):
+                assert not _crosses(edges[i][0], edges[i][1], edges[j][0], edges[j][1])
+    assert cropregion.signed_area(out) > cropregion.signed_area(notched)
+
+
+def test_floorplans_crop_to_room_boundary():
+    model = models.linked_rooms_model(2, levels=1, offset=db.XYZ(100, 50, 0), rotation=math.pi / 6)
+    model.rooms[0]._boundary = _circle(6.0, 360, 10, 10)
+    picks = [[models.reference(room, model.link_instance) for room in model.rooms]]
+    pyrevit.answers.push("alert", "Room-contour")
+    fakerevit.load_script(FLOORPLANS_OF_ROOMS, model.doc, picks=picks)
+
+    views = dict((v.Name, v) for v in model.doc._iter_class(db.ViewPlan))
+    shape = views["{0} {1}".format(model.rooms[0].Number, model.rooms[0].Name)].GetCropRegionShapeManager()
+    loop = list(shape.GetCropShape()[0])
+    assert 3 < len(loop) <= cropregion.MAX_POINTS
+    # De contour ligt in host-coördinaten, rond het getransformeerde middelpunt.
+    center = model.link_instance.GetTotalTransform().OfPoint(db.XYZ(10, 10, 0))
+    for curve in loop:
+        radius = math.hypot(curve.GetEndPoint(0).X - center.X, curve.GetEndPoint(0).Y - center.Y)
+        assert 6.0 < radius < 6.0 + 2 * cropregion.SIMPLIFY_TOLERANCE + 200.0 / 304.8
+    assert model.doc.calls["SetCropShape"] == 2
+
+
+def test_floorplan_crop_box_covers_room_in_rotated_link():
+    model = models.linked_rooms_model(1, levels=1, offset=db.XYZ(100, 50, 0), rotation=math.radians(150))
+    picks = [[models.reference(model.rooms[0], model.link_instance)]]
+    pyrevit.answers.push("alert", "Bounding box")
+    fakerevit.load_script(FLOORPLANS_OF_ROOMS, model.doc, picks=picks)
+
+    room = model.rooms[0]
+    crop = [v for v in model.doc._iter_class(db.ViewPlan) if v.Name == "{0} {1}".format(room.Number, room.Name)][0].CropBox
+    assert crop.Min.X < crop.Max.X and crop.Min.Y < crop.Max.Y
+    transform = model.link_instance.GetTotalTransform()
+    for point in room._boundary:
+        corner = transform.OfPoint(point)
+        assert crop.Min.X < corner.X < crop.Max.X and crop.Min.Y < corner.Y < crop.Max.Y
+
+
+def test_failed_floorplan_leaves_no_view_behind(monkeypatch):
+    model = models.linked_rooms_model(2, levels=1)
+    failing = model.rooms[0]
+    crop_box_for = linkedrooms.crop_box_for
+
+    def crop_box_or_error(linked_room):
+        if linked_room.room is failing:
+            raise errors.ArgumentException("Ongeldige crop box")
+        return crop_box_for(linked_room)
+
+    monkeypatch.setattr(linkedrooms, "crop_box_for", crop_box_or_error)
+    picks = [[models.reference(room, model.link_instance) for room in model.rooms]]
+    pyrevit.answers.push("alert", "Bounding box")
+    existing = set(v.Id for v in model.doc._iter_class(db.ViewPlan))
+    fakerevit.load_script(FLOORPLANS_OF_ROOMS, model.doc, picks=picks)
+
+    room = model.rooms[1]
+    assert [v.Name for v in model.doc._iter_class(db.ViewPlan) if v.Id not in existing] == \
+        ["{0} {1}".format(room.Number, room.Name)]
+    assert any("Ongeldige crop box" in line for line in pyrevit.get_output().lines)
+
+
+def test_oriented_rectangle_follows_rotated_l_shape():
+    angle = math.radians(30)
+    rot = db.Transform.CreateRotation(db.XYZ.BasisZ, angle)
+    rect = cropregion.oriented_rectangle([rot.OfPoint(p) for p in _l_shape()])
+    assert abs(math.atan2(rect.axis_x.Y, rect.axis_x.X) - angle) < 1e-9
+    assert abs(rect.half_x - 5.0) < 1e-9 and abs(rect.half_y - 5.0) < 1e-9
+    center = rot.OfPoint(db.XYZ(5, 5, 0))
+    assert center.IsAlmostEqualTo(rect.center, 1e-9)
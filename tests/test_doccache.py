@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+from fakerevit import db, models
+
+from scholtenbim import doccache, sheetindex
+
+
+def _change(doc):
+    t = db.Transaction(doc, "Test")
+    t.Start()
+    db.Level.Create(doc, 20.0)
+    t.Commit()
+
+
+def test_cache_survives_clicks_until_the_model_changes():
+    model = models.sheet_model(20)
+    doc = model.doc
+    index = sheetindex.cached(doc)
+    scans = doc.calls["FilteredElementCollector"]
+
+    assert sheetindex.cached(doc) is index
+    assert doc.calls["FilteredElementCollector"] == scans
+
+    _change(doc)
+    rebuilt = sheetindex.cached(doc)
+    assert rebuilt is not index
+    assert sheetindex.cached(doc) is rebuilt
+
+    doc.SynchronizeWithCentral()
+    assert doccache.peek(doc, "sheetindex") is None
+
+    static = doccache.get(doc, "names", lambda: ["a"], track_changes=False)
+    _change(doc)
+    assert doccache.get(doc, "names", lambda: ["b"]) is static
+    doc.Close()
+    assert doccache.stats()["entries"] == 0
+
+
+def test_least_recently_used_entries_are_evicted(monkeypatch):
+    monkeypatch.setattr(doccache, "MAX_ENTRIES", 3)
+    monkeypatch.setattr(doccache, "MAX_WEIGHT", 100)
+    doc = models.empty_document()
+    for name in "abc":
+        doccache.put(doc, name, [name])
+    doccache.peek(doc, "a")
+    doccache.put(doc, "d", ["d"])
+    assert [doccache.peek(doc, n) is not None for n in "abcd"] == [True, False, True, True]
+
+    doccache.put(doc, "big", list(range(99)))
+    assert doccache.peek(doc, "big") is not None
+    assert doccache.stats()["weight"] <= 100
+
+    doc.Application.LinkedResourceOpened.fire(doc.Application, None)
+    assert doccache.stats()["entries"] == 0
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+import math
+
+import pytest
+
+import fakerevit
+from fakerevit import db, errors, models, pyrevit, system
+
+CLEAR_MARK = "Elements.panel/ClearMark.pushbutton/script.py"
+FROM_TO_MULTIPLE = "Elements.panel/CopyParameters.pulldown/CopyParameterFromToMultiple.pushbutton/script.py"
+FROM_TO_TYPE = "Elements.panel/CopyParameters.pulldown/CopyParameterFromToType.pushbutton/script.py"
+SECTIONS_OF_ROOMS = "Views.panel/Create SectionViews.pulldown/Sections of Rooms.pushbutton/script.py"
+FLOORPLANS_OF_ROOMS = "Views.panel/Create SectionViews.pulldown/Floorplan of Rooms.pushbutton/script.py"
+CEILINGPLANS_OF_ROOMS = "Views.panel/Create SectionViews.pulldown/Ceilingplan of Rooms.pushbutton/script.py"
+
+MARK = db.BuiltInParameter.ALL_MODEL_MARK
+FAR_CLIP = db.BuiltInParameter.VIEWER_BOUND_OFFSET_FAR
+
+
+def _marks(doc):
+    return [e.get_Parameter(MARK).AsString() for e in doc._iter_class(db.FamilyInstance)]
+
+
+# ------------------------------
+# Fake API
+# ------------------------------
+def test_set_requires_transaction_and_rolls_back():
+    doc = models.generic_model(10)
+    elem = next(doc._iter_class(db.FamilyInstance))
+    param = elem.LookupParameter("Comments")
+    with pytest.raises(errors.ModificationOutsideTransactionException):
+        param.Set("x")
+
+    t = db.Transaction(doc, "Test")
+    t.Start()
+    param.Set("x")
+    assert elem.LookupParameter("Comments").AsString() == "x"
+    t.RollBack()
+    assert elem.LookupParameter("Comments").AsString() != "x"
+
+
+def test_parameter_filter_skips_elements_without_parameter():
+    doc = models.generic_model(50, mark_ratio=0.5)
+    rule = db.FilterStringRule(db.ParameterValueProvider(db.ElementId(MARK)), db.FilterStringEquals(), "")
+    filled = db.FilteredElementCollector(doc).WherePasses(db.ElementParameterFilter(rule, True))
+    empty = db.FilteredElementCollector(doc).WherePasses(db.ElementParameterFilter(rule))
+    instances = len(list(doc._iter_class(db.FamilyInstance)))
+    # Levels, views en types hebben geen Mark en vallen in beide gevallen af.
+    assert filled.GetElementCount() + empty.GetElementCount() == instances
+
+
+def test_view_names_are_unique():
+    doc = models.empty_document()
+    t = db.Transaction(doc, "Test")
+    t.Start()
+    vft = db.FilteredElementCollector(doc).OfClass(db.ViewFamilyType).FirstElement()
+    view = db.ViewPlan.Create(doc, vft.Id, next(doc._iter_class(db.Level)).Id)
+    with pytest.raises(errors.ArgumentException):
+        view.Name = "Plattegrond"
+    view.Name = "Nieuw"
+    t.Commit()
+    assert view.Name == "Nieuw"
+
+
+def test_generator_sizes():
+    doc = models.generic_model(1000)
+    assert db.FilteredElementCollector(doc).OfClass(db.FamilyInstance).GetElementCount() == 1000
+    sheets = models.sheet_model(20, views_per_sheet=2, unplaced_views=5)
+    assert len(sheets.sheets) == 20 and len(sheets.views) == 45
+    assert all(len(s.GetAllPlacedViews()) == 2 for s in sheets.sheets)
+
+
+# ------------------------------
+# Scripts
+# ------------------------------
+def test_clear_mark_whole_model():
+    doc = models.generic_model(500, mark_ratio=0.6)
+    mod = fakerevit.load_script(CLEAR_MARK, doc)
+    elems = mod.collect_whole_model_only_filled()
+    assert len(elems) == sum(1 for m in _marks(doc) if m)
+
+    changed, cancelled = mod.clear_mark_with_progress(elems)
+    assert (changed, cancelled) == (len(elems), False)
+    assert not any(_marks(doc))
+    assert doc.calls["Transaction.Commit"] == 1
+
+
+def test_clear_mark_cancel_rolls_back():
+    doc = models.generic_model(2500, mark_ratio=1.0)
+    mod = fakerevit.load_script(CLEAR_MARK, doc)
+    pyrevit.ProgressBar.cancel_after = 1
+    pyrevit.answers.push("alert", "Terugdraaien")
+    changed, cancelled = mod.clear_mark_with_progress(mod.collect_whole_model_only_filled())
+    assert cancelled and changed == 0
+    assert all(_marks(doc))
+
+
+def test_clear_mark_cancel_keeps_finished_chunks():
+    doc = models.generic_model(2500, mark_ratio=1.0)
+    mod = fakerevit.load_script(CLEAR_MARK, doc)
+    pyrevit.ProgressBar.cancel_after = 1
+    pyrevit.answers.push("alert", "Behouden")
+    changed, cancelled = mod.clear_mark_with_progress(mod.collect_whole_model_only_filled())
+    # Eerste blok (1000 elementen) is klaar en blijft staan.
+    assert cancelled and changed == 1000
+    assert sum(1 for m in _marks(doc) if not m) == 1000
+    # Hooguit ~10 voortgangsupdates per seconde, niet één per element.
+    assert pyrevit.ProgressBar.updates < 100
+
+
+def test_clear_mark_counts_are_cached_until_the_model_changes():
+    doc = models.generic_model(300, mark_ratio=0.5)
+    filled = sum(1 for m in _marks(doc) if m)
+
+    def open_whole_model():
+        window = fakerevit.load_script(CLEAR_MARK, doc).window
+        window.rb_selection.IsChecked = False
+        window.rb_wholemodel.IsChecked = True
+        window._scope_changed(None, None)
+        return window
+
+    window = open_whole_model()
+    # Het venster telt pas na openen, één scope per tick.
+    assert window.txt_count.Text == "Telling: bezig met tellen..."
+    while window.count_next():
+        pass
+    assert window.txt_count.Text == "Telling: {0} (Whole Model)".format(filled)
+
+    collectors = doc.calls["FilteredElementCollector"]
+    window = open_whole_model()
+    assert window.txt_count.Text == "Telling: {0} (Whole Model)".format(filled)
+    assert not window.count_next() and doc.calls["FilteredElementCollector"] == collectors
+
+    # Mark leegmaken wijzigt het model: de tellingen vervallen.
+    fakerevit.load_script(CLEAR_MARK, doc).clear_mark_with_progress(
+        [e for e in doc._iter_class(db.FamilyInstance) if e.LookupParameter("Mark").AsString()][:10])
+    window = open_whole_model()
+    assert window.txt_count.Text == "Telling: bezig met tellen..."
+    while window.count_next():
+        pass
+    assert window.txt_count.Text == "Telling: {0} (Whole Model)".format(filled - 10)
+
+
+def test_clear_mark_selection_uses_id_scoped_collector():
+    doc = models.generic_model(600, mark_ratio=0.5)
+    instances = list(doc._iter_class(db.FamilyInstance))[:400]
+    uidoc = fakerevit.bind(doc)
+    uidoc.Selection.SetElementIds([e.Id for e in instances])
+    mod = fakerevit.load_script(CLEAR_MARK, doc, uidoc=uidoc)
+    doc.calls.clear()
+
+    elems = mod.collect_selection_only_filled()
+    assert set(e.Id for e in elems) == set(e.Id for e in instances if e.LookupParameter("Mark").AsString())
+    assert mod.count_scope(mod.SCOPE_SELECTION) == len(elems)
+    # Geen GetElement per id: alleen de geselecteerde elementen in de collector.
+    assert doc.calls["GetElement"] == 0
+    assert doc.calls["collector.visited"] == 2 * len(instances)
+
+
+def test_clear_mark_active_view_scope():
+    doc = models.generic_model(400, in_view_ratio=0.25)
+    mod = fakerevit.load_script(CLEAR_MARK, doc)
+    visible = doc.ActiveView._visible_ids
+    elems = mod.collect_active_view_only_filled()
+    assert elems and all(e.Id in visible for e in elems)
+
+
+def test_copy_parameters_from_to_multiple():
+    doc = models.generic_model(100)
+    instances = list(doc._iter_class(db.FamilyInstance))
+    source = models.fill_parameters(instances[0], {"CT_compartment01": "BC-01", "scheidingsschot": "EI60"})
+    picks = [models.reference(source), [models.reference(e) for e in instances[1:]]]
+
+    mod = fakerevit.load_script(FROM_TO_MULTIPLE, doc, picks=picks)
+    assert not mod.exited and not mod.errors
+    assert all(e.LookupParameter("CT_compartment01").AsString() == "BC-01" for e in instances)
+    assert all(e.LookupParameter("scheidingsschot").AsString() == "EI60" for e in instances)
+
+
+def test_copy_parameters_looks_up_names_once_per_type():
+    doc = models.generic_model(500)
+    instances = list(doc._iter_class(db.FamilyInstance))
+    source = models.fill_parameters(instances[0], dict((name, "X") for name in models.CT_PARAMETERS))
+    picks = [models.reference(source), [models.reference(e) for e in instances[1:]]]
+    fakerevit.load_script(FROM_TO_MULTIPLE, doc, picks=picks)
+
+    assert all(e.LookupParameter("CT_compartment05").AsString() == "X" for e in instances)
+    doc.calls.clear()
+    fakerevit.load_script(FROM_TO_MULTIPLE, doc, picks=picks)
+    types = len(set((e.Category.Id, e.GetTypeId()) for e in instances))
+    # Bron: 1x per naam; doelen: 1x per type en naam in plaats van 2x per element.
+    assert doc.calls["LookupParameter"] == len(models.CT_PARAMETERS) * (1 + types)
+
+
+def _type_model(count):
+    doc = models.generic_model(count, types_per_category=2)
+    symbols = list(doc._iter_class(db.FamilySymbol))
+    for symbol in symbols[1:]:
+        models.fill_parameters(symbol, {"Description": ""})
+    models.fill_parameters(symbols[0], {"Description": "Brandwerend"})
+    return doc, symbols
+
+
+def test_copy_type_parameters_writes_each_type_once():
+    doc, symbols = _type_model(600)
+    instances = list(doc._iter_class(db.FamilyInstance))
+    source = next(e for e in instances if e.GetTypeId() == symbols[0].Id)
+    picks = [models.reference(source), [models.reference(e) for e in instances]]
+    pyrevit.answers.push("alert", "Objecten selecteren")
+    fakerevit.load_script(FROM_TO_TYPE, doc, picks=picks)
+
+    assert all(s.LookupParameter("Description").AsString() == "Brandwerend" for s in symbols)
+    assert doc.calls["Parameter.Set"] == len(symbols)
+    assert system.MessageBox.shown[-1][0] == "{0} type(s) bijgewerkt (600 instantie(s)).".format(len(symbols))
+
+
+def test_copy_type_parameters_from_type_list():
+    doc, symbols = _type_model(20)
+    source = next(e for e in doc._iter_class(db.FamilyInstance) if e.GetTypeId() == symbols[0].Id)
+    # Type zonder Description: komt als ontbrekend in het overzicht.
+    doc.add(db.FamilySymbol(doc, "Kaal", symbols[1]._category, family_name="Leeg"))
+    label = "{0} : {1}".format(symbols[1].FamilyName, symbols[1].Name)
+    pyrevit.answers.push("alert", "Types uit lijst")
+    pyrevit.answers.push("SelectFromList", [label, "Leeg : Kaal"])
+    fakerevit.load_script(FROM_TO_TYPE, doc, picks=[models.reference(source)])
+
+    assert symbols[1].LookupParameter("Description").AsString() == "Brandwerend"
+    assert symbols[2].LookupParameter("Description").AsString() == ""
+    message = system.MessageBox.shown[-1][0]
+    assert message.splitlines() == ["1 type(s) bijgewerkt.",
+                                    "Type 'Leeg : Kaal': ontbrekende parameter(s): Description."]
+
+
+def test_copy_parameters_cancelled_pick():
+    doc = models.generic_model(10)
+    fakerevit.load_script(FROM_TO_MULTIPLE, doc)
+    assert system.MessageBox.shown[-1][0] == "De gebruiker heeft de actie gestopt."
+    assert doc.calls["Transaction.Start"] == 0
+
+
+def test_sections_of_rooms():
+    model = models.linked_rooms_model(6)
+    picks = [[models.reference(room, model.link_instance) for room in model.rooms]]
+    fakerevit.load_script(SECTIONS_OF_ROOMS, model.doc, picks=picks)
+    names = [v.Name for v in model.doc._iter_class(db.ViewSection)]
+    assert len(names) == 24 and len(set(names)) == 24
+    assert "0.01 Ruimte 1_A" in names
+
+    # Een tweede run maakt geen dubbele namen maar nummert door.
+    picks = [[models.reference(room, model.link_instance) for room in model.rooms[:1]]]
+    fakerevit.load_script(SECTIONS_OF_ROOMS, model.doc, picks=picks)
+    assert "0.01 Ruimte 1_A Copy 1" in [v.Name for v in model.doc._iter_class(db.ViewSection)]
+
+
+def test_sections_of_rooms_follow_rotated_link():
+    model = models.linked_rooms_model(1, room_size=(4.0, 6.0), offset=db.XYZ(50, 20, 0), rotation=math.radians(20))
+    picks = [[models.reference(room, model.link_instance) for room in model.rooms]]
+    fakerevit.load_script(SECTIONS_OF_ROOMS, model.doc, picks=picks)
+    views = dict((v.Name.rsplit("_", 1)[1], v) for v in model.doc._iter_class(db.ViewSection))
+
+    axis = model.link_instance.GetTotalTransform().BasisX
+    assert views["A"].ViewDirection.IsAlmostEqualTo(axis, 1e-9)
+    # Ver-clip: halve diepte van de room + marge, niet de diagonaal van de bounding box.
+    lo, hi = model.rooms[0].get_BoundingBox(None).Min, model.rooms[0].get_BoundingBox(None).Max
+    far = views["A"].get_Parameter(FAR_CLIP).AsDouble()
+    assert abs(far - ((hi.X - lo.X) / 2.0 + 200.0 / 304.8)) < 1e-9
+
+
+def test_sections_of_rooms_cancel_rolls_back_everything():
+    model = models.linked_rooms_model(40)
+    picks = [[models.reference(room, model.link_instance) for room in model.rooms]]
+    pyrevit.ProgressBar.cancel_after = 1
+    fakerevit.load_script(SECTIONS_OF_ROOMS, model.doc, picks=picks)
+    assert not list(model.doc._iter_class(db.ViewSection))
+
+
+def test_room_plans_map_levels_by_elevation():
+    model = models.linked_rooms_model(9, levels=3)
+    # Andere levelnamen in de link: koppelen moet dan op hoogte.
+    t = db.Transaction(model.link_doc, "Rename")
+    t.Start()
+    for i, level in enumerate(model.levels):
+        level.Name = "ARC {0:02d}".format(i)
+    t.Commit()
+    host_levels = dict((l.Elevation, l.Id) for l in model.doc._iter_class(db.Level))
+
+    picks = [[models.reference(room, model.link_instance) for room in model.rooms]]
+    pyrevit.answers.push("alert", "Bounding box", "Bounding box")
+    fakerevit.load_script(FLOORPLANS_OF_ROOMS, model.doc, picks=picks)
+    by_name = dict((v.Name, v) for v in model.doc._iter_class(db.ViewPlan))
+    for room in model.rooms:
+        view = by_name["{0} {1}".format(room.Number, room.Name)]
+        level = model.link_doc.GetElement(room.LevelId)
+        assert view.GenLevel.Id == host_levels[level.Elevation]
+    assert model.doc.calls["TransactionGroup.Start"] == 1
+
+    fakerevit.load_script(CEILINGPLANS_OF_ROOMS, model.doc, picks=picks)
+    names = [v.Name for v in model.doc._iter_class(db.ViewPlan)]
+    assert "{0} {1} CP".format(model.rooms[0].Number, model.rooms[0].Name) in names
+
+
+# ------------------------------
+# Document index
+# ------------------------------
+def test_docindex_follows_document_changes():
+    from scholtenbim import docindex
+
+    doc = models.empty_document()
+    index = docindex.get_index(doc)
+    assert index.level_by_name("01 Verdieping") is not None
+    scans = doc.calls["FilteredElementCollector"]
+
+    t = db.Transaction(doc, "Test")
+    t.Start()
+    level = db.Level.Create(doc, 10.0)
+    level.Name = "Dak"
+    t.Commit()
+
+    assert index.level_by_name("Dak") is level
+    assert index.levels()[-1] is level
+    assert doc.calls["FilteredElementCollector"] == scans
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+import os
+
+import fakerevit
+from fakerevit import db, models, pyrevit, system
+
+from scholtenbim import doccache, linkcache
+
+ELEMENT_ID = "Elements.panel/ElementId.pushbutton/script.py"
+
+
+def _model(tmp_path):
+    model = models.linked_elements_model(20, sources=30)
+    link_file = tmp_path / "Bouwkunde.rvt"
+    link_file.write_bytes(b"rvt")
+    model.link_doc.PathName = str(link_file)
+    return model
+
+
+def test_unchanged_link_is_read_from_cache(tmp_path):
+    model = _model(tmp_path)
+    cache_file = str(tmp_path / "cache.sqlite")
+    first = linkcache.LinkMetadataCache(cache_file)
+    records = first.records(model.link_doc, parameters=["Family and Type"])
+    first.close()
+    # Alle elementen met een categorie, dus ook levels en views.
+    assert first.live_reads == len(records)
+    assert set(e.Id.IntegerValue for e in model.sources) <= set(records)
+
+    model.link_doc.calls.clear()
+    second = linkcache.LinkMetadataCache(cache_file)
+    cached = second.records(model.link_doc, parameters=["Family and Type"])
+    assert second.live_reads == 0 and not model.link_doc.calls
+    source = model.sources[0]
+    record = cached[source.Id.IntegerValue]
+    assert record.parameters == {"Family and Type": source.Name}
+    assert record.bbox == (source._bbox[0].X, source._bbox[0].Y, source._bbox[0].Z,
+                           source._bbox[1].X, source._bbox[1].Y, source._bbox[1].Z)
+
+    # Nieuwe parameter of gewijzigd bestand: opnieuw uitlezen.
+    second.records(model.link_doc, parameters=["Comments"])
+    assert second.live_reads == len(records)
+    second.records(model.link_doc, parameters=["Comments", "Family and Type"])
+    assert second.live_reads == len(records)
+    os.utime(model.link_doc.PathName, (1, 1))
+    second.records(model.link_doc)
+    assert second.live_reads == 2 * len(records)
+
+
+def test_saved_link_that_is_not_reloaded_is_not_cached(tmp_path):
+    model = _model(tmp_path)
+    cache = linkcache.LinkMetadataCache(str(tmp_path / "cache.sqlite"))
+    count = len(cache.records(model.link_doc))
+
+    # Bestand opgeslagen, link niet herladen: de geladen link is de oude versie.
+    stat = os.stat(model.link_doc.PathName)
+    os.utime(model.link_doc.PathName, (stat.st_atime, stat.st_mtime + 60))
+    cache.records(model.link_doc)
+    cache.records(model.link_doc)
+    assert cache.live_reads == 3 * count
+    rows = cache._connect().execute("SELECT mtime FROM links").fetchall()
+    assert rows == [(stat.st_mtime,)]
+
+    # Nieuwe klik zonder rocket mode: alleen de DocumentVersion verraadt de nieuwe versie.
+    doccache.invalidate()
+    db.BasicFileInfo.saved_elsewhere[model.link_doc.PathName] = db.DocumentVersion(saves=1)
+    cache.records(model.link_doc)
+    assert cache.live_reads == 4 * count
+    assert cache._connect().execute("SELECT mtime FROM links").fetchall() == rows
+
+    # Link herladen: het bestand en de geladen link zijn weer gelijk.
+    doccache.invalidate()
+    del db.BasicFileInfo.saved_elsewhere[model.link_doc.PathName]
+    cache.records(model.link_doc)
+    cache.records(model.link_doc)
+    assert cache.live_reads == 5 * count
+    assert cache._connect().execute("SELECT mtime FROM links").fetchall() == [(stat.st_mtime + 60,)]
+
+
+def test_selected_elements_are_read_once(tmp_path):
+    model = _model(tmp_path)
+    cache = linkcache.LinkMetadataCache(str(tmp_path / "cache.sqlite"))
+    ids = [e.Id.IntegerValue for e in model.sources[:3]]
+    assert sorted(cache.records(model.link_doc, ids)) == sorted(ids)
+    cache.records(model.link_doc, ids[:2])
+    assert cache.live_reads == 3
+
+
+def test_linked_ids_use_cache(tmp_path):
+    model = _model(tmp_path)
+    picks = [[models.reference(e, model.link_instance) for e in model.sources[:5]]]
+    fakerevit.load_script(ELEMENT_ID, model.doc, picks=picks)
+    model.link_doc.calls.clear()
+    module = fakerevit.load_script(ELEMENT_ID, model.doc, picks=picks)
+
+    assert not system.MessageBox.shown
+    module.window.load_all()
+    assert [row.Family for row in module.window.rows] == [e.Name for e in model.sources[:5]]
+    assert model.link_doc.calls["GetElement"] == 0
+
+
+def test_export_whole_categories(tmp_path, monkeypatch):
+    model = _model(tmp_path)
+    path = str(tmp_path / "export.jsonl")
+    monkeypatch.setattr(system.Control, "ModifierKeys", system.Keys.Shift)
+    pyrevit.answers.push("SelectFromList", [model.sources[0].Category.Name])
+    pyrevit.answers.push("ask_for_string", "Family and Type; Comments")
+    pyrevit.answers.push("alert", "JSON Lines (.jsonl)")
+    pyrevit.answers.push("save_file", path)
+    live_reads = []
+    close = linkcache.LinkMetadataCache.close
+    monkeypatch.setattr(linkcache.LinkMetadataCache, "close", lambda self: live_reads.append(self.live_reads) or close(self))
+    fakerevit.load_script(ELEMENT_ID, model.doc)
+
+    # Categorieën en export uit dezelfde uitlezing: de link wordt maar één keer live gelezen.
+    expected = len(linkcache.LinkMetadataCache(str(tmp_path / "check.sqlite")).records(model.link_doc))
+    assert live_reads == [expected]
+
+    with io.open(path, encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert [row["unique_id"] for row in rows] == [e.UniqueId for e in model.sources]
+    assert rows[0]["parameters"] == {"Family and Type": model.sources[0].Name, "Comments": None}
+    assert system.MessageBox.shown[-1][0].startswith("{0} element(en) ge".format(len(model.sources)))
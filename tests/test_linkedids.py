@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+from fakerevit import db
+
+from scholtenbim import linkedids
+
+
+def _rows():
+    return [
+        linkedids.LinkedIdRow("Walls", "Basic Wall: 200", "Bouwkundig.rvt", 30),
+        linkedids.LinkedIdRow("Doors", "Deur: 930x2315", "Bouwkundig.rvt", 12),
+        linkedids.LinkedIdRow("Walls", "Basic Wall: 100", "Constructie.rvt", 7),
+        linkedids.LinkedIdRow("Doors", "Deur: 830x2315", "Constructie.rvt", 101),
+    ]
+
+
+def test_arrange_filters_sorts_and_groups():
+    rows = _rows()
+    assert [r.Id for r in linkedids.arrange(rows, text="DEUR")] == [12, 101]
+    assert [r.Id for r in linkedids.arrange(rows, sort_by="Id", descending=True)] == [101, 30, 12, 7]
+    # Per categorie bij elkaar, binnen de groep op ID.
+    assert [r.Id for r in linkedids.arrange(rows, sort_by="Id", group_by="Category")] == [12, 101, 7, 30]
+    assert linkedids.ids_text(linkedids.arrange(rows, text="constructie.rvt")) == "7;101"
+
+
+def test_insert_arranged_matches_arrange():
+    rows = _rows() + [
+        linkedids.LinkedIdRow("Walls", "Basic Wall: 300", "Bouwkundig.rvt", 12),
+        linkedids.LinkedIdRow("Doors", "Deur: 1030x2315", "Bouwkundig.rvt", 55),
+        linkedids.LinkedIdRow("Windows", "Raam: 1200", "Constructie.rvt", 3),
+    ]
+    for text, sort_by, descending, group_by in (("", "Id", False, None), ("", "Id", True, "Category"),
+                                                ("rvt", "Family", False, "LinkedFile"), ("deur", None, False, None)):
+        items = db._List(linkedids.arrange(rows[:3], text, sort_by, descending, group_by))
+        kept = list(items)
+        linkedids.insert_arranged(items, rows[3:], text, sort_by, descending, group_by)
+        assert list(items) == linkedids.arrange(rows, text, sort_by, descending, group_by)
+        # De rijen die er al stonden zijn niet vervangen.
+        assert [row for row in items if row in kept] == kept
+
+
+def test_row_loader_grows_batches():
+    loader = linkedids.RowLoader(range(25), first_batch=2, max_batch=8)
+    sizes = []
+    while not loader.done:
+        sizes.append(len(loader.next_batch()))
+    assert sizes == [2, 4, 8, 8, 3]
+    assert loader.next_batch() == []
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+import io
+
+import pytest
+
+import fakerevit
+from fakerevit import db, models, pyrevit, system
+
+from scholtenbim import parammapping
+
+FROM_MAPPING = "Elements.panel/CopyParameters.pulldown/CopyParameterFromMapping.pushbutton/script.py"
+MARK = db.BuiltInParameter.ALL_MODEL_MARK
+
+
+def _write_csv(tmp_path, lines, name="mapping.csv"):
+    path = tmp_path / name
+    with io.open(str(path), "w", encoding="utf-8-sig") as out:
+        out.write(u"\n".join(lines))
+    return str(path)
+
+
+def _model(count=20):
+    doc = models.generic_model(count, mark_ratio=1.0)
+    instances = list(doc._iter_class(db.FamilyInstance))
+    for i, elem in enumerate(instances):
+        models.fill_parameters(elem, {"Comments": "Opmerking {0}".format(i), "Offset": 0.0})
+    return doc, instances
+
+
+def test_read_mapping_detects_delimiter_and_quotes(tmp_path):
+    path = _write_csv(tmp_path, ['source key,TARGET KEY,Source Parameter,Target Parameter,Unit',
+                                 'M-1,M-2,Comments,,',
+                                 '"A,B",M-3,Comments,Description,mm',
+                                 ',,,,'])
+    rows = parammapping.read_mapping(path)
+    assert [(r.line, r.source_key, r.target_parameter, r.unit) for r in rows] == [
+        (2, "M-1", "Comments", ""), (3, "A,B", "Description", "mm")]
+
+    with pytest.raises(parammapping.MappingError):
+        parammapping.read_mapping(_write_csv(tmp_path, ["Source Key;Target Key"], "leeg.csv"))
+
+
+def test_plan_resolves_keys_once_and_converts_units():
+    doc, instances = _model()
+    models.fill_parameters(instances[0], {"Comments": "1200"})
+    marks = [e.get_Parameter(MARK).AsString() for e in instances]
+    rows = parammapping.rows_from_table([
+        ["Source Key", "Target Key", "Source Parameter", "Target Parameter", "Unit"],
+        [marks[0], str(instances[5].Id.IntegerValue), "Comments", "Offset", "mm"],
+        [marks[1], str(instances[6].Id.IntegerValue), "Comments", "", ""],
+        ["bestaat niet", str(instances[7].Id.IntegerValue), "Comments", "", ""],
+        [marks[2], "999999", "Comments", "", ""],
+        [marks[3], str(instances[8].Id.IntegerValue), "Comments", "Offset", "parsec"],
+        [marks[4], str(instances[9].Id.IntegerValue), "Comments", "Offset", ""],
+    ])
+    scans = doc.calls["FilteredElementCollector"]
+    plan = parammapping.build_plan(doc, rows, parammapping.KEY_MARK, parammapping.KEY_ELEMENT_ID)
+    assert doc.calls["FilteredElementCollector"] - scans == 1
+    assert plan.issue_counts() == {parammapping.ISSUE_SOURCE_NOT_FOUND: 1, parammapping.ISSUE_TARGET_NOT_FOUND: 1,
+                                   parammapping.ISSUE_UNIT: 1, parammapping.ISSUE_CONVERSION: 1}
+
+    result = parammapping.apply_plan(doc, plan)
+    assert len(result.succeeded) == 2 and doc.calls["TransactionGroup.Start"] == 1
+    assert abs(instances[5].LookupParameter("Offset").AsDouble() - 1200 / 304.8) < 1e-9
+    assert instances[6].LookupParameter("Comments").AsString() == "Opmerking 1"
+
+
+def test_mapping_script(tmp_path):
+    doc, instances = _model(3000)
+    marks = [e.get_Parameter(MARK).AsString() for e in instances]
+    lines = ["Source Key;Target Key;Source Parameter;Target Parameter"]
+    lines += ["{0};{1};Comments;CT_compartment01".format(marks[i], marks[i + 1]) for i in range(0, 3000, 2)]
+    pyrevit.answers.push("pick_file", _write_csv(tmp_path, lines))
+    pyrevit.answers.push("SelectFromList", "Mark", "Andere parameter...")
+    pyrevit.answers.push("ask_for_string", "Mark")
+    fakerevit.load_script(FROM_MAPPING, doc)
+
+    assert instances[1].LookupParameter("CT_compartment01").AsString() == "Opmerking 0"
+    assert instances[2999].LookupParameter("CT_compartment01").AsString() == "Opmerking 2998"
+    assert system.MessageBox.shown[-1][0].splitlines() == ["1500 regel(s) in de mapping.",
+                                                           "1500 parameter(s) weggeschreven."]
+    assert doc.calls["Transaction.Commit"] == 3
+
+
+def test_mapping_script_heading(tmp_path):
+    doc, instances = _model(6)
+    marks = [e.get_Parameter(MARK).AsString() for e in instances]
+    lines = ["Source Key;Target Key;Source Parameter;Target Parameter",
+             "{0};{1};Comments;CT_compartment01".format(marks[0], marks[1]),
+             "Onbekend;{0};Comments;CT_compartment01".format(marks[2]),
+             "{0};Onbekend;Comments;CT_compartment01".format(marks[3])]
+    pyrevit.answers.push("pick_file", _write_csv(tmp_path, lines))
+    pyrevit.answers.push("SelectFromList", "Mark", "Mark")
+    fakerevit.load_script(FROM_MAPPING, doc)
+    assert pyrevit.get_output().lines[0] == "## Copy Parameter from Mapping: Aandachtspunten (2 regels niet verwerkt)"
+
+    pyrevit.get_output().lines[:] = []
+    pyrevit.answers.push("pick_file", _write_csv(tmp_path, lines[:1] + lines[2:], name="niets.csv"))
+    pyrevit.answers.push("SelectFromList", "Mark", "Mark")
+    fakerevit.load_script(FROM_MAPPING, doc)
+    assert pyrevit.get_output().lines[0] == "## Copy Parameter from Mapping: niet uitgevoerd"
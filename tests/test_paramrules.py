@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+import re
+
+import fakerevit
+from fakerevit import db, models, system
+
+from scholtenbim import batch, paramrules
+
+CLEAR_SET_PARAMETER = "Elements.panel/ClearSetParameter.pushbutton/script.py"
+
+
+def _values(doc, name):
+    return dict((e.Id, e.LookupParameter(name).AsString() or "") for e in doc._iter_class(db.FamilyInstance))
+
+
+def test_rules_in_collector_and_in_python():
+    doc = models.generic_model(300, mark_ratio=0.5)
+    marks = _values(doc, "Mark")
+
+    def query(kind, value="", scope=paramrules.SCOPE_MODEL):
+        return paramrules.RuleQuery(doc, paramrules.ParameterRule("Mark", kind, value), scope)
+
+    filled = query(paramrules.RULE_NOT_EMPTY)
+    assert filled.native is not None
+    assert filled.count() == sum(1 for m in marks.values() if m)
+    assert query(paramrules.RULE_EMPTY).count() == sum(1 for m in marks.values() if not m)
+    assert query(paramrules.RULE_CONTAINS, "M-1").count() == sum(1 for m in marks.values() if "M-1" in m)
+
+    regex = query(paramrules.RULE_REGEX, r"^M-\d{2}$")
+    assert regex.native is None
+    assert regex.count() == sum(1 for m in marks.values() if re.match(r"^M-\d{2}$", m))
+
+    visible = doc.ActiveView._visible_ids
+    in_view = query(paramrules.RULE_NOT_EMPTY, scope=paramrules.SCOPE_VIEW)
+    assert set(e.Id for e, _ in in_view.elements()) == set(i for i, m in marks.items() if m and i in visible)
+
+
+def test_numeric_and_id_rules_in_collector():
+    doc = models.generic_model(300, mark_ratio=0.5)
+    for name, storage_type in (("Aantal", db.StorageType.Integer), ("Lengte", db.StorageType.Double),
+                               ("Niveau", db.StorageType.ElementId)):
+        doc.define_parameter(name, storage_type)
+    levels = list(doc._iter_class(db.Level))
+    instances = list(doc._iter_class(db.FamilyInstance))
+    for i, elem in enumerate(instances):
+        models.fill_parameters(elem, {"Aantal": i % 4 or None, "Lengte": (i % 3) * 500 / 304.8,
+                                      "Niveau": levels[i % len(levels)].Id if i % 5 else None})
+
+    def query(name, kind, value=""):
+        doc.calls.clear()
+        result = paramrules.RuleQuery(doc, paramrules.ParameterRule(name, kind, value), paramrules.SCOPE_MODEL)
+        # Op naam zoeken alleen per (categorie, type), niet per element.
+        assert doc.calls["LookupParameter"] <= len(doc._by_class[db.FamilySymbol]) + 10
+        return result
+
+    for name, kind, value, expected in (
+            ("Aantal", paramrules.RULE_EMPTY, "", sum(1 for i in range(300) if not i % 4)),
+            ("Aantal", paramrules.RULE_NOT_EMPTY, "", sum(1 for i in range(300) if i % 4)),
+            ("Aantal", paramrules.RULE_EQUALS, "2", sum(1 for i in range(300) if i % 4 == 2)),
+            ("Lengte", paramrules.RULE_EQUALS, "1000", sum(1 for i in range(300) if i % 3 == 2)),
+            ("Niveau", paramrules.RULE_EQUALS, str(levels[1].Id.IntegerValue),
+             sum(1 for i in range(300) if i % 5 and i % len(levels) == 1))):
+        rule = query(name, kind, value)
+        assert rule.native is not None
+        assert rule.count() == len(rule.elements()) == expected
+        python = sum(1 for elem in instances if rule.rule.matches(elem.LookupParameter(name)))
+        assert python == expected
+
+    # Een levelnaam kan niet in het filter: dan vergelijkt Python de weergave.
+    by_name = query("Niveau", paramrules.RULE_EQUALS, levels[1].Name)
+    assert by_name.native is None
+    assert by_name.count() == sum(1 for i in range(300) if i % 5 and i % len(levels) == 1)
+
+
+def test_copy_from_other_parameter_where_empty():
+    doc = models.generic_model(200, mark_ratio=0.5)
+    marks = _values(doc, "Mark")
+    comments = _values(doc, "Comments")
+    mod = fakerevit.load_script(CLEAR_SET_PARAMETER, doc)
+
+    window = mod.window
+    window.combo_param.Text = "Mark"
+    window.combo_rule.SelectedIndex = 0
+    window.rb_selection.IsChecked = False
+    window.rb_wholemodel.IsChecked = True
+    window.combo_action.SelectedIndex = 2
+    window.txt_action_value.Text = "Comments"
+    window.run_click(None, None)
+
+    expected = dict((i, m or comments[i]) for i, m in marks.items())
+    assert _values(doc, "Mark") == expected
+    assert system.MessageBox.shown[-1][0] == "Er zijn {0} van {0} element(en) aangepast.".format(
+        sum(1 for m in marks.values() if not m))
+
+
+def test_rejected_value_is_a_failure(monkeypatch):
+    doc = models.generic_model(10, mark_ratio=1.0)
+    # Revit weigert sommige waarden zonder exceptie: Set geeft dan False.
+    monkeypatch.setattr(db.Parameter, "Set", lambda self, value: False)
+    writes = [(e, e.LookupParameter("Mark"), "X") for e in doc._iter_class(db.FamilyInstance)]
+
+    for setter in (None, paramrules.set_parameter_text):
+        result = batch.write_parameters(doc, "Test", writes, setter=setter)
+        assert not result.succeeded and len(result.failures) == len(writes)
+        assert all(isinstance(error, ValueError) for _, error in result.failures)
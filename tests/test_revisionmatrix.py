@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import io
+
+import fakerevit
+from fakerevit import models, pyrevit
+
+from scholtenbim.revisionmatrix import RevisionMatrix
+
+REVISION_MATRIX = "Revisions.panel/Revisions.pulldown/Revision Matrix.pushbutton/script.py"
+
+
+def test_matrix_matches_sheet_revisions():
+    model = models.sheet_model(30, revisions=6, revisions_per_sheet=2)
+    matrix = RevisionMatrix(model.doc)
+    for rev in model.revisions:
+        expected = sorted(s.SheetNumber for s in model.sheets if rev.Id in s.GetAllRevisionIds())
+        assert [s.SheetNumber for s in matrix.sheets_for_sequence(rev.SequenceNumber)] == expected
+    # GetElement wordt niet per revisie-id op een sheet aangeroepen.
+    assert model.doc.calls["GetElement"] == 0
+
+
+def test_export_csv_via_script(tmp_path):
+    model = models.sheet_model(3, revisions=2, revisions_per_sheet=1, clouds_per_sheet=0)
+    path = str(tmp_path / "matrix.csv")
+    pyrevit.answers.push("alert", "CSV (.csv)")
+    pyrevit.answers.push("save_file", path)
+    fakerevit.load_script(REVISION_MATRIX, model.doc)
+
+    with io.open(path, encoding="utf-8-sig") as f:
+        lines = f.read().splitlines()
+    assert lines[0] == "Sheet Number;Sheet Name;1 - Revisie A;2 - Revisie B"
+    assert len(lines) == 4
+    assert all(line.count("X") == 1 for line in lines[1:])
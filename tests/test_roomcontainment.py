@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import json
+import math
+import os
+import shutil
+
+import fakerevit
+from fakerevit import db, models, pyrevit, system
+
+from scholtenbim import roomcontainment
+
+COPY_ROOM_PARAMETERS = "Elements.panel/CopyParameters.pulldown/CopyRoomParametersFromLink.pushbutton"
+
+
+def test_elements_above_ceiling_belong_to_room_below():
+    model = models.linked_rooms_model(40, levels=3, offset=db.XYZ(100.0, 50.0, 0.0), rotation=math.radians(30))
+    expected = models.add_room_contents(model, per_room=5, outside=10)
+    # Verlaagd plafond: de rooms zijn lager dan de verdiepingshoogte.
+    for room in model.rooms:
+        lo, hi = room._bbox
+        room._bbox = (lo, db.XYZ(hi.X, hi.Y, lo.Z + 2.0))
+
+    elements = list(model.doc._iter_class(db.FamilyInstance))
+    points = roomcontainment.element_points(elements)
+    containment = roomcontainment.RoomContainment(roomcontainment.room_footprints(model.link_instance))
+    assigned = containment.assign(points)
+
+    found = dict((points[i][0].Id, footprint.linked.number) for i, footprint in assigned.items())
+    assert found == expected
+    # Alleen rooms in de buurt: veel minder tests dan elementen x rooms.
+    assert containment.tests < 2 * len(expected)
+
+
+def test_spaces_use_is_point_in_space():
+    model = models.linked_rooms_model(9, levels=2, offset=db.XYZ(20.0, -10.0, 0.0), rotation=math.radians(45),
+                                      room_class=db.Space)
+    expected = models.add_room_contents(model, per_room=2, outside=3)
+
+    points = roomcontainment.element_points(list(model.doc._iter_class(db.FamilyInstance)))
+    containment = roomcontainment.RoomContainment(roomcontainment.room_footprints(model.link_instance))
+    assigned = containment.assign(points)
+
+    assert dict((points[i][0].Id, footprint.linked.number) for i, footprint in assigned.items()) == expected
+    assert model.link_doc.calls["IsPointInSpace"] == containment.tests
+    assert model.link_doc.calls["IsPointInRoom"] == 0
+
+
+def _run_copy_room_parameters(tmp_path, model, config):
+    # Eigen kopie van de knop, zodat config.json in de repo ongemoeid blijft.
+    bundle = str(tmp_path / "CopyRoomParametersFromLink.pushbutton")
+    shutil.copytree(fakerevit.resolve(COPY_ROOM_PARAMETERS), bundle)
+    with open(os.path.join(bundle, "config.json"), "w") as f:
+        json.dump(config, f)
+
+    pyrevit.answers.push("alert", "Hele model")
+    fakerevit.load_script(os.path.join(bundle, "script.py"), model.doc)
+
+
+def test_copy_room_parameters_from_link(tmp_path):
+    model = models.linked_rooms_model(12)
+    expected = models.add_room_contents(model, per_room=3, outside=2)
+    _run_copy_room_parameters(tmp_path, model, {"read_param": ["Number"], "write_param": ["Mark"]})
+
+    marks = dict((e.Id, e.LookupParameter("Mark").AsString()) for e in model.doc._iter_class(db.FamilyInstance))
+    assert all(marks[element_id] == number for element_id, number in expected.items())
+    assert sorted(mark for element_id, mark in marks.items() if element_id not in expected) == ["", ""]
+    assert system.MessageBox.shown[-1][0].splitlines() == [
+        "36 van 38 element(en) liggen in een room uit '{0}' (12 rooms).".format(model.link_instance.Name),
+        "2 element(en) liggen niet in een room en zijn niet aangepast.",
+    ]
+
+
+def test_rejected_room_values_are_reported(tmp_path):
+    model = models.linked_rooms_model(4)
+    expected = models.add_room_contents(model, per_room=2)
+    model.doc.define_parameter("Hoogte", db.StorageType.Double)
+    for element in model.doc._iter_class(db.FamilyInstance):
+        models.fill_parameters(element, {"Hoogte": 0.0})
+    # De naam ("Ruimte 1") is geen lengte: die waarden mogen niet als aangepast tellen.
+    _run_copy_room_parameters(tmp_path, model, {"read_param": ["Number", "Name"], "write_param": ["Mark", "Hoogte"]})
+
+    elements = list(model.doc._iter_class(db.FamilyInstance))
+    assert all(e.LookupParameter("Mark").AsString() == expected[e.Id] for e in elements)
+    assert all(e.LookupParameter("Hoogte").AsDouble() == 0.0 for e in elements)
+    message = system.MessageBox.shown[-1][0].splitlines()
+    assert message[-1].startswith("8 element(en) konden niet (volledig) worden aangepast, bijv. 'Hoogte' = 'Ruimte ")
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+import fakerevit
+from fakerevit import db, models, system
+
+from scholtenbim.sheetindex import SheetIndex
+
+OPEN_SHEETS_BY_VIEWS = "Views.panel/Open.pulldown/Open Sheets by Selected Views.pushbutton/script.py"
+
+
+def test_index_covers_viewports_and_schedules():
+    model = models.sheet_model(5, views_per_sheet=2, unplaced_views=3, schedules_per_sheet=1)
+    index = SheetIndex(model.doc)
+    sheet = model.sheets[2]
+    assert index.sheets_for_view(model.views[4].Id) == [sheet]
+    assert index.sheets_for_view(model.schedules[2].Id) == [sheet]
+    assert set(index.view_ids_on_sheet(sheet.Id)) == {model.views[4].Id, model.views[5].Id,
+                                                      model.schedules[2].Id}
+    # De actieve plattegrond en de drie losse views staan nergens op.
+    assert [v.Name for v in index.unplaced_views()] == ["Los 1", "Los 2", "Los 3", "Plattegrond"]
+
+
+def test_open_sheets_reports_unplaced_views():
+    model = models.sheet_model(4, views_per_sheet=1, unplaced_views=1)
+    uidoc = fakerevit.bind(model.doc)
+    uidoc.Selection.SetElementIds([model.views[1].Id, model.views[-1].Id])
+    fakerevit.load_script(OPEN_SHEETS_BY_VIEWS, model.doc, uidoc=uidoc)
+    assert uidoc.ActiveView is model.sheets[1]
+    message = system.MessageBox.shown[-1][0]
+    assert message.startswith("Er zijn 1 sheets geopend.") and "- Los 1" in message
+    assert model.doc.calls["FilteredElementCollector"] == 2
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import math
+import random
+
+import fakerevit
+from fakerevit import db, models, pyrevit, system
+
+from scholtenbim import configstore, spatialindex
+
+COPY_PARAMETER_LINK = "Elements.panel/CopyParameters.pulldown/CopyParameterLink.pushbutton/script.py"
+
+
+def _box(x0, y0, z0, x1, y1, z1):
+    return spatialindex.Box((x0, y0, z0), (x1, y1, z1))
+
+
+def test_best_match_prefers_overlap_then_smallest_box():
+    grid = spatialindex.BoxGrid(5.0)
+    grid.insert("ruimte", _box(10, 10, 0, 20, 20, 3))
+    grid.insert("buur", _box(20, 10, 0, 30, 20, 3))
+    # Over de grens: het meeste overlapvolume wint.
+    assert grid.best_match(_box(18, 12, 1, 21, 13, 2)) == "ruimte"
+    assert grid.best_match(_box(19, 12, 1, 25, 13, 2)) == "buur"
+    assert grid.best_match(_box(200, 200, 0, 201, 201, 1)) is None
+    # Plat element (plafondplaat) telt ook mee.
+    assert grid.best_match(_box(25, 15, 3, 26, 16, 3)) == "buur"
+
+    # Binnen "ruimte" en "verdieping": de kleinste omsluitende wint; een
+    # element over de grens valt alleen nog helemaal binnen "verdieping".
+    grid.insert("verdieping", _box(0, 0, 0, 100, 100, 3))
+    assert grid.best_match(_box(12, 12, 1, 13, 13, 2)) == "ruimte"
+    assert grid.best_match(_box(18, 12, 1, 21, 13, 2)) == "verdieping"
+
+
+def test_grid_matches_brute_force():
+    rng = random.Random(3)
+    boxes = {}
+    for i in range(400):
+        x, y, z = rng.uniform(0, 200), rng.uniform(0, 200), rng.uniform(0, 10)
+        boxes[i] = _box(x, y, z, x + rng.uniform(0.5, 30), y + rng.uniform(0.5, 30), z + rng.uniform(0, 3))
+    grid = spatialindex.BoxGrid(spatialindex.cell_size_for(list(boxes.values())))
+    for key, box in boxes.items():
+        grid.insert(key, box)
+    for _ in range(200):
+        x, y, z = rng.uniform(0, 200), rng.uniform(0, 200), rng.uniform(0, 10)
+        query = _box(x, y, z, x + 2, y + 2, z + 1)
+        scored = [((b.overlap(query), -b.volume), k) for k, b in boxes.items() if b.overlap(query) > 0]
+        assert grid.best_match(query) == (max(scored)[1] if scored else None)
+
+
+def test_copy_parameter_link_matches_by_overlap():
+    model = models.linked_elements_model(300, sources=48, offset=db.XYZ(250.0, -40.0, 0.0), rotation=math.pi / 2)
+    outside = model.targets[0]
+    outside._bbox = (db.XYZ(-5000, -5000, 0), db.XYZ(-4999, -4999, 1))
+    before = outside.LookupParameter("Comments").AsString()
+    pyrevit.answers.push("alert", "Automatisch op overlap")
+    fakerevit.load_script(COPY_PARAMETER_LINK, model.doc, picks=[[models.reference(e) for e in model.targets]])
+
+    # config.json: "Family and Type" -> Comments en Width (Width ontbreekt op de doelen).
+    assert all(e.LookupParameter("Comments").AsString() == model.expected[e.Id] for e in model.targets[1:])
+    assert outside.LookupParameter("Comments").AsString() == before
+    assert model.doc.calls["Transaction.Commit"] == 1
+    message = system.MessageBox.shown[-1][0]
+    assert message.startswith("299 van 300 element(en) gekoppeld aan een element uit")
+    assert "(ID: {0})".format(outside.Id) in message and "Parameter 'Width'" in message
+
+
+def test_copy_parameter_link_reports_rejected_values():
+    model = models.linked_elements_model(40, sources=8)
+    model.doc.define_parameter("Hoogte", db.StorageType.Double)
+    for target in model.targets:
+        models.fill_parameters(target, {"Hoogte": 0.0})
+    # "Compartiment n" is geen lengte: niet als aangepast tellen.
+    configstore.save("CopyParameterLink", {"read_param": "Family and Type", "write_param": ["Comments", "Hoogte"]})
+    pyrevit.answers.push("alert", "Automatisch op overlap")
+    fakerevit.load_script(COPY_PARAMETER_LINK, model.doc, picks=[[models.reference(e) for e in model.targets]])
+
+    assert all(e.LookupParameter("Comments").AsString() == model.expected[e.Id] for e in model.targets)
+    assert all(e.LookupParameter("Hoogte").AsDouble() == 0.0 for e in model.targets)
+    message = system.MessageBox.shown[-1][0]
+    assert "40 element(en) konden niet (volledig) worden aangepast, bijv. 'Hoogte' = 'Compartiment " in message
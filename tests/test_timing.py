@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+import fakerevit
+from fakerevit import models, pyrevit
+
+from scholtenbim import timing
+
+CLEAR_MARK = "Elements.panel/ClearMark.pushbutton/script.py"
+TIMING_REPORT = "Model Checks.panel/Timing Report.pushbutton/script.py"
+REVISIONS_ON_SHEETS = "Revisions.panel/Revisions.pulldown/Revisions on Sheets.pushbutton/script.py"
+UNUSED_REVISIONS = "Revisions.panel/Revisions.pulldown/Unused Revisions.pushbutton/script.py"
+
+
+def test_clear_mark_phases_end_up_in_the_report():
+    doc = models.generic_model(1500, mark_ratio=1.0)
+    for _ in range(3):
+        window = fakerevit.load_script(CLEAR_MARK, doc).window
+        while window.count_next():
+            pass
+    mod = fakerevit.load_script(CLEAR_MARK, doc)
+    mod.clear_mark_with_progress(mod.collect_whole_model_only_filled())
+
+    records = list(timing.read_records(timing.log_files()))
+    assert set(r["tool"] for r in records) == {"Clear Mark"}
+    phases = dict((r["phase"], r) for r in records)
+    assert set(phases) >= {"venster", "tellen", "verzamelen", "verwerken", "commit"}
+    assert phases["verzamelen"]["count"] == phases["verwerken"]["count"] == 1500
+    assert phases["commit"]["count"] == 2
+
+    pyrevit.answers.push("alert", "Eigen log")
+    fakerevit.load_script(TIMING_REPORT, doc)
+    title, columns, table = pyrevit.get_output().lines[-1]
+    assert columns == timing.REPORT_COLUMNS
+    venster = next(row for row in table if row[:2] == ["Clear Mark", "venster"])
+    assert venster[2] == 4
+
+
+def test_revision_tools_log_their_phases():
+    model = models.sheet_model(20, revisions=6, revisions_per_sheet=0, clouds_per_sheet=0)
+    pyrevit.answers.push("SelectFromList", ["1 - Revisie A"])
+    fakerevit.load_script(REVISIONS_ON_SHEETS, model.doc)
+    pyrevit.answers.push("SelectFromList", ["2 - Revisie B", "3 - Revisie C"])
+    fakerevit.load_script(UNUSED_REVISIONS, model.doc)
+
+    phases = dict(((r["tool"], r["phase"]), r["count"]) for r in timing.read_records(timing.log_files()))
+    assert phases == {("Revisions on Sheets", "matrix"): 20, ("Revisions on Sheets", "keuzelijst"): 6,
+                      ("Revisions on Sheets", "overzicht"): 0, ("Unused Revisions", "zoeken"): 6,
+                      ("Unused Revisions", "keuzelijst"): 6, ("Unused Revisions", "verwijderen"): 2}
+
+
+def test_log_rotates_and_report_skips_broken_lines(tmp_path, monkeypatch):
+    monkeypatch.setattr(timing, "MAX_BYTES", 2000)
+    path = str(tmp_path / "timing.jsonl")
+    timer = timing.Timer("Tool", path=path)
+    for ms in range(1, 101):
+        timer.record("fase", ms / 1000.0, count=ms)
+    files = timing.log_files(path)
+    assert files[0] == path and len(files) == timing.BACKUPS + 1
+
+    with open(path, "a") as f:
+        f.write('{"tool": "Tool", "phase": "fa')
+    records = list(timing.read_records(files))
+    assert len(records) < 100
+    row = timing.report(records)[0]
+    assert row.runs == len(records)
+    durations = sorted(r["ms"] for r in records)
+    assert row.p50 == timing.percentile(durations, 50) and row.p95 <= row.max == durations[-1]
+    assert timing.percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.5
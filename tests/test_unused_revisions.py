@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+import fakerevit
+from fakerevit import db, models, pyrevit
+
+UNUSED_REVISIONS = "Revisions.panel/Revisions.pulldown/Unused Revisions.pushbutton/script.py"
+
+
+def _model_with_unused(title, used=2, unused=5):
+    model = models.sheet_model(4, revisions=used + unused, revisions_per_sheet=0, clouds_per_sheet=0,
+                               title=title)
+    for sheet in model.sheets:
+        sheet._revision_ids = [r.Id for r in model.revisions[:used]]
+    return model
+
+
+def _sequences(doc):
+    return sorted(r.SequenceNumber for r in doc._iter_class(db.Revision))
+
+
+def test_selected_revisions_are_deleted_in_one_call():
+    model = _model_with_unused("A")
+    pyrevit.answers.push("SelectFromList", ["3 - Revisie C", "5 - Revisie E", "7 - Revisie G"])
+    fakerevit.load_script(UNUSED_REVISIONS, model.doc)
+    assert _sequences(model.doc) == [1, 2, 4, 6]
+    assert model.doc.calls["Delete"] == 1
+
+
+def test_purge_all_open_documents():
+    first = _model_with_unused("A", used=1, unused=3)
+    second = _model_with_unused("B", used=0, unused=4)
+    pyrevit.answers.push("alert", "Alle ongebruikte verwijderen (alle open modellen)")
+    fakerevit.load_script(UNUSED_REVISIONS, first.doc)
+    assert _sequences(first.doc) == [1]
+    # Zonder gebruikte revisies blijft de eerste staan.
+    assert _sequences(second.doc) == [1]